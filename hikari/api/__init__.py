@@ -32,8 +32,10 @@
 from hikari.api.entity_factory import *
 from hikari.api.event_factory import *
 from hikari.api.event_manager import *
+from hikari.api.identify_coordinator import *
 from hikari.api.interaction_server import *
 from hikari.api.rest import *
+from hikari.api.session_store import *
 from hikari.api.shard import *
 from hikari.api.special_endpoints import *
 from hikari.api.voice import *
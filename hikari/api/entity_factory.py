@@ -859,6 +859,29 @@ def deserialize_channel(
             If the channel type is unknown.
         """
 
+    @abc.abstractmethod
+    def serialize_guild_channel(self, channel: channel_models.PermissibleGuildChannel) -> data_binding.JSONObject:
+        """Serialize a guild channel object to a json serializable dict.
+
+        The result matches the payload Discord sends for the channel, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_channel`][].
+
+        Parameters
+        ----------
+        channel
+            The guild channel object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the guild channel.
+
+        Raises
+        ------
+        TypeError
+            If the channel type is not supported.
+        """
+
     ################
     # EMBED MODELS #
     ################
@@ -1082,6 +1105,35 @@ def deserialize_member(
             `"guild_id"` is not present in the passed payload.
         """
 
+    @abc.abstractmethod
+    def deserialize_members(
+        self, payloads: data_binding.JSONArray, *, guild_id: snowflakes.Snowflake
+    ) -> typing.Mapping[snowflakes.Snowflake, guild_models.Member]:
+        """Parse a batch of raw member payloads from the same guild.
+
+        This is more efficient than calling
+        [`hikari.api.entity_factory.EntityFactory.deserialize_member`][] for
+        each payload, as the role IDs and timestamps which are repeated across
+        the members are only converted once and shared between them.
+
+        !!! note
+            The `role_ids` of the returned members are immutable and may be
+            shared between members.
+
+        Parameters
+        ----------
+        payloads
+            The JSON payloads of the members to deserialize. These must all
+            include the `"user"` field.
+        guild_id
+            The ID of the guild the members belong to.
+
+        Returns
+        -------
+        typing.Mapping[hikari.snowflakes.Snowflake, hikari.guilds.Member]
+            A mapping of user IDs to the deserialized member objects.
+        """
+
     @abc.abstractmethod
     def deserialize_role(
         self, payload: data_binding.JSONObject, *, guild_id: snowflakes.Snowflake
@@ -1103,6 +1155,42 @@ def deserialize_role(
             The deserialized role object.
         """
 
+    @abc.abstractmethod
+    def serialize_member(self, member: guild_models.Member) -> data_binding.JSONObject:
+        """Serialize a member object to a json serializable dict.
+
+        The result matches the payload Discord sends for the member, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_member`][].
+
+        Parameters
+        ----------
+        member
+            The member object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the member.
+        """
+
+    @abc.abstractmethod
+    def serialize_role(self, role: guild_models.Role) -> data_binding.JSONObject:
+        """Serialize a role object to a json serializable dict.
+
+        The result matches the payload Discord sends for the role, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_role`][].
+
+        Parameters
+        ----------
+        role
+            The role object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the role.
+        """
+
     @abc.abstractmethod
     def deserialize_partial_integration(self, payload: data_binding.JSONObject) -> guild_models.PartialIntegration:
         """Parse a raw payload from Discord into a partial integration object.
@@ -1222,6 +1310,30 @@ def deserialize_gateway_guild(
             internally.
         """
 
+    @abc.abstractmethod
+    def serialize_gateway_guild(self, guild: guild_models.GatewayGuild) -> data_binding.JSONObject:
+        """Serialize a gateway guild object to a json serializable dict.
+
+        The result matches the payload Discord sends for the guild, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_gateway_guild`][].
+
+        !!! note
+            This only includes the fields of the guild itself. The collections
+            which are cached separately (such as `"roles"`, `"channels"` and
+            `"members"`) should be added to the payload using their own
+            serializers if needed.
+
+        Parameters
+        ----------
+        guild
+            The guild object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the guild.
+        """
+
     ######################
     # INTERACTION MODELS #
     ######################
@@ -1602,6 +1714,26 @@ def deserialize_message(self, payload: data_binding.JSONObject) -> message_model
             The deserialized message object.
         """
 
+    @abc.abstractmethod
+    def serialize_message(self, message: message_models.PartialMessage) -> data_binding.JSONObject:
+        """Serialize a message object to a json serializable dict.
+
+        The result matches the payload Discord sends for the message, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_message`][]
+        or [`hikari.api.entity_factory.EntityFactory.deserialize_partial_message`][].
+        Fields which are undefined on a partial message are left out.
+
+        Parameters
+        ----------
+        message
+            The message object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the message.
+        """
+
     ###################
     # PRESENCE MODELS #
     ###################
@@ -1641,6 +1773,24 @@ def deserialize_member_presence(
             `"guild_id"` is not present in the passed payload.
         """
 
+    @abc.abstractmethod
+    def serialize_member_presence(self, presence: presence_models.MemberPresence) -> data_binding.JSONObject:
+        """Serialize a member presence object to a json serializable dict.
+
+        The result matches the payload Discord sends for the presence, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_member_presence`][].
+
+        Parameters
+        ----------
+        presence
+            The member presence object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the member presence.
+        """
+
     ##########################
     # SCHEDULED EVENT MODELS #
     ##########################
@@ -1777,6 +1927,24 @@ def deserialize_user(self, payload: data_binding.JSONObject) -> user_models.User
             The deserialized user object.
         """
 
+    @abc.abstractmethod
+    def serialize_user(self, user: user_models.User) -> data_binding.JSONObject:
+        """Serialize a user object to a json serializable dict.
+
+        The result matches the payload Discord sends for the user, so it
+        can be passed back to [`hikari.api.entity_factory.EntityFactory.deserialize_user`][].
+
+        Parameters
+        ----------
+        user
+            The user object to serialize.
+
+        Returns
+        -------
+        hikari.internal.data_binding.JSONObject
+            The serialized representation of the user.
+        """
+
     @abc.abstractmethod
     def deserialize_my_user(self, payload: data_binding.JSONObject) -> user_models.OwnUser:
         """Parse a raw payload from Discord into a user object.
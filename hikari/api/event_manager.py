@@ -22,13 +22,14 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("EventManager", "EventStream")
+__all__: typing.Sequence[str] = ("EventManager", "EventStream", "StreamOverflowPolicy")
 
 import abc
 import typing
 
 from hikari import iterators
 from hikari.events import base_events
+from hikari.internal import enums
 from hikari.internal import typing_extensions
 
 if typing.TYPE_CHECKING:
@@ -37,16 +38,37 @@
 
     from typing_extensions import Self
 
+    from hikari import channels
+    from hikari import guilds
+    from hikari import snowflakes
     from hikari.api import shard as gateway_shard
     from hikari.internal import data_binding
 
     PredicateT = typing.Callable[[base_events.EventT], bool]
+    KeyExtractorT = typing.Callable[[base_events.EventT], typing.Hashable]
+    PayloadPredicateT = typing.Callable[[data_binding.JSONObject], bool]
     CallbackT = typing.Callable[[base_events.EventT], typing.Coroutine[typing.Any, typing.Any, None]]
     ConsumerT = typing.Callable[
         [gateway_shard.GatewayShard, data_binding.JSONObject], typing.Coroutine[typing.Any, typing.Any, None]
     ]
 
 
+@typing.final
+class StreamOverflowPolicy(str, enums.Enum):
+    """What an event stream does with new events once its limit is reached."""
+
+    DROP_NEWEST = "drop_newest"
+    """Drop the incoming events until there is space for them again."""
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest queued event to make space for the incoming one."""
+    BLOCK = "block"
+    """Hold the dispatch of the incoming events until there is space for them.
+
+    The held dispatches count as pending, so this will eventually pause the
+    gateway reads if dispatch water marks are configured.
+    """
+
+
 class EventStream(iterators.LazyIterator[base_events.EventT], abc.ABC):
     """A base abstract class for all event streamers.
 
@@ -142,6 +164,46 @@ def filter(
             The current stream with the new filter applied.
         """
 
+    @abc.abstractmethod
+    def batches(
+        self, max_size: int, max_latency: float | None = None
+    ) -> typing.AsyncIterator[typing.Sequence[base_events.EventT]]:
+        """Iterate over the streamed events in batches.
+
+        Each batch is started by the first event received, which is waited
+        for for up to the timeout of the stream. The iteration ends if no
+        event arrives in time.
+
+        Parameters
+        ----------
+        max_size
+            The maximum amount of events in a batch.
+        max_latency
+            How long to wait for a batch to fill up after its first event was
+            received, in seconds. If [`None`][] then the batches only contain
+            the events which were already queued.
+
+        Returns
+        -------
+        typing.AsyncIterator[typing.Sequence[hikari.events.base_events.Event]]
+            The async iterator of event batches.
+
+        Raises
+        ------
+        ValueError
+            If `max_size` is less than 1.
+        TypeError
+            If the stream was not started before iterating over it.
+
+        Examples
+        --------
+        ```py
+        with bot.stream(events.MessageCreateEvent, timeout=None, limit=1000) as stream:
+            async for batch in stream.batches(100, max_latency=5):
+                await database.insert_messages([event.message for event in batch])
+        ```
+        """
+
     @abc.abstractmethod
     def __enter__(self) -> Self:
         raise NotImplementedError
@@ -184,6 +246,56 @@ def consume_raw_event(
             If there is no consumer for the event.
         """
 
+    @abc.abstractmethod
+    def should_consume_raw_event(self, event_name: str) -> bool:
+        """Check whether consuming a raw event would have any effect.
+
+        This is used by shards to skip decoding dispatches which would
+        otherwise be discarded, so it must be cheap to call.
+
+        Parameters
+        ----------
+        event_name
+            The case-insensitive name of the event.
+
+        Returns
+        -------
+        bool
+            [`False`][] if consuming the event is guaranteed to have no effect,
+            otherwise [`True`][].
+        """
+
+    @abc.abstractmethod
+    def should_pause_reading(self, shard: gateway_shard.GatewayShard) -> bool:
+        """Check whether a shard should stop reading events from the gateway.
+
+        This is used by shards to apply backpressure when too many of the
+        events they received are still being handled, so it must be cheap
+        to call.
+
+        Parameters
+        ----------
+        shard
+            The shard about to read the next event.
+
+        Returns
+        -------
+        bool
+            [`True`][] if the shard should wait for
+            [`hikari.api.event_manager.EventManager.wait_to_resume_reading`][]
+            before reading the next event, otherwise [`False`][].
+        """
+
+    @abc.abstractmethod
+    async def wait_to_resume_reading(self, shard: gateway_shard.GatewayShard) -> None:
+        """Wait until a shard which paused reading events may resume.
+
+        Parameters
+        ----------
+        shard
+            The shard waiting to resume reading.
+        """
+
     @abc.abstractmethod
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
         """Dispatch an event.
@@ -274,9 +386,26 @@ async def on_everyone_mentioned(event):
     # For the sake of UX, I will check this at runtime instead and let the
     # user use a static type checker.
     @abc.abstractmethod
-    def subscribe(self, event_type: type[typing.Any], callback: CallbackT[typing.Any]) -> None:
+    def subscribe(
+        self,
+        event_type: type[typing.Any],
+        callback: CallbackT[typing.Any],
+        *,
+        guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None = None,
+        channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None = None,
+        author_is_bot: bool | None = None,
+        payload_predicate: PayloadPredicateT | None = None,
+        sample_every: int | None = None,
+        coalesce_by: str | KeyExtractorT[typing.Any] | None = None,
+        window: float | None = None,
+    ) -> None:
         """Subscribe a given callback to a given event type.
 
+        The raw payload filters are checked before the event is deserialized,
+        so events which no callback or cache needs are never built. Events
+        which were not received from the gateway (such as the ones dispatched
+        manually) are passed to the callback regardless of the filters.
+
         Parameters
         ----------
         event_type
@@ -287,6 +416,39 @@ def subscribe(self, event_type: type[typing.Any], callback: CallbackT[typing.Any
             Must be a coroutine function to invoke. This should
             consume an instance of the given event, or an instance of a valid
             subclass if one exists. Any result is discarded.
+        guild_ids
+            If provided, only events whose raw payload has a `guild_id` in
+            these guilds are passed to the callback.
+        channel_ids
+            If provided, only events whose raw payload has a `channel_id` in
+            these channels are passed to the callback.
+        author_is_bot
+            If provided, only events whose raw payload has an `author` (or
+            `user`) with a matching `bot` flag are passed to the callback.
+        payload_predicate
+            If provided, only events whose raw payload this returns [`True`][]
+            for are passed to the callback.
+        sample_every
+            If provided, only one in every `sample_every` events accepted by
+            the other raw payload filters is passed to the callback. Like the
+            other raw payload filters, this is checked before the event is
+            deserialized.
+        coalesce_by
+            The attribute to group the events by, such as `"user_id"`, or a
+            function returning the key of an event. This can only be used
+            together with `window`.
+        window
+            If provided, the events are held for up to this many seconds and
+            only the latest event of each `coalesce_by` key (or the latest
+            event overall, if no key is given) is passed to the callback once
+            the window ends. The events superseded within the window never
+            reach the callback.
+
+        Raises
+        ------
+        ValueError
+            If `sample_every` is less than 1, if `window` is not positive or
+            if `coalesce_by` is provided without `window`.
 
         Examples
         --------
@@ -303,6 +465,22 @@ async def on_message(event): ...
         bot.subscribe(MessageCreateEvent, on_message)
         ```
 
+        The following only passes the messages sent in a couple of channels
+        to the callback, without building the events for any of the others.
+
+        ```py
+        bot.subscribe(MessageCreateEvent, on_message, channel_ids=[123, 456])
+        ```
+
+        The following only passes the latest presence of each user every
+        5 seconds to the callback.
+
+        ```py
+        bot.subscribe(
+            PresenceUpdateEvent, on_presence, coalesce_by="user_id", window=5.0
+        )
+        ```
+
         See Also
         --------
         Dispatch : [`hikari.api.event_manager.EventManager.dispatch`][].
@@ -379,11 +557,20 @@ def get_listeners(
 
     @abc.abstractmethod
     def listen(
-        self, *event_types: type[base_events.EventT]
+        self,
+        *event_types: type[base_events.EventT],
+        guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None = None,
+        channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None = None,
+        author_is_bot: bool | None = None,
+        payload_predicate: PayloadPredicateT | None = None,
+        sample_every: int | None = None,
+        coalesce_by: str | KeyExtractorT[base_events.EventT] | None = None,
+        window: float | None = None,
     ) -> typing.Callable[[CallbackT[base_events.EventT]], CallbackT[base_events.EventT]]:
         """Generate a decorator to subscribe a callback to an event type.
 
-        This is a second-order decorator.
+        This is a second-order decorator. The raw payload filters are applied
+        as described in [`hikari.api.event_manager.EventManager.subscribe`][].
 
         Parameters
         ----------
@@ -392,6 +579,33 @@ def listen(
             to be undefined. If this is the case, the event type will be inferred
             instead from the type hints on the function signature.
             `T` must be a subclass of [`hikari.events.base_events.Event`][].
+        guild_ids
+            If provided, only events whose raw payload has a `guild_id` in
+            these guilds are passed to the callback.
+        channel_ids
+            If provided, only events whose raw payload has a `channel_id` in
+            these channels are passed to the callback.
+        author_is_bot
+            If provided, only events whose raw payload has an `author` (or
+            `user`) with a matching `bot` flag are passed to the callback.
+        payload_predicate
+            If provided, only events whose raw payload this returns [`True`][]
+            for are passed to the callback.
+        sample_every
+            If provided, only one in every `sample_every` events accepted by
+            the other raw payload filters is passed to the callback. Like the
+            other raw payload filters, this is checked before the event is
+            deserialized.
+        coalesce_by
+            The attribute to group the events by, such as `"user_id"`, or a
+            function returning the key of an event. This can only be used
+            together with `window`.
+        window
+            If provided, the events are held for up to this many seconds and
+            only the latest event of each `coalesce_by` key (or the latest
+            event overall, if no key is given) is passed to the callback once
+            the window ends. The events superseded within the window never
+            reach the callback.
 
         Returns
         -------
@@ -400,6 +614,12 @@ def listen(
             [`hikari.api.event_manager.EventManager.subscribe`][] before returning the function
             reference.
 
+        Raises
+        ------
+        ValueError
+            If `sample_every` is less than 1, if `window` is not positive or
+            if `coalesce_by` is provided without `window`.
+
         See Also
         --------
         Dispatch : [`hikari.api.event_manager.EventManager.dispatch`][].
@@ -411,7 +631,15 @@ def listen(
 
     @abc.abstractmethod
     def stream(
-        self, event_type: type[base_events.EventT], /, timeout: float | None, limit: int | None = None
+        self,
+        event_type: type[base_events.EventT],
+        /,
+        timeout: float | None,
+        limit: int | None = None,
+        *,
+        overflow: str = StreamOverflowPolicy.DROP_NEWEST,
+        key_by: str | KeyExtractorT[base_events.EventT] | None = None,
+        key: typing.Hashable = None,
     ) -> EventStream[base_events.EventT]:
         """Return a stream iterator for the given event and sub-events.
 
@@ -430,9 +658,24 @@ def stream(
             ending the iteration. If [`None`][] then this will continue
             until explicitly broken from.
         limit
-            The limit for how many events this should queue at one time before
-            dropping extra incoming events, leave this as [`None`][] for
-            the cache size to be unlimited.
+            The limit for how many events this should queue at one time,
+            leave this as [`None`][] for the queue size to be unlimited.
+        overflow
+            What to do with incoming events once `limit` is reached. By
+            default, they are dropped. See [`hikari.api.event_manager.StreamOverflowPolicy`][].
+        key_by
+            The attribute to look the events up by, such as `"message_id"`,
+            or a function returning the key of an event. Dotted attribute
+            paths such as `"interaction.message.id"` are also supported.
+
+            When provided, only the events whose key is equal to `key` are
+            considered, and they are found with a single lookup instead of
+            checking every stream. This keeps streaming the events of a lot
+            of different keys at once cheap. Functions are only indexed
+            together when they are the same object, so they should be reused
+            between calls.
+        key
+            The key the events must have. This is only used with `key_by`.
 
         Returns
         -------
@@ -441,6 +684,13 @@ def stream(
             with `with stream:` or [`stream.open`][hikari.api.event_manager.EventStream.open]
             before asynchronously iterating over it.
 
+        Raises
+        ------
+        ValueError
+            If `key` is provided without `key_by`, or if `overflow` is
+            [`hikari.api.event_manager.StreamOverflowPolicy.BLOCK`][] for a
+            keyed stream.
+
         Examples
         --------
         ```py
@@ -479,6 +729,9 @@ async def wait_for(
         /,
         timeout: float | None,
         predicate: PredicateT[base_events.EventT] | None = None,
+        *,
+        key_by: str | KeyExtractorT[base_events.EventT] | None = None,
+        key: typing.Hashable = None,
     ) -> base_events.EventT:
         """Wait for a given event to occur once, then return the event.
 
@@ -502,6 +755,18 @@ async def wait_for(
             [`None`][], then no timeout will be waited for (no timeout can
             result in "leaking" of coroutines that never complete if called in
             an uncontrolled way, so is not recommended).
+        key_by
+            The attribute to look the events up by, such as `"message_id"`,
+            or a function returning the key of an event. Dotted attribute
+            paths such as `"interaction.message.id"` are also supported.
+
+            When provided, only the events whose key is equal to `key` are
+            considered, and they are found with a single lookup instead of
+            checking every waiter. This keeps waiting on a lot of different
+            keys at once cheap. Functions are only indexed together when they
+            are the same object, so they should be reused between calls.
+        key
+            The key the events must have. This is only used with `key_by`.
 
         Returns
         -------
@@ -513,6 +778,8 @@ async def wait_for(
         asyncio.TimeoutError
             If the timeout is not [`None`][] and is reached before an
             event is received that the predicate returns [`True`][] for.
+        ValueError
+            If `key` is provided without `key_by`.
 
         See Also
         --------
@@ -0,0 +1,56 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Interfaces used to coordinate gateway identifies between shards."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("IdentifyCoordinator",)
+
+import abc
+import typing
+
+
+class IdentifyCoordinator(abc.ABC):
+    """Interface for a coordinator of gateway identifies.
+
+    Discord only allows one identify every 5 seconds for each rate limit bucket,
+    which is given by `shard_id % max_concurrency`. Shards acquire a slot from
+    the coordinator before every identify, which allows sharing the rate limit
+    between shards running in different processes or even different hosts.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def acquire(self, shard_id: int, max_concurrency: int) -> None:
+        """Wait until the given shard is allowed to identify.
+
+        Once this returns, the identify slot is considered used, so the shard
+        should identify straight away.
+
+        Parameters
+        ----------
+        shard_id
+            The ID of the shard that wants to identify.
+        max_concurrency
+            The maximum number of shards that can identify concurrently, as
+            given by Discord.
+        """
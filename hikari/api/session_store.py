@@ -0,0 +1,100 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Interfaces used to persist gateway sessions, so they can be resumed later."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("GatewaySession", "GatewaySessionStore")
+
+import abc
+import typing
+
+import attrs
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class GatewaySession:
+    """State required to resume a gateway session."""
+
+    session_id: str = attrs.field()
+    """The ID of the session."""
+
+    seq: int = attrs.field()
+    """The sequence number of the last dispatch received in the session."""
+
+    resume_gateway_url: str = attrs.field()
+    """The URL to use to resume the session."""
+
+    shard_count: int = attrs.field()
+    """The number of shards the session was created with.
+
+    Sessions can only be resumed by a shard with the same ID and shard count.
+    """
+
+
+class GatewaySessionStore(abc.ABC):
+    """Interface for a store of gateway sessions.
+
+    A session store allows shards to resume their gateway sessions after the
+    process restarts, instead of having to identify again. Sessions are stored
+    per shard ID.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def load(self, shard_id: int) -> GatewaySession | None:
+        """Load the stored session for a shard.
+
+        Parameters
+        ----------
+        shard_id
+            The ID of the shard.
+
+        Returns
+        -------
+        typing.Optional[GatewaySession]
+            The stored session, or [`None`][] if there is none.
+        """
+
+    @abc.abstractmethod
+    async def save(self, shard_id: int, session: GatewaySession) -> None:
+        """Store the session for a shard, replacing any previous one.
+
+        Parameters
+        ----------
+        shard_id
+            The ID of the shard.
+        session
+            The session to store.
+        """
+
+    @abc.abstractmethod
+    async def delete(self, shard_id: int) -> None:
+        """Delete the stored session for a shard.
+
+        This should do nothing if no session is stored for the shard.
+
+        Parameters
+        ----------
+        shard_id
+            The ID of the shard.
+        """
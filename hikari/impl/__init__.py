@@ -35,10 +35,13 @@
 from hikari.impl.event_manager import *
 from hikari.impl.event_manager_base import *
 from hikari.impl.gateway_bot import *
+from hikari.impl.identify_coordinator import *
 from hikari.impl.interaction_server import *
+from hikari.impl.member_chunker import *
 from hikari.impl.rate_limits import *
 from hikari.impl.rest import *
 from hikari.impl.rest_bot import *
+from hikari.impl.session_store import *
 from hikari.impl.shard import *
 from hikari.impl.special_endpoints import *
 from hikari.impl.voice import *
@@ -25,6 +25,7 @@
 __all__: typing.Sequence[str] = ("EntityFactoryImpl",)
 
 import datetime
+import functools
 import logging
 import typing
 
@@ -66,10 +67,13 @@
 from hikari.interactions import modal_interactions
 from hikari.internal import attrs_extensions
 from hikari.internal import data_binding
+from hikari.internal import deserializers
 from hikari.internal import time
 from hikari.internal import typing_extensions
 
 if typing.TYPE_CHECKING:
+    from typing_extensions import Self
+
     ValueT = typing.TypeVar("ValueT")
     EntityT = typing.TypeVar("EntityT")
     UndefinedSnowflakeMapping = undefined.UndefinedOr[typing.Mapping[snowflakes.Snowflake, EntityT]]
@@ -362,10 +366,7 @@ def members(self) -> typing.Mapping[snowflakes.Snowflake, guild_models.Member]:
                 msg = "'members' not in payload"
                 raise LookupError(msg)
 
-            self._members = {
-                snowflakes.Snowflake(m["user"]["id"]): self._entity_factory.deserialize_member(m, guild_id=self.id)
-                for m in self._payload["members"]
-            }
+            self._members = self._entity_factory.deserialize_members(self._payload["members"], guild_id=self.id)
 
         return self._members
 
@@ -437,6 +438,150 @@ def voice_states(self) -> typing.Mapping[snowflakes.Snowflake, voice_models.Voic
         return self._voice_states
 
 
+def _serialize_datetime(value: datetime.datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _serialize_snowflake(value: snowflakes.Snowflake | None) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _serialize_unix_epoch(value: datetime.datetime) -> int:
+    # Rounded, as the float timestamp may not exactly match the number of milliseconds it was built from
+    return round(value.timestamp() * 1_000)
+
+
+# The hottest flat models are deserialized by generated functions, see hikari.internal.deserializers
+_deserialize_user: typing.Callable[[data_binding.JSONObject, traits.RESTAware], user_models.UserImpl] = (
+    deserializers.generate_deserializer(
+        user_models.UserImpl,
+        [
+            deserializers.Field(name="id", converter=snowflakes.Snowflake),
+            deserializers.Field(name="discriminator"),
+            deserializers.Field(name="username"),
+            deserializers.Field(name="global_name", default=None),
+            deserializers.Field(name="avatar_hash", key="avatar"),
+            deserializers.Field(name="banner_hash", key="banner", default=None),
+            deserializers.Field(name="accent_color", converter=color_models.Color, default=None),
+            deserializers.Field(name="is_bot", key="bot", default=False),
+            deserializers.Field(name="is_system", key="system", default=False),
+            deserializers.Field(
+                name="flags", key="public_flags", converter=user_models.UserFlag, default=user_models.UserFlag.NONE
+            ),
+        ],
+        arguments=("app",),
+    )
+)
+_deserialize_member: typing.Callable[
+    [
+        data_binding.JSONObject,
+        user_models.User,
+        snowflakes.Snowflake,
+        typing.Sequence[snowflakes.Snowflake],
+        typing.Callable[[str], datetime.datetime],
+    ],
+    guild_models.Member,
+] = deserializers.generate_deserializer(
+    guild_models.Member,
+    [
+        deserializers.Field(name="joined_at", converter="parse_timestamp", nullable=True),
+        deserializers.Field(name="nickname", key="nick", default=None),
+        deserializers.Field(name="guild_avatar_hash", key="avatar", default=None),
+        deserializers.Field(name="guild_banner_hash", key="banner", default=None),
+        deserializers.Field(name="premium_since", converter="parse_timestamp", default=None),
+        deserializers.Field(name="is_deaf", key="deaf", default=undefined.UNDEFINED),
+        deserializers.Field(name="is_mute", key="mute", default=undefined.UNDEFINED),
+        deserializers.Field(name="is_pending", key="pending", default=undefined.UNDEFINED),
+        deserializers.Field(
+            name="raw_communication_disabled_until",
+            key="communication_disabled_until",
+            converter="parse_timestamp",
+            default=None,
+            # Empty values mean that the member is not timed out, as with None
+            default_if_falsy=True,
+        ),
+        deserializers.Field(
+            name="guild_flags",
+            key="flags",
+            converter=guild_models.GuildMemberFlags,
+            default=guild_models.GuildMemberFlags.NONE,
+        ),
+    ],
+    arguments=("user", "guild_id", "role_ids", "parse_timestamp"),
+)
+
+
+def _undefined_if_missing(
+    keys: tuple[str, ...],
+    deserialize: typing.Callable[[data_binding.JSONObject], ValueT],
+    payload: data_binding.JSONObject,
+    /,
+) -> undefined.UndefinedOr[ValueT]:
+    # Partial messages only include the fields which changed
+    if any(key in payload for key in keys):
+        return deserialize(payload)
+
+    return undefined.UNDEFINED
+
+
+def _undefined_if_empty(
+    key: str, deserialize: typing.Callable[[data_binding.JSONObject], ValueT], payload: data_binding.JSONObject, /
+) -> undefined.UndefinedOr[ValueT]:
+    if payload.get(key):
+        return deserialize(payload)
+
+    return undefined.UNDEFINED
+
+
+class _LazyMessageFields:
+    """Mixin deserializing the expensive fields of a message on first access."""
+
+    __slots__: typing.Sequence[str] = ()
+
+    _lazy_payload: data_binding.JSONObject
+    _lazy_fields: typing.Mapping[str, typing.Callable[[data_binding.JSONObject], typing.Any]]
+
+    @classmethod
+    def create(
+        cls,
+        fields: typing.Mapping[str, typing.Any],
+        payload: data_binding.JSONObject,
+        lazy_fields: typing.Mapping[str, typing.Callable[[data_binding.JSONObject], typing.Any]],
+    ) -> Self:
+        # The lazy fields are left unset, so that accessing them falls back to __getattr__
+        message = cls.__new__(cls)
+        for name, value in fields.items():
+            setattr(message, name, value)
+
+        message._lazy_payload = payload  # noqa: SLF001 - Initialising the new instance
+        message._lazy_fields = lazy_fields  # noqa: SLF001 - Initialising the new instance
+        return message
+
+    def __getattr__(self, name: str) -> object:
+        # This is only called once the normal lookup fails, so the fields which were
+        # already deserialized are read straight from their slots.
+        if name.startswith("_lazy"):
+            raise AttributeError(name)
+
+        try:
+            deserialize = self._lazy_fields[name]
+        except KeyError:
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg) from None
+
+        value = deserialize(self._lazy_payload)
+        setattr(self, name, value)
+        return value
+
+
+class _LazyPartialMessage(_LazyMessageFields, message_models.PartialMessage):
+    __slots__: typing.Sequence[str] = ("_lazy_fields", "_lazy_payload")
+
+
+class _LazyMessage(_LazyMessageFields, message_models.Message):
+    __slots__: typing.Sequence[str] = ("_lazy_fields", "_lazy_payload")
+
+
 class EntityFactoryImpl(entity_factory.EntityFactory):
     """Standard implementation for a serializer/deserializer.
 
@@ -449,18 +594,23 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         "_audit_log_event_mapping",
         "_command_mapping",
         "_dm_channel_type_mapping",
+        "_guild_channel_serializer_mapping",
         "_guild_channel_type_mapping",
         "_interaction_metadata_mapping",
         "_interaction_type_mapping",
+        "_lazy_messages",
         "_message_component_type_mapping",
+        "_message_field_deserializers",
         "_modal_component_type_mapping",
+        "_partial_message_field_deserializers",
         "_scheduled_event_type_mapping",
         "_thread_channel_type_mapping",
         "_webhook_type_mapping",
     )
 
-    def __init__(self, app: traits.RESTAware) -> None:
+    def __init__(self, app: traits.RESTAware, *, lazy_messages: bool = False) -> None:
         self._app = app
+        self._lazy_messages = lazy_messages
         self._audit_log_entry_converters: dict[str, typing.Callable[[typing.Any], typing.Any]] = {
             audit_log_models.AuditLogChangeKey.OWNER_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.AFK_CHANNEL_ID: snowflakes.Snowflake,
@@ -547,6 +697,16 @@ def __init__(self, app: traits.RESTAware) -> None:
             channel_models.ChannelType.GUILD_STAGE: self.deserialize_guild_stage_channel,
             channel_models.ChannelType.GUILD_FORUM: self.deserialize_guild_forum_channel,
         }
+        self._guild_channel_serializer_mapping: dict[
+            channel_models.ChannelType | int, typing.Callable[[typing.Any], data_binding.JSONObject]
+        ] = {
+            channel_models.ChannelType.GUILD_CATEGORY: self._serialize_guild_channel_fields,
+            channel_models.ChannelType.GUILD_TEXT: self._serialize_guild_text_channel,
+            channel_models.ChannelType.GUILD_NEWS: self._serialize_guild_news_channel,
+            channel_models.ChannelType.GUILD_VOICE: self._serialize_guild_voice_channel,
+            channel_models.ChannelType.GUILD_STAGE: self._serialize_guild_voice_channel,
+            channel_models.ChannelType.GUILD_FORUM: self._serialize_guild_forum_channel,
+        }
         self._thread_channel_type_mapping = {
             channel_models.ChannelType.GUILD_NEWS_THREAD: self.deserialize_guild_news_thread,
             channel_models.ChannelType.GUILD_PUBLIC_THREAD: self.deserialize_guild_public_thread,
@@ -577,6 +737,56 @@ def __init__(self, app: traits.RESTAware) -> None:
             webhook_models.WebhookType.CHANNEL_FOLLOWER: self.deserialize_channel_follower_webhook,
             webhook_models.WebhookType.APPLICATION: self.deserialize_application_webhook,
         }
+        # The fields of messages which are expensive to deserialize, and are deferred in lazy mode
+        self._message_field_deserializers: dict[str, typing.Callable[[data_binding.JSONObject], typing.Any]] = {
+            "attachments": self._deserialize_message_attachments,
+            "embeds": self._deserialize_message_embeds,
+            "poll": self._deserialize_message_poll,
+            "reactions": self._deserialize_message_reactions,
+            "activity": self._deserialize_message_message_activity,
+            "application": self._deserialize_message_message_application,
+            "message_reference": self._deserialize_message_message_reference,
+            "referenced_message": self._deserialize_message_referenced_message,
+            "stickers": self._deserialize_message_stickers,
+            "components": self._deserialize_message_components,
+            "user_mentions": self._deserialize_message_user_mentions,
+            "role_mention_ids": self._deserialize_message_role_mention_ids,
+            "channel_mentions": self._deserialize_message_channel_mentions,
+            "interaction_metadata": self._deserialize_message_interaction_metadata,
+            "thread": self._deserialize_message_thread,
+        }
+        self._partial_message_field_deserializers: dict[str, typing.Callable[[data_binding.JSONObject], typing.Any]] = {
+            "attachments": functools.partial(
+                _undefined_if_missing, ("attachments",), self._deserialize_message_attachments
+            ),
+            "embeds": functools.partial(_undefined_if_missing, ("embeds",), self._deserialize_message_embeds),
+            "poll": functools.partial(_undefined_if_missing, ("poll",), self._deserialize_message_poll),
+            "reactions": functools.partial(_undefined_if_missing, ("reactions",), self._deserialize_message_reactions),
+            "activity": functools.partial(
+                _undefined_if_missing, ("activity",), self._deserialize_message_message_activity
+            ),
+            "application": functools.partial(
+                _undefined_if_missing, ("application",), self._deserialize_message_message_application
+            ),
+            "message_reference": functools.partial(
+                _undefined_if_missing, ("message_reference",), self._deserialize_message_message_reference
+            ),
+            "referenced_message": self._deserialize_partial_message_referenced_message,
+            "stickers": functools.partial(
+                _undefined_if_missing, ("sticker_items", "stickers"), self._deserialize_message_stickers
+            ),
+            "components": functools.partial(_undefined_if_empty, "components", self._deserialize_message_components),
+            "user_mentions": functools.partial(
+                _undefined_if_empty, "mentions", self._deserialize_message_user_mentions
+            ),
+            "role_mention_ids": functools.partial(
+                _undefined_if_empty, "mention_roles", self._deserialize_message_role_mention_ids
+            ),
+            "channel_mentions": functools.partial(
+                _undefined_if_empty, "mention_channels", self._deserialize_message_channel_mentions
+            ),
+            "interaction_metadata": self._deserialize_message_interaction_metadata,
+        }
 
     @property
     def app(self) -> traits.RESTAware:
@@ -1401,6 +1611,43 @@ def _deserialize_thread_metadata(self, payload: data_binding.JSONObject) -> chan
             auto_archive_duration=datetime.timedelta(minutes=payload["auto_archive_duration"]),
         )
 
+    def _serialize_guild_thread(self, thread: channel_models.GuildThreadChannel) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "id": str(thread.id),
+            "name": thread.name,
+            "type": int(thread.type),
+            "guild_id": str(thread.guild_id),
+            "parent_id": str(thread.parent_id),
+            "last_message_id": _serialize_snowflake(thread.last_message_id),
+            "last_pin_timestamp": _serialize_datetime(thread.last_pin_timestamp),
+            "rate_limit_per_user": int(thread.rate_limit_per_user.total_seconds()),
+            "member_count": thread.approximate_member_count,
+            "message_count": thread.approximate_message_count,
+            "owner_id": str(thread.owner_id),
+            "thread_metadata": {
+                "archived": thread.metadata.is_archived,
+                "invitable": thread.metadata.is_invitable,
+                "archive_timestamp": thread.metadata.archive_timestamp.isoformat(),
+                "locked": thread.metadata.is_locked,
+                "create_timestamp": _serialize_datetime(thread.metadata.created_at),
+                "auto_archive_duration": int(thread.metadata.auto_archive_duration.total_seconds() // 60),
+            },
+        }
+
+        if thread.member is not None:
+            payload["member"] = {
+                "id": str(thread.member.thread_id),
+                "user_id": str(thread.member.user_id),
+                "join_timestamp": thread.member.joined_at.isoformat(),
+                "flags": thread.member.flags,
+            }
+
+        if isinstance(thread, channel_models.GuildPublicThread):
+            payload["applied_tags"] = [str(tag_id) for tag_id in thread.applied_tag_ids]
+            payload["flags"] = int(thread.flags)
+
+        return payload
+
     @typing_extensions.override
     def deserialize_guild_news_thread(
         self,
@@ -1566,6 +1813,78 @@ def deserialize_channel(
         msg = f"Unrecognised channel type {channel_type}"
         raise errors.UnrecognisedEntityError(msg)
 
+    def _serialize_guild_channel_fields(self, channel: channel_models.PermissibleGuildChannel) -> dict[str, typing.Any]:
+        return {
+            "id": str(channel.id),
+            "name": channel.name,
+            "type": int(channel.type),
+            "guild_id": str(channel.guild_id),
+            "parent_id": _serialize_snowflake(channel.parent_id),
+            "permission_overwrites": [
+                self.serialize_permission_overwrite(overwrite) for overwrite in channel.permission_overwrites.values()
+            ],
+            "nsfw": channel.is_nsfw,
+            "position": channel.position,
+        }
+
+    def _serialize_guild_text_channel(self, channel: channel_models.GuildTextChannel) -> dict[str, typing.Any]:
+        payload = self._serialize_guild_news_channel(channel)
+        payload["rate_limit_per_user"] = int(channel.rate_limit_per_user.total_seconds())
+        return payload
+
+    def _serialize_guild_news_channel(
+        self, channel: channel_models.GuildNewsChannel | channel_models.GuildTextChannel
+    ) -> dict[str, typing.Any]:
+        payload = self._serialize_guild_channel_fields(channel)
+        payload["topic"] = channel.topic
+        payload["last_message_id"] = _serialize_snowflake(channel.last_message_id)
+        payload["last_pin_timestamp"] = _serialize_datetime(channel.last_pin_timestamp)
+        payload["default_auto_archive_duration"] = int(channel.default_auto_archive_duration.total_seconds() // 60)
+        return payload
+
+    def _serialize_guild_voice_channel(
+        self, channel: channel_models.GuildVoiceChannel | channel_models.GuildStageChannel
+    ) -> dict[str, typing.Any]:
+        payload = self._serialize_guild_channel_fields(channel)
+        payload["rtc_region"] = channel.region
+        payload["bitrate"] = channel.bitrate
+        payload["user_limit"] = channel.user_limit
+        payload["video_quality_mode"] = int(channel.video_quality_mode)
+        payload["last_message_id"] = _serialize_snowflake(channel.last_message_id)
+        return payload
+
+    def _serialize_guild_forum_channel(self, channel: channel_models.GuildForumChannel) -> dict[str, typing.Any]:
+        payload = self._serialize_guild_channel_fields(channel)
+        payload["topic"] = channel.topic
+        payload["last_message_id"] = _serialize_snowflake(channel.last_thread_id)
+        payload["rate_limit_per_user"] = int(channel.rate_limit_per_user.total_seconds())
+        payload["default_thread_rate_limit_per_user"] = int(channel.default_thread_rate_limit_per_user.total_seconds())
+        payload["default_auto_archive_duration"] = int(channel.default_auto_archive_duration.total_seconds() // 60)
+        payload["available_tags"] = [self.serialize_forum_tag(tag) for tag in channel.available_tags]
+        payload["flags"] = int(channel.flags)
+        payload["default_forum_layout"] = int(channel.default_layout)
+        payload["default_sort_order"] = int(channel.default_sort_order)
+        payload["default_reaction_emoji"] = None
+        if channel.default_reaction_emoji_id is not None or channel.default_reaction_emoji_name is not None:
+            payload["default_reaction_emoji"] = {
+                "emoji_id": _serialize_snowflake(channel.default_reaction_emoji_id),
+                "emoji_name": (
+                    str(channel.default_reaction_emoji_name)
+                    if channel.default_reaction_emoji_name is not None
+                    else None
+                ),
+            }
+
+        return payload
+
+    @typing_extensions.override
+    def serialize_guild_channel(self, channel: channel_models.PermissibleGuildChannel) -> data_binding.JSONObject:
+        if serialize := self._guild_channel_serializer_mapping.get(channel.type):
+            return serialize(channel)
+
+        msg = f"Cannot serialize guild channel of type {channel.type}"
+        raise TypeError(msg)
+
     ################
     # EMBED MODELS #
     ################
@@ -1896,35 +2215,52 @@ def deserialize_member(
         if guild_id not in role_ids:
             role_ids.append(guild_id)
 
-        raw_joined_at = payload["joined_at"]
-        joined_at = time.iso8601_datetime_string_to_datetime(raw_joined_at) if raw_joined_at is not None else None
+        # Members are attached to every message and voice state, repeating the same timestamps
+        return _deserialize_member(payload, user, guild_id, role_ids, time.cached_iso8601_datetime_string_to_datetime)
 
-        raw_premium_since = payload.get("premium_since")
-        premium_since = (
-            time.iso8601_datetime_string_to_datetime(raw_premium_since) if raw_premium_since is not None else None
-        )
+    @typing_extensions.override
+    def deserialize_members(
+        self, payloads: data_binding.JSONArray, *, guild_id: snowflakes.Snowflake
+    ) -> dict[snowflakes.Snowflake, guild_models.Member]:
+        # The members of a guild mostly share the same few role combinations, and members which
+        # joined together share their join timestamp, so these are only converted once per batch.
+        # This also means that the members share the same objects for these, saving memory.
+        role_ids_cache: dict[tuple[str | int, ...], tuple[snowflakes.Snowflake, ...]] = {}
+        role_id_cache: dict[str | int, snowflakes.Snowflake] = {}
+        timestamp_cache: dict[str, datetime.datetime] = {}
+
+        def parse_timestamp(raw_timestamp: str) -> datetime.datetime:
+            try:
+                return timestamp_cache[raw_timestamp]
+            except KeyError:
+                timestamp = timestamp_cache[raw_timestamp] = time.iso8601_datetime_string_to_datetime(raw_timestamp)
+                return timestamp
 
-        guild_flags = guild_models.GuildMemberFlags(payload.get("flags") or guild_models.GuildMemberFlags.NONE)
+        members: dict[snowflakes.Snowflake, guild_models.Member] = {}
+        for payload in payloads:
+            raw_role_ids = tuple(payload["roles"])
+            role_ids = role_ids_cache.get(raw_role_ids)
+            if role_ids is None:
+                role_id_list: list[snowflakes.Snowflake] = []
+                for raw_role_id in raw_role_ids:
+                    role_id = role_id_cache.get(raw_role_id)
+                    if role_id is None:
+                        role_id = role_id_cache[raw_role_id] = snowflakes.Snowflake(raw_role_id)
 
-        communication_disabled_until: datetime.datetime | None = None
-        if raw_communication_disabled_until := payload.get("communication_disabled_until"):
-            communication_disabled_until = time.iso8601_datetime_string_to_datetime(raw_communication_disabled_until)
+                    role_id_list.append(role_id)
 
-        return guild_models.Member(
-            user=user,
-            guild_id=guild_id,
-            role_ids=role_ids,
-            joined_at=joined_at,
-            nickname=payload.get("nick"),
-            guild_avatar_hash=payload.get("avatar"),
-            guild_banner_hash=payload.get("banner"),
-            premium_since=premium_since,
-            is_deaf=payload.get("deaf", undefined.UNDEFINED),
-            is_mute=payload.get("mute", undefined.UNDEFINED),
-            is_pending=payload.get("pending", undefined.UNDEFINED),
-            raw_communication_disabled_until=communication_disabled_until,
-            guild_flags=guild_flags,
-        )
+                # If Discord ever does start including this here without warning we don't want to duplicate the entry.
+                if guild_id not in role_id_list:
+                    role_id_list.append(guild_id)
+
+                role_ids = role_ids_cache[raw_role_ids] = tuple(role_id_list)
+
+            member = _deserialize_member(
+                payload, self.deserialize_user(payload["user"]), guild_id, role_ids, parse_timestamp
+            )
+            members[member.user.id] = member
+
+        return members
 
     @typing_extensions.override
     def deserialize_role(
@@ -1976,6 +2312,73 @@ def deserialize_role(
             is_guild_linked_role=is_guild_linked_role,
         )
 
+    @typing_extensions.override
+    def serialize_member(self, member: guild_models.Member) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "user": self.serialize_user(member.user),
+            "guild_id": str(member.guild_id),
+            "nick": member.nickname,
+            "avatar": member.guild_avatar_hash,
+            "banner": member.guild_banner_hash,
+            # The ID of the guild is added back to the role IDs when deserializing the member
+            "roles": [str(role_id) for role_id in member.role_ids if role_id != member.guild_id],
+            "joined_at": _serialize_datetime(member.joined_at),
+            "premium_since": _serialize_datetime(member.premium_since),
+            "communication_disabled_until": _serialize_datetime(member.raw_communication_disabled_until),
+            "flags": int(member.guild_flags),
+        }
+
+        if member.is_deaf is not undefined.UNDEFINED:
+            payload["deaf"] = member.is_deaf
+
+        if member.is_mute is not undefined.UNDEFINED:
+            payload["mute"] = member.is_mute
+
+        if member.is_pending is not undefined.UNDEFINED:
+            payload["pending"] = member.is_pending
+
+        return payload
+
+    @typing_extensions.override
+    def serialize_role(self, role: guild_models.Role) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "id": str(role.id),
+            "name": role.name,
+            "color": int(role.color),
+            "hoist": role.is_hoisted,
+            "icon": role.icon_hash,
+            "unicode_emoji": str(role.unicode_emoji) if role.unicode_emoji is not None else None,
+            "position": role.position,
+            "permissions": str(int(role.permissions)),
+            "managed": role.is_managed,
+            "mentionable": role.is_mentionable,
+        }
+
+        # The boolean tags are set by the key being present, with a value of null
+        tags: dict[str, typing.Any] = {}
+        if role.bot_id is not None:
+            tags["bot_id"] = str(role.bot_id)
+
+        if role.integration_id is not None:
+            tags["integration_id"] = str(role.integration_id)
+
+        if role.is_premium_subscriber_role:
+            tags["premium_subscriber"] = None
+
+        if role.subscription_listing_id is not None:
+            tags["subscription_listing_id"] = str(role.subscription_listing_id)
+
+        if role.is_available_for_purchase:
+            tags["available_for_purchase"] = None
+
+        if role.is_guild_linked_role:
+            tags["guild_connections"] = None
+
+        if tags:
+            payload["tags"] = tags
+
+        return payload
+
     @staticmethod
     def _set_partial_integration_attributes(payload: data_binding.JSONObject) -> _IntegrationFields:
         account_payload = payload["account"]
@@ -2159,6 +2562,56 @@ def deserialize_gateway_guild(
         guild_id = snowflakes.Snowflake(payload["id"])
         return _GatewayGuildDefinition(id=guild_id, payload=payload, entity_factory=self, user_id=user_id)
 
+    @typing_extensions.override
+    def serialize_gateway_guild(self, guild: guild_models.GatewayGuild) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "id": str(guild.id),
+            "name": guild.name,
+            "icon": guild.icon_hash,
+            "features": [str(feature) for feature in guild.features],
+            "splash": guild.splash_hash,
+            "discovery_splash": guild.discovery_splash_hash,
+            "owner_id": str(guild.owner_id),
+            "afk_channel_id": _serialize_snowflake(guild.afk_channel_id),
+            "afk_timeout": int(guild.afk_timeout.total_seconds()),
+            "verification_level": int(guild.verification_level),
+            "default_message_notifications": int(guild.default_message_notifications),
+            "explicit_content_filter": int(guild.explicit_content_filter),
+            "mfa_level": int(guild.mfa_level),
+            "application_id": _serialize_snowflake(guild.application_id),
+            "widget_channel_id": _serialize_snowflake(guild.widget_channel_id),
+            "system_channel_id": _serialize_snowflake(guild.system_channel_id),
+            "system_channel_flags": int(guild.system_channel_flags),
+            "rules_channel_id": _serialize_snowflake(guild.rules_channel_id),
+            "vanity_url_code": guild.vanity_url_code,
+            "description": guild.description,
+            "banner": guild.banner_hash,
+            "premium_tier": int(guild.premium_tier),
+            "preferred_locale": str(guild.preferred_locale),
+            "public_updates_channel_id": _serialize_snowflake(guild.public_updates_channel_id),
+            "nsfw_level": int(guild.nsfw_level),
+        }
+
+        if guild.is_widget_enabled is not None:
+            payload["widget_enabled"] = guild.is_widget_enabled
+
+        if guild.max_video_channel_users is not None:
+            payload["max_video_channel_users"] = guild.max_video_channel_users
+
+        if guild.premium_subscription_count is not None:
+            payload["premium_subscription_count"] = guild.premium_subscription_count
+
+        if guild.is_large is not None:
+            payload["large"] = guild.is_large
+
+        if guild.joined_at is not None:
+            payload["joined_at"] = guild.joined_at.isoformat()
+
+        if guild.member_count is not None:
+            payload["member_count"] = guild.member_count
+
+        return payload
+
     #################
     # INVITE MODELS #
     #################
@@ -3110,6 +3563,51 @@ def _deserialize_text_input(self, payload: data_binding.JSONObject) -> component
             type=component_models.ComponentType(payload["type"]), custom_id=payload["custom_id"], value=payload["value"]
         )
 
+    def _serialize_message_component(
+        self, component: component_models.MessageComponentTypesT
+    ) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {"type": int(component.type)}
+
+        if isinstance(component, component_models.ButtonComponent):
+            payload["style"] = int(component.style)
+            payload["disabled"] = component.is_disabled
+            if component.label is not None:
+                payload["label"] = component.label
+
+            if component.emoji is not None:
+                payload["emoji"] = self._serialize_emoji(component.emoji)
+
+            if component.custom_id is not None:
+                payload["custom_id"] = component.custom_id
+
+            if component.url is not None:
+                payload["url"] = component.url
+
+            return payload
+
+        payload["custom_id"] = component.custom_id
+        payload["placeholder"] = component.placeholder
+        payload["min_values"] = component.min_values
+        payload["max_values"] = component.max_values
+        payload["disabled"] = component.is_disabled
+
+        if isinstance(component, component_models.TextSelectMenuComponent):
+            payload["options"] = [
+                {
+                    "label": option.label,
+                    "value": option.value,
+                    "description": option.description,
+                    "emoji": self._serialize_emoji(option.emoji) if option.emoji is not None else None,
+                    "default": option.is_default,
+                }
+                for option in component.options
+            ]
+
+        elif isinstance(component, component_models.ChannelSelectMenuComponent):
+            payload["channel_types"] = [int(channel_type) for channel_type in component.channel_types]
+
+        return payload
+
     ##################
     # MESSAGE MODELS #
     ##################
@@ -3243,10 +3741,144 @@ def _deserialize_interaction_metadata(
         msg = f"Unrecognised interaction metadata type: {interaction_metadata_type}"
         raise errors.UnrecognisedEntityError(msg)
 
-    @typing_extensions.override
-    def deserialize_partial_message(  # noqa: C901, PLR0912, PLR0915
+    def _serialize_interaction_metadata(
+        self, metadata: base_interactions.PartialInteractionMetadata
+    ) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "id": str(metadata.interaction_id),
+            "type": int(metadata.type),
+            "user": self.serialize_user(metadata.user),
+            "authorizing_integration_owners": {
+                str(int(integration_type)): str(owner_id)
+                for integration_type, owner_id in metadata.authorizing_integration_owners.items()
+            },
+        }
+
+        if metadata.original_response_message_id is not None:
+            payload["original_response_message_id"] = str(metadata.original_response_message_id)
+
+        if isinstance(metadata, command_interactions.CommandInteractionMetadata):
+            if metadata.target_user is not None:
+                payload["target_user"] = self.serialize_user(metadata.target_user)
+
+            if metadata.target_message_id is not None:
+                payload["target_message_id"] = str(metadata.target_message_id)
+
+        elif isinstance(metadata, component_interactions.ComponentInteractionMetadata):
+            payload["interacted_message_id"] = str(metadata.interacted_message_id)
+
+        elif isinstance(metadata, modal_interactions.ModalInteractionMetadata):
+            payload["triggering_interaction_metadata"] = self._serialize_interaction_metadata(
+                metadata.triggering_interaction_metadata
+            )
+
+        return payload
+
+    def _deserialize_message_attachments(self, payload: data_binding.JSONObject) -> list[message_models.Attachment]:
+        return [self._deserialize_message_attachment(attachment) for attachment in payload["attachments"]]
+
+    def _deserialize_message_embeds(self, payload: data_binding.JSONObject) -> list[embed_models.Embed]:
+        return [self.deserialize_embed(embed) for embed in payload["embeds"]]
+
+    def _deserialize_message_poll(self, payload: data_binding.JSONObject) -> poll_models.Poll | None:
+        if "poll" in payload:
+            return self.deserialize_poll(payload["poll"])
+
+        return None
+
+    def _deserialize_message_reactions(self, payload: data_binding.JSONObject) -> list[message_models.Reaction]:
+        return [self._deserialize_message_reaction(reaction) for reaction in payload.get("reactions", ())]
+
+    def _deserialize_message_message_activity(
+        self, payload: data_binding.JSONObject
+    ) -> message_models.MessageActivity | None:
+        if "activity" in payload:
+            return self._deserialize_message_activity(payload["activity"])
+
+        return None
+
+    def _deserialize_message_message_application(
         self, payload: data_binding.JSONObject
-    ) -> message_models.PartialMessage:
+    ) -> message_models.MessageApplication | None:
+        if "application" in payload:
+            return self._deserialize_message_application(payload["application"])
+
+        return None
+
+    def _deserialize_message_message_reference(
+        self, payload: data_binding.JSONObject
+    ) -> message_models.MessageReference | None:
+        if "message_reference" in payload:
+            return self._deserialize_message_reference(payload["message_reference"])
+
+        return None
+
+    def _deserialize_message_referenced_message(
+        self, payload: data_binding.JSONObject
+    ) -> message_models.PartialMessage | None:
+        if referenced_message_payload := payload.get("referenced_message"):
+            return self.deserialize_partial_message(referenced_message_payload)
+
+        return None
+
+    def _deserialize_partial_message_referenced_message(
+        self, payload: data_binding.JSONObject
+    ) -> undefined.UndefinedNoneOr[message_models.Message]:
+        if "referenced_message" not in payload:
+            return undefined.UNDEFINED
+
+        if (referenced_message_payload := payload["referenced_message"]) is not None:
+            return self.deserialize_message(referenced_message_payload)
+
+        return None
+
+    def _deserialize_message_stickers(self, payload: data_binding.JSONObject) -> list[sticker_models.PartialSticker]:
+        if "sticker_items" in payload:
+            return [self.deserialize_partial_sticker(sticker) for sticker in payload["sticker_items"]]
+
+        # This is only here for backwards compatibility as old messages still return this field
+        if "stickers" in payload:
+            return [self.deserialize_partial_sticker(sticker) for sticker in payload["stickers"]]
+
+        return []
+
+    def _deserialize_message_components(
+        self, payload: data_binding.JSONObject
+    ) -> list[component_models.MessageActionRowComponent]:
+        if component_payloads := payload.get("components"):
+            return self._deserialize_components(component_payloads, self._message_component_type_mapping)
+
+        return []
+
+    def _deserialize_message_user_mentions(
+        self, payload: data_binding.JSONObject
+    ) -> dict[snowflakes.Snowflake, user_models.User]:
+        return {u.id: u for u in map(self.deserialize_user, payload.get("mentions", ()))}
+
+    def _deserialize_message_role_mention_ids(self, payload: data_binding.JSONObject) -> list[snowflakes.Snowflake]:
+        return [snowflakes.Snowflake(i) for i in payload.get("mention_roles", ())]
+
+    def _deserialize_message_channel_mentions(
+        self, payload: data_binding.JSONObject
+    ) -> dict[snowflakes.Snowflake, channel_models.PartialChannel]:
+        return {c.id: c for c in map(self.deserialize_partial_channel, payload.get("mention_channels", ()))}
+
+    def _deserialize_message_interaction_metadata(
+        self, payload: data_binding.JSONObject
+    ) -> base_interactions.PartialInteractionMetadata | None:
+        if interaction_metadata_payload := payload.get("interaction_metadata"):
+            return self._deserialize_interaction_metadata(interaction_metadata_payload)
+
+        return None
+
+    def _deserialize_message_thread(self, payload: data_binding.JSONObject) -> channel_models.GuildThreadChannel | None:
+        if thread_payload := payload.get("thread"):
+            return self.deserialize_guild_thread(thread_payload)
+
+        return None
+
+    @typing_extensions.override
+    def deserialize_partial_message(self, payload: data_binding.JSONObject) -> message_models.PartialMessage:
         author: undefined.UndefinedOr[user_models.User] = undefined.UNDEFINED
         if author_pl := payload.get("author"):
             author = self.deserialize_user(author_pl)
@@ -3274,48 +3906,6 @@ def deserialize_partial_message(  # noqa: C901, PLR0912, PLR0915
             else:
                 edited_timestamp = None
 
-        attachments: undefined.UndefinedOr[list[message_models.Attachment]] = undefined.UNDEFINED
-        if "attachments" in payload:
-            attachments = [self._deserialize_message_attachment(attachment) for attachment in payload["attachments"]]
-
-        embeds: undefined.UndefinedOr[list[embed_models.Embed]] = undefined.UNDEFINED
-        if "embeds" in payload:
-            embeds = [self.deserialize_embed(embed) for embed in payload["embeds"]]
-
-        poll: undefined.UndefinedOr[poll_models.Poll] = undefined.UNDEFINED
-        if "poll" in payload:
-            poll = self.deserialize_poll(payload["poll"])
-
-        reactions: undefined.UndefinedOr[list[message_models.Reaction]] = undefined.UNDEFINED
-        if "reactions" in payload:
-            reactions = [self._deserialize_message_reaction(reaction) for reaction in payload["reactions"]]
-
-        activity: undefined.UndefinedOr[message_models.MessageActivity] = undefined.UNDEFINED
-        if "activity" in payload:
-            activity = self._deserialize_message_activity(payload["activity"])
-
-        application: undefined.UndefinedOr[message_models.MessageApplication] = undefined.UNDEFINED
-        if "application" in payload:
-            application = self._deserialize_message_application(payload["application"])
-
-        message_reference: undefined.UndefinedOr[message_models.MessageReference] = undefined.UNDEFINED
-        if "message_reference" in payload:
-            message_reference = self._deserialize_message_reference(payload["message_reference"])
-
-        referenced_message: undefined.UndefinedNoneOr[message_models.Message] = undefined.UNDEFINED
-        if "referenced_message" in payload:
-            if (referenced_message_payload := payload["referenced_message"]) is not None:
-                referenced_message = self.deserialize_message(referenced_message_payload)
-            else:
-                referenced_message = None
-
-        stickers: undefined.UndefinedOr[typing.Sequence[sticker_models.PartialSticker]] = undefined.UNDEFINED
-        if "sticker_items" in payload:
-            stickers = [self.deserialize_partial_sticker(sticker) for sticker in payload["sticker_items"]]
-        # This is only here for backwards compatibility as old messages still return this field
-        elif "stickers" in payload:
-            stickers = [self.deserialize_partial_sticker(sticker) for sticker in payload["stickers"]]
-
         content = payload.get("content", undefined.UNDEFINED)
         if content is not undefined.UNDEFINED:
             content = content or None  # Default to None if content is an empty string
@@ -3324,64 +3914,38 @@ def deserialize_partial_message(  # noqa: C901, PLR0912, PLR0915
         if raw_application_id := payload.get("application_id"):
             application_id = snowflakes.Snowflake(raw_application_id)
 
-        components: undefined.UndefinedOr[list[component_models.MessageActionRowComponent]] = undefined.UNDEFINED
-        if component_payloads := payload.get("components"):
-            components = self._deserialize_components(component_payloads, self._message_component_type_mapping)
-
-        channel_mentions: undefined.UndefinedOr[dict[snowflakes.Snowflake, channel_models.PartialChannel]] = (
-            undefined.UNDEFINED
-        )
-        if raw_channel_mentions := payload.get("mention_channels"):
-            channel_mentions = {c.id: c for c in map(self.deserialize_partial_channel, raw_channel_mentions)}
-
-        user_mentions: undefined.UndefinedOr[dict[snowflakes.Snowflake, user_models.User]] = undefined.UNDEFINED
-        if raw_user_mentions := payload.get("mentions"):
-            user_mentions = {u.id: u for u in map(self.deserialize_user, raw_user_mentions)}
+        fields: dict[str, typing.Any] = {
+            "app": self._app,
+            "id": snowflakes.Snowflake(payload["id"]),
+            "channel_id": snowflakes.Snowflake(payload["channel_id"]),
+            "guild_id": guild_id,
+            "author": author,
+            "member": member,
+            "content": content,
+            "timestamp": timestamp,
+            "edited_timestamp": edited_timestamp,
+            "is_tts": payload.get("tts", undefined.UNDEFINED),
+            "is_pinned": payload.get("pinned", undefined.UNDEFINED),
+            "webhook_id": (
+                snowflakes.Snowflake(payload["webhook_id"]) if "webhook_id" in payload else undefined.UNDEFINED
+            ),
+            "type": message_models.MessageType(payload["type"]) if "type" in payload else undefined.UNDEFINED,
+            "flags": message_models.MessageFlag(payload["flags"]) if "flags" in payload else undefined.UNDEFINED,
+            "nonce": payload.get("nonce", undefined.UNDEFINED),
+            "application_id": application_id,
+            "mentions_everyone": payload.get("mention_everyone", undefined.UNDEFINED),
+        }
 
-        role_mention_ids: undefined.UndefinedOr[list[snowflakes.Snowflake]] = undefined.UNDEFINED
-        if raw_role_mention_ids := payload.get("mention_roles"):
-            role_mention_ids = [snowflakes.Snowflake(i) for i in raw_role_mention_ids]
+        if self._lazy_messages:
+            return _LazyPartialMessage.create(fields, payload, self._partial_message_field_deserializers)
 
-        interaction_metadata = None
-        if interaction_metadata_payload := payload.get("interaction_metadata"):
-            interaction_metadata = self._deserialize_interaction_metadata(interaction_metadata_payload)
+        for name, deserialize in self._partial_message_field_deserializers.items():
+            fields[name] = deserialize(payload)
 
-        return message_models.PartialMessage(
-            app=self._app,
-            id=snowflakes.Snowflake(payload["id"]),
-            channel_id=snowflakes.Snowflake(payload["channel_id"]),
-            guild_id=guild_id,
-            author=author,
-            member=member,
-            content=content,
-            timestamp=timestamp,
-            edited_timestamp=edited_timestamp,
-            is_tts=payload.get("tts", undefined.UNDEFINED),
-            attachments=attachments,
-            embeds=embeds,
-            poll=poll,
-            reactions=reactions,
-            is_pinned=payload.get("pinned", undefined.UNDEFINED),
-            webhook_id=snowflakes.Snowflake(payload["webhook_id"]) if "webhook_id" in payload else undefined.UNDEFINED,
-            type=message_models.MessageType(payload["type"]) if "type" in payload else undefined.UNDEFINED,
-            activity=activity,
-            application=application,
-            message_reference=message_reference,
-            referenced_message=referenced_message,
-            flags=message_models.MessageFlag(payload["flags"]) if "flags" in payload else undefined.UNDEFINED,
-            stickers=stickers,
-            nonce=payload.get("nonce", undefined.UNDEFINED),
-            application_id=application_id,
-            components=components,
-            channel_mentions=channel_mentions,
-            user_mentions=user_mentions,
-            role_mention_ids=role_mention_ids,
-            mentions_everyone=payload.get("mention_everyone", undefined.UNDEFINED),
-            interaction_metadata=interaction_metadata,
-        )
+        return message_models.PartialMessage(**fields)
 
     @typing_extensions.override
-    def deserialize_message(self, payload: data_binding.JSONObject) -> message_models.Message:  # noqa: PLR0912, PLR0915
+    def deserialize_message(self, payload: data_binding.JSONObject) -> message_models.Message:
         author = self.deserialize_user(payload["author"])
 
         guild_id: snowflakes.Snowflake | None = None
@@ -3396,95 +3960,241 @@ def deserialize_message(self, payload: data_binding.JSONObject) -> message_model
         if (raw_edited_timestamp := payload["edited_timestamp"]) is not None:
             edited_timestamp = time.iso8601_datetime_string_to_datetime(raw_edited_timestamp)
 
-        attachments = [self._deserialize_message_attachment(attachment) for attachment in payload["attachments"]]
+        fields: dict[str, typing.Any] = {
+            "app": self._app,
+            "id": snowflakes.Snowflake(payload["id"]),
+            "channel_id": snowflakes.Snowflake(payload["channel_id"]),
+            "guild_id": guild_id,
+            "author": author,
+            "member": member,
+            "content": payload["content"] or None,
+            "timestamp": time.iso8601_datetime_string_to_datetime(payload["timestamp"]),
+            "edited_timestamp": edited_timestamp,
+            "is_tts": payload["tts"],
+            "is_pinned": payload["pinned"],
+            "webhook_id": snowflakes.Snowflake(payload["webhook_id"]) if "webhook_id" in payload else None,
+            "type": message_models.MessageType(payload["type"]),
+            "flags": message_models.MessageFlag(payload["flags"]),
+            "nonce": payload.get("nonce"),
+            "application_id": (
+                snowflakes.Snowflake(payload["application_id"]) if "application_id" in payload else None
+            ),
+            "mentions_everyone": payload.get("mention_everyone", False),
+        }
 
-        embeds = [self.deserialize_embed(embed) for embed in payload["embeds"]]
+        if self._lazy_messages:
+            return _LazyMessage.create(fields, payload, self._message_field_deserializers)
 
-        poll: poll_models.Poll | None = None
-        if "poll" in payload:
-            poll = self.deserialize_poll(payload["poll"])
+        for name, deserialize in self._message_field_deserializers.items():
+            fields[name] = deserialize(payload)
 
-        if "reactions" in payload:
-            reactions = [self._deserialize_message_reaction(reaction) for reaction in payload["reactions"]]
-        else:
-            reactions = []
+        return message_models.Message(**fields)
 
-        activity: message_models.MessageActivity | None = None
-        if "activity" in payload:
-            activity = self._deserialize_message_activity(payload["activity"])
+    def _serialize_emoji(self, emoji: emoji_models.Emoji) -> data_binding.JSONObject:
+        if isinstance(emoji, emoji_models.CustomEmoji):
+            return {"id": str(emoji.id), "name": emoji.name, "animated": emoji.is_animated}
 
-        message_reference: message_models.MessageReference | None = None
-        if "message_reference" in payload:
-            message_reference = self._deserialize_message_reference(payload["message_reference"])
+        return {"id": None, "name": emoji.name}
 
-        referenced_message: message_models.PartialMessage | None = None
-        if referenced_message_payload := payload.get("referenced_message"):
-            referenced_message = self.deserialize_partial_message(referenced_message_payload)
+    def _serialize_received_embed(self, embed: embed_models.Embed) -> data_binding.JSONObject:  # noqa: PLR0912 - Too many branches
+        # Unlike serialize_embed, this keeps the fields which are only ever set by Discord
+        payload: dict[str, typing.Any] = {}
 
-        application: message_models.MessageApplication | None = None
-        if "application" in payload:
-            application = self._deserialize_message_application(payload["application"])
+        if embed.title is not None:
+            payload["title"] = embed.title
 
-        if "sticker_items" in payload:
-            stickers = [self.deserialize_partial_sticker(sticker) for sticker in payload["sticker_items"]]
-        elif "stickers" in payload:
-            stickers = [self.deserialize_partial_sticker(sticker) for sticker in payload["stickers"]]
-        else:
-            stickers = []
+        if embed.description is not None:
+            payload["description"] = embed.description
 
-        thread: channel_models.GuildThreadChannel | None = None
-        if thread_payload := payload.get("thread"):
-            thread = self.deserialize_guild_thread(thread_payload)
+        if embed.url is not None:
+            payload["url"] = embed.url
 
-        components: list[component_models.MessageActionRowComponent]
-        if component_payloads := payload.get("components"):
-            components = self._deserialize_components(component_payloads, self._message_component_type_mapping)
+        if embed.color is not None:
+            payload["color"] = int(embed.color)
 
-        else:
-            components = []
+        if embed.timestamp is not None:
+            payload["timestamp"] = embed.timestamp.isoformat()
 
-        user_mentions = {u.id: u for u in map(self.deserialize_user, payload.get("mentions", ()))}
-        role_mention_ids = [snowflakes.Snowflake(i) for i in payload.get("mention_roles", ())]
-        channel_mentions = {u.id: u for u in map(self.deserialize_partial_channel, payload.get("mention_channels", ()))}
+        for key, media in (("image", embed.image), ("thumbnail", embed.thumbnail), ("video", embed.video)):
+            if media is not None:
+                media_payload: dict[str, typing.Any] = {"url": media.url, "height": media.height, "width": media.width}
+                if media.proxy_url is not None:
+                    media_payload["proxy_url"] = media.proxy_url
 
-        interaction_metadata = None
-        if interaction_metadata_payload := payload.get("interaction_metadata"):
-            interaction_metadata = self._deserialize_interaction_metadata(interaction_metadata_payload)
+                payload[key] = media_payload
 
-        return message_models.Message(
-            app=self._app,
-            id=snowflakes.Snowflake(payload["id"]),
-            channel_id=snowflakes.Snowflake(payload["channel_id"]),
-            guild_id=guild_id,
-            author=author,
-            member=member,
-            content=payload["content"] or None,
-            timestamp=time.iso8601_datetime_string_to_datetime(payload["timestamp"]),
-            edited_timestamp=edited_timestamp,
-            is_tts=payload["tts"],
-            attachments=attachments,
-            embeds=embeds,
-            poll=poll,
-            reactions=reactions,
-            is_pinned=payload["pinned"],
-            webhook_id=snowflakes.Snowflake(payload["webhook_id"]) if "webhook_id" in payload else None,
-            type=message_models.MessageType(payload["type"]),
-            activity=activity,
-            application=application,
-            message_reference=message_reference,
-            referenced_message=referenced_message,
-            flags=message_models.MessageFlag(payload["flags"]),
-            stickers=stickers,
-            nonce=payload.get("nonce"),
-            application_id=snowflakes.Snowflake(payload["application_id"]) if "application_id" in payload else None,
-            components=components,
-            user_mentions=user_mentions,
-            channel_mentions=channel_mentions,
-            role_mention_ids=role_mention_ids,
-            mentions_everyone=payload.get("mention_everyone", False),
-            thread=thread,
-            interaction_metadata=interaction_metadata,
-        )
+        if embed.provider is not None:
+            payload["provider"] = {"name": embed.provider.name, "url": embed.provider.url}
+
+        if embed.author is not None:
+            author_payload: dict[str, typing.Any] = {"name": embed.author.name, "url": embed.author.url}
+            if embed.author.icon is not None:
+                author_payload["icon_url"] = embed.author.icon.url
+                author_payload["proxy_icon_url"] = embed.author.icon.proxy_url
+
+            payload["author"] = author_payload
+
+        if embed.footer is not None:
+            footer_payload: dict[str, typing.Any] = {"text": embed.footer.text}
+            if embed.footer.icon is not None:
+                footer_payload["icon_url"] = embed.footer.icon.url
+                footer_payload["proxy_icon_url"] = embed.footer.icon.proxy_url
+
+            payload["footer"] = footer_payload
+
+        if embed.fields:
+            payload["fields"] = [
+                {"name": field.name, "value": field.value, "inline": field.is_inline} for field in embed.fields
+            ]
+
+        return payload
+
+    def _serialize_message_attachment(self, attachment: message_models.Attachment) -> data_binding.JSONObject:
+        return {
+            "id": str(attachment.id),
+            "filename": attachment.filename,
+            "title": attachment.title,
+            "description": attachment.description,
+            "content_type": attachment.media_type,
+            "size": attachment.size,
+            "url": attachment.url,
+            "proxy_url": attachment.proxy_url,
+            "height": attachment.height,
+            "width": attachment.width,
+            "ephemeral": attachment.is_ephemeral,
+            "duration_secs": attachment.duration,
+            "waveform": attachment.waveform,
+        }
+
+    def _serialize_message_reference(self, reference: message_models.MessageReference) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {"channel_id": str(reference.channel_id)}
+
+        if reference.id is not None:
+            payload["message_id"] = str(reference.id)
+
+        if reference.guild_id is not None:
+            payload["guild_id"] = str(reference.guild_id)
+
+        return payload
+
+    @typing_extensions.override
+    def serialize_message(  # noqa: C901, PLR0912, PLR0915 - Too complex, too many branches, too many statements
+        self, message: message_models.PartialMessage
+    ) -> data_binding.JSONObject:
+        # We rather keep everything we can here inline, as messages have a lot of optional fields.
+        payload: dict[str, typing.Any] = {"id": str(message.id), "channel_id": str(message.channel_id)}
+
+        if message.guild_id is not None:
+            payload["guild_id"] = str(message.guild_id)
+
+        if message.author is not undefined.UNDEFINED:
+            payload["author"] = self.serialize_user(message.author)
+
+        if message.member:
+            payload["member"] = self.serialize_member(message.member)
+
+        if message.content is not undefined.UNDEFINED:
+            payload["content"] = message.content or ""
+
+        if message.timestamp is not undefined.UNDEFINED:
+            payload["timestamp"] = message.timestamp.isoformat()
+
+        if message.edited_timestamp is not undefined.UNDEFINED:
+            payload["edited_timestamp"] = _serialize_datetime(message.edited_timestamp)
+
+        if message.is_tts is not undefined.UNDEFINED:
+            payload["tts"] = message.is_tts
+
+        if message.is_pinned is not undefined.UNDEFINED:
+            payload["pinned"] = message.is_pinned
+
+        if message.mentions_everyone is not undefined.UNDEFINED:
+            payload["mention_everyone"] = message.mentions_everyone
+
+        if message.user_mentions is not undefined.UNDEFINED:
+            payload["mentions"] = [self.serialize_user(user) for user in message.user_mentions.values()]
+
+        if message.role_mention_ids is not undefined.UNDEFINED:
+            payload["mention_roles"] = [str(role_id) for role_id in message.role_mention_ids]
+
+        if message.channel_mentions is not undefined.UNDEFINED:
+            payload["mention_channels"] = [
+                {"id": str(channel.id), "name": channel.name, "type": int(channel.type)}
+                for channel in message.channel_mentions.values()
+            ]
+
+        if message.attachments is not undefined.UNDEFINED:
+            payload["attachments"] = [self._serialize_message_attachment(a) for a in message.attachments]
+
+        if message.embeds is not undefined.UNDEFINED:
+            payload["embeds"] = [self._serialize_received_embed(embed) for embed in message.embeds]
+
+        if message.reactions is not undefined.UNDEFINED:
+            payload["reactions"] = [
+                {"count": reaction.count, "emoji": self._serialize_emoji(reaction.emoji), "me": reaction.is_me}
+                for reaction in message.reactions
+            ]
+
+        if message.stickers is not undefined.UNDEFINED:
+            payload["sticker_items"] = [
+                {"id": str(sticker.id), "name": sticker.name, "format_type": int(sticker.format_type)}
+                for sticker in message.stickers
+            ]
+
+        if message.webhook_id:
+            payload["webhook_id"] = str(message.webhook_id)
+
+        if message.type is not undefined.UNDEFINED:
+            payload["type"] = int(message.type)
+
+        if message.flags is not undefined.UNDEFINED:
+            payload["flags"] = int(message.flags)
+
+        if message.nonce:
+            payload["nonce"] = message.nonce
+
+        if message.application_id:
+            payload["application_id"] = str(message.application_id)
+
+        if message.activity:
+            payload["activity"] = {"type": int(message.activity.type), "party_id": message.activity.party_id}
+
+        if message.application:
+            payload["application"] = {
+                "id": str(message.application.id),
+                "name": message.application.name,
+                "description": message.application.description or "",
+                "icon": message.application.icon_hash,
+                "cover_image": message.application.cover_image_hash,
+            }
+
+        if message.message_reference:
+            payload["message_reference"] = self._serialize_message_reference(message.message_reference)
+
+        if message.referenced_message is not undefined.UNDEFINED:
+            payload["referenced_message"] = (
+                self.serialize_message(message.referenced_message) if message.referenced_message else None
+            )
+
+        if message.components is not undefined.UNDEFINED:
+            payload["components"] = [
+                {
+                    "type": int(row.type),
+                    "components": [self._serialize_message_component(component) for component in row.components],
+                }
+                for row in message.components
+            ]
+
+        if message.poll:
+            payload["poll"] = self._serialize_poll(message.poll)
+
+        if message.interaction_metadata:
+            payload["interaction_metadata"] = self._serialize_interaction_metadata(message.interaction_metadata)
+
+        if isinstance(message, message_models.Message) and message.thread:
+            payload["thread"] = self._serialize_guild_thread(message.thread)
+
+        return payload
 
     ###################
     # PRESENCE MODELS #
@@ -3603,6 +4313,83 @@ def deserialize_member_presence(
             client_status=client_status,
         )
 
+    def _serialize_activity(self, activity: presence_models.RichActivity) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "name": activity.name,
+            "type": int(activity.type),
+            "url": activity.url,
+            "created_at": _serialize_unix_epoch(activity.created_at),
+            "details": activity.details,
+            "state": activity.state,
+            "buttons": list(activity.buttons),
+        }
+
+        if activity.timestamps is not None:
+            timestamps_payload: dict[str, int] = {}
+            if activity.timestamps.start is not None:
+                timestamps_payload["start"] = _serialize_unix_epoch(activity.timestamps.start)
+
+            if activity.timestamps.end is not None:
+                timestamps_payload["end"] = _serialize_unix_epoch(activity.timestamps.end)
+
+            payload["timestamps"] = timestamps_payload
+
+        if activity.application_id is not None:
+            payload["application_id"] = str(activity.application_id)
+
+        if activity.emoji is not None:
+            payload["emoji"] = self._serialize_emoji(activity.emoji)
+
+        if activity.party is not None:
+            party_payload: dict[str, typing.Any] = {"id": activity.party.id}
+            if activity.party.current_size is not None:
+                party_payload["size"] = [activity.party.current_size, activity.party.max_size]
+
+            payload["party"] = party_payload
+
+        if activity.assets is not None:
+            payload["assets"] = {
+                "large_image": activity.assets.large_image,
+                "large_text": activity.assets.large_text,
+                "small_image": activity.assets.small_image,
+                "small_text": activity.assets.small_text,
+            }
+
+        if activity.secrets is not None:
+            payload["secrets"] = {
+                "join": activity.secrets.join,
+                "spectate": activity.secrets.spectate,
+                "match": activity.secrets.match,
+            }
+
+        if activity.is_instance is not None:
+            payload["instance"] = activity.is_instance
+
+        if activity.flags is not None:
+            payload["flags"] = int(activity.flags)
+
+        return payload
+
+    @typing_extensions.override
+    def serialize_member_presence(self, presence: presence_models.MemberPresence) -> data_binding.JSONObject:
+        client_status = presence.client_status
+        return {
+            "user": {"id": str(presence.user_id)},
+            "guild_id": str(presence.guild_id),
+            "status": str(presence.visible_status),
+            "activities": [self._serialize_activity(activity) for activity in presence.activities],
+            # Offline clients are left out, the same as Discord does
+            "client_status": {
+                platform: str(status)
+                for platform, status in (
+                    ("desktop", client_status.desktop),
+                    ("mobile", client_status.mobile),
+                    ("web", client_status.web),
+                )
+                if status != presence_models.Status.OFFLINE
+            },
+        }
+
     ##########################
     # SCHEDULED EVENT MODELS #
     ##########################
@@ -3810,23 +4597,22 @@ def _set_user_attributes(payload: data_binding.JSONObject) -> _UserFields:
 
     @typing_extensions.override
     def deserialize_user(self, payload: data_binding.JSONObject) -> user_models.User:
-        user_fields = self._set_user_attributes(payload)
-        flags = (
-            user_models.UserFlag(payload["public_flags"]) if "public_flags" in payload else user_models.UserFlag.NONE
-        )
-        return user_models.UserImpl(
-            app=self._app,
-            id=user_fields.id,
-            discriminator=user_fields.discriminator,
-            username=user_fields.username,
-            global_name=payload.get("global_name"),
-            avatar_hash=user_fields.avatar_hash,
-            banner_hash=user_fields.banner_hash,
-            accent_color=user_fields.accent_color,
-            is_bot=user_fields.is_bot,
-            is_system=user_fields.is_system,
-            flags=flags,
-        )
+        return _deserialize_user(payload, self._app)
+
+    @typing_extensions.override
+    def serialize_user(self, user: user_models.User) -> data_binding.JSONObject:
+        return {
+            "id": str(user.id),
+            "username": user.username,
+            "global_name": user.global_name,
+            "discriminator": user.discriminator,
+            "avatar": user.avatar_hash,
+            "banner": user.banner_hash,
+            "accent_color": int(user.accent_color) if user.accent_color is not None else None,
+            "bot": user.is_bot,
+            "system": user.is_system,
+            "public_flags": int(user.flags),
+        }
 
     @typing_extensions.override
     def deserialize_my_user(self, payload: data_binding.JSONObject) -> user_models.OwnUser:
@@ -4032,6 +4818,40 @@ def _deserialize_poll_media(self, payload: data_binding.JSONObject) -> poll_mode
             text=payload.get("text"), emoji=self.deserialize_emoji(payload["emoji"]) if "emoji" in payload else None
         )
 
+    def _serialize_poll_media(self, media: poll_models.PollMedia) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {}
+
+        if media.text is not None:
+            payload["text"] = media.text
+
+        if media.emoji is not None:
+            payload["emoji"] = self._serialize_emoji(media.emoji)
+
+        return payload
+
+    def _serialize_poll(self, poll: poll_models.Poll) -> data_binding.JSONObject:
+        payload: dict[str, typing.Any] = {
+            "question": self._serialize_poll_media(poll.question),
+            "answers": [
+                {"answer_id": answer.answer_id, "poll_media": self._serialize_poll_media(answer.poll_media)}
+                for answer in poll.answers
+            ],
+            "expiry": _serialize_datetime(poll.expiry),
+            "allow_multiselect": poll.allow_multiselect,
+            "layout_type": int(poll.layout_type),
+        }
+
+        if poll.results is not None:
+            payload["results"] = {
+                "is_finalized": poll.results.is_finalized,
+                "answer_counts": [
+                    {"id": count.id, "count": count.count, "me_voted": count.me_voted}
+                    for count in poll.results.answer_counts
+                ],
+            }
+
+        return payload
+
     @typing_extensions.override
     def deserialize_poll(self, payload: data_binding.JSONObject) -> poll_models.Poll:
         answers: list[poll_models.PollAnswer] = []
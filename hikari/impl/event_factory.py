@@ -931,10 +931,7 @@ def deserialize_guild_member_chunk_event(
         guild_id = snowflakes.Snowflake(payload["guild_id"])
         index = int(payload["chunk_index"])
         count = int(payload["chunk_count"])
-        members = {
-            snowflakes.Snowflake(m["user"]["id"]): self._app.entity_factory.deserialize_member(m, guild_id=guild_id)
-            for m in payload["members"]
-        }
+        members = self._app.entity_factory.deserialize_members(payload["members"], guild_id=guild_id)
         # Note, these IDs may be returned as ints or strings based on whether they're over a certain value.
         not_found = [snowflakes.Snowflake(sn) for sn in payload["not_found"]] if "not_found" in payload else []
 
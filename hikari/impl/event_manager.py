@@ -25,12 +25,10 @@
 __all__: typing.Sequence[str] = ("EventManagerImpl",)
 
 import asyncio
-import base64
+import functools
 import logging
-import random
 import typing
 
-from hikari import errors
 from hikari import intents as intents_
 from hikari import presences as presences_
 from hikari import snowflakes
@@ -52,10 +50,13 @@
 from hikari.events import user_events
 from hikari.events import voice_events
 from hikari.impl import event_manager_base
-from hikari.internal import time
+from hikari.impl import member_chunker
+from hikari.internal import typing_extensions
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
+
     from hikari import guilds
     from hikari import invites
     from hikari import voices
@@ -67,38 +68,67 @@
 
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.event_manager")
-
-
-def _fixed_size_nonce() -> str:
-    # This generates nonces of length 28 for use in member chunking.
-    head = time.monotonic_ns().to_bytes(8, "big")
-    tail = random.getrandbits(92).to_bytes(12, "big")
-    return base64.b64encode(head + tail).decode("ascii")
-
-
-async def _request_guild_members(
-    shard: gateway_shard.GatewayShard,
-    guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
-    *,
-    include_presences: bool,
-    nonce: str,
-) -> None:
-    try:
-        await shard.request_guild_members(guild, include_presences=include_presences, nonce=nonce)
-
-    # Ignore errors raised by a shard shutting down
-    except errors.ComponentStateConflictError:
-        pass
+_T = typing.TypeVar("_T")
 
 
 class EventManagerImpl(event_manager_base.EventManagerBase):
-    """Provides event handling logic for Discord events."""
+    """Provides event handling logic for Discord events.
+
+    Parameters
+    ----------
+    entity_factory
+        The entity factory to use.
+    event_factory
+        The event factory to use.
+    intents
+        The intents the shards are using.
+    auto_chunk_members
+        Whether to request the members of guilds when needed.
+    max_outstanding_chunk_requests
+        The maximum number of guilds to have member chunks in flight for at
+        once, per shard.
+    cache
+        The cache to keep up to date, if any.
+    eager_dispatch
+        Whether to start the tasks of the consumers and listeners eagerly,
+        running them until they first suspend. See
+        [`hikari.impl.event_manager_base.EventManagerBase`][].
+    dispatch_water_marks
+        The `(low, high)` water marks for the number of raw events of all the
+        shards still being handled, used to pause reading from the gateway.
+        See [`hikari.impl.event_manager_base.EventManagerBase`][].
+    shard_dispatch_water_marks
+        The `(low, high)` water marks for the number of raw events of a single
+        shard still being handled, used to pause reading from the gateway.
+        See [`hikari.impl.event_manager_base.EventManagerBase`][].
+    ordered_dispatch
+        Whether to handle the events of the same guild one after another, in
+        the order they were received. Listeners must not wait for later events
+        of the same guild, as those are only handled once the listener returns.
+        See [`hikari.impl.event_manager_base.EventManagerBase`][].
+    executor
+        The executor to offload the deserialization of the members of large
+        guilds to (see `offload_member_count`), or [`None`][] to use the
+        default executor of the event loop. This is the default.
+
+        This must run the calls in the current process, such as a
+        [`concurrent.futures.ThreadPoolExecutor`][].
+    offload_member_count
+        The number of members in a `GUILD_CREATE` payload above which its
+        entities are deserialized in the `executor` instead of blocking the
+        event loop.
+
+        Defaults to [`None`][], which means nothing is offloaded.
+    """
 
     __slots__: typing.Sequence[str] = (
         "_auto_chunk_members",
         "_cache",
         "_entity_factory",
-        "_guild_member_request_tasks",
+        "_executor",
+        "_guild_chunkers",
+        "_max_outstanding_chunk_requests",
+        "_offload_member_count",
     )
 
     def __init__(
@@ -109,19 +139,55 @@ def __init__(
         /,
         *,
         auto_chunk_members: bool = True,
+        max_outstanding_chunk_requests: int = 5,
         cache: cache_.MutableCache | None = None,
+        eager_dispatch: bool = False,
+        dispatch_water_marks: tuple[int, int] | None = None,
+        shard_dispatch_water_marks: tuple[int, int] | None = None,
+        ordered_dispatch: bool = False,
+        executor: concurrent.futures.Executor | None = None,
+        offload_member_count: int | None = None,
     ) -> None:
         self._cache = cache
         self._auto_chunk_members = auto_chunk_members
         self._entity_factory = entity_factory
-        self._guild_member_request_tasks: set[asyncio.Task[None]] = set()
+        self._executor = executor
+        self._guild_chunkers: dict[int, member_chunker.GuildChunker] = {}
+        self._max_outstanding_chunk_requests = max_outstanding_chunk_requests
+        self._offload_member_count = offload_member_count
 
         components = cache.settings.components if cache else config.CacheComponents.NONE
-        super().__init__(event_factory=event_factory, intents=intents, cache_components=components)
+        super().__init__(
+            event_factory=event_factory,
+            intents=intents,
+            cache_components=components,
+            eager_dispatch=eager_dispatch,
+            dispatch_water_marks=dispatch_water_marks,
+            shard_dispatch_water_marks=shard_dispatch_water_marks,
+            ordered_dispatch=ordered_dispatch,
+        )
+
+    @property
+    def guild_chunkers(self) -> typing.Mapping[int, member_chunker.GuildChunker]:
+        """Mapping of shard ID to the scheduler of the member chunk requests of that shard.
+
+        Schedulers are only created once their shard needs to request members.
+        """
+        return self._guild_chunkers
 
     def _cache_enabled_for(self, components: config.CacheComponents, /) -> bool:
         return self._cache is not None and (self._cache.settings.components & components) == components
 
+    async def _deserialize_guild_create(
+        self, payload: data_binding.JSONObject, deserialize: typing.Callable[[], _T]
+    ) -> _T:
+        # Deserializing the members of a very large guild blocks the event loop for long enough
+        # to delay the heartbeats of every shard, so it is offloaded to the executor instead.
+        if self._offload_member_count is not None and len(payload.get("members", ())) > self._offload_member_count:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, deserialize)
+
+        return deserialize()
+
     @event_manager_base.filtered(shard_events.ShardReadyEvent, config.CacheComponents.ME)
     async def on_ready(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway-events#ready for more info."""
@@ -274,9 +340,13 @@ async def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too comple
             return
 
         if unavailable is not None and self._enabled_for_event(guild_events.GuildAvailableEvent):
-            event = self._event_factory.deserialize_guild_available_event(shard, payload)
+            event = await self._deserialize_guild_create(
+                payload, functools.partial(self._event_factory.deserialize_guild_available_event, shard, payload)
+            )
         elif unavailable is None and self._enabled_for_event(guild_events.GuildJoinEvent):
-            event = self._event_factory.deserialize_guild_join_event(shard, payload)
+            event = await self._deserialize_guild_create(
+                payload, functools.partial(self._event_factory.deserialize_guild_join_event, shard, payload)
+            )
         else:
             event = None
 
@@ -302,7 +372,11 @@ async def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too comple
             stickers = gd.stickers() if self._cache_enabled_for(config.CacheComponents.GUILD_STICKERS) else None
             guild = gd.guild() if self._cache_enabled_for(config.CacheComponents.GUILDS) else None
             guild_id = gd.id
-            members = gd.members() if self._cache_enabled_for(config.CacheComponents.MEMBERS) else None
+            members = (
+                await self._deserialize_guild_create(payload, gd.members)
+                if self._cache_enabled_for(config.CacheComponents.MEMBERS)
+                else None
+            )
             presences = gd.presences() if self._cache_enabled_for(config.CacheComponents.PRESENCES) else None
             roles = gd.roles() if self._cache_enabled_for(config.CacheComponents.ROLES) else None
             voice_states = gd.voice_states() if self._cache_enabled_for(config.CacheComponents.VOICE_STATES) else None
@@ -404,19 +478,23 @@ async def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too comple
                 or self._enabled_for_event(shard_events.MemberChunkEvent)
             )
         ):
-            nonce = f"{shard.id}.{_fixed_size_nonce()}"
-
-            if event:
-                event.chunk_nonce = nonce
+            chunker = self._guild_chunkers.get(shard.id)
+            # The shard is replaced when the bot is restarted, so the old chunker can no longer be used
+            if chunker is None or chunker.shard is not shard:
+                if chunker is not None:
+                    chunker.close()
+
+                chunker = self._guild_chunkers[shard.id] = member_chunker.GuildChunker(
+                    shard, max_outstanding=self._max_outstanding_chunk_requests
+                )
 
-            # We create a task here instead of awaiting the result to avoid any rate-limits from delaying dispatch.
-            task = asyncio.create_task(
-                _request_guild_members(shard, guild_id, include_presences=presences_declared, nonce=nonce),
-                name=f"{shard.id}:{guild_id} guild create members request",
+            # The request is only queued here, so that rate-limits do not delay the dispatch.
+            nonce = chunker.request(
+                guild_id, include_presences=presences_declared, member_count=payload.get("member_count", 0)
             )
 
-            self._guild_member_request_tasks.add(task)
-            task.add_done_callback(self._guild_member_request_tasks.discard)
+            if event:
+                event.chunk_nonce = nonce
 
         if event:
             await self.dispatch(event)
@@ -616,11 +694,29 @@ async def on_guild_member_update(self, shard: gateway_shard.GatewayShard, payloa
 
         await self.dispatch(event)
 
+    @typing_extensions.override
+    def _is_payload_required(
+        self,
+        callback: typing.Callable[..., typing.Any],
+        shard: gateway_shard.GatewayShard,
+        payload: data_binding.JSONObject,
+    ) -> bool:
+        # Chunks requested by the chunker have to be recorded even if no listener accepts them,
+        # otherwise the requests would hold their slots until they time out.
+        return (
+            callback == self.on_guild_members_chunk
+            and (chunker := self._guild_chunkers.get(shard.id)) is not None
+            and chunker.is_in_flight(payload.get("nonce"))
+        )
+
     @event_manager_base.filtered(shard_events.MemberChunkEvent, config.CacheComponents.MEMBERS)
     async def on_guild_members_chunk(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway-events#guild-members-chunk for more info."""
         event = self._event_factory.deserialize_guild_member_chunk_event(shard, payload)
 
+        if chunker := self._guild_chunkers.get(shard.id):
+            chunker.record_chunk(event)
+
         if self._cache:
             for member in event.members.values():
                 self._cache.set_member(member)
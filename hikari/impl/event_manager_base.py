@@ -25,9 +25,13 @@
 __all__: typing.Sequence[str] = ("EventManagerBase", "EventStream", "filtered")
 
 import asyncio
+import collections
+import contextvars
+import functools
 import inspect
 import itertools
 import logging
+import operator
 import sys
 import types
 import typing
@@ -45,13 +49,17 @@
 from hikari.internal import aio
 from hikari.internal import fast_protocol
 from hikari.internal import reflect
+from hikari.internal import time
 from hikari.internal import typing_extensions
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Self
 
+    from hikari import channels
+    from hikari import guilds
     from hikari import intents as intents_
+    from hikari import snowflakes
     from hikari.api import event_factory as event_factory_
     from hikari.api import shard as gateway_shard
     from hikari.internal import data_binding
@@ -64,6 +72,22 @@
         typing.Optional[event_manager_.PredicateT[base_events.EventT]], "asyncio.Future[base_events.EventT]"
     ]
     _WaiterMapT = dict[type[base_events.EventT], set[_WaiterT[base_events.EventT]]]
+    # Receives the events with a matching key, returning whether it should be removed
+    _KeyedSinkT = typing.Callable[[base_events.Event], bool]
+    _KeyByT = typing.Union[str, event_manager_.KeyExtractorT[typing.Any]]
+    # The listeners of all the classes an event type is dispatched as, their raw payload filters
+    # and coalescers (if any of them have one) and whether any of the classes have waiters
+    _DispatchEntryT = tuple[
+        tuple[event_manager_.CallbackT[base_events.EventT], ...],
+        typing.Optional[tuple["_PayloadFilter | None", ...]],
+        typing.Optional[tuple["_Coalescer | None", ...]],
+        bool,
+    ]
+    _ListenerOptionT = typing.TypeVar("_ListenerOptionT", "_PayloadFilter", "_Coalescer")
+    # The fields of a raw payload which hold the guild and channel IDs
+    _IdFieldsT = tuple[str, str]
+    # The raw events of a partition which are still to be handled, in the order they were received
+    _PartitionT = collections.deque[tuple["_Consumer", gateway_shard.GatewayShard, data_binding.JSONObject]]
 
     _EventManagerBaseT = typing.TypeVar("_EventManagerBaseT", bound="EventManagerBase")
     _UnboundMethodT = typing.Callable[
@@ -79,6 +103,30 @@
     _UNIONS = frozenset((typing.Union,))
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.event_manager")
+# The raw payload the events currently being dispatched were deserialized from and the fields
+# holding its guild and channel IDs, used to apply the payload filters
+_RAW_PAYLOAD: typing.Final[contextvars.ContextVar[tuple[data_binding.JSONObject, _IdFieldsT] | None]] = (
+    contextvars.ContextVar("hikari.event_manager.raw_payload", default=None)
+)
+# The key of the ordered dispatch partition whose events are currently being handled
+_ORDERED_PARTITION: typing.Final[contextvars.ContextVar[str | int | None]] = contextvars.ContextVar(
+    "hikari.event_manager.ordered_partition", default=None
+)
+
+# Events for which the guild or channel ID is in the "id" field instead of "guild_id" or "channel_id"
+_GUILD_EVENT_NAMES: typing.Final[frozenset[str]] = frozenset(("GUILD_CREATE", "GUILD_UPDATE", "GUILD_DELETE"))
+_CHANNEL_EVENT_NAMES: typing.Final[frozenset[str]] = frozenset(("CHANNEL_CREATE", "CHANNEL_UPDATE", "CHANNEL_DELETE"))
+_DEFAULT_ID_FIELDS: typing.Final[_IdFieldsT] = ("guild_id", "channel_id")
+
+
+def _id_fields(event_name: str) -> _IdFieldsT:
+    if event_name in _GUILD_EVENT_NAMES:
+        return ("id", "channel_id")
+
+    if event_name in _CHANNEL_EVENT_NAMES:
+        return ("guild_id", "id")
+
+    return _DEFAULT_ID_FIELDS
 
 
 @typing.runtime_checkable
@@ -111,6 +159,54 @@ async def call_weak_method(event: base_events.Event) -> None:
     return call_weak_method
 
 
+def _generate_weak_sink(reference: weakref.WeakMethod[typing.Any]) -> _KeyedSinkT:
+    def call_weak_method(event: base_events.Event) -> bool:
+        method = reference()
+        if method is None:
+            # The stream was garbage collected without being closed, so stop sending it events
+            return True
+
+        method(event)
+        return False
+
+    return call_weak_method
+
+
+def _resolve_waiter(
+    predicate: event_manager_.PredicateT[base_events.EventT] | None,
+    future: asyncio.Future[base_events.EventT],
+    event: base_events.EventT,
+) -> bool:
+    if future.done():
+        return True
+
+    try:
+        if predicate and not predicate(event):
+            return False
+    # We need to use a blind except here as it is a user provided predicate
+    except Exception as ex:  # noqa: BLE001
+        future.set_exception(ex)
+    else:
+        future.set_result(event)
+
+    return True
+
+
+@attrs.define(weakref_slot=False)
+class _KeyIndex:
+    key_by: _KeyByT = attrs.field()
+    """The attribute path or function the events are indexed by."""
+
+    extract: typing.Callable[[base_events.Event], typing.Hashable] = attrs.field(init=False)
+    """The function to get the key of an event with."""
+
+    sinks: dict[typing.Hashable, list[_KeyedSinkT]] = attrs.field(init=False, factory=dict)
+    """The sinks waiting on each key."""
+
+    def __attrs_post_init__(self) -> None:
+        self.extract = operator.attrgetter(self.key_by) if isinstance(self.key_by, str) else self.key_by
+
+
 class EventStream(event_manager_.EventStream[base_events.EventT]):
     """An implementation of an event [`hikari.api.event_manager.EventStream`][] class.
 
@@ -128,9 +224,15 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
         "_event_manager",
         "_event_type",
         "_filters",
+        "_key",
+        "_key_by",
         "_limit",
+        "_overflow",
+        "_producers",
         "_queue",
         "_registered_listener",
+        "_registered_sink",
+        "_reserved",
         "_timeout",
     )
 
@@ -143,18 +245,44 @@ def __init__(
         *,
         timeout: float | None,
         limit: int | None = None,
+        overflow: str = event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+        key_by: _KeyByT | None = None,
+        key: typing.Hashable = None,
     ) -> None:
         self._active = False
+        self._overflow = event_manager_.StreamOverflowPolicy(overflow)
+
+        if key_by is not None and not isinstance(event_manager, EventManagerBase):
+            msg = "keyed event streams are only supported by EventManagerBase"
+            raise TypeError(msg)
+
+        if key_by is not None and self._overflow is event_manager_.StreamOverflowPolicy.BLOCK:
+            # Keyed events are pushed synchronously while dispatching, so there is nothing to hold
+            msg = "keyed event streams cannot block the dispatch of events"
+            raise ValueError(msg)
+
         self._event: asyncio.Event | None = None
         self._event_manager = event_manager
         self._event_type = event_type
         self._filters: iterators.All[base_events.EventT] = iterators.All(())
+        self._key = key
+        self._key_by = key_by
         self._limit = limit
-        self._queue: list[base_events.EventT] = []
+        # Only DROP_OLDEST bounds the queue itself, which then drops the oldest events on its own.
+        # DROP_NEWEST is applied when enqueueing and BLOCK holds the listener until there is space.
+        self._queue: collections.deque[base_events.EventT] = collections.deque(
+            maxlen=limit if self._overflow is event_manager_.StreamOverflowPolicy.DROP_OLDEST else None
+        )
+        # The producers blocked until there is space in the queue, in the order they arrived in
+        self._producers: collections.deque[asyncio.Future[None]] = collections.deque()
+        # The registered wrapping function for the weak ref to this class's _listener method.
         self._registered_listener: (
             typing.Callable[[base_events.EventT], typing.Coroutine[typing.Any, typing.Any, None]] | None
         ) = None
-        # The registered wrapping function for the weak ref to this class's _listener method.
+        # The registered wrapping function for the weak ref to this class's _push method, for keyed streams.
+        self._registered_sink: _KeyedSinkT | None = None
+        # The amount of queue slots promised to released producers which have not used them yet
+        self._reserved = 0
         self._timeout = timeout
 
     @typing_extensions.override
@@ -174,18 +302,12 @@ async def __anext__(self) -> base_events.EventT:
             msg = "stream must be started with before entering it"
             raise TypeError(msg)
 
-        while not self._queue:
-            if not self._event:
-                self._event = asyncio.Event()
-
-            try:
-                await asyncio.wait_for(self._event.wait(), timeout=self._timeout)
-            except asyncio.TimeoutError:
-                raise StopAsyncIteration from None
+        if not await self._wait_for_events(self._timeout):
+            raise StopAsyncIteration
 
-            self._event.clear()
-
-        return self._queue.pop(0)
+        event = self._queue.popleft()
+        self._release_producers()
+        return event
 
     @typing_extensions.override
     def __await__(self) -> typing.Generator[None, None, typing.Sequence[base_events.EventT]]:
@@ -207,13 +329,83 @@ async def _await_all(self) -> typing.Sequence[base_events.EventT]:
         return result
 
     async def _listener(self, event: base_events.EventT) -> None:
-        if not self._filters(event) or (self._limit is not None and len(self._queue) >= self._limit):
+        if not self._filters(event):
+            return
+
+        if self._overflow is event_manager_.StreamOverflowPolicy.BLOCK and self._limit is not None:
+            await self._wait_for_space(self._limit)
+
+            if not self._active:
+                return
+
+        self._enqueue(event)
+
+    def _push(self, event: base_events.EventT) -> None:
+        if self._filters(event):
+            self._enqueue(event)
+
+    def _enqueue(self, event: base_events.EventT) -> None:
+        if (
+            self._limit is not None
+            and len(self._queue) >= self._limit
+            and self._overflow is event_manager_.StreamOverflowPolicy.DROP_NEWEST
+        ):
             return
 
         self._queue.append(event)
         if self._event:
             self._event.set()
 
+    async def _wait_for_events(self, timeout: float | None) -> bool:
+        while not self._queue:
+            if not self._event:
+                self._event = asyncio.Event()
+
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return False
+
+            self._event.clear()
+
+        return True
+
+    async def _wait_for_space(self, limit: int) -> None:
+        # Producers which are already waiting go first, to keep the events in order
+        if not self._producers and len(self._queue) + self._reserved < limit:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._producers.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                try:
+                    self._producers.remove(future)
+                except ValueError:
+                    pass
+
+            else:
+                # The space was already reserved for this producer, so pass it on
+                self._reserved -= 1
+                self._release_producers()
+
+            raise
+
+        self._reserved -= 1
+
+    def _release_producers(self) -> None:
+        if self._limit is None:
+            return
+
+        while self._producers and (not self._active or len(self._queue) + self._reserved < self._limit):
+            future = self._producers.popleft()
+            if not future.done():
+                future.set_result(None)
+                self._reserved += 1
+
     @typing_extensions.override
     def close(self) -> None:
         if self._active and self._registered_listener is not None:
@@ -224,7 +416,47 @@ def close(self) -> None:
 
             self._registered_listener = None
 
+        if self._active and self._registered_sink is not None:
+            assert isinstance(self._event_manager, EventManagerBase)
+            assert self._key_by is not None
+            self._event_manager._remove_keyed_sink(  # noqa: SLF001 - Only used by the streams of the manager
+                self._event_type, self._key_by, self._key, self._registered_sink
+            )
+            self._registered_sink = None
+
         self._active = False
+        # Let go of all the blocked producers, which drop their events now that the stream is closed
+        self._release_producers()
+
+    @typing_extensions.override
+    async def batches(
+        self, max_size: int, max_latency: float | None = None
+    ) -> typing.AsyncIterator[typing.Sequence[base_events.EventT]]:
+        if max_size < 1:
+            msg = "'max_size' must be greater than 0"
+            raise ValueError(msg)
+
+        if not self._active:
+            msg = "stream must be started with before entering it"
+            raise TypeError(msg)
+
+        while await self._wait_for_events(self._timeout):
+            deadline = None if max_latency is None else time.monotonic() + max_latency
+            batch: list[base_events.EventT] = []
+
+            while True:
+                while self._queue and len(batch) < max_size:
+                    batch.append(self._queue.popleft())
+
+                self._release_producers()
+
+                if len(batch) >= max_size or deadline is None:
+                    break
+
+                if not await self._wait_for_events(deadline - time.monotonic()):
+                    break
+
+            yield batch
 
     @typing_extensions.override
     def filter(
@@ -232,7 +464,8 @@ def filter(
     ) -> Self:
         filter_ = self._map_predicates_and_attr_getters("filter", *predicates, **attrs)
         if self._active:
-            self._queue = [entry for entry in self._queue if filter_(entry)]
+            self._queue = collections.deque(filter(filter_, self._queue), maxlen=self._queue.maxlen)
+            self._release_producers()
 
         self._filters |= filter_
         return self
@@ -244,10 +477,20 @@ def open(self) -> None:
             # listener with a weakref then try to close this on deletion. While this may lead to their consoles being
             # spammed, this is a small price to pay as it'll be way more obvious what's wrong than if we just left them
             # with a vague ominous memory leak.
-            reference = weakref.WeakMethod(self._listener)
-            listener = _generate_weak_listener(reference)
-            self._registered_listener = listener
-            self._event_manager.subscribe(self._event_type, listener)
+            if self._key_by is not None:
+                assert isinstance(self._event_manager, EventManagerBase)
+                sink = _generate_weak_sink(weakref.WeakMethod(self._push))
+                self._registered_sink = sink
+                self._event_manager._add_keyed_sink(  # noqa: SLF001 - Only used by the streams of the manager
+                    self._event_type, self._key_by, self._key, sink
+                )
+
+            else:
+                reference = weakref.WeakMethod(self._listener)
+                listener = _generate_weak_listener(reference)
+                self._registered_listener = listener
+                self._event_manager.subscribe(self._event_type, listener)
+
             self._active = True
 
 
@@ -308,30 +551,390 @@ class _Consumer:
     is_caching: bool = attrs.field()
     """Cached value of whether or not this consumer is making cache calls in the current env."""
 
+    id_fields: _IdFieldsT = attrs.field(default=_DEFAULT_ID_FIELDS)
+    """The fields of the raw payloads holding the guild and channel IDs."""
+
     listener_group_count: int = attrs.field(init=False, default=0)
     """The number of listener groups registered to this consumer."""
 
     waiter_group_count: int = attrs.field(init=False, default=0)
     """The number of waiters groups registered to this consumer."""
 
+    payload_filters: tuple[_PayloadFilter, ...] | None = attrs.field(init=False, default=None)
+    """The raw payload filters of the listeners registered to this consumer.
+
+    This is [`None`][] if any of the listeners has no filter, in which case every payload is needed.
+    """
+
     @property
     def is_enabled(self) -> bool:
         return self.is_caching or self.listener_group_count > 0 or self.waiter_group_count > 0
 
 
+@attrs.define(kw_only=True, weakref_slot=False)
+class _PayloadFilter:
+    guild_ids: frozenset[str | int] | None = attrs.field()
+    """The IDs of the guilds to accept, in both their string and integer form."""
+
+    channel_ids: frozenset[str | int] | None = attrs.field()
+    """The IDs of the channels to accept, in both their string and integer form."""
+
+    author_is_bot: bool | None = attrs.field()
+    """Whether to accept bot or non-bot authors."""
+
+    predicate: event_manager_.PayloadPredicateT | None = attrs.field()
+    """The predicate to accept the payloads with."""
+
+    sample_every: int | None = attrs.field(default=None)
+    """Only accept one in every this many payloads accepted by the other filters."""
+
+    samples_to_skip: int = attrs.field(init=False, default=0)
+    """The amount of payloads to skip before accepting the next sample."""
+
+    def __call__(self, payload: data_binding.JSONObject, id_fields: _IdFieldsT) -> bool:
+        # This does not count the payload towards the sampling, see consume
+        return self.samples_to_skip == 0 and self.matches(payload, id_fields)
+
+    def consume(self, payload: data_binding.JSONObject, id_fields: _IdFieldsT) -> bool:
+        if not self.matches(payload, id_fields):
+            return False
+
+        if self.sample_every is None:
+            return True
+
+        if self.samples_to_skip:
+            self.samples_to_skip -= 1
+            return False
+
+        self.samples_to_skip = self.sample_every - 1
+        return True
+
+    def matches(self, payload: data_binding.JSONObject, id_fields: _IdFieldsT) -> bool:
+        guild_id_field, channel_id_field = id_fields
+        if self.guild_ids is not None and payload.get(guild_id_field) not in self.guild_ids:
+            return False
+
+        if self.channel_ids is not None and payload.get(channel_id_field) not in self.channel_ids:
+            return False
+
+        if self.author_is_bot is not None:
+            author = payload.get("author")
+            if author is None:
+                author = payload.get("user")
+
+            if not isinstance(author, dict) or author.get("bot", False) is not self.author_is_bot:
+                return False
+
+        return self.predicate is None or self.predicate(payload)
+
+
+def _snowflake_keys(ids: snowflakes.SnowflakeishSequence[snowflakes.Unique] | None) -> frozenset[str | int] | None:
+    if ids is None:
+        return None
+
+    # Snowflakes are strings in JSON payloads, but integers in ETF payloads
+    return frozenset(key for snowflake in map(int, ids) for key in (snowflake, str(snowflake)))
+
+
+def _make_payload_filter(
+    guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None,
+    channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None,
+    author_is_bot: bool | None,
+    payload_predicate: event_manager_.PayloadPredicateT | None,
+    sample_every: int | None,
+) -> _PayloadFilter | None:
+    if sample_every is not None and sample_every < 1:
+        msg = "'sample_every' must be greater than 0"
+        raise ValueError(msg)
+
+    if (
+        guild_ids is None
+        and channel_ids is None
+        and author_is_bot is None
+        and payload_predicate is None
+        and sample_every is None
+    ):
+        return None
+
+    return _PayloadFilter(
+        guild_ids=_snowflake_keys(guild_ids),
+        channel_ids=_snowflake_keys(channel_ids),
+        author_is_bot=author_is_bot,
+        predicate=payload_predicate,
+        sample_every=sample_every,
+    )
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class _Coalescer:
+    callback: event_manager_.CallbackT[typing.Any] = attrs.field()
+    """The callback to pass the latest events to."""
+
+    invoke: typing.Callable[
+        [event_manager_.CallbackT[typing.Any], base_events.Event], typing.Coroutine[typing.Any, typing.Any, None]
+    ] = attrs.field()
+    """The function to invoke the callback with."""
+
+    extract: event_manager_.KeyExtractorT[typing.Any] | None = attrs.field()
+    """The function returning the key of an event, or [`None`][] to only keep the latest event."""
+
+    window: float = attrs.field()
+    """How long to hold the events for, in seconds."""
+
+    pending: dict[typing.Hashable, base_events.Event] = attrs.field(init=False, factory=dict)
+    """The latest event of each key, in the order they were last received in."""
+
+    task: asyncio.Task[None] | None = attrs.field(init=False, default=None)
+    """The task passing the pending events to the callback, if there are any."""
+
+    def push(self, event: base_events.Event) -> None:
+        key: typing.Hashable = None
+        if self.extract is not None:
+            try:
+                key = self.extract(event)
+            except Exception:
+                _LOGGER.exception(
+                    "an exception occurred extracting the coalescing key of an event (%s)", type(event).__name__
+                )
+                return
+
+        # Superseded events are simply replaced, so they never reach the callback
+        self.pending.pop(key, None)
+        self.pending[key] = event
+
+        # The task is only done without being reset if it was cancelled before it started running
+        if self.task is None or self.task.done():
+            name = getattr(self.callback, "__qualname__", repr(self.callback))
+            self.task = asyncio.create_task(self._flush(), name=f"coalesced dispatch {name}")
+
+    def close(self) -> None:
+        self.pending.clear()
+
+    async def _flush(self) -> None:
+        # The next window only starts once the callbacks are done, so that a slow
+        # callback does not pile up invocations
+        try:
+            while self.pending:
+                await asyncio.sleep(self.window)
+                events = list(self.pending.values())
+                self.pending.clear()
+                await asyncio.gather(*(self.invoke(self.callback, event) for event in events))
+
+        finally:
+            # Otherwise no more events would be flushed after a failure or cancellation
+            self.task = None
+
+
+def _make_coalescer(
+    callback: event_manager_.CallbackT[typing.Any],
+    invoke: typing.Callable[
+        [event_manager_.CallbackT[typing.Any], base_events.Event], typing.Coroutine[typing.Any, typing.Any, None]
+    ],
+    coalesce_by: str | event_manager_.KeyExtractorT[typing.Any] | None,
+    window: float | None,
+) -> _Coalescer | None:
+    if window is None:
+        if coalesce_by is not None:
+            msg = "'coalesce_by' can only be provided with 'window'"
+            raise ValueError(msg)
+
+        return None
+
+    if window <= 0:
+        msg = "'window' must be greater than 0"
+        raise ValueError(msg)
+
+    extract = operator.attrgetter(coalesce_by) if isinstance(coalesce_by, str) else coalesce_by
+    return _Coalescer(callback=callback, invoke=invoke, extract=extract, window=window)
+
+
+def _add_listener_option(
+    options: dict[type[base_events.Event], list[_ListenerOptionT | None]],
+    event_type: type[base_events.Event],
+    listener_count: int,
+    option: _ListenerOptionT | None,
+) -> None:
+    # The options are only kept for the event types which have any, in the same order as the listeners
+    if option is not None and event_type not in options:
+        options[event_type] = [None] * listener_count
+
+    if event_type in options:
+        options[event_type].append(option)
+
+
+def _remove_listener_option(
+    options: dict[type[base_events.Event], list[_ListenerOptionT | None]],
+    event_type: type[base_events.Event],
+    index: int,
+) -> _ListenerOptionT | None:
+    if (type_options := options.get(event_type)) is None:
+        return None
+
+    option = type_options.pop(index)
+    if all(type_option is None for type_option in type_options):
+        del options[event_type]
+
+    return option
+
+
+def _select_callbacks(
+    event: base_events.Event,
+    callbacks: tuple[event_manager_.CallbackT[base_events.Event], ...],
+    filters: tuple[_PayloadFilter | None, ...] | None,
+    coalescers: tuple[_Coalescer | None, ...] | None,
+) -> tuple[event_manager_.CallbackT[base_events.Event], ...]:
+    # Events which were not deserialized from a raw payload are not filtered
+    raw_payload = _RAW_PAYLOAD.get() if filters is not None else None
+    selected: list[event_manager_.CallbackT[base_events.Event]] = []
+
+    for index, callback in enumerate(callbacks):
+        if raw_payload is not None:
+            assert filters is not None
+            if (payload_filter := filters[index]) is not None and not payload_filter.consume(*raw_payload):
+                continue
+
+        if coalescers is not None and (coalescer := coalescers[index]) is not None:
+            coalescer.push(event)
+            continue
+
+        selected.append(callback)
+
+    return tuple(selected)
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class _PausedShard:
+    future: asyncio.Future[None] = attrs.field()
+    """Future resolved once the shard may resume reading."""
+
+    by_shard: bool = attrs.field()
+    """Whether the shard paused because of its own pending dispatches."""
+
+    by_bot: bool = attrs.field()
+    """Whether the shard paused because of the pending dispatches of all the shards."""
+
+
+_PARTITION_KEY_FIELDS: typing.Final[tuple[str, ...]] = ("guild_id", "channel_id", "user_id")
+
+
+def _partition_key(event_name: str, payload: data_binding.JSONObject) -> str | int | None:
+    # Snowflakes are strings in JSON payloads, but integers in ETF payloads
+    if event_name in _GUILD_EVENT_NAMES:
+        return typing.cast("str | int | None", payload.get("id"))
+
+    for field in _PARTITION_KEY_FIELDS:
+        if (key := payload.get(field)) is not None:
+            return typing.cast("str | int", key)
+
+    user = payload.get("user")
+    return typing.cast("str | int | None", user.get("id")) if isinstance(user, dict) else None
+
+
+def _check_key(key_by: _KeyByT | None, key: typing.Hashable) -> None:
+    if key_by is None and key is not None:
+        msg = "'key' can only be provided with 'key_by'"
+        raise ValueError(msg)
+
+
+def _warn_if_in_ordered_partition(method: str, event_type: type[typing.Any]) -> None:
+    if (key := _ORDERED_PARTITION.get()) is None:
+        return
+
+    _LOGGER.warning(
+        "%s(%s) was called while handling an event of ordered dispatch partition %s; the later events of the "
+        "partition are only handled once this returns, so waiting on one of them will only end by timing out",
+        method,
+        event_type.__name__,
+        key,
+    )
+
+
+def _check_water_marks(name: str, water_marks: tuple[int, int] | None) -> None:
+    if water_marks is None:
+        return
+
+    low, high = water_marks
+    if not 0 <= low < high:
+        msg = f"'{name}' must be a (low, high) tuple where 0 <= low < high"
+        raise ValueError(msg)
+
+
 class EventManagerBase(event_manager_.EventManager):
     """Provides functionality to consume and dispatch events.
 
     Specific event handlers should be in functions named `on_xxx` where `xxx`
     is the raw event name being dispatched in lower-case.
+
+    Parameters
+    ----------
+    event_factory
+        The event factory to use.
+    intents
+        The intents the shards are using.
+    cache_components
+        The cache components the consumers may make altering calls to.
+    eager_dispatch
+        Whether to start the tasks of the consumers and listeners eagerly,
+        running them until they first suspend instead of scheduling them.
+        Tasks which complete without ever suspending are never scheduled.
+
+        This saves a lot of overhead for the events which are handled without
+        ever suspending, but it means that the consumers and listeners start
+        running before [`dispatch`][] returns. This requires Python 3.12 or
+        above and has no effect on older versions.
+    dispatch_water_marks
+        The `(low, high)` water marks for the number of raw events of all the
+        shards still being handled. Once `high` is reached, shards stop reading
+        events from the gateway until it drops back to `low`.
+
+        Defaults to [`None`][], which means reading is never paused.
+    shard_dispatch_water_marks
+        The `(low, high)` water marks for the number of raw events of a single
+        shard still being handled, with the same behaviour as
+        `dispatch_water_marks`.
+
+        Defaults to [`None`][], which means reading is never paused.
+    ordered_dispatch
+        Whether to handle the raw events of the same guild one after another,
+        in the order they were received, while still handling the events of
+        different guilds concurrently. Events which are not in a guild are
+        ordered by channel, or by user if they are not in a channel either.
+
+        Events which cannot be attributed to any of these are still handled
+        concurrently with everything else.
+
+        !!! warning
+            A listener which waits for a later event of the same guild,
+            channel or user, such as through [`wait_for`][hikari.impl.event_manager_base.EventManagerBase.wait_for]
+            or [`stream`][hikari.impl.event_manager_base.EventManagerBase.stream], blocks that event from
+            being handled until it returns, so the wait can only end by
+            timing out. A warning is logged when this is attempted. Run such
+            waits in a separate task instead.
+
+    Raises
+    ------
+    ValueError
+        If any of the water marks are not `0 <= low < high`.
     """
 
     __slots__: typing.Sequence[str] = (
         "_consumers",
+        "_dispatch_table",
+        "_dispatch_water_marks",
+        "_eager_dispatch",
         "_event_factory",
         "_handling_dispatch_tasks",
         "_intents",
+        "_keyed_waiters",
+        "_listener_coalescers",
+        "_listener_filters",
         "_listeners",
+        "_ordered_dispatch",
+        "_partitions",
+        "_paused_shards",
+        "_pending_dispatches",
+        "_shard_dispatch_water_marks",
+        "_total_pending_dispatches",
         "_waiters",
     )
 
@@ -341,13 +944,34 @@ def __init__(
         intents: intents_.Intents,
         *,
         cache_components: config.CacheComponents = config.CacheComponents.NONE,
+        eager_dispatch: bool = False,
+        dispatch_water_marks: tuple[int, int] | None = None,
+        shard_dispatch_water_marks: tuple[int, int] | None = None,
+        ordered_dispatch: bool = False,
     ) -> None:
+        _check_water_marks("dispatch_water_marks", dispatch_water_marks)
+        _check_water_marks("shard_dispatch_water_marks", shard_dispatch_water_marks)
+
         self._consumers: dict[str, _Consumer] = {}
+        self._dispatch_table: dict[type[base_events.Event], _DispatchEntryT[base_events.Event]] = {}
+        self._dispatch_water_marks = dispatch_water_marks
+        self._eager_dispatch = eager_dispatch
+        self._ordered_dispatch = ordered_dispatch
+        self._partitions: dict[str | int, _PartitionT] = {}
+        self._paused_shards: dict[int, _PausedShard] = {}
+        self._pending_dispatches: dict[int, int] = {}
+        self._shard_dispatch_water_marks = shard_dispatch_water_marks
+        self._total_pending_dispatches = 0
         self._event_factory = event_factory
         self._intents = intents
         self._listeners: _ListenerMapT[base_events.Event] = {}
+        # Only kept for the event types which have filtered listeners, in the same order as the listeners
+        self._listener_filters: dict[type[base_events.Event], list[_PayloadFilter | None]] = {}
+        # Only kept for the event types which have coalesced listeners, in the same order as the listeners
+        self._listener_coalescers: dict[type[base_events.Event], list[_Coalescer | None]] = {}
         self._waiters: _WaiterMapT[base_events.Event] = {}
-        self._handling_dispatch_tasks: set[asyncio.Task[None]] = set()
+        self._keyed_waiters: dict[type[base_events.Event], dict[_KeyByT, _KeyIndex]] = {}
+        self._handling_dispatch_tasks: set[asyncio.Future[None]] = set()
 
         for name, member in inspect.getmembers(self):
             if name.startswith("on_"):
@@ -355,10 +979,14 @@ def __init__(
                 if isinstance(member, _FilteredMethodT):
                     caching = (member.__cache_components__ & cache_components) != 0
 
-                    self._consumers[event_name] = _Consumer(member, member.__events_bitmask__, caching)
+                    self._consumers[event_name] = _Consumer(
+                        member, member.__events_bitmask__, caching, _id_fields(event_name.upper())
+                    )
 
                 else:
-                    self._consumers[event_name] = _Consumer(member, -1, cache_components != cache_components.NONE)
+                    self._consumers[event_name] = _Consumer(
+                        member, -1, cache_components != cache_components.NONE, _id_fields(event_name.upper())
+                    )
 
     def _increment_listener_group_count(
         self, event_type: type[base_events.Event], count: typing.Literal[-1, 1]
@@ -374,12 +1002,70 @@ def _increment_waiter_group_count(self, event_type: type[base_events.Event], cou
             if (consumer.events_bitmask & event_bitmask) == event_bitmask:
                 consumer.waiter_group_count += count
 
-    def _enabled_for_event(self, event_type: type[base_events.Event], /) -> bool:
+    def _get_dispatch_entry(self, event_type: type[base_events.Event], /) -> _DispatchEntryT[base_events.Event]:
+        # Walking the MRO of the event on every dispatch is expensive, so the result is
+        # kept until the listeners or waiters change, which is far less frequent.
+        try:
+            return self._dispatch_table[event_type]
+        except KeyError:
+            pass
+
+        callbacks: list[event_manager_.CallbackT[base_events.Event]] = []
+        filters: list[_PayloadFilter | None] = []
+        coalescers: list[_Coalescer | None] = []
+        has_filters = False
+        has_coalescers = False
+        has_waiters = False
         for cls in event_type.dispatches():
-            if cls in self._listeners or cls in self._waiters:
-                return True
+            listeners = self._listeners.get(cls, ())
+            callbacks.extend(listeners)
+            if cls in self._listener_filters:
+                filters.extend(self._listener_filters[cls])
+                has_filters = True
+            else:
+                filters.extend(None for _ in listeners)
 
-        return False
+            if cls in self._listener_coalescers:
+                coalescers.extend(self._listener_coalescers[cls])
+                has_coalescers = True
+            else:
+                coalescers.extend(None for _ in listeners)
+
+            has_waiters = has_waiters or cls in self._waiters or cls in self._keyed_waiters
+
+        entry = self._dispatch_table[event_type] = (
+            tuple(callbacks),
+            tuple(filters) if has_filters else None,
+            tuple(coalescers) if has_coalescers else None,
+            has_waiters,
+        )
+        return entry
+
+    def _update_payload_filters(self) -> None:
+        for consumer in self._consumers.values():
+            consumer.payload_filters = None
+
+            if not self._listener_filters:
+                continue
+
+            payload_filters: list[_PayloadFilter] = []
+            for event_type in self._listeners:
+                event_bitmask = event_type.bitmask()
+                if (consumer.events_bitmask & event_bitmask) != event_bitmask:
+                    continue
+
+                type_filters = self._listener_filters.get(event_type)
+                if type_filters is None or None in type_filters:
+                    break
+
+                payload_filters.extend(typing.cast("list[_PayloadFilter]", type_filters))
+
+            else:
+                consumer.payload_filters = tuple(payload_filters)
+
+    def _enabled_for_event(self, event_type: type[base_events.Event], /) -> bool:
+        callbacks, _, _, has_waiters = self._get_dispatch_entry(event_type)
+        return bool(callbacks) or has_waiters
 
     def _check_event(self, event_type: type[typing.Any], nested: int) -> None:
         # Extract the underlying type from generics
@@ -421,11 +1107,151 @@ def consume_raw_event(
             payload_event = self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name)
             self.dispatch(payload_event)
         consumer = self._consumers[event_name.lower()]
+        tracked = self._dispatch_water_marks is not None or self._shard_dispatch_water_marks is not None
+        if tracked:
+            self._pending_dispatches[shard.id] = self._pending_dispatches.get(shard.id, 0) + 1
+            self._total_pending_dispatches += 1
+
+        if self._ordered_dispatch and (key := _partition_key(event_name, payload)) is not None:
+            if (partition := self._partitions.get(key)) is not None:
+                partition.append((consumer, shard, payload))
+                return
+
+            partition = self._partitions[key] = collections.deque(((consumer, shard, payload),))
+            self._start_dispatch(
+                self._drain_partition(key, partition),
+                f"dispatch partition {key}",
+                functools.partial(self._on_partition_done, key, partition),
+            )
+            return
+
+        self._start_dispatch(
+            self._handle_dispatch(consumer, shard, payload),
+            f"dispatch {event_name}",
+            functools.partial(self._on_dispatch_done, shard.id) if tracked else self._handling_dispatch_tasks.discard,
+        )
 
-        task = asyncio.create_task(self._handle_dispatch(consumer, shard, payload), name=f"dispatch {event_name}")
+    def _start_dispatch(
+        self,
+        coroutine: typing.Coroutine[typing.Any, typing.Any, None],
+        name: str,
+        done_callback: typing.Callable[[asyncio.Future[None]], None],
+    ) -> None:
+        task: asyncio.Future[None] | None
+        if self._eager_dispatch:
+            task = aio.eager_task(coroutine, name=name)
+            if task is None:
+                # Completed without ever suspending, but the bookkeeping still has to be done
+                done_callback(aio.completed_future())
+                return
+
+        else:
+            task = asyncio.create_task(coroutine, name=name)
 
         self._handling_dispatch_tasks.add(task)
-        task.add_done_callback(self._handling_dispatch_tasks.discard)
+        task.add_done_callback(done_callback)
+
+    async def _drain_partition(self, key: str | int, partition: _PartitionT) -> None:
+        tracked = self._dispatch_water_marks is not None or self._shard_dispatch_water_marks is not None
+        _ORDERED_PARTITION.set(key)
+
+        while True:
+            consumer, shard, payload = partition[0]
+            await self._handle_dispatch(consumer, shard, payload)
+            partition.popleft()
+
+            if tracked:
+                self._finish_dispatch(shard.id)
+
+            # This has to happen without suspending, so that no event can be queued
+            # on the partition after it has been drained.
+            if not partition:
+                del self._partitions[key]
+                return
+
+    def _on_partition_done(self, key: str | int, partition: _PartitionT, task: asyncio.Future[None]) -> None:
+        self._handling_dispatch_tasks.discard(task)
+
+        # The partition is only still registered if it was not drained, which
+        # happens when the task is cancelled before it gets to run.
+        if self._partitions.get(key) is not partition:
+            return
+
+        del self._partitions[key]
+        if self._dispatch_water_marks is not None or self._shard_dispatch_water_marks is not None:
+            for _, shard, _ in partition:
+                self._finish_dispatch(shard.id)
+
+        partition.clear()
+
+    def _on_dispatch_done(self, shard_id: int, task: asyncio.Future[None]) -> None:
+        self._handling_dispatch_tasks.discard(task)
+        self._finish_dispatch(shard_id)
+
+    def _finish_dispatch(self, shard_id: int) -> None:
+        self._total_pending_dispatches -= 1
+
+        if pending := self._pending_dispatches[shard_id] - 1:
+            self._pending_dispatches[shard_id] = pending
+        else:
+            del self._pending_dispatches[shard_id]
+
+        for paused_shard_id, paused in tuple(self._paused_shards.items()):
+            if paused.by_shard:
+                assert self._shard_dispatch_water_marks is not None
+                if self._pending_dispatches.get(paused_shard_id, 0) > self._shard_dispatch_water_marks[0]:
+                    continue
+
+            if paused.by_bot:
+                assert self._dispatch_water_marks is not None
+                if self._total_pending_dispatches > self._dispatch_water_marks[0]:
+                    continue
+
+            del self._paused_shards[paused_shard_id]
+            if not paused.future.done():
+                paused.future.set_result(None)
+
+    def _water_marks_reached(self, shard_id: int) -> tuple[bool, bool]:
+        by_shard = (
+            self._shard_dispatch_water_marks is not None
+            and self._pending_dispatches.get(shard_id, 0) >= self._shard_dispatch_water_marks[1]
+        )
+        by_bot = (
+            self._dispatch_water_marks is not None and self._total_pending_dispatches >= self._dispatch_water_marks[1]
+        )
+        return by_shard, by_bot
+
+    @typing_extensions.override
+    def should_pause_reading(self, shard: gateway_shard.GatewayShard) -> bool:
+        if self._dispatch_water_marks is None and self._shard_dispatch_water_marks is None:
+            return False
+
+        by_shard, by_bot = self._water_marks_reached(shard.id)
+        return by_shard or by_bot
+
+    @typing_extensions.override
+    async def wait_to_resume_reading(self, shard: gateway_shard.GatewayShard) -> None:
+        by_shard, by_bot = self._water_marks_reached(shard.id)
+        if not by_shard and not by_bot:
+            return
+
+        paused = _PausedShard(future=asyncio.get_running_loop().create_future(), by_shard=by_shard, by_bot=by_bot)
+        self._paused_shards[shard.id] = paused
+
+        try:
+            await paused.future
+        finally:
+            if self._paused_shards.get(shard.id) is paused:
+                del self._paused_shards[shard.id]
+
+    @typing_extensions.override
+    def should_consume_raw_event(self, event_name: str) -> bool:
+        if self._enabled_for_event(shard_events.ShardPayloadEvent):
+            return True
+
+        # Unknown events are still consumed, so that they can be logged
+        consumer = self._consumers.get(event_name.lower())
+        return consumer is None or consumer.is_enabled
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
@@ -433,7 +1259,18 @@ def consume_raw_event(
     # user use a static type checker.
     @typing_extensions.override
     def subscribe(
-        self, event_type: type[typing.Any], callback: event_manager_.CallbackT[typing.Any], *, _nested: int = 0
+        self,
+        event_type: type[typing.Any],
+        callback: event_manager_.CallbackT[typing.Any],
+        *,
+        guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None = None,
+        channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None = None,
+        author_is_bot: bool | None = None,
+        payload_predicate: event_manager_.PayloadPredicateT | None = None,
+        sample_every: int | None = None,
+        coalesce_by: str | event_manager_.KeyExtractorT[typing.Any] | None = None,
+        window: float | None = None,
+        _nested: int = 0,
     ) -> None:
         if not (
             inspect.iscoroutinefunction(callback)
@@ -456,23 +1293,28 @@ def subscribe(
             event_type.__qualname__,
         )
 
-        try:
-            self._listeners[event_type].append(callback)
-        except KeyError:
+        payload_filter = _make_payload_filter(guild_ids, channel_ids, author_is_bot, payload_predicate, sample_every)
+        coalescer = _make_coalescer(callback, self._invoke_callback, coalesce_by, window)
+        listeners = self._listeners.get(event_type)
+        _add_listener_option(self._listener_filters, event_type, len(listeners or ()), payload_filter)
+        _add_listener_option(self._listener_coalescers, event_type, len(listeners or ()), coalescer)
+
+        if listeners is not None:
+            listeners.append(callback)
+        else:
             self._listeners[event_type] = [callback]
             self._increment_listener_group_count(event_type, 1)
 
+        self._dispatch_table.clear()
+        self._update_payload_filters()
+
     @typing_extensions.override
     def get_listeners(
         self, event_type: type[base_events.EventT], /, *, polymorphic: bool = True
     ) -> typing.Collection[event_manager_.CallbackT[base_events.EventT]]:
         if polymorphic:
-            listeners: list[event_manager_.CallbackT[base_events.EventT]] = []
-            for event in event_type.dispatches():
-                if subscribed_listeners := self._listeners.get(event):
-                    listeners.extend(subscribed_listeners)
-
-            return listeners
+            callbacks, _, _, _ = self._get_dispatch_entry(event_type)
+            return list(callbacks)
 
         if items := self._listeners.get(event_type):
             return items.copy()
@@ -493,14 +1335,30 @@ def unsubscribe(self, event_type: type[typing.Any], callback: event_manager_.Cal
                 event_type.__module__,
                 event_type.__qualname__,
             )
-            listeners.remove(callback)
+            index = listeners.index(callback)
+            del listeners[index]
             if not listeners:
                 del self._listeners[event_type]
                 self._increment_listener_group_count(event_type, -1)
 
+            _remove_listener_option(self._listener_filters, event_type, index)
+            if coalescer := _remove_listener_option(self._listener_coalescers, event_type, index):
+                coalescer.close()
+
+            self._dispatch_table.clear()
+            self._update_payload_filters()
+
     @typing_extensions.override
     def listen(
-        self, *event_types: type[base_events.EventT]
+        self,
+        *event_types: type[base_events.EventT],
+        guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None = None,
+        channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None = None,
+        author_is_bot: bool | None = None,
+        payload_predicate: event_manager_.PayloadPredicateT | None = None,
+        sample_every: int | None = None,
+        coalesce_by: str | event_manager_.KeyExtractorT[base_events.EventT] | None = None,
+        window: float | None = None,
     ) -> typing.Callable[[event_manager_.CallbackT[base_events.EventT]], event_manager_.CallbackT[base_events.EventT]]:
         def decorator(
             callback: event_manager_.CallbackT[base_events.EventT],
@@ -530,7 +1388,18 @@ def decorator(
                     resolved_types = (annotation,)
 
             for resolved_type in resolved_types:
-                self.subscribe(resolved_type, callback, _nested=1)
+                self.subscribe(
+                    resolved_type,
+                    callback,
+                    guild_ids=guild_ids,
+                    channel_ids=channel_ids,
+                    author_is_bot=author_is_bot,
+                    payload_predicate=payload_predicate,
+                    sample_every=sample_every,
+                    coalesce_by=coalesce_by,
+                    window=window,
+                    _nested=1,
+                )
 
             return callback
 
@@ -538,10 +1407,31 @@ def decorator(
 
     @typing_extensions.override
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
-        tasks: list[typing.Coroutine[None, typing.Any, None]] = []
+        callbacks, filters, coalescers, has_waiters = self._get_dispatch_entry(type(event))
+
+        if has_waiters:
+            self._notify_waiters(event)
+
+        if filters is not None or coalescers is not None:
+            callbacks = _select_callbacks(event, callbacks, filters, coalescers)
+
+        if not callbacks:
+            return aio.completed_future()
 
+        if not self._eager_dispatch:
+            return asyncio.gather(*(self._invoke_callback(callback, event) for callback in callbacks))
+
+        futures = [
+            future
+            for callback in callbacks
+            if (future := aio.eager_task(self._invoke_callback(callback, event))) is not None
+        ]
+        return asyncio.gather(*futures) if futures else aio.completed_future()
+
+    def _notify_waiters(self, event: base_events.Event) -> None:
         for cls in event.dispatches():
-            tasks.extend(self._invoke_callback(c, event) for c in self._listeners.get(cls, ()))
+            if cls in self._keyed_waiters:
+                self._notify_keyed_waiters(cls, event)
 
             if cls not in self._waiters:
                 continue
@@ -549,33 +1439,98 @@ def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
             waiter_set = self._waiters[cls]
             for waiter in tuple(waiter_set):
                 predicate, future = waiter
-                if not future.done():
-                    try:
-                        if predicate and not predicate(event):
-                            continue
-                    # We need to use a blind except here as it is a user provided predicate
-                    except Exception as ex:  # noqa: BLE001
-                        future.set_exception(ex)
-                    else:
-                        future.set_result(event)
-
-                waiter_set.remove(waiter)
+                if _resolve_waiter(predicate, future, event):
+                    waiter_set.remove(waiter)
 
             if not waiter_set:
                 del self._waiters[cls]
-                self._increment_waiter_group_count(cls, -1)
+                if cls not in self._keyed_waiters:
+                    self._increment_waiter_group_count(cls, -1)
+                    self._dispatch_table.clear()
 
-        if tasks:
-            return asyncio.gather(*tasks)
+    def _notify_keyed_waiters(self, event_type: type[base_events.Event], event: base_events.Event) -> None:
+        for index in tuple(self._keyed_waiters[event_type].values()):
+            try:
+                key = index.extract(event)
+                sinks = index.sinks.get(key)
 
-        return aio.completed_future()
+            # We need to catch everything here as it may be a user provided function
+            except Exception as ex:
+                # Not all the events of a type have all the attributes (for example, only
+                # component interactions have a message), which just means that they do not match.
+                if not isinstance(index.key_by, str) or not isinstance(ex, (AttributeError, TypeError)):
+                    _LOGGER.exception("an exception occurred extracting the key of an event (%s)", type(event).__name__)
+
+                continue
+
+            if not sinks:
+                continue
+
+            sinks[:] = [sink for sink in sinks if not sink(event)]
+            if not sinks:
+                self._discard_key(event_type, index.key_by, key)
+
+    def _add_keyed_sink(
+        self, event_type: type[base_events.Event], key_by: _KeyByT, key: typing.Hashable, sink: _KeyedSinkT
+    ) -> None:
+        indexes = self._keyed_waiters.get(event_type)
+        if indexes is None:
+            if event_type not in self._waiters:
+                self._increment_waiter_group_count(event_type, 1)
+                self._dispatch_table.clear()
+
+            indexes = self._keyed_waiters[event_type] = {}
+
+        index = indexes.get(key_by)
+        if index is None:
+            index = indexes[key_by] = _KeyIndex(key_by)
+
+        index.sinks.setdefault(key, []).append(sink)
+
+    def _remove_keyed_sink(
+        self, event_type: type[base_events.Event], key_by: _KeyByT, key: typing.Hashable, sink: _KeyedSinkT
+    ) -> None:
+        try:
+            sinks = self._keyed_waiters[event_type][key_by].sinks[key]
+            sinks.remove(sink)
+        except (KeyError, ValueError):
+            return
+
+        if not sinks:
+            self._discard_key(event_type, key_by, key)
+
+    def _discard_key(self, event_type: type[base_events.Event], key_by: _KeyByT, key: typing.Hashable) -> None:
+        indexes = self._keyed_waiters[event_type]
+        index = indexes[key_by]
+        del index.sinks[key]
+        if index.sinks:
+            return
+
+        del indexes[key_by]
+        if indexes:
+            return
+
+        del self._keyed_waiters[event_type]
+        if event_type not in self._waiters:
+            self._increment_waiter_group_count(event_type, -1)
+            self._dispatch_table.clear()
 
     @typing_extensions.override
     def stream(
-        self, event_type: type[base_events.EventT], /, timeout: float | None, limit: int | None = None
+        self,
+        event_type: type[base_events.EventT],
+        /,
+        timeout: float | None,
+        limit: int | None = None,
+        *,
+        overflow: str = event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+        key_by: str | event_manager_.KeyExtractorT[base_events.EventT] | None = None,
+        key: typing.Hashable = None,
     ) -> event_manager_.EventStream[base_events.EventT]:
+        _check_key(key_by, key)
         self._check_event(event_type, 1)
-        return EventStream(self, event_type, timeout=timeout, limit=limit)
+        _warn_if_in_ordered_partition("stream", event_type)
+        return EventStream(self, event_type, timeout=timeout, limit=limit, overflow=overflow, key_by=key_by, key=key)
 
     @typing_extensions.override
     async def wait_for(
@@ -584,18 +1539,33 @@ async def wait_for(
         /,
         timeout: float | None,
         predicate: event_manager_.PredicateT[base_events.EventT] | None = None,
+        *,
+        key_by: str | event_manager_.KeyExtractorT[base_events.EventT] | None = None,
+        key: typing.Hashable = None,
     ) -> base_events.EventT:
+        _check_key(key_by, key)
         self._check_event(event_type, 1)
+        _warn_if_in_ordered_partition("wait_for", event_type)
 
         future: asyncio.Future[base_events.EventT] = asyncio.get_running_loop().create_future()
 
+        if key_by is not None:
+            sink = functools.partial(_resolve_waiter, predicate, future)
+            self._add_keyed_sink(event_type, key_by, key, sink)
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            finally:
+                self._remove_keyed_sink(event_type, key_by, key, sink)
+
         waiter_set: typing.MutableSet[_WaiterT[base_events.Event]]
         try:
             waiter_set = self._waiters[event_type]
         except KeyError:
             waiter_set = set()
             self._waiters[event_type] = waiter_set
-            self._increment_waiter_group_count(event_type, 1)
+            if event_type not in self._keyed_waiters:
+                self._increment_waiter_group_count(event_type, 1)
+                self._dispatch_table.clear()
 
         pair = (predicate, future)
 
@@ -606,10 +1576,24 @@ async def wait_for(
             waiter_set.remove(pair)  # type: ignore[arg-type]
             if not waiter_set:
                 del self._waiters[event_type]
-                self._increment_waiter_group_count(event_type, -1)
+                if event_type not in self._keyed_waiters:
+                    self._increment_waiter_group_count(event_type, -1)
+                    self._dispatch_table.clear()
 
             raise
 
+    def _is_payload_required(
+        self,
+        callback: _ConsumerT,  # noqa: ARG002 - Unused arguments
+        shard: gateway_shard.GatewayShard,  # noqa: ARG002 - Unused arguments
+        payload: data_binding.JSONObject,  # noqa: ARG002 - Unused arguments
+    ) -> bool:
+        """Whether a payload has to be consumed even if none of the listener filters accept it.
+
+        This is used for payloads which the event manager itself is waiting on.
+        """
+        return False
+
     async def _handle_dispatch(
         self, consumer: _Consumer, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
@@ -621,6 +1605,27 @@ async def _handle_dispatch(
             return
 
         try:
+            # Avoid deserializing the payload when only filtered listeners would
+            # receive the events and none of their filters accepts it.
+            if (
+                consumer.payload_filters is not None
+                and not consumer.is_caching
+                and consumer.waiter_group_count == 0
+                and not any(payload_filter(payload, consumer.id_fields) for payload_filter in consumer.payload_filters)
+                and not self._is_payload_required(consumer.callback, shard, payload)
+            ):
+                # The skipped payload still counts towards the sampling of the listeners
+                for payload_filter in consumer.payload_filters:
+                    payload_filter.consume(payload, consumer.id_fields)
+
+                _LOGGER.log(
+                    ux.TRACE,
+                    "Skipping raw dispatch for %s as no listener accepts the payload",
+                    consumer.callback.__name__,
+                )
+                return
+
+            _RAW_PAYLOAD.set((payload, consumer.id_fields))
             await consumer.callback(shard, payload)
         except asyncio.CancelledError:
             # Skip cancelled errors, likely caused by the event loop being shut down.
@@ -640,6 +1645,9 @@ async def _handle_dispatch(
     async def _invoke_callback(
         self, callback: event_manager_.CallbackT[base_events.EventT], event: base_events.EventT
     ) -> None:
+        # Events dispatched by the listener were not deserialized from the payload
+        _RAW_PAYLOAD.set(None)
+
         try:
             await callback(event)
         except Exception as ex:
@@ -25,9 +25,11 @@
 __all__: typing.Sequence[str] = ("GatewayBot",)
 
 import asyncio
+import functools
 import logging
 import math
 import sys
+import tempfile
 import types
 import typing
 import warnings
@@ -39,15 +41,20 @@
 from hikari import snowflakes
 from hikari import traits
 from hikari import undefined
+from hikari.api import event_manager as event_manager_
+from hikari.api import shard as gateway_shard
+from hikari.events import lifetime_events
 from hikari.impl import cache as cache_impl
 from hikari.impl import config as config_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
+from hikari.impl import identify_coordinator as identify_coordinator_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
+from hikari.internal import cluster
 from hikari.internal import data_binding
 from hikari.internal import signals
 from hikari.internal import time
@@ -65,13 +72,15 @@
     from hikari.api import cache as cache_
     from hikari.api import entity_factory as entity_factory_
     from hikari.api import event_factory as event_factory_
-    from hikari.api import event_manager as event_manager_
+    from hikari.api import identify_coordinator as identify_coordinator_
     from hikari.api import rest as rest_
-    from hikari.api import shard as gateway_shard
+    from hikari.api import session_store as session_store_
     from hikari.api import voice as voice_
     from hikari.events import base_events
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.bot")
+# Interval at which cluster workers report their heartbeat latencies to the supervisor
+_CLUSTER_REPORT_INTERVAL: typing.Final[float] = 30.0
 
 
 def _validate_activity(activity: undefined.UndefinedNoneOr[presences.Activity]) -> None:
@@ -158,11 +167,80 @@ class GatewayBot(traits.GatewayBotAware):
         This will take precedence over `allow_color` if both are specified.
     cache_settings
         Optional cache settings. If unspecified, will use the defaults.
+    compression
+        The transport compression to use for the gateway shards. Supported
+        values are `"transport_zlib_stream"` (the default),
+        `"transport_zstd_stream"` or [`None`][] to disable compression.
+
+        Using `"transport_zstd_stream"` requires the optional `hikari[zstd]`
+        dependencies to be installed. It results in lower inbound bandwidth
+        and lower inflate costs than `"transport_zlib_stream"`.
+    data_format
+        The data format to use for gateway payloads. Supported values are
+        `"json"` (the default) or `"etf"`.
+
+        When using `"etf"`, gateway payloads are smaller and snowflakes are
+        received as integers. Gateway payloads will then not use the `dumps`
+        and `loads` provided.
+    dispatch_water_marks
+        The `(low, high)` water marks for the number of events received by all
+        the shards which are still being handled. Once `high` is reached, the
+        shards stop reading from the gateway until it drops back to `low`,
+        bounding the memory used when listeners cannot keep up. Heartbeats
+        keep being sent while reading is paused.
+
+        Time spent paused is reported in the metrics of each shard. Defaults
+        to [`None`][], which means reading is never paused.
+    shard_dispatch_water_marks
+        The same as `dispatch_water_marks`, but for the events received by
+        each shard individually.
+    eager_dispatch
+        If [`True`][], the tasks of event consumers and listeners are started
+        eagerly, running until they first suspend instead of being scheduled.
+        This reduces the overhead of dispatching events which are handled
+        without ever awaiting anything, at the cost of the handlers starting
+        to run before the dispatch returns. This requires Python 3.12 or above
+        and has no effect on older versions.
+
+        Defaults to [`False`][].
+    ordered_dispatch
+        If [`True`][], the events of the same guild are handled one after
+        another, in the order they were received, while the events of
+        different guilds are still handled concurrently. This means that, for
+        example, the listeners of a member update only run once the ones for
+        the preceding member add have finished. Events outside of guilds are
+        ordered per channel, or per user if they are not in a channel either.
+
+        !!! warning
+            A listener which waits for a later event of the same guild,
+            channel or user, such as through [`wait_for`][hikari.impl.gateway_bot.GatewayBot.wait_for]
+            or [`stream`][hikari.impl.gateway_bot.GatewayBot.stream], blocks that event from being
+            handled until it returns, so the wait can only end by timing out.
+            Run such waits in a separate task instead.
+
+        Defaults to [`False`][].
+    lazy_messages
+        If [`True`][], the attachments, embeds, components, mentions and other
+        nested fields of received messages are only deserialized the first
+        time they are accessed. This makes message events cheaper to build
+        when most of them are never inspected in full, but has no effect if
+        messages are cached, as caching them reads every field.
+
+        Defaults to [`False`][].
     http_settings
         Optional custom HTTP configuration settings to use. Allows you to
         customise functionality such as whether SSL-verification is enabled,
         what timeouts [`aiohttp`][] should expect to use for requests, and behavior
         regarding HTTP-redirects.
+    identify_coordinator
+        The coordinator shards acquire a slot from before every identify. If
+        [`None`][] (the default), an
+        [`hikari.impl.identify_coordinator.InProcessIdentifyCoordinator`][]
+        is used, which only coordinates the shards of this bot.
+
+        When running the shards of a bot over multiple processes, they should
+        share a coordinator, such as
+        [`hikari.impl.identify_coordinator.FileLockIdentifyCoordinator`][].
     intents
         This allows you
         to change which intents your application will use on the gateway. This
@@ -191,6 +269,13 @@ class GatewayBot(traits.GatewayBotAware):
                    payload).
                 2. The user is waiting for the member chunks (there is an event
                    listener for it).
+    max_outstanding_chunk_requests
+        The maximum number of guilds to have member chunks in flight for at
+        once, per shard. Guilds beyond this are queued, with the smallest
+        guilds being requested first.
+
+        The progress of the requests can be followed through
+        [`hikari.impl.event_manager.EventManagerImpl.guild_chunkers`][].
     logs
         The flavour to set the logging to.
 
@@ -213,6 +298,31 @@ class GatewayBot(traits.GatewayBotAware):
         Note that `"TRACE_HIKARI"` is a library-specific logging level
         which is expected to be more verbose than `"DEBUG"`.
 
+    max_gateway_payload_size
+        The maximum size, in bytes, that a decompressed gateway payload can
+        have. Payloads exceeding this size will be dropped by the shard that
+        received them and a warning will be logged. This only applies when
+        using transport compression.
+
+        Defaults to [`None`][], which means there is no limit.
+    offload_gateway_payload_size
+        The size, in bytes, above which gateway payloads are inflated and
+        decoded in the `executor` instead of blocking the event loop. This is
+        compared to the size of the payload as it was received for inflating,
+        and to its inflated size for decoding. Payloads are still handled in
+        the order they were received by each shard.
+
+        Defaults to [`None`][], which means nothing is offloaded.
+    offload_guild_member_count
+        The number of members in a `GUILD_CREATE` payload above which its
+        entities are deserialized in the `executor` instead of blocking the
+        event loop.
+
+        Defaults to [`None`][], which means nothing is offloaded.
+
+        !!! note
+            Offloading requires the `executor` to run the calls in the current
+            process, such as the default [`concurrent.futures.ThreadPoolExecutor`][].
     max_rate_limit
         The max number of seconds to backoff for when rate limited. Anything
         greater than this will instead raise an error.
@@ -234,6 +344,12 @@ class GatewayBot(traits.GatewayBotAware):
     proxy_settings
         Custom proxy settings to use with network-layer logic
         in your application to get through an HTTP-proxy.
+    session_store
+        The store to persist gateway sessions in, so that shards can resume
+        them after the bot restarts instead of identifying again, or [`None`][]
+        to not persist them. This is the default.
+
+        See [`hikari.impl.session_store`][] for the available implementations.
     dumps
         The JSON encoder this application should use.
     loads
@@ -292,23 +408,30 @@ class GatewayBot(traits.GatewayBotAware):
         "_cache",
         "_closed_event",
         "_closing_event",
+        "_cluster",
+        "_compression",
+        "_data_format",
         "_dumps",
         "_entity_factory",
         "_event_factory",
         "_event_manager",
         "_executor",
         "_http_settings",
+        "_identify_coordinator",
         "_intents",
         "_loads",
+        "_max_gateway_payload_size",
+        "_offload_gateway_payload_size",
         "_proxy_settings",
         "_rest",
+        "_session_store",
         "_shards",
         "_token",
         "_voice",
         "shards",
     )
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - Too many arguments
         self,
         token: str,
         *,
@@ -318,16 +441,29 @@ def __init__(
         executor: concurrent.futures.Executor | None = None,
         force_color: bool = False,
         cache_settings: config_impl.CacheSettings | None = None,
+        compression: str | None = gateway_shard.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+        data_format: str = gateway_shard.GatewayDataFormat.JSON,
+        dispatch_water_marks: tuple[int, int] | None = None,
+        shard_dispatch_water_marks: tuple[int, int] | None = None,
+        eager_dispatch: bool = False,
+        ordered_dispatch: bool = False,
+        lazy_messages: bool = False,
         http_settings: config_impl.HTTPSettings | None = None,
         dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         loads: data_binding.JSONDecoder = data_binding.default_json_loads,
+        identify_coordinator: identify_coordinator_.IdentifyCoordinator | None = None,
         intents: intents_.Intents = intents_.Intents.ALL_UNPRIVILEGED,
         auto_chunk_members: bool = True,
+        max_outstanding_chunk_requests: int = 5,
         logs: None | str | int | dict[str, typing.Any] | os.PathLike[str] = "INFO",
+        max_gateway_payload_size: int | None = None,
+        offload_gateway_payload_size: int | None = None,
+        offload_guild_member_count: int | None = None,
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
         proxy_settings: config_impl.ProxySettings | None = None,
         rest_url: str | None = None,
+        session_store: session_store_.GatewaySessionStore | None = None,
     ) -> None:
         # Beautification and logging
         ux.init_logging(logs, allow_color=allow_color, force_color=force_color)
@@ -337,10 +473,21 @@ def __init__(
         # Settings and state
         self._closed_event: asyncio.Event | None = None
         self._closing_event: asyncio.Event | None = None
+        self._cluster: cluster.ClusterSupervisor | None = None
+        self._compression = compression
+        self._data_format = data_format
         self._executor = executor
         self._http_settings = http_settings if http_settings is not None else config_impl.HTTPSettings()
+        self._identify_coordinator = (
+            identify_coordinator
+            if identify_coordinator is not None
+            else identify_coordinator_impl.InProcessIdentifyCoordinator()
+        )
         self._intents = intents
+        self._max_gateway_payload_size = max_gateway_payload_size
+        self._offload_gateway_payload_size = offload_gateway_payload_size
         self._proxy_settings = proxy_settings if proxy_settings is not None else config_impl.ProxySettings()
+        self._session_store = session_store
         self._token = token.strip()
         self._dumps = dumps
         self._loads = loads
@@ -350,7 +497,7 @@ def __init__(
         self._cache = cache_impl.CacheImpl(self, cache_settings)
 
         # Entity creation
-        self._entity_factory = entity_factory_impl.EntityFactoryImpl(self)
+        self._entity_factory = entity_factory_impl.EntityFactoryImpl(self, lazy_messages=lazy_messages)
 
         # Event creation
         self._event_factory = event_factory_impl.EventFactoryImpl(self)
@@ -361,7 +508,14 @@ def __init__(
             self._event_factory,
             self._intents,
             auto_chunk_members=auto_chunk_members,
+            max_outstanding_chunk_requests=max_outstanding_chunk_requests,
             cache=self._cache,
+            eager_dispatch=eager_dispatch,
+            dispatch_water_marks=dispatch_water_marks,
+            shard_dispatch_water_marks=shard_dispatch_water_marks,
+            ordered_dispatch=ordered_dispatch,
+            executor=self._executor,
+            offload_member_count=offload_guild_member_count,
         )
 
         # Voice subsystem
@@ -413,14 +567,34 @@ def event_factory(self) -> event_factory_.EventFactory:
     def executor(self) -> concurrent.futures.Executor | None:
         return self._executor
 
+    @property
+    def gateway_metrics(self) -> shard_impl.GatewayShardMetrics:
+        """Gateway metrics, aggregated across all the shards.
+
+        See [`hikari.impl.shard.GatewayShardMetrics.aggregate`][] for how
+        they are aggregated.
+        """
+        return shard_impl.GatewayShardMetrics.aggregate(self.shard_metrics.values())
+
+    @property
+    def shard_metrics(self) -> typing.Mapping[int, shard_impl.GatewayShardMetrics]:
+        """Mapping of shard ID to the gateway metrics collected by that shard."""
+        return {s.id: s.metrics for s in self._shards.values() if isinstance(s, shard_impl.GatewayShardImpl)}
+
     @property
     @typing_extensions.override
     def heartbeat_latencies(self) -> typing.Mapping[int, float]:
+        if self._cluster is not None:
+            return dict(self._cluster.heartbeat_latencies)
+
         return {s.id: s.heartbeat_latency for s in self._shards.values()}
 
     @property
     @typing_extensions.override
     def heartbeat_latency(self) -> float:
+        if self._cluster is not None:
+            return self._cluster.heartbeat_latency
+
         latencies = [s.heartbeat_latency for s in self._shards.values() if not math.isnan(s.heartbeat_latency)]
         return sum(latencies) / len(latencies) if latencies else float("nan")
 
@@ -491,6 +665,9 @@ async def close(self) -> None:
         for coro in asyncio.as_completed(shards):
             await coro
 
+        for chunker in self._event_manager.guild_chunkers.values():
+            chunker.close()
+
         await _close_resource("rest", self._rest.close())
 
         # Clear out cache and shard map
@@ -622,11 +799,20 @@ async def join(self) -> None:
         await aio.first_completed(self._closed_event.wait(), *(s.join() for s in self._shards.values()))
 
     def listen(
-        self, *event_types: type[base_events.EventT]
+        self,
+        *event_types: type[base_events.EventT],
+        guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None = None,
+        channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None = None,
+        author_is_bot: bool | None = None,
+        payload_predicate: event_manager_.PayloadPredicateT | None = None,
+        sample_every: int | None = None,
+        coalesce_by: str | event_manager_.KeyExtractorT[base_events.EventT] | None = None,
+        window: float | None = None,
     ) -> typing.Callable[[event_manager_.CallbackT[base_events.EventT]], event_manager_.CallbackT[base_events.EventT]]:
         """Generate a decorator to subscribe a callback to an event type.
 
-        This is a second-order decorator.
+        This is a second-order decorator. The raw payload filters are applied
+        as described in [`hikari.impl.gateway_bot.GatewayBot.subscribe`][].
 
         Parameters
         ----------
@@ -636,6 +822,33 @@ def listen(
             instead from the type hints on the function signature.
 
             `EventT` must be a subclass of [`hikari.events.base_events.Event`][].
+        guild_ids
+            If provided, only events whose raw payload has a `guild_id` in
+            these guilds are passed to the callback.
+        channel_ids
+            If provided, only events whose raw payload has a `channel_id` in
+            these channels are passed to the callback.
+        author_is_bot
+            If provided, only events whose raw payload has an `author` (or
+            `user`) with a matching `bot` flag are passed to the callback.
+        payload_predicate
+            If provided, only events whose raw payload this returns [`True`][]
+            for are passed to the callback.
+        sample_every
+            If provided, only one in every `sample_every` events accepted by
+            the other raw payload filters is passed to the callback. Like the
+            other raw payload filters, this is checked before the event is
+            deserialized.
+        coalesce_by
+            The attribute to group the events by, such as `"user_id"`, or a
+            function returning the key of an event. This can only be used
+            together with `window`.
+        window
+            If provided, the events are held for up to this many seconds and
+            only the latest event of each `coalesce_by` key (or the latest
+            event overall, if no key is given) is passed to the callback once
+            the window ends. The events superseded within the window never
+            reach the callback.
 
         Returns
         -------
@@ -644,6 +857,12 @@ def listen(
             [`hikari.impl.event_manager.EventManagerImpl.subscribe`][] before returning the function
             reference.
 
+        Raises
+        ------
+        ValueError
+            If `sample_every` is less than 1, if `window` is not positive or
+            if `coalesce_by` is provided without `window`.
+
         See Also
         --------
         Dispatch : [`hikari.impl.gateway_bot.GatewayBot.dispatch`][].
@@ -652,7 +871,16 @@ def listen(
         Unsubscribe : [`hikari.impl.gateway_bot.GatewayBot.unsubscribe`][].
         Wait_for : [`hikari.impl.gateway_bot.GatewayBot.wait_for`][].
         """
-        return self._event_manager.listen(*event_types)
+        return self._event_manager.listen(
+            *event_types,
+            guild_ids=guild_ids,
+            channel_ids=channel_ids,
+            author_is_bot=author_is_bot,
+            payload_predicate=payload_predicate,
+            sample_every=sample_every,
+            coalesce_by=coalesce_by,
+            window=window,
+        )
 
     @staticmethod
     def print_banner(
@@ -693,7 +921,7 @@ def print_banner(
         ux.print_banner(banner, allow_color=allow_color, force_color=force_color, extra_args=extra_args)
 
     @typing_extensions.override
-    def run(
+    def run(  # noqa: PLR0912
         self,
         *,
         activity: presences.Activity | None = None,
@@ -707,6 +935,7 @@ def run(
         idle_since: datetime.datetime | None = None,
         ignore_session_start_limit: bool = False,
         large_threshold: int = 250,
+        processes: int = 1,
         propagate_interrupts: bool = False,
         status: presences.Status = presences.Status.ONLINE,
         shard_ids: typing.Sequence[int] | None = None,
@@ -773,6 +1002,29 @@ def run(
             Threshold for members in a guild before it is treated as being
             "large" and no longer sending member details in the [GUILD CREATE][]
             event.
+        processes
+            The number of worker processes to run the shards in.
+
+            Defaults to `1`, which runs all the shards in the current process.
+            If greater than `1`, the shards are split between that many forked
+            worker processes, each with their own event loop, while the current
+            process supervises them. Workers that exit unexpectedly are restarted,
+            and their logs are handled by the logging configuration of the current
+            process. Listeners must be registered before calling this, so that
+            they are inherited by the workers.
+
+            While the workers are running, the
+            [`heartbeat_latencies`][hikari.impl.gateway_bot.GatewayBot.heartbeat_latencies]
+            and [`heartbeat_latency`][hikari.impl.gateway_bot.GatewayBot.heartbeat_latency]
+            of the bot in the current process report the latencies last reported
+            by the workers for each of their shards.
+
+            Unless a custom identify coordinator was passed to the constructor,
+            the workers share a [`hikari.impl.identify_coordinator.FileLockIdentifyCoordinator`][]
+            to respect the identify rate limits between them.
+
+            !!! note
+                This is not supported on Windows.
         propagate_interrupts
             If [`True`][], then any internal [`hikari.errors.HikariInterrupt`][]
             that is raises as a result of catching an OS level signal will
@@ -804,6 +1056,10 @@ def run(
             If bot is already running.
         TypeError
             If `shard_ids` is passed without `shard_count`.
+        ValueError
+            If `processes` is less than `1`.
+        NotImplementedError
+            If `processes` is greater than `1` on Windows.
         """
         if self._closed_event:
             msg = "bot is already running"
@@ -813,6 +1069,35 @@ def run(
             msg = "'shard_ids' must be passed with 'shard_count'"
             raise TypeError(msg)
 
+        if processes < 1:
+            msg = "'processes' must be at least 1"
+            raise ValueError(msg)
+
+        if processes > 1:
+            run = functools.partial(
+                self.run,
+                activity=activity,
+                afk=afk,
+                asyncio_debug=asyncio_debug,
+                check_for_updates=check_for_updates,
+                close_passed_executor=close_passed_executor,
+                close_loop=close_loop,
+                coroutine_tracking_depth=coroutine_tracking_depth,
+                idle_since=idle_since,
+                ignore_session_start_limit=ignore_session_start_limit,
+                large_threshold=large_threshold,
+                status=status,
+            )
+            self._run_cluster(
+                run,
+                enable_signal_handlers=enable_signal_handlers,
+                processes=processes,
+                propagate_interrupts=propagate_interrupts,
+                shard_ids=shard_ids,
+                shard_count=shard_count,
+            )
+            return
+
         loop = aio.get_or_make_loop()
 
         if asyncio_debug:
@@ -867,6 +1152,84 @@ def run(
                     _LOGGER.warning("forcefully terminated")
                     raise
 
+    def _run_cluster(
+        self,
+        run: typing.Callable[..., None],
+        *,
+        enable_signal_handlers: bool | None,
+        processes: int,
+        propagate_interrupts: bool,
+        shard_ids: typing.Sequence[int] | None,
+        shard_count: int | None,
+    ) -> None:
+        if sys.platform == "win32":
+            msg = "Running shards in multiple processes is not supported on Windows"
+            raise NotImplementedError(msg)
+
+        if shard_count is None:
+            # This runs in a throwaway event loop, as the workers must not inherit a running one
+            shard_count = asyncio.run(self._fetch_recommended_shard_count())
+
+        shard_ids = tuple(range(shard_count) if shard_ids is None else dict.fromkeys(shard_ids))
+
+        with tempfile.TemporaryDirectory(prefix="hikari-identify-") as coordinator_directory:
+            supervisor = cluster.ClusterSupervisor(
+                functools.partial(
+                    self._run_cluster_worker,
+                    run=run,
+                    shard_count=shard_count,
+                    coordinator_directory=coordinator_directory,
+                ),
+                cluster.split_shard_ids(shard_ids, processes),
+            )
+
+            self._cluster = supervisor
+            try:
+                with signals.handle_blocking_interrupts(
+                    enabled=enable_signal_handlers, propagate_interrupts=propagate_interrupts
+                ):
+                    supervisor.run()
+
+            finally:
+                self._cluster = None
+
+    async def _fetch_recommended_shard_count(self) -> int:
+        self._rest.start()
+
+        try:
+            return (await self._rest.fetch_gateway_bot_info()).shard_count
+
+        finally:
+            await self._rest.close()
+
+    def _run_cluster_worker(
+        self,
+        channel: cluster.WorkerChannel,
+        *,
+        run: typing.Callable[..., None],
+        shard_count: int,
+        coordinator_directory: str,
+    ) -> None:
+        # The worker is forked while the supervisor runs, but it reports the latencies of its own shards
+        self._cluster = None
+
+        # Identifies have to be coordinated across all the workers, not just within each one of them
+        if isinstance(self._identify_coordinator, identify_coordinator_impl.InProcessIdentifyCoordinator):
+            self._identify_coordinator = identify_coordinator_impl.FileLockIdentifyCoordinator(coordinator_directory)
+
+        async def report_heartbeat_latencies() -> None:
+            while self.is_alive:
+                channel.report_heartbeat_latencies(self.heartbeat_latencies)
+                await asyncio.sleep(_CLUSTER_REPORT_INTERVAL)
+
+        async def on_started(_: lifetime_events.StartedEvent) -> None:
+            asyncio.create_task(  # noqa: RUF006 - We want this to be a dangling asyncio task
+                report_heartbeat_latencies(), name="report heartbeat latencies"
+            )
+
+        self.subscribe(lifetime_events.StartedEvent, on_started)
+        run(shard_ids=channel.shard_ids, shard_count=shard_count)
+
     @typing_extensions.override
     async def start(
         self,
@@ -981,53 +1344,51 @@ async def start(
             "s" if len(shard_ids) != 1 else "",
         )
 
+        # Identifies are rate limited per bucket, which is given by the shard ID modulo
+        # the max concurrency. Each bucket can start a shard as soon as its own slot
+        # opens, independently of the others.
         max_concurrency = requirements.session_start_limit.max_concurrency
-        while shard_ids:
-            window = shard_ids[:max_concurrency]
-            shard_ids = shard_ids[max_concurrency:]
-
-            if self._shards:
-                _LOGGER.info("the next startup window is in 5 seconds, please wait...")
-
-                try:
-                    await aio.first_completed(
-                        self._closing_event.wait(), *(shard.join() for shard in self._shards.values()), timeout=5
-                    )
-
-                    if self._closing_event.is_set():
-                        return
-
-                    _LOGGER.critical("one or more shards closed while starting; shutting down")
-                    msg = "One or more shards closed while starting"
-                    raise RuntimeError(msg)
-                except asyncio.TimeoutError:
-                    # new window starts.
-                    pass
-
-            gather = asyncio.gather(
-                *(
-                    self._start_one_shard(
-                        activity=activity,
-                        afk=afk,
-                        idle_since=idle_since,
-                        status=status,
-                        large_threshold=large_threshold,
-                        shard_id=shard_id,
-                        shard_count=shard_count,
-                        url=requirements.url,
-                    )
-                    for shard_id in window
+        buckets: dict[int, list[int]] = {}
+        for shard_id in shard_ids:
+            buckets.setdefault(shard_id % max_concurrency, []).append(shard_id)
+
+        # If any bucket fails, all_of cancels the others, so they stop identifying shards
+        buckets_started = aio.all_of(
+            *(
+                self._start_shard_bucket(
+                    bucket,
+                    activity=activity,
+                    afk=afk,
+                    idle_since=idle_since,
+                    status=status,
+                    large_threshold=large_threshold,
+                    max_concurrency=max_concurrency,
+                    shard_count=shard_count,
+                    url=requirements.url,
                 )
+                for bucket in buckets.values()
             )
+        )
 
-            await aio.first_completed(self._closing_event.wait(), gather)
+        await aio.first_completed(self._closing_event.wait(), buckets_started)
+
+        if self._closing_event.is_set():
+            return
 
         await self._event_manager.dispatch(self._event_factory.deserialize_started_event())
 
         _LOGGER.info("started successfully in approx %.2f seconds", time.monotonic() - start_time)
 
     def stream(
-        self, event_type: type[base_events.EventT], /, timeout: float | None, limit: int | None = None
+        self,
+        event_type: type[base_events.EventT],
+        /,
+        timeout: float | None,
+        limit: int | None = None,
+        *,
+        overflow: str = event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+        key_by: str | event_manager_.KeyExtractorT[base_events.EventT] | None = None,
+        key: typing.Hashable = None,
     ) -> event_manager_.EventStream[base_events.EventT]:
         """Return a stream iterator for the given event and sub-events.
 
@@ -1046,9 +1407,24 @@ def stream(
             ending the iteration. If [`None`][] then this will continue
             until explicitly broken from.
         limit
-            The limit for how many events this should queue at one time before
-            dropping extra incoming events, leave this as [`None`][] for
-            the cache size to be unlimited.
+            The limit for how many events this should queue at one time,
+            leave this as [`None`][] for the queue size to be unlimited.
+        overflow
+            What to do with incoming events once `limit` is reached. By
+            default, they are dropped. See [`hikari.api.event_manager.StreamOverflowPolicy`][].
+        key_by
+            The attribute to look the events up by, such as `"message_id"`,
+            or a function returning the key of an event. Dotted attribute
+            paths such as `"interaction.message.id"` are also supported.
+
+            When provided, only the events whose key is equal to `key` are
+            considered, and they are found with a single lookup instead of
+            checking every stream. This keeps streaming the events of a lot
+            of different keys at once cheap. Functions are only indexed
+            together when they are the same object, so they should be reused
+            between calls.
+        key
+            The key the events must have. This is only used with `key_by`.
 
         Returns
         -------
@@ -1057,6 +1433,13 @@ def stream(
             with `with stream:` or `stream.open()` before
             asynchronously iterating over it.
 
+        Raises
+        ------
+        ValueError
+            If `key` is provided without `key_by`, or if `overflow` is
+            [`hikari.api.event_manager.StreamOverflowPolicy.BLOCK`][] for a
+            keyed stream.
+
         Examples
         --------
         ```py
@@ -1088,15 +1471,34 @@ def stream(
         Wait_for : [`hikari.impl.gateway_bot.GatewayBot.wait_for`][].
         """
         self._check_if_alive()
-        return self._event_manager.stream(event_type, timeout=timeout, limit=limit)
+        return self._event_manager.stream(
+            event_type, timeout=timeout, limit=limit, overflow=overflow, key_by=key_by, key=key
+        )
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
     # For the sake of UX, I will check this at runtime instead and let the
     # user use a static type checker.
-    def subscribe(self, event_type: type[typing.Any], callback: event_manager_.CallbackT[typing.Any]) -> None:
+    def subscribe(
+        self,
+        event_type: type[typing.Any],
+        callback: event_manager_.CallbackT[typing.Any],
+        *,
+        guild_ids: snowflakes.SnowflakeishSequence[guilds.PartialGuild] | None = None,
+        channel_ids: snowflakes.SnowflakeishSequence[channels.PartialChannel] | None = None,
+        author_is_bot: bool | None = None,
+        payload_predicate: event_manager_.PayloadPredicateT | None = None,
+        sample_every: int | None = None,
+        coalesce_by: str | event_manager_.KeyExtractorT[typing.Any] | None = None,
+        window: float | None = None,
+    ) -> None:
         """Subscribe a given callback to a given event type.
 
+        The raw payload filters are checked before the event is deserialized,
+        so events which no callback or cache needs are never built. Events
+        which were not received from the gateway (such as the ones dispatched
+        manually) are passed to the callback regardless of the filters.
+
         Parameters
         ----------
         event_type
@@ -1107,6 +1509,39 @@ def subscribe(self, event_type: type[typing.Any], callback: event_manager_.Callb
             Must be a coroutine function to invoke. This should
             consume an instance of the given event, or an instance of a valid
             subclass if one exists. Any result is discarded.
+        guild_ids
+            If provided, only events whose raw payload has a `guild_id` in
+            these guilds are passed to the callback.
+        channel_ids
+            If provided, only events whose raw payload has a `channel_id` in
+            these channels are passed to the callback.
+        author_is_bot
+            If provided, only events whose raw payload has an `author` (or
+            `user`) with a matching `bot` flag are passed to the callback.
+        payload_predicate
+            If provided, only events whose raw payload this returns [`True`][]
+            for are passed to the callback.
+        sample_every
+            If provided, only one in every `sample_every` events accepted by
+            the other raw payload filters is passed to the callback. Like the
+            other raw payload filters, this is checked before the event is
+            deserialized.
+        coalesce_by
+            The attribute to group the events by, such as `"user_id"`, or a
+            function returning the key of an event. This can only be used
+            together with `window`.
+        window
+            If provided, the events are held for up to this many seconds and
+            only the latest event of each `coalesce_by` key (or the latest
+            event overall, if no key is given) is passed to the callback once
+            the window ends. The events superseded within the window never
+            reach the callback.
+
+        Raises
+        ------
+        ValueError
+            If `sample_every` is less than 1, if `window` is not positive or
+            if `coalesce_by` is provided without `window`.
 
         Examples
         --------
@@ -1131,7 +1566,17 @@ async def on_message(event): ...
         Unsubscribe : [`hikari.impl.gateway_bot.GatewayBot.unsubscribe`][].
         Wait_for : [`hikari.impl.gateway_bot.GatewayBot.wait_for`][].
         """
-        self._event_manager.subscribe(event_type, callback)
+        self._event_manager.subscribe(
+            event_type,
+            callback,
+            guild_ids=guild_ids,
+            channel_ids=channel_ids,
+            author_is_bot=author_is_bot,
+            payload_predicate=payload_predicate,
+            sample_every=sample_every,
+            coalesce_by=coalesce_by,
+            window=window,
+        )
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
@@ -1180,6 +1625,9 @@ async def wait_for(
         /,
         timeout: float | None,
         predicate: event_manager_.PredicateT[base_events.EventT] | None = None,
+        *,
+        key_by: str | event_manager_.KeyExtractorT[base_events.EventT] | None = None,
+        key: typing.Hashable = None,
     ) -> base_events.EventT:
         """Wait for a given event to occur once, then return the event.
 
@@ -1203,6 +1651,18 @@ async def wait_for(
             [`None`][], then no timeout will be waited for (no timeout can
             result in "leaking" of coroutines that never complete if called in
             an uncontrolled way, so is not recommended).
+        key_by
+            The attribute to look the events up by, such as `"message_id"`,
+            or a function returning the key of an event. Dotted attribute
+            paths such as `"interaction.message.id"` are also supported.
+
+            When provided, only the events whose key is equal to `key` are
+            considered, and they are found with a single lookup instead of
+            checking every waiter. This keeps waiting on a lot of different
+            keys at once cheap. Functions are only indexed together when they
+            are the same object, so they should be reused between calls.
+        key
+            The key the events must have. This is only used with `key_by`.
 
         Returns
         -------
@@ -1214,6 +1674,8 @@ async def wait_for(
         asyncio.TimeoutError
             If the timeout is not [`None`][] and is reached before an
             event is received that the predicate returns [`True`][] for.
+        ValueError
+            If `key` is provided without `key_by`.
 
         See Also
         --------
@@ -1224,7 +1686,9 @@ async def wait_for(
         Unsubscribe : [`hikari.impl.gateway_bot.GatewayBot.unsubscribe`][].
         """
         self._check_if_alive()
-        return await self._event_manager.wait_for(event_type, timeout=timeout, predicate=predicate)
+        return await self._event_manager.wait_for(
+            event_type, timeout=timeout, predicate=predicate, key_by=key_by, key=key
+        )
 
     def _get_shard(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild]) -> gateway_shard.GatewayShard:
         guild = snowflakes.Snowflake(guild)
@@ -1283,6 +1747,42 @@ async def request_guild_members(
             guild=guild, include_presences=include_presences, query=query, limit=limit, users=users, nonce=nonce
         )
 
+    async def _start_shard_bucket(
+        self,
+        shard_ids: typing.Sequence[int],
+        *,
+        activity: presences.Activity | None,
+        afk: bool,
+        idle_since: datetime.datetime | None,
+        status: presences.Status,
+        large_threshold: int,
+        max_concurrency: int,
+        shard_count: int,
+        url: str,
+    ) -> None:
+        # Identifies are paced by the identify coordinator, which is only acquired by
+        # shards that actually IDENTIFY, so shards which RESUME start immediately.
+        started: list[gateway_shard.GatewayShard] = []
+
+        for shard_id in shard_ids:
+            if any(not shard.is_alive for shard in started):
+                _LOGGER.critical("one or more shards closed while starting; shutting down")
+                msg = "One or more shards closed while starting"
+                raise RuntimeError(msg)
+
+            await self._start_one_shard(
+                activity=activity,
+                afk=afk,
+                idle_since=idle_since,
+                status=status,
+                large_threshold=large_threshold,
+                max_concurrency=max_concurrency,
+                shard_id=shard_id,
+                shard_count=shard_count,
+                url=url,
+            )
+            started.append(self._shards[shard_id])
+
     async def _start_one_shard(
         self,
         *,
@@ -1291,11 +1791,14 @@ async def _start_one_shard(
         idle_since: datetime.datetime | None,
         status: presences.Status,
         large_threshold: int,
+        max_concurrency: int,
         shard_id: int,
         shard_count: int,
         url: str,
     ) -> None:
         new_shard = shard_impl.GatewayShardImpl(
+            compression=self._compression,
+            data_format=self._data_format,
             http_settings=self._http_settings,
             proxy_settings=self._proxy_settings,
             event_manager=self._event_manager,
@@ -1307,7 +1810,13 @@ async def _start_one_shard(
             initial_is_afk=afk,
             initial_idle_since=idle_since,
             initial_status=status,
+            identify_coordinator=self._identify_coordinator,
             large_threshold=large_threshold,
+            max_concurrency=max_concurrency,
+            max_payload_size=self._max_gateway_payload_size,
+            executor=self._executor,
+            offload_payload_size=self._offload_gateway_payload_size,
+            session_store=self._session_store,
             shard_id=shard_id,
             shard_count=shard_count,
             token=self._token,
@@ -0,0 +1,146 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Basic implementations of gateway identify coordinators."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("FileLockIdentifyCoordinator", "InProcessIdentifyCoordinator")
+
+import asyncio
+import os
+import sys
+import typing
+
+import attrs
+
+from hikari import files
+from hikari.api import identify_coordinator
+from hikari.internal import time
+from hikari.internal import typing_extensions
+
+if sys.platform != "win32":
+    import fcntl
+
+# Minimum time between two identifies in the same rate limit bucket
+_IDENTIFY_INTERVAL: typing.Final[float] = 5.0
+# Time to wait between attempts to acquire a file lock
+_FILE_LOCK_POLL_INTERVAL: typing.Final[float] = 0.1
+
+
+@attrs.define(weakref_slot=False)
+class _Bucket:
+    lock: asyncio.Lock = attrs.field(factory=asyncio.Lock)
+    """Lock held while waiting for the next identify slot."""
+
+    last_identify: float = attrs.field(default=-float("inf"))
+    """Monotonic time of the last identify."""
+
+
+class InProcessIdentifyCoordinator(identify_coordinator.IdentifyCoordinator):
+    """Identify coordinator for the shards running in the current process.
+
+    This is the default used by [`hikari.impl.gateway_bot.GatewayBot`][].
+    """
+
+    __slots__: typing.Sequence[str] = ("_buckets",)
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, _Bucket] = {}
+
+    @typing_extensions.override
+    async def acquire(self, shard_id: int, max_concurrency: int) -> None:
+        key = shard_id % max_concurrency
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            # Created lazily, as locks must be created inside the event loop in older Python versions
+            bucket = self._buckets[key] = _Bucket()
+
+        async with bucket.lock:
+            if (wait := bucket.last_identify + _IDENTIFY_INTERVAL - time.monotonic()) > 0:
+                await asyncio.sleep(wait)
+
+            bucket.last_identify = time.monotonic()
+
+
+class FileLockIdentifyCoordinator(identify_coordinator.IdentifyCoordinator):
+    """Identify coordinator for shards running in multiple processes on the same host.
+
+    Each rate limit bucket is represented by a file in the given directory,
+    which holds the time of the last identify in the bucket. Shards take an
+    exclusive lock on the file while they wait for the next identify slot,
+    so all processes that use the same directory share the rate limit.
+
+    !!! note
+        This is only supported on POSIX systems, as it relies on [`fcntl.flock`][].
+
+    Parameters
+    ----------
+    directory
+        The directory to keep the bucket files in. It must already exist and
+        be shared by all the processes.
+
+    Raises
+    ------
+    NotImplementedError
+        If the current platform is not supported.
+    """
+
+    __slots__: typing.Sequence[str] = ("_directory",)
+
+    def __init__(self, directory: files.Pathish) -> None:
+        if sys.platform == "win32":
+            msg = "FileLockIdentifyCoordinator is only supported on POSIX systems"
+            raise NotImplementedError(msg)
+
+        self._directory = files.ensure_path(directory)
+
+    @typing_extensions.override
+    async def acquire(self, shard_id: int, max_concurrency: int) -> None:
+        path = self._directory / f"identify-{shard_id % max_concurrency}.lock"
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+            # The lock is polled rather than blocked on in an executor, as a thread
+            # blocked on the lock could not be cancelled and would hold the lock
+            # forever once it got it.
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(_FILE_LOCK_POLL_INTERVAL)
+
+            try:
+                last_identify = float(os.pread(fd, 64, 0))
+            except ValueError:
+                # The file is new or was corrupted
+                last_identify = -float("inf")
+
+            # Wall clock time is used, as it is the only clock shared between processes
+            if (wait := last_identify + _IDENTIFY_INTERVAL - time.utc_datetime().timestamp()) > 0:
+                await asyncio.sleep(wait)
+
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, repr(time.utc_datetime().timestamp()).encode(), 0)
+
+        finally:
+            # Closing the file also releases the lock
+            os.close(fd)
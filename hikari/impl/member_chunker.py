@@ -0,0 +1,416 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Scheduling of the member chunk requests sent by gateway shards."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("ChunkingProgress", "GuildChunker")
+
+import asyncio
+import base64
+import contextlib
+import heapq
+import itertools
+import logging
+import random
+import typing
+
+import attrs
+
+from hikari import errors
+from hikari import snowflakes
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari import guilds
+    from hikari.api import shard as gateway_shard
+    from hikari.events import shard_events
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.member_chunker")
+
+# Time without receiving a chunk after which a request is considered lost
+_CHUNK_TIMEOUT: typing.Final[float] = 60.0
+# Time to wait before sending a request again while the shard is reconnecting
+_RETRY_INTERVAL: typing.Final[float] = 5.0
+
+
+def _fixed_size_nonce() -> str:
+    # This generates nonces of length 28 for use in member chunking.
+    head = time.monotonic_ns().to_bytes(8, "big")
+    tail = random.getrandbits(92).to_bytes(12, "big")
+    return base64.b64encode(head + tail).decode("ascii")
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class ChunkingProgress:
+    """Snapshot of the progress of a [`hikari.impl.member_chunker.GuildChunker`][]."""
+
+    guilds_pending: int = attrs.field(default=0)
+    """Number of guilds waiting for their members to be requested."""
+
+    guilds_in_flight: int = attrs.field(default=0)
+    """Number of guilds which had their members requested, but not received in full yet."""
+
+    guilds_chunked: int = attrs.field(default=0)
+    """Number of guilds which had all their members received."""
+
+    guilds_dropped: int = attrs.field(default=0)
+    """Number of guilds which did not have all their members received.
+
+    This happens when the request could not be sent, the chunks stopped
+    arriving or the chunker was closed.
+    """
+
+    members_received: int = attrs.field(default=0)
+    """Number of members received in chunks."""
+
+    @property
+    def is_chunked(self) -> bool:
+        """Whether there are no requests left pending or in flight."""
+        return not self.guilds_pending and not self.guilds_in_flight
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class _ChunkRequest:
+    guild_id: snowflakes.Snowflake = attrs.field()
+    """The ID of the guild to request the members of."""
+
+    nonce: str = attrs.field()
+    """The nonce the chunks will be received with."""
+
+    include_presences: bool = attrs.field()
+    """Whether to request the presences of the members."""
+
+    key: tuple[bool, int, int] = attrs.field()
+    """The sort key of the request in the queue.
+
+    This is made of whether the request was not prioritized, the member count
+    of the guild and the order in which the request was queued.
+    """
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class _InFlightRequest:
+    guild_id: snowflakes.Snowflake = attrs.field()
+    """The ID of the guild the members were requested for."""
+
+    deadline: float = attrs.field()
+    """Monotonic time after which the request is considered lost, if no more chunks arrive."""
+
+    chunks_received: int = attrs.field(default=0)
+    """Number of chunks received so far."""
+
+
+class GuildChunker:
+    """Scheduler for the member chunk requests of a gateway shard.
+
+    Requests are deduplicated per guild and sent in order of priority, with
+    explicitly prioritized guilds first and then the smallest guilds first,
+    so that as many guilds as possible become fully chunked early. Only a
+    limited number of guilds have their chunks in flight at once, leaving the
+    gateway rate limit of the shard available for other commands.
+
+    Parameters
+    ----------
+    shard
+        The shard to request the members with.
+    max_outstanding
+        The maximum number of guilds to have member chunks in flight for at once.
+    timeout
+        The time in seconds without receiving a chunk after which a request is
+        considered lost, freeing up its slot.
+
+    Raises
+    ------
+    ValueError
+        If `max_outstanding` is less than 1.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_chunked_event",
+        "_guilds_chunked",
+        "_guilds_dropped",
+        "_in_flight",
+        "_max_outstanding",
+        "_members_received",
+        "_pending",
+        "_queue",
+        "_sequence",
+        "_shard",
+        "_task",
+        "_timeout",
+        "_wakeup_event",
+    )
+
+    def __init__(
+        self, shard: gateway_shard.GatewayShard, *, max_outstanding: int = 5, timeout: float = _CHUNK_TIMEOUT
+    ) -> None:
+        if max_outstanding < 1:
+            msg = "'max_outstanding' must be greater than 0"
+            raise ValueError(msg)
+
+        self._chunked_event = asyncio.Event()
+        self._chunked_event.set()
+        self._guilds_chunked = 0
+        self._guilds_dropped = 0
+        self._in_flight: dict[str, _InFlightRequest] = {}
+        self._max_outstanding = max_outstanding
+        self._members_received = 0
+        self._pending: dict[snowflakes.Snowflake, _ChunkRequest] = {}
+        self._queue: list[tuple[tuple[bool, int, int], snowflakes.Snowflake]] = []
+        self._sequence = itertools.count()
+        self._shard = shard
+        self._task: asyncio.Task[None] | None = None
+        self._timeout = timeout
+        self._wakeup_event = asyncio.Event()
+
+    @property
+    def shard(self) -> gateway_shard.GatewayShard:
+        """The shard the members are requested through."""
+        return self._shard
+
+    @property
+    def progress(self) -> ChunkingProgress:
+        """Snapshot of the progress of the requests made by this chunker."""
+        return ChunkingProgress(
+            guilds_pending=len(self._pending),
+            guilds_in_flight=len(self._in_flight),
+            guilds_chunked=self._guilds_chunked,
+            guilds_dropped=self._guilds_dropped,
+            members_received=self._members_received,
+        )
+
+    def request(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        *,
+        include_presences: bool = False,
+        member_count: int = 0,
+        priority: bool = False,
+    ) -> str:
+        """Queue a request for the members of a guild.
+
+        If the members of the guild are already queued to be requested, then
+        the existing request is reused instead.
+
+        Parameters
+        ----------
+        guild
+            The guild to request the members of.
+        include_presences
+            Whether to request the presences of the members too.
+        member_count
+            The approximate number of members in the guild, used to request
+            the members of the smallest guilds first.
+        priority
+            Whether to request the members of this guild before those of any
+            guild not requested with priority.
+
+        Returns
+        -------
+        str
+            The nonce the member chunks will be received with.
+        """
+        guild_id = snowflakes.Snowflake(guild)
+
+        if request := self._pending.get(guild_id):
+            request.include_presences = request.include_presences or include_presences
+            if priority and request.key[0]:
+                # The old entry in the queue is skipped once popped, as its key no longer matches
+                request.key = (False, request.key[1], request.key[2])
+                heapq.heappush(self._queue, (request.key, guild_id))
+
+            return request.nonce
+
+        request = _ChunkRequest(
+            guild_id=guild_id,
+            nonce=f"{self._shard.id}.{_fixed_size_nonce()}",
+            include_presences=include_presences,
+            key=(not priority, member_count, next(self._sequence)),
+        )
+        self._pending[guild_id] = request
+        heapq.heappush(self._queue, (request.key, guild_id))
+        self._chunked_event.clear()
+        self._wakeup_event.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"shard {self._shard.id} member chunking")
+
+        return request.nonce
+
+    def is_in_flight(self, nonce: str | None) -> bool:
+        """Whether the chunks with the given nonce were requested by this chunker and are still expected.
+
+        Parameters
+        ----------
+        nonce
+            The nonce of the member chunk.
+
+        Returns
+        -------
+        bool
+            Whether the chunks are still expected.
+        """
+        return nonce is not None and nonce in self._in_flight
+
+    def record_chunk(self, event: shard_events.MemberChunkEvent) -> None:
+        """Record the receipt of a member chunk.
+
+        Chunks which were not requested by this chunker are ignored.
+
+        Parameters
+        ----------
+        event
+            The member chunk event received.
+        """
+        if event.nonce is None or (request := self._in_flight.get(event.nonce)) is None:
+            return
+
+        self._members_received += len(event.members)
+        request.chunks_received += 1
+        request.deadline = time.monotonic() + self._timeout
+
+        if request.chunks_received >= event.chunk_count:
+            del self._in_flight[event.nonce]
+            self._guilds_chunked += 1
+            self._wakeup_event.set()
+            self._update_chunked()
+
+    async def wait_until_chunked(self) -> None:
+        """Wait until there are no requests left pending or in flight.
+
+        This returns immediately if nothing was requested.
+        """
+        await self._chunked_event.wait()
+
+    def close(self) -> None:
+        """Stop requesting members, dropping all the requests which were not completed."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._drop_all()
+
+    def _update_chunked(self) -> None:
+        if not self._pending and not self._in_flight:
+            self._chunked_event.set()
+
+    def _drop_all(self) -> None:
+        self._guilds_dropped += len(self._pending) + len(self._in_flight)
+        self._pending.clear()
+        self._queue.clear()
+        self._in_flight.clear()
+        self._update_chunked()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for nonce, request in tuple(self._in_flight.items()):
+            if request.deadline <= now:
+                _LOGGER.warning(
+                    "shard %s stopped receiving member chunks for guild %s, dropping the request",
+                    self._shard.id,
+                    request.guild_id,
+                )
+                del self._in_flight[nonce]
+                self._guilds_dropped += 1
+
+    async def _sleep(self) -> None:
+        # Wait until a request is queued or completed, or until the next in flight request expires
+        self._wakeup_event.clear()
+        timeout = min(request.deadline for request in self._in_flight.values()) - time.monotonic()
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wakeup_event.wait(), timeout=max(timeout, 0.0))
+
+    def _pop_next(self) -> _ChunkRequest:
+        while True:
+            key, guild_id = heapq.heappop(self._queue)
+            request = self._pending.get(guild_id)
+
+            if request is not None and request.key == key:
+                del self._pending[guild_id]
+                return request
+
+    async def _send(self, request: _ChunkRequest) -> bool:
+        # The request is sent in its own task, so that it being cancelled by the shard
+        # reconnecting can be told apart from this task being cancelled.
+        task = asyncio.create_task(
+            self._shard.request_guild_members(
+                request.guild_id, include_presences=request.include_presences, nonce=request.nonce
+            )
+        )
+
+        try:
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+        if task.cancelled() or isinstance(task.exception(), errors.ComponentStateConflictError):
+            return False
+
+        if exception := task.exception():
+            _LOGGER.error(
+                "shard %s failed to request the members of guild %s",
+                self._shard.id,
+                request.guild_id,
+                exc_info=exception,
+            )
+            del self._in_flight[request.nonce]
+            self._guilds_dropped += 1
+
+        return True
+
+    async def _run(self) -> None:
+        try:
+            while self._pending or self._in_flight:
+                self._expire()
+
+                if not self._pending or len(self._in_flight) >= self._max_outstanding:
+                    if self._in_flight:
+                        await self._sleep()
+                    continue
+
+                request = self._pop_next()
+                self._in_flight[request.nonce] = _InFlightRequest(
+                    guild_id=request.guild_id, deadline=time.monotonic() + self._timeout
+                )
+
+                if await self._send(request):
+                    continue
+
+                del self._in_flight[request.nonce]
+
+                if not self._shard.is_alive:
+                    _LOGGER.debug("shard %s closed, dropping all member chunk requests", self._shard.id)
+                    self._pending[request.guild_id] = request
+                    self._drop_all()
+                    return
+
+                # The shard is reconnecting, so try again later unless the guild was queued again meanwhile
+                if request.guild_id not in self._pending:
+                    self._pending[request.guild_id] = request
+                    heapq.heappush(self._queue, (request.key, request.guild_id))
+
+                await asyncio.sleep(_RETRY_INTERVAL)
+
+        finally:
+            self._update_chunked()
@@ -0,0 +1,149 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Basic implementations of gateway session stores."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("FileSessionStore", "InMemorySessionStore")
+
+import asyncio
+import os
+import typing
+
+from hikari import files
+from hikari.api import session_store
+from hikari.internal import data_binding
+from hikari.internal import typing_extensions
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+    import pathlib
+
+
+class InMemorySessionStore(session_store.GatewaySessionStore):
+    """Session store which keeps the sessions in memory.
+
+    This only allows shards to resume after being restarted within the same
+    process, which is mostly useful for testing.
+    """
+
+    __slots__: typing.Sequence[str] = ("_sessions",)
+
+    def __init__(self) -> None:
+        self._sessions: dict[int, session_store.GatewaySession] = {}
+
+    @typing_extensions.override
+    async def load(self, shard_id: int) -> session_store.GatewaySession | None:
+        return self._sessions.get(shard_id)
+
+    @typing_extensions.override
+    async def save(self, shard_id: int, session: session_store.GatewaySession) -> None:
+        self._sessions[shard_id] = session
+
+    @typing_extensions.override
+    async def delete(self, shard_id: int) -> None:
+        self._sessions.pop(shard_id, None)
+
+
+def _session_path(directory: pathlib.Path, shard_id: int) -> pathlib.Path:
+    return directory / f"shard-{shard_id}.json"
+
+
+def _load_session(path: pathlib.Path) -> session_store.GatewaySession | None:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    payload = data_binding.default_json_loads(raw)
+    assert isinstance(payload, dict)
+    return session_store.GatewaySession(
+        session_id=payload["session_id"],
+        seq=int(payload["seq"]),
+        resume_gateway_url=payload["resume_gateway_url"],
+        shard_count=int(payload["shard_count"]),
+    )
+
+
+def _save_session(path: pathlib.Path, session: session_store.GatewaySession) -> None:
+    payload = {
+        "session_id": session.session_id,
+        "seq": session.seq,
+        "resume_gateway_url": session.resume_gateway_url,
+        "shard_count": session.shard_count,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first, so that the session is never left
+    # partially written if the process dies in the middle of a checkpoint.
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data_binding.default_json_dumps(payload))
+    os.replace(tmp_path, path)  # noqa: PTH105 - Use pathlib
+
+
+def _delete_session(path: pathlib.Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+class FileSessionStore(session_store.GatewaySessionStore):
+    """Session store which keeps the sessions in a directory, with one JSON file per shard.
+
+    Each shard only ever reads and writes its own file, so the directory can
+    be shared by multiple processes running different shards, such as the
+    workers of a cluster, and a checkpoint only costs writing a single small
+    file. Files are replaced atomically, so a session is never left partially
+    written. All file operations are run in the given executor.
+
+    !!! warning
+        The files contain the session IDs of the bot, which can be used
+        to resume its sessions alongside the token. They should be kept
+        as private as the token itself.
+
+    Parameters
+    ----------
+    directory
+        The directory to store the sessions in. It will be created if it
+        does not exist.
+    executor
+        The executor to run file operations in. If [`None`][], the default
+        executor of the event loop will be used.
+    """
+
+    __slots__: typing.Sequence[str] = ("_directory", "_executor")
+
+    def __init__(self, directory: files.Pathish, *, executor: concurrent.futures.Executor | None = None) -> None:
+        self._directory = files.ensure_path(directory)
+        self._executor = executor
+
+    @typing_extensions.override
+    async def load(self, shard_id: int) -> session_store.GatewaySession | None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _load_session, _session_path(self._directory, shard_id))
+
+    @typing_extensions.override
+    async def save(self, shard_id: int, session: session_store.GatewaySession) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, _save_session, _session_path(self._directory, shard_id), session)
+
+    @typing_extensions.override
+    async def delete(self, shard_id: int) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, _delete_session, _session_path(self._directory, shard_id))
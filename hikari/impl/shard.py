@@ -22,18 +22,21 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("GatewayShardImpl",)
+__all__: typing.Sequence[str] = ("GatewayShardImpl", "GatewayShardMetrics")
 
 import asyncio
+import collections
 import contextlib
 import logging
 import platform
+import re
 import sys
 import typing
 import urllib.parse
 import zlib
 
 import aiohttp
+import attrs
 
 from hikari import _about as about
 from hikari import errors
@@ -42,23 +45,30 @@
 from hikari import snowflakes
 from hikari import undefined
 from hikari import urls
+from hikari.api import session_store as session_store_
 from hikari.api import shard
 from hikari.impl import rate_limits
 from hikari.internal import aio
 from hikari.internal import data_binding
+from hikari.internal import etf
 from hikari.internal import net
 from hikari.internal import time
 from hikari.internal import typing_extensions
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
     import datetime
 
+    # This is kept inline as zstandard is an optional dependency.
+    import zstandard
+
     from hikari import channels
     from hikari import guilds
     from hikari import users as users_
     from hikari.api import event_factory as event_factory_
     from hikari.api import event_manager as event_manager_
+    from hikari.api import identify_coordinator as identify_coordinator_
     from hikari.impl import config
 
 # Important attributes
@@ -97,8 +107,34 @@
 # This is done to always allow for HEARTBEAT packages
 # to get around (leaving 3 slots for it).
 _NON_PRIORITY_RATELIMIT: typing.Final[tuple[float, int]] = (60.0, 117)
+# Priorities of the commands sent through the command queue, lower values are sent first
+_VOICE_STATE_UPDATE_PRIORITY: typing.Final[int] = 0
+_REQUEST_GUILD_MEMBERS_PRIORITY: typing.Final[int] = 1
+_PRESENCE_UPDATE_PRIORITY: typing.Final[int] = 2
+# Key of the pending presence update in the command queue, as only the latest one needs to be sent
+_PRESENCE_UPDATE_KEY: typing.Final[str] = "presence"
 # Used to identify the end of a ZLIB payload
 _ZLIB_SUFFIX: typing.Final[bytes] = b"\x00\x00\xff\xff"
+_ZLIB_SUFFIX_LENGTH: typing.Final[int] = len(_ZLIB_SUFFIX)
+# Maximum size of each chunk produced when inflating a ZLIB payload
+_ZLIB_INFLATE_CHUNK_SIZE: typing.Final[int] = 65_536
+# Maximum size of each slice of compressed data fed to the zstd decompressor. Unlike zlib,
+# it cannot bound the size of its output, so the input is bounded instead
+_ZSTD_INFLATE_CHUNK_SIZE: typing.Final[int] = 16_384
+# Fragmented messages larger than this do not keep the reusable buffer at their size
+_MAX_RETAINED_BUFFER_SIZE: typing.Final[int] = 1_048_576
+# Matches the start of a JSON dispatch, as sent by Discord, to be able to read the
+# event name and sequence without decoding the whole payload. Payloads which don't
+# match (including all ETF payloads) are just decoded in full.
+_JSON_DISPATCH_HEADER_PATTERN: typing.Final[typing.Pattern[bytes]] = re.compile(
+    rb'\{"t":"([A-Z0-9_]+)","s":([0-9]+),"op":0,'
+)
+# Value of the "compress" query parameter for each supported transport compression
+_COMPRESS_QUERY_VALUES: typing.Final[typing.Mapping[shard.GatewayCompression, str]] = {
+    shard.GatewayCompression.TRANSPORT_ZLIB_STREAM: "zlib-stream",
+    shard.GatewayCompression.TRANSPORT_ZSTD_STREAM: "zstd-stream",
+}
+_TRANSPORT_COMPRESSION_FORMATS: typing.Final[frozenset[str]] = frozenset(_COMPRESS_QUERY_VALUES)
 # Close codes which don't invalidate the current session.
 _RECONNECTABLE_CLOSE_CODES: frozenset[errors.ShardCloseCode] = frozenset(
     (
@@ -111,6 +147,8 @@
 )
 # Default value used by the client
 _CUSTOM_STATUS_NAME = "Custom Status"
+# Number of heartbeat latencies to keep in the metrics of each shard
+_HEARTBEAT_LATENCY_HISTORY_SIZE: typing.Final[int] = 1_000
 
 
 def _log_filterer(token: bytes) -> typing.Callable[[bytes], bytes]:
@@ -120,51 +158,200 @@ def filterer(entry: bytes) -> bytes:
     return filterer
 
 
+@attrs.define(kw_only=True, weakref_slot=False)
+class GatewayShardMetrics:
+    """Metrics collected by a gateway shard.
+
+    All values are cumulative since the shard was created, across all the
+    connections it made. Times are measured in seconds.
+    """
+
+    frames_received: int = attrs.field(default=0)
+    """Number of websocket frames received."""
+
+    payloads_received: int = attrs.field(default=0)
+    """Number of gateway payloads received.
+
+    This may be lower than [`frames_received`][] when payloads are split
+    across multiple frames.
+    """
+
+    raw_bytes_received: int = attrs.field(default=0)
+    """Number of bytes received on the websocket, before decompression."""
+
+    bytes_received: int = attrs.field(default=0)
+    """Number of bytes received, after decompression."""
+
+    dispatches: collections.Counter[str] = attrs.field(factory=collections.Counter)
+    """Number of dispatches received, per event name."""
+
+    skipped_dispatches: int = attrs.field(default=0)
+    """Number of dispatches which were not decoded, as nothing would consume them."""
+
+    inflate_time: float = attrs.field(default=0.0)
+    """Time spent decompressing payloads."""
+
+    decode_time: float = attrs.field(default=0.0)
+    """Time spent decoding payloads."""
+
+    total_rate_limit_wait_time: float = attrs.field(default=0.0)
+    """Time spent waiting on the rate limit which applies to all payloads sent."""
+
+    non_priority_rate_limit_wait_time: float = attrs.field(default=0.0)
+    """Time spent waiting on the rate limit which applies to non-priority payloads sent."""
+
+    coalesced_commands: int = attrs.field(default=0)
+    """Number of commands which replaced a pending one instead of being sent separately."""
+
+    read_pauses: int = attrs.field(default=0)
+    """Number of times reading from the gateway was paused, as too many events were still being handled."""
+
+    read_pause_time: float = attrs.field(default=0.0)
+    """Time spent with reading from the gateway paused."""
+
+    identifies: int = attrs.field(default=0)
+    """Number of times a new session was identified."""
+
+    resumes: int = attrs.field(default=0)
+    """Number of times a session resume was attempted."""
+
+    reconnects: int = attrs.field(default=0)
+    """Number of times a connection was attempted after the first one."""
+
+    heartbeat_latencies: collections.deque[float] = attrs.field(
+        factory=lambda: collections.deque(maxlen=_HEARTBEAT_LATENCY_HISTORY_SIZE)
+    )
+    """History of heartbeat latencies, from oldest to newest.
+
+    Only the last 1000 latencies are kept for each shard.
+    """
+
+    @classmethod
+    def aggregate(cls, metrics: typing.Iterable[GatewayShardMetrics], /) -> GatewayShardMetrics:
+        """Aggregate the metrics of multiple shards.
+
+        Counters and times are summed, and the heartbeat latency histories
+        are concatenated.
+
+        Parameters
+        ----------
+        metrics
+            The metrics to aggregate.
+
+        Returns
+        -------
+        GatewayShardMetrics
+            The aggregated metrics.
+        """
+        result = cls(heartbeat_latencies=collections.deque())
+
+        for metric in metrics:
+            result.frames_received += metric.frames_received
+            result.payloads_received += metric.payloads_received
+            result.raw_bytes_received += metric.raw_bytes_received
+            result.bytes_received += metric.bytes_received
+            result.dispatches.update(metric.dispatches)
+            result.skipped_dispatches += metric.skipped_dispatches
+            result.inflate_time += metric.inflate_time
+            result.decode_time += metric.decode_time
+            result.total_rate_limit_wait_time += metric.total_rate_limit_wait_time
+            result.non_priority_rate_limit_wait_time += metric.non_priority_rate_limit_wait_time
+            result.coalesced_commands += metric.coalesced_commands
+            result.read_pauses += metric.read_pauses
+            result.read_pause_time += metric.read_pause_time
+            result.identifies += metric.identifies
+            result.resumes += metric.resumes
+            result.reconnects += metric.reconnects
+            result.heartbeat_latencies.extend(metric.heartbeat_latencies)
+
+        return result
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class _PendingCommand:
+    priority: int = attrs.field()
+    """Priority of the command, lower values are sent first."""
+
+    data: data_binding.JSONObject = attrs.field()
+    """The payload to send, which is replaced when the command is coalesced."""
+
+    future: asyncio.Future[None] = attrs.field()
+    """Future completed once the command was sent."""
+
+
 @typing.final
 class _GatewayTransport:
     """Internal component to handle lower-level communication logic.
 
     This includes translating aiohttp error conditions to hikari ones,
-    handling inbound zlib packets, creating the websocket and client session,
+    handling inbound zlib and zstd packets, creating the websocket and client session,
     and ensuring all resources are freed deterministically where possible.
 
     Payload logging is also performed here.
     """
 
     __slots__ = (
+        "_buffer",
         "_dumps",
+        "_executor",
         "_exit_stack",
         "_loads",
         "_log_filterer",
         "_logger",
+        "_max_payload_size",
+        "_metrics",
+        "_offload_payload_size",
         "_receive_and_check",
         "_sent_close",
         "_ws",
         "_zlib",
+        "_zstd",
     )
 
     def __init__(
         self,
         *,
         ws: aiohttp.ClientWebSocketResponse,
-        transport_compression: bool,
+        compression: str | None,
+        data_format: str,
         exit_stack: contextlib.AsyncExitStack,
         logger: logging.Logger,
         log_filterer: typing.Callable[[bytes], bytes],
         dumps: data_binding.JSONEncoder,
         loads: data_binding.JSONDecoder,
+        max_payload_size: int | None = None,
+        metrics: GatewayShardMetrics | None = None,
+        executor: concurrent.futures.Executor | None = None,
+        offload_payload_size: int | None = None,
     ) -> None:
+        # Reused across fragmented messages to avoid allocating a new buffer
+        # for each one. It grows to fit the largest message received, but is
+        # released again after messages over _MAX_RETAINED_BUFFER_SIZE.
+        self._buffer = bytearray()
         self._logger = logger
+        self._max_payload_size = max_payload_size
+        self._metrics = metrics if metrics is not None else GatewayShardMetrics()
+        self._executor = executor
+        self._offload_payload_size = offload_payload_size
         self._log_filterer = log_filterer
         self._exit_stack = exit_stack
         self._sent_close = False
         self._ws = ws
         self._zlib = zlib.decompressobj()
+        self._zstd: zstandard.ZstdDecompressionObj | None = None
         self._loads = loads
         self._dumps = dumps
 
-        if transport_compression:
+        if compression == shard.GatewayCompression.TRANSPORT_ZLIB_STREAM:
             self._receive_and_check = self._receive_and_check_zlib
+        elif compression == shard.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+            # This is kept inline as zstandard is an optional dependency.
+            import zstandard
+
+            self._zstd = zstandard.ZstdDecompressor().decompressobj()
+            self._receive_and_check = self._receive_and_check_zstd
+        elif data_format == shard.GatewayDataFormat.ETF:
+            self._receive_and_check = self._receive_and_check_binary
         else:
             self._receive_and_check = self._receive_and_check_text
 
@@ -189,13 +376,32 @@ async def send_close(self, *, code: int, message: bytes) -> None:
             # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
             await asyncio.sleep(0.25)
 
-    async def receive_json(self) -> data_binding.JSONObject:
-        pl = await self._receive_and_check()
-        if self._logger.isEnabledFor(ux.TRACE):
-            filtered = self._log_filterer(pl)
-            self._logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
+    async def receive_json(
+        self, skip_dispatch: typing.Callable[[str, int], bool] | None = None
+    ) -> data_binding.JSONObject:
+        while True:
+            pl = await self._receive_and_check()
+            self._metrics.payloads_received += 1
+            self._metrics.bytes_received += len(pl)
+
+            if self._logger.isEnabledFor(ux.TRACE):
+                filtered = self._log_filterer(pl)
+                self._logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
+
+            if (
+                skip_dispatch is None
+                or (header := _JSON_DISPATCH_HEADER_PATTERN.match(pl)) is None
+                or not skip_dispatch(header[1].decode("ascii"), int(header[2]))
+            ):
+                break
+
+        start = time.monotonic()
+        if self._should_offload(len(pl)):
+            val = await asyncio.get_running_loop().run_in_executor(self._executor, self._loads, pl)
+        else:
+            val = self._loads(pl)
+        self._metrics.decode_time += time.monotonic() - start
 
-        val = self._loads(pl)
         assert isinstance(val, dict)
         return val
 
@@ -239,35 +445,181 @@ async def _receive_and_check_text(self) -> bytes:
 
         if message.type == aiohttp.WSMsgType.TEXT:
             assert isinstance(message.data, str)
-            return message.data.encode()
+            data = message.data.encode()
+            self._metrics.frames_received += 1
+            self._metrics.raw_bytes_received += len(data)
+            return data
 
         self._handle_other_message(message)  # noqa: RET503 - Missing `return None`
 
-    async def _receive_and_check_zlib(self) -> bytes:
+    async def _receive_and_check_binary(self) -> bytes:
         message = await self._ws.receive()
 
         if message.type == aiohttp.WSMsgType.BINARY:
+            assert isinstance(message.data, bytes)
+            self._metrics.frames_received += 1
+            self._metrics.raw_bytes_received += len(message.data)
+            return message.data
+
+        self._handle_other_message(message)  # noqa: RET503 - Missing `return None`
+
+    def _should_offload(self, size: int) -> bool:
+        return self._offload_payload_size is not None and size > self._offload_payload_size
+
+    def _log_dropped_payload(self, size: int) -> None:
+        self._logger.warning(
+            "dropping payload of %s bytes, as it exceeds the maximum payload size of %s bytes",
+            size,
+            self._max_payload_size,
+        )
+
+    def _inflate_zlib(self, data: bytes | memoryview) -> bytes | None:
+        # Decompress in bounded chunks, so that we can stop buffering as soon as
+        # the payload goes over the size limit. The rest of the payload must still
+        # go through the decompressor to keep the stream state consistent.
+        chunks: list[bytes] = []
+        size = 0
+        too_large = False
+        start = time.monotonic()
+
+        while True:
+            chunk = self._zlib.decompress(data, _ZLIB_INFLATE_CHUNK_SIZE)
+            data = self._zlib.unconsumed_tail
+            size += len(chunk)
+
+            if not too_large:
+                chunks.append(chunk)
+
+                if self._max_payload_size is not None and size > self._max_payload_size:
+                    too_large = True
+                    chunks.clear()
+
+            if not data and len(chunk) < _ZLIB_INFLATE_CHUNK_SIZE:
+                break
+
+        self._metrics.inflate_time += time.monotonic() - start
+
+        if too_large:
+            self._log_dropped_payload(size)
+            return None
+
+        # Hot and fast path: the whole payload fit in a single chunk
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def _inflate_zstd(self, data: bytes) -> bytes | None:
+        # Decompress in bounded slices, so that we can stop buffering as soon as
+        # the payload goes over the size limit. The rest of the payload must still
+        # go through the decompressor to keep the stream state consistent.
+        assert self._zstd is not None
+        start = time.monotonic()
+
+        if len(data) <= _ZSTD_INFLATE_CHUNK_SIZE:
+            # Hot and fast path: the whole payload fits in a single slice
+            chunks = [self._zstd.decompress(data)]
+            size = len(chunks[0])
+
+        else:
+            chunks = []
+            size = 0
+            with memoryview(data) as view:
+                for offset in range(0, len(data), _ZSTD_INFLATE_CHUNK_SIZE):
+                    with view[offset : offset + _ZSTD_INFLATE_CHUNK_SIZE] as piece:
+                        chunk = self._zstd.decompress(piece)
+
+                    size += len(chunk)
+                    if self._max_payload_size is None or size <= self._max_payload_size:
+                        chunks.append(chunk)
+                    else:
+                        chunks.clear()
+
+        self._metrics.inflate_time += time.monotonic() - start
+
+        if self._max_payload_size is not None and size > self._max_payload_size:
+            self._log_dropped_payload(size)
+            return None
+
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    async def _receive_and_check_zlib(self) -> bytes:
+        while True:
+            message = await self._ws.receive()
+
+            if message.type != aiohttp.WSMsgType.BINARY:
+                self._handle_other_message(message)
+
+            self._metrics.frames_received += 1
+            self._metrics.raw_bytes_received += len(message.data)
+
             if message.data.endswith(_ZLIB_SUFFIX):
                 # Hot and fast path: we already have the full message
                 # in a single frame
-                return self._zlib.decompress(message.data)
+                if self._should_offload(len(message.data)):
+                    payload = await asyncio.get_running_loop().run_in_executor(
+                        self._executor, self._inflate_zlib, message.data
+                    )
+                else:
+                    payload = self._inflate_zlib(message.data)
 
-            # Cold and slow path: we need to keep receiving frames to complete
-            # the whole message. Only then do we create a buffer
-            buff = bytearray(message.data)
+            else:
+                # Cold and slow path: we need to keep receiving frames to complete
+                # the whole message, which we store in the reusable buffer
+                buff = self._buffer
+                size = len(message.data)
+                buff[:size] = message.data
+
+                # The suffix may itself be split across frames, so check the buffer instead
+                while buff[size - _ZLIB_SUFFIX_LENGTH : size] != _ZLIB_SUFFIX:
+                    message = await self._ws.receive()
+
+                    if message.type != aiohttp.WSMsgType.BINARY:
+                        self._handle_other_message(message)
+
+                    self._metrics.frames_received += 1
+                    self._metrics.raw_bytes_received += len(message.data)
+
+                    # Assigning past the end of the buffer will grow it as required
+                    buff[size : size + len(message.data)] = message.data
+                    size += len(message.data)
+
+                if self._should_offload(size):
+                    # The buffer cannot be resized while it is exported, so the executor
+                    # gets its own copy in case this is cancelled while it is inflating
+                    payload = await asyncio.get_running_loop().run_in_executor(
+                        self._executor, self._inflate_zlib, bytes(buff[:size])
+                    )
+                else:
+                    with memoryview(buff) as view, view[:size] as data:
+                        payload = self._inflate_zlib(data)
 
-            while not buff.endswith(_ZLIB_SUFFIX):
-                message = await self._ws.receive()
+                # Do not pin the memory of a single large message (such as a big
+                # GUILD_CREATE) for the rest of the connection
+                if len(buff) > _MAX_RETAINED_BUFFER_SIZE:
+                    self._buffer = bytearray()
 
-                if message.type == aiohttp.WSMsgType.BINARY:
-                    buff.extend(message.data)
-                    continue
+            if payload is not None:
+                return payload
 
+    async def _receive_and_check_zstd(self) -> bytes:
+        while True:
+            message = await self._ws.receive()
+
+            if message.type != aiohttp.WSMsgType.BINARY:
                 self._handle_other_message(message)
 
-            return self._zlib.decompress(buff)
+            # Unlike zlib, Discord flushes the zstd stream at the end of every
+            # message, so each websocket message can be inflated on its own.
+            self._metrics.frames_received += 1
+            self._metrics.raw_bytes_received += len(message.data)
 
-        self._handle_other_message(message)  # noqa: RET503 - Missing `return None`
+            if self._should_offload(len(message.data)):
+                payload = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._inflate_zstd, message.data
+                )
+            else:
+                payload = self._inflate_zstd(message.data)
+
+            if payload is not None:
+                return payload
 
     @classmethod
     async def connect(
@@ -279,7 +631,12 @@ async def connect(
         log_filterer: typing.Callable[[bytes], bytes],
         dumps: data_binding.JSONEncoder,
         loads: data_binding.JSONDecoder,
-        transport_compression: bool,
+        compression: str | None,
+        data_format: str,
+        max_payload_size: int | None = None,
+        metrics: GatewayShardMetrics | None = None,
+        executor: concurrent.futures.Executor | None = None,
+        offload_payload_size: int | None = None,
         url: str,
     ) -> _GatewayTransport:
         """Generate a single-use websocket connection.
@@ -315,12 +672,17 @@ async def connect(
 
                 return cls(
                     ws=web_socket,
-                    transport_compression=transport_compression,
+                    compression=compression,
+                    data_format=data_format,
                     exit_stack=exit_stack,
                     logger=logger,
                     log_filterer=log_filterer,
                     loads=loads,
                     dumps=dumps,
+                    max_payload_size=max_payload_size,
+                    metrics=metrics,
+                    executor=executor,
+                    offload_payload_size=offload_payload_size,
                 )
 
             except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError) as ex:
@@ -398,11 +760,26 @@ class GatewayShardImpl(shard.GatewayShard):
         The event factory this shard should use.
     compression
         Compression format to use for the shard. Only supported values are
-        `"transport_zlib_stream"` or [`None`][] to disable it.
+        `"transport_zlib_stream"`, `"transport_zstd_stream"` or [`None`][]
+        to disable it.
+
+        Using `"transport_zstd_stream"` requires the optional `hikari[zstd]`
+        dependencies to be installed.
     dumps
         The JSON encoder this application should use.
+
+        This is not used for gateway payloads if `data_format` is `"etf"`.
     loads
         The JSON decoder this application should use.
+
+        This is not used for gateway payloads if `data_format` is `"etf"`.
+    executor
+        The executor to offload the inflating and decoding of large payloads
+        to (see `offload_payload_size`), or [`None`][] to use the default
+        executor of the event loop. This is the default.
+
+        As the decompressor is stateful, this must run the calls in the current
+        process, such as a [`concurrent.futures.ThreadPoolExecutor`][].
     initial_activity
         The initial activity to appear to have for this shard, or
         [`None`][] if no activity should be set initially. This is the
@@ -414,10 +791,38 @@ class GatewayShardImpl(shard.GatewayShard):
         Whether to appear to be AFK or not on login.
     initial_status
         The initial status to set on login for the shard.
+    identify_coordinator
+        The coordinator to acquire a slot from before every identify, or
+        [`None`][] to identify without coordinating with other shards. This
+        is the default.
     intents
         Collection of intents to use.
     large_threshold
         The number of members to have in a guild for it to be considered large.
+    max_payload_size
+        The maximum size, in bytes, that a decompressed payload can have.
+        Payloads exceeding this size will be dropped and a warning will be
+        logged. This only applies when using transport compression.
+
+        Defaults to [`None`][], which means there is no limit.
+    offload_payload_size
+        The size, in bytes, above which payloads are inflated and decoded in
+        the `executor` instead of blocking the event loop. This is compared
+        to the size of the payload as it was received for inflating, and to
+        its inflated size for decoding. Payloads are still handled in order.
+
+        Defaults to [`None`][], which means nothing is offloaded.
+    max_concurrency
+        The maximum number of shards that can identify concurrently, as given
+        by Discord. This is passed to the `identify_coordinator`.
+    session_store
+        The store to persist the gateway session in, so that it can be resumed
+        after the process restarts, or [`None`][] to not persist it. This is
+        the default.
+
+        The session is checkpointed on every heartbeat and when the shard is
+        closed. When a store is used, closing the shard keeps the session open
+        on Discord's side, so that it can be resumed.
     shard_id
         The shard ID.
     shard_count
@@ -427,18 +832,29 @@ class GatewayShardImpl(shard.GatewayShard):
     proxy_settings
         The proxy settings to use while negotiating a websocket.
     data_format
-        Data format to use for inbound data. Only supported format is `"json"`.
+        Data format to use for gateway payloads. Supported formats are
+        `"json"` (the default) and `"etf"`.
+
+        When using `"etf"`, payloads are smaller and snowflakes are received
+        as integers rather than strings. Payloads are encoded and decoded using
+        the pure-Python implementation in [`hikari.internal.etf`][].
     """
 
     __slots__: typing.Sequence[str] = (
         "_activity",
+        "_checkpoint_task",
+        "_command_task",
+        "_compression",
+        "_data_format",
         "_dumps",
         "_event_factory",
         "_event_manager",
+        "_executor",
         "_gateway_url",
         "_handshake_event",
         "_heartbeat_latency",
         "_http_settings",
+        "_identify_coordinator",
         "_idle_since",
         "_intents",
         "_is_afk",
@@ -449,33 +865,45 @@ class GatewayShardImpl(shard.GatewayShard):
         "_last_heartbeat_sent",
         "_loads",
         "_logger",
+        "_max_concurrency",
+        "_max_payload_size",
+        "_metrics",
         "_non_priority_rate_limit",
+        "_offload_payload_size",
+        "_pending_commands",
         "_proxy_settings",
+        "_reading_paused",
         "_resume_gateway_url",
         "_seq",
         "_session_id",
+        "_session_store",
         "_shard_count",
         "_shard_id",
         "_status",
         "_token",
         "_total_rate_limit",
-        "_transport_compression",
         "_user_id",
         "_ws",
     )
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0915 - Too many arguments and too long
         self,
         *,
         compression: str | None = shard.GatewayCompression.TRANSPORT_ZLIB_STREAM,
         dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         loads: data_binding.JSONDecoder = data_binding.default_json_loads,
+        executor: concurrent.futures.Executor | None = None,
         initial_activity: presences.Activity | None = None,
         initial_idle_since: datetime.datetime | None = None,
         initial_is_afk: bool = False,
         initial_status: presences.Status = presences.Status.ONLINE,
+        identify_coordinator: identify_coordinator_.IdentifyCoordinator | None = None,
         intents: intents_.Intents,
         large_threshold: int = 250,
+        max_concurrency: int = 1,
+        max_payload_size: int | None = None,
+        offload_payload_size: int | None = None,
+        session_store: session_store_.GatewaySessionStore | None = None,
         shard_id: int = 0,
         shard_count: int = 1,
         http_settings: config.HTTPSettings,
@@ -486,21 +914,33 @@ def __init__(
         token: str,
         url: str,
     ) -> None:
-        if data_format != shard.GatewayDataFormat.JSON:
+        if data_format not in (shard.GatewayDataFormat.JSON, shard.GatewayDataFormat.ETF):
             msg = f"Unsupported gateway data format: {data_format}"
             raise NotImplementedError(msg)
 
-        if compression and compression != shard.GatewayCompression.TRANSPORT_ZLIB_STREAM:
+        if compression and compression not in _TRANSPORT_COMPRESSION_FORMATS:
             msg = f"Unsupported compression format {compression}"
             raise NotImplementedError(msg)
 
+        if compression == shard.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+            # This is kept inline as zstandard is an optional dependency.
+            try:
+                import zstandard  # noqa: F401 - Unused import
+            except ModuleNotFoundError as exc:
+                msg = "You must install the optional `hikari[zstd]` dependencies to use zstd transport compression."
+                raise RuntimeError(msg) from exc
+
         self._activity = initial_activity
+        self._checkpoint_task: asyncio.Task[None] | None = None
+        self._command_task: asyncio.Task[None] | None = None
         self._event_manager = event_manager
         self._event_factory = event_factory
+        self._executor = executor
         self._gateway_url = url
         self._handshake_event: asyncio.Event | None = None
         self._heartbeat_latency = float("nan")
         self._http_settings = http_settings
+        self._identify_coordinator = identify_coordinator
         self._idle_since = initial_idle_since
         self._intents = intents
         self._is_afk = initial_is_afk
@@ -509,14 +949,22 @@ def __init__(
         self._large_threshold = large_threshold
         self._last_heartbeat_ack_received = float("nan")
         self._last_heartbeat_sent = float("nan")
+        self._reading_paused = False
         self._logger = logging.getLogger(f"hikari.gateway.{shard_id}")
+        self._max_concurrency = max_concurrency
+        self._max_payload_size = max_payload_size
+        self._metrics = GatewayShardMetrics()
+        self._offload_payload_size = offload_payload_size
         self._non_priority_rate_limit = rate_limits.WindowedBurstRateLimiter(
             f"shard {shard_id} non-priority rate limit", *_NON_PRIORITY_RATELIMIT
         )
+        # Insertion ordered, so that commands of the same priority are sent in order
+        self._pending_commands: dict[typing.Hashable, _PendingCommand] = {}
         self._proxy_settings = proxy_settings
         self._resume_gateway_url: str | None = None
         self._seq: int | None = None
         self._session_id: str | None = None
+        self._session_store = session_store
         self._shard_count = shard_count
         self._shard_id = shard_id
         self._status = initial_status
@@ -524,9 +972,10 @@ def __init__(
         self._total_rate_limit = rate_limits.WindowedBurstRateLimiter(
             f"shard {shard_id} total rate limit", *_TOTAL_RATELIMIT
         )
-        self._transport_compression = compression is not None
-        self._dumps = dumps
-        self._loads = loads
+        self._compression = shard.GatewayCompression(compression) if compression else None
+        self._data_format = shard.GatewayDataFormat(data_format)
+        self._dumps = etf.dumps if self._data_format is shard.GatewayDataFormat.ETF else dumps
+        self._loads = etf.loads if self._data_format is shard.GatewayDataFormat.ETF else loads
         self._user_id: snowflakes.Snowflake | None = None
         self._ws: _GatewayTransport | None = None
 
@@ -555,6 +1004,11 @@ def is_alive(self) -> bool:
     def is_connected(self) -> bool:
         return self._ws is not None and self._handshake_event is not None and self._handshake_event.is_set()
 
+    @property
+    def metrics(self) -> GatewayShardMetrics:
+        """Metrics collected by this shard."""
+        return self._metrics
+
     @property
     @typing_extensions.override
     def shard_count(self) -> int:
@@ -600,14 +1054,78 @@ async def join(self) -> None:
         await asyncio.wait_for(asyncio.shield(self._keep_alive_task), timeout=None)
 
     async def _send_json(self, data: data_binding.JSONObject, *, priority: bool = False) -> None:
+        start = time.monotonic()
+
         if not priority:
             await self._non_priority_rate_limit.acquire()
+            now = time.monotonic()
+            self._metrics.non_priority_rate_limit_wait_time += now - start
+            start = now
 
         await self._total_rate_limit.acquire()
+        self._metrics.total_rate_limit_wait_time += time.monotonic() - start
 
         assert self._ws is not None
         await self._ws.send_json(data)
 
+    async def _send_command(self, key: typing.Hashable, priority: int, data: data_binding.JSONObject) -> None:
+        # Commands are queued instead of being sent straight away, so that the rate limit
+        # goes to the most important ones first. Commands which only need their latest state
+        # to be sent share a key, and replace the pending one while keeping its place.
+        command = self._pending_commands.get(key)
+
+        if command is None:
+            command = _PendingCommand(priority=priority, data=data, future=asyncio.get_running_loop().create_future())
+            self._pending_commands[key] = command
+
+        else:
+            command.data = data
+            self._metrics.coalesced_commands += 1
+
+        if self._command_task is None:
+            self._command_task = asyncio.create_task(
+                self._send_pending_commands(), name=f"send commands (shard {self._shard_id})"
+            )
+
+        # Shielded, as the same command may be awaited by multiple callers
+        await asyncio.shield(command.future)
+
+    async def _send_pending_commands(self) -> None:
+        try:
+            while self._pending_commands:
+                start = time.monotonic()
+                await self._non_priority_rate_limit.acquire()
+                self._metrics.non_priority_rate_limit_wait_time += time.monotonic() - start
+
+                # The command is only picked once we are allowed to send it, so that it
+                # is the most important one at that time, with its latest state
+                key = min(self._pending_commands, key=lambda k: self._pending_commands[k].priority)
+                command = self._pending_commands.pop(key)
+
+                try:
+                    await self._send_json(command.data, priority=True)
+
+                except asyncio.CancelledError:
+                    command.future.cancel()
+                    raise
+
+                except Exception as ex:  # noqa: BLE001 - Blind except
+                    command.future.set_exception(ex)
+
+                else:
+                    command.future.set_result(None)
+
+        except asyncio.CancelledError:
+            # The rate limits were closed, either because the shard is closing or reconnecting
+            for command in self._pending_commands.values():
+                command.future.cancel()
+
+            self._pending_commands.clear()
+            raise
+
+        finally:
+            self._command_task = None
+
     def _check_if_connected(self) -> None:
         if not self.is_connected:
             msg = f"shard {self._shard_id} is not connected so it cannot be interacted with"
@@ -655,7 +1173,8 @@ async def request_guild_members(
         payload.put_snowflake_array("user_ids", users)
         payload.put("nonce", nonce)
 
-        await self._send_json({_OP: _REQUEST_GUILD_MEMBERS, _D: payload})
+        # Every request gets its own key, as they are never coalesced
+        await self._send_command(object(), _REQUEST_GUILD_MEMBERS_PRIORITY, {_OP: _REQUEST_GUILD_MEMBERS, _D: payload})
 
     @typing_extensions.override
     async def start(self) -> None:
@@ -664,6 +1183,10 @@ async def start(self) -> None:
             raise errors.ComponentStateConflictError(msg)
 
         self._handshake_event = asyncio.Event()
+
+        if self._session_store is not None and self._session_id is None:
+            await self._restore_session()
+
         keep_alive_task = asyncio.create_task(self._keep_alive(), name=f"keep alive (shard {self._shard_id})")
 
         await aio.first_completed(self._handshake_event.wait(), asyncio.shield(keep_alive_task))
@@ -691,7 +1214,9 @@ async def update_presence(
         presence_payload = self._serialize_and_store_presence_payload(
             idle_since=idle_since, afk=afk, activity=activity, status=status
         )
-        await self._send_json({_OP: _PRESENCE_UPDATE, _D: presence_payload})
+        await self._send_command(
+            _PRESENCE_UPDATE_KEY, _PRESENCE_UPDATE_PRIORITY, {_OP: _PRESENCE_UPDATE, _D: presence_payload}
+        )
 
     @typing_extensions.override
     async def update_voice_state(
@@ -710,7 +1235,11 @@ async def update_voice_state(
         payload.put("self_mute", self_mute)
         payload.put("self_deaf", self_deaf)
 
-        await self._send_json({_OP: _VOICE_STATE_UPDATE, _D: payload})
+        await self._send_command(
+            (_VOICE_STATE_UPDATE, snowflakes.Snowflake(guild)),
+            _VOICE_STATE_UPDATE_PRIORITY,
+            {_OP: _VOICE_STATE_UPDATE, _D: payload},
+        )
 
     async def _send_heartbeat(self) -> None:
         self._logger.log(ux.TRACE, "sending HEARTBEAT [s:%s]", self._seq)
@@ -723,7 +1252,8 @@ async def _heartbeat(self, heartbeat_interval: float) -> None:
         self._logger.debug("starting heartbeat with interval %ss", heartbeat_interval)
 
         while True:
-            if self._last_heartbeat_ack_received <= self._last_heartbeat_sent:
+            # Acknowledgements cannot be received while reading is paused, so they are not expected then
+            if not self._reading_paused and self._last_heartbeat_ack_received <= self._last_heartbeat_sent:
                 # Gateway is zombie, close and request reconnect.
                 self._logger.error(
                     "connection has not received a HEARTBEAT_ACK for approx %.1fs and is being disconnected; "
@@ -733,15 +1263,110 @@ async def _heartbeat(self, heartbeat_interval: float) -> None:
                 return
 
             await self._send_heartbeat()
+            self._start_checkpoint()
 
             await asyncio.sleep(heartbeat_interval)
 
-    async def _poll_events(self) -> None:
+    async def _restore_session(self) -> None:
+        assert self._session_store is not None
+
+        try:
+            session = await self._session_store.load(self._shard_id)
+        except Exception:
+            self._logger.exception("failed to load stored session, will identify with a new session")
+            return
+
+        if session is None:
+            return
+
+        if session.shard_count != self._shard_count:
+            self._logger.info(
+                "ignoring stored session %s, as it was created with a shard count of %s",
+                session.session_id,
+                session.shard_count,
+            )
+            return
+
+        self._logger.debug("restored session %s with seq %s", session.session_id, session.seq)
+        self._session_id = session.session_id
+        self._seq = session.seq
+        self._resume_gateway_url = session.resume_gateway_url
+
+    def _start_checkpoint(self) -> None:
+        # Checkpoints run in the background, so that a slow session store can never delay the heartbeats.
+        # One is skipped while the previous is still running, as the next one stores the latest state anyway.
+        if self._session_store is None or (self._checkpoint_task is not None and not self._checkpoint_task.done()):
+            return
+
+        self._checkpoint_task = asyncio.create_task(
+            self._checkpoint_session(), name=f"checkpoint session (shard {self._shard_id})"
+        )
+
+    async def _checkpoint_session(self) -> None:
+        if self._session_store is None:
+            return
+
+        try:
+            if self._session_id is None or self._seq is None or self._resume_gateway_url is None:
+                await self._session_store.delete(self._shard_id)
+            else:
+                await self._session_store.save(
+                    self._shard_id,
+                    session_store_.GatewaySession(
+                        session_id=self._session_id,
+                        seq=self._seq,
+                        resume_gateway_url=self._resume_gateway_url,
+                        shard_count=self._shard_count,
+                    ),
+                )
+        except Exception:
+            self._logger.exception("failed to checkpoint session")
+
+    async def _final_checkpoint(self) -> None:
+        # A checkpoint still running could otherwise overwrite the final one
+        if self._checkpoint_task is not None:
+            await self._checkpoint_task
+            self._checkpoint_task = None
+
+        await self._checkpoint_session()
+
+    def _skip_dispatch(self, name: str, seq: int) -> bool:
+        # READY and RESUMED are required to complete the handshake, so they are never skipped
+        if name in (_READY, _RESUMED) or self._event_manager.should_consume_raw_event(name):
+            return False
+
+        self._seq = seq
+        self._metrics.dispatches[name] += 1
+        self._metrics.skipped_dispatches += 1
+        self._logger.log(ux.TRACE, "skipping dispatch %s with seq %s, as nothing would consume it", name, seq)
+        return True
+
+    async def _pause_reading(self) -> None:
+        self._logger.warning("too many events are still being handled, pausing reading from the gateway")
+        self._metrics.read_pauses += 1
+        self._reading_paused = True
+        start = time.monotonic()
+
+        try:
+            await self._event_manager.wait_to_resume_reading(self)
+        finally:
+            now = time.monotonic()
+            self._metrics.read_pause_time += now - start
+            self._reading_paused = False
+            # Give the next heartbeat acknowledgement a chance to be read before expecting it again
+            self._last_heartbeat_ack_received = now
+
+        self._logger.info("resuming reading from the gateway after %.2fs", now - start)
+
+    async def _poll_events(self) -> None:  # noqa: PLR0912 - Too many branches
         assert self._ws is not None
         assert self._handshake_event is not None
 
         while True:
-            payload = await self._ws.receive_json()
+            if self._event_manager.should_pause_reading(self):
+                await self._pause_reading()
+
+            payload = await self._ws.receive_json(self._skip_dispatch)
 
             op = payload[_OP]
 
@@ -749,6 +1374,7 @@ async def _poll_events(self) -> None:
                 name = payload[_T]
                 data = payload[_D]
                 self._seq = payload[_S]
+                self._metrics.dispatches[name] += 1
 
                 self._logger.log(ux.TRACE, "dispatching %s with seq %s", name, self._seq)
 
@@ -785,6 +1411,7 @@ async def _poll_events(self) -> None:
                 now = time.monotonic()
                 self._last_heartbeat_ack_received = now
                 self._heartbeat_latency = now - self._last_heartbeat_sent
+                self._metrics.heartbeat_latencies.append(self._heartbeat_latency)
                 self._logger.log(ux.TRACE, "received HEARTBEAT ACK in %.1fms", self._heartbeat_latency * 1_000)
 
             elif op == _HEARTBEAT:
@@ -821,10 +1448,10 @@ async def _connect(self) -> tuple[asyncio.Task[None], ...]:
 
         query = dict(urllib.parse.parse_qsl(url_parts.query))
         query["v"] = str(urls.VERSION)
-        query["encoding"] = "json"
+        query["encoding"] = self._data_format.value
 
-        if self._transport_compression:
-            query["compress"] = "zlib-stream"
+        if self._compression is not None:
+            query["compress"] = _COMPRESS_QUERY_VALUES[self._compression]
 
         url = urllib.parse.urlunparse(
             (url_parts.scheme, url_parts.netloc, url_parts.path, url_parts.params, urllib.parse.urlencode(query), "")
@@ -835,9 +1462,14 @@ async def _connect(self) -> tuple[asyncio.Task[None], ...]:
             log_filterer=_log_filterer(self._token.encode()),
             logger=self._logger,
             proxy_settings=self._proxy_settings,
-            transport_compression=self._transport_compression,
+            compression=self._compression,
+            data_format=self._data_format,
             loads=self._loads,
             dumps=self._dumps,
+            max_payload_size=self._max_payload_size,
+            executor=self._executor,
+            offload_payload_size=self._offload_payload_size,
+            metrics=self._metrics,
             url=url,
         )
 
@@ -879,7 +1511,12 @@ async def _connect(self) -> tuple[asyncio.Task[None], ...]:
 
         # Perform handshake
         if self._seq is None:
+            if self._identify_coordinator is not None:
+                self._logger.debug("waiting for identify slot")
+                await self._identify_coordinator.acquire(self._shard_id, self._max_concurrency)
+
             self._logger.info("identifying with new session")
+            self._metrics.identifies += 1
             await self._send_json(
                 {
                     _OP: _IDENTIFY,
@@ -900,6 +1537,7 @@ async def _connect(self) -> tuple[asyncio.Task[None], ...]:
             )
         else:
             self._logger.info("resuming session %s", self._session_id)
+            self._metrics.resumes += 1
             await self._send_json(
                 {_OP: _RESUME, _D: {"token": self._token, "seq": self._seq, "session_id": self._session_id}}
             )
@@ -927,6 +1565,9 @@ async def _keep_alive(self) -> None:  # noqa: PLR0912, PLR0915
                 await asyncio.sleep(backoff_time)
 
             try:
+                if last_started_at != -float("inf"):
+                    self._metrics.reconnects += 1
+
                 last_started_at = time.monotonic()
                 lifetime_tasks = await self._connect()
 
@@ -994,17 +1635,21 @@ async def _keep_alive(self) -> None:  # noqa: PLR0912, PLR0915
                     ws = self._ws
                     self._ws = None
 
-                    if self._is_closing:
+                    if self._is_closing and self._session_store is None:
                         await ws.send_close(
                             code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting permanently"
                         )
                     else:
+                        # If the session is being persisted, we want to be able to resume it later
                         await ws.send_close(code=_RESUME_CLOSE_CODE, message=b"shard disconnecting temporarily")
 
                     if self._handshake_event.is_set():
                         # We dispatched the connected event, so we can dispatch the disconnected one too
                         await self._event_manager.dispatch(self._event_factory.deserialize_disconnected_event(self))
 
+                if self._is_closing:
+                    await self._final_checkpoint()
+
     def _serialize_and_store_presence_payload(
         self,
         idle_since: undefined.UndefinedNoneOr[datetime.datetime] = undefined.UNDEFINED,
@@ -22,9 +22,17 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("all_of", "completed_future", "destroy_loop", "first_completed", "get_or_make_loop")
+__all__: typing.Sequence[str] = (
+    "all_of",
+    "completed_future",
+    "destroy_loop",
+    "eager_task",
+    "first_completed",
+    "get_or_make_loop",
+)
 
 import asyncio
+import sys
 import typing
 import warnings
 
@@ -61,6 +69,43 @@ def completed_future(result: T_inv | None = None, /) -> asyncio.Future[T_inv | N
     return future
 
 
+def eager_task(
+    coro: typing.Coroutine[typing.Any, typing.Any, T_inv], /, *, name: str | None = None
+) -> asyncio.Future[T_inv] | None:
+    """Create a task for a coroutine, starting it eagerly where supported.
+
+    On Python 3.12 and above, the task runs until it first suspends before
+    this returns. This avoids scheduling coroutines which usually complete
+    without ever suspending. On older versions, this is a plain
+    [`asyncio.create_task`][] call.
+
+    The coroutine always runs in its own task, so timeouts and cancellation
+    inside of it never affect the task of the caller.
+
+    Parameters
+    ----------
+    coro
+        The coroutine to run.
+    name
+        The name to give to the task.
+
+    Returns
+    -------
+    typing.Optional[asyncio.Future[T_inv]]
+        The task running the coroutine or [`None`][] if it already completed
+        successfully.
+    """
+    if sys.version_info >= (3, 12):
+        task = asyncio.Task(coro, loop=asyncio.get_running_loop(), name=name, eager_start=True)
+
+        if task.done() and not task.cancelled() and task.exception() is None:
+            return None
+
+        return task
+
+    return asyncio.create_task(coro, name=name)
+
+
 async def first_completed(*aws: typing.Awaitable[typing.Any], timeout: float | None = None) -> None:
     """Wait for the first awaitable to complete.
 
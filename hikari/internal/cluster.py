@@ -0,0 +1,370 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Supervision of shards running across multiple worker processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("ClusterSupervisor", "WorkerChannel", "split_shard_ids")
+
+import logging
+import logging.handlers
+import math
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.process
+import os
+import signal
+import threading
+import typing
+
+import attrs
+
+from hikari.internal import time
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cluster")
+
+# Time given to the workers to shut down gracefully before they are killed
+_SHUTDOWN_TIMEOUT: typing.Final[float] = 30.0
+# Delay before restarting a worker that exited unexpectedly, doubled for every consecutive failure
+_RESTART_BACKOFF_INITIAL: typing.Final[float] = 1.0
+_RESTART_BACKOFF_MAXIMUM: typing.Final[float] = 60.0
+# Workers which stay up for this long are considered healthy again, resetting their backoff
+_RESTART_BACKOFF_RESET: typing.Final[float] = 120.0
+
+
+def split_shard_ids(shard_ids: typing.Sequence[int], processes: int) -> list[tuple[int, ...]]:
+    """Split the shard IDs into contiguous slices of (almost) equal size.
+
+    Parameters
+    ----------
+    shard_ids
+        The shard IDs to split.
+    processes
+        The number of slices to split the shard IDs into. If there are less
+        shard IDs than this, then only one slice per shard ID is returned.
+
+    Returns
+    -------
+    list[tuple[int, ...]]
+        The slices of shard IDs.
+    """
+    if not shard_ids:
+        return []
+
+    processes = min(processes, len(shard_ids))
+    size, extra = divmod(len(shard_ids), processes)
+    slices: list[tuple[int, ...]] = []
+    start = 0
+
+    for index in range(processes):
+        end = start + size + (index < extra)
+        slices.append(tuple(shard_ids[start:end]))
+        start = end
+
+    return slices
+
+
+class WorkerChannel:
+    """The connection from a worker process back to its supervisor.
+
+    This also implements enough of the queue interface for it to be used
+    by [`logging.handlers.QueueHandler`][].
+    """
+
+    __slots__: typing.Sequence[str] = ("_connection", "_lock", "index", "shard_ids")
+
+    index: int
+    """The index of the worker in the cluster."""
+
+    shard_ids: tuple[int, ...]
+    """The shard IDs the worker should run."""
+
+    def __init__(
+        self, index: int, shard_ids: tuple[int, ...], connection: multiprocessing.connection.Connection
+    ) -> None:
+        self.index = index
+        self.shard_ids = shard_ids
+        self._connection = connection
+        # Log records may be emitted from any thread
+        self._lock = threading.Lock()
+
+    def put_nowait(self, item: object) -> None:
+        """Send an item to the supervisor.
+
+        Parameters
+        ----------
+        item
+            The item to send. This must be picklable.
+        """
+        with self._lock:
+            self._connection.send(item)
+
+    def forward_logs(self) -> None:
+        """Replace the root logger handlers with one forwarding to the supervisor."""
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+
+        root.addHandler(logging.handlers.QueueHandler(self))  # type: ignore[arg-type]
+
+    def report_heartbeat_latencies(self, heartbeat_latencies: typing.Mapping[int, float]) -> None:
+        """Report the heartbeat latencies of the shards in this worker.
+
+        Parameters
+        ----------
+        heartbeat_latencies
+            Mapping of shard ID to heartbeat latency in seconds.
+        """
+        self.put_nowait(dict(heartbeat_latencies))
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class _Worker:
+    index: int = attrs.field()
+    """The index of the worker in the cluster."""
+
+    shard_ids: tuple[int, ...] = attrs.field()
+    """The shard IDs the worker runs."""
+
+    process: multiprocessing.process.BaseProcess | None = attrs.field(default=None)
+    """The running process, if any."""
+
+    connection: multiprocessing.connection.Connection | None = attrs.field(default=None)
+    """The receiving end of the worker channel, if open."""
+
+    started_at: float = attrs.field(default=0.0)
+    """Monotonic time the process was last started at."""
+
+    failures: int = attrs.field(default=0)
+    """Number of consecutive unexpected exits."""
+
+    restart_at: float | None = attrs.field(default=None)
+    """Monotonic time to restart the process at, if it is pending a restart."""
+
+
+def _run_worker(
+    target: typing.Callable[[WorkerChannel], None],
+    index: int,
+    shard_ids: tuple[int, ...],
+    connection: multiprocessing.connection.Connection,
+) -> None:
+    # Move out of the process group of the supervisor, so that interrupts from the
+    # terminal only reach the supervisor, which then shuts the workers down in order.
+    os.setpgrp()
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    channel = WorkerChannel(index, shard_ids, connection)
+    channel.forward_logs()
+
+    try:
+        target(channel)
+    except Exception:
+        _LOGGER.exception("worker %s crashed", index)
+        raise SystemExit(1) from None
+
+
+class ClusterSupervisor:
+    """Supervisor for a cluster of forked worker processes running shards.
+
+    Workers which exit unexpectedly are restarted with an exponential back-off,
+    while workers which exit cleanly are left alone. Log records emitted in the
+    workers are handled by the logging configuration of the supervisor.
+
+    !!! note
+        This relies on the `fork` start method, so it is not available on Windows.
+
+    Parameters
+    ----------
+    target
+        The function to run in each worker process. It is passed the
+        [`hikari.internal.cluster.WorkerChannel`][] of the worker.
+    shard_slices
+        The shard IDs to run in each worker.
+    """
+
+    __slots__: typing.Sequence[str] = ("_context", "_heartbeat_latencies", "_stopping", "_target", "_workers")
+
+    def __init__(
+        self, target: typing.Callable[[WorkerChannel], None], shard_slices: typing.Sequence[tuple[int, ...]]
+    ) -> None:
+        self._context = multiprocessing.get_context("fork")
+        self._heartbeat_latencies: dict[int, float] = {}
+        self._stopping = False
+        self._target = target
+        self._workers = [_Worker(index=index, shard_ids=shard_ids) for index, shard_ids in enumerate(shard_slices)]
+
+    @property
+    def heartbeat_latencies(self) -> typing.Mapping[int, float]:
+        """Mapping of shard ID to the last heartbeat latency reported for it, in seconds."""
+        return self._heartbeat_latencies
+
+    @property
+    def heartbeat_latency(self) -> float:
+        """Average heartbeat latency of all the shards in the cluster, in seconds.
+
+        If no shard has reported a latency yet, this will be [`float("nan")`][].
+        """
+        latencies = [latency for latency in self._heartbeat_latencies.values() if not math.isnan(latency)]
+        return sum(latencies) / len(latencies) if latencies else float("nan")
+
+    def run(self) -> None:
+        """Start the workers and supervise them until they have all exited.
+
+        If this is interrupted, the workers are shut down before returning.
+        """
+        try:
+            for worker in self._workers:
+                self._start(worker)
+
+            while self._poll(None):
+                pass
+
+        finally:
+            self._stop()
+
+    def _start(self, worker: _Worker) -> None:
+        reader, writer = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_run_worker,
+            args=(self._target, worker.index, worker.shard_ids, writer),
+            name=f"hikari-cluster-worker-{worker.index}",
+        )
+        process.start()
+        # Only the worker should hold the writing end, so that we get an EOF when it exits
+        writer.close()
+
+        worker.process = process
+        worker.connection = reader
+        worker.started_at = time.monotonic()
+        worker.restart_at = None
+        _LOGGER.info("started worker %s (pid %s) for shards %s", worker.index, process.pid, worker.shard_ids)
+
+    def _poll(self, timeout: float | None) -> bool:
+        now = time.monotonic()
+        for worker in self._workers:
+            if worker.restart_at is not None and worker.restart_at <= now:
+                self._start(worker)
+
+        connections = {worker.connection: worker for worker in self._workers if worker.connection}
+        sentinels = {worker.process.sentinel: worker for worker in self._workers if worker.process}
+        restarts = [worker.restart_at for worker in self._workers if worker.restart_at is not None]
+
+        if not sentinels and not restarts:
+            return False
+
+        if restarts:
+            wait = max(0.0, min(restarts) - now)
+            timeout = wait if timeout is None else min(timeout, wait)
+
+        ready = multiprocessing.connection.wait([*connections, *sentinels], timeout)
+
+        # Receive first, so that the last messages of exiting workers are not lost
+        for connection, worker in connections.items():
+            if connection in ready:
+                self._receive(worker)
+
+        for sentinel, worker in sentinels.items():
+            if sentinel in ready:
+                self._reap(worker)
+
+        return True
+
+    def _receive(self, worker: _Worker) -> None:
+        assert worker.connection is not None
+
+        try:
+            message = worker.connection.recv()
+        except EOFError:
+            worker.connection.close()
+            worker.connection = None
+            return
+
+        if isinstance(message, logging.LogRecord):
+            logging.getLogger(message.name).handle(message)
+            return
+
+        self._heartbeat_latencies.update(message)
+        _LOGGER.debug(
+            "worker %s reported heartbeat latencies, cluster average is now %.0fms",
+            worker.index,
+            self.heartbeat_latency * 1_000,
+        )
+
+    def _reap(self, worker: _Worker) -> None:
+        assert worker.process is not None
+        process = worker.process
+        process.join()
+        worker.process = None
+
+        while worker.connection and worker.connection.poll():
+            self._receive(worker)
+
+        if worker.connection:
+            worker.connection.close()
+            worker.connection = None
+
+        for shard_id in worker.shard_ids:
+            self._heartbeat_latencies.pop(shard_id, None)
+
+        if process.exitcode == 0 or self._stopping:
+            _LOGGER.info("worker %s exited with code %s", worker.index, process.exitcode)
+            return
+
+        if time.monotonic() - worker.started_at >= _RESTART_BACKOFF_RESET:
+            worker.failures = 0
+
+        backoff = min(_RESTART_BACKOFF_INITIAL * 2**worker.failures, _RESTART_BACKOFF_MAXIMUM)
+        worker.failures += 1
+        worker.restart_at = time.monotonic() + backoff
+        _LOGGER.error(
+            "worker %s exited unexpectedly with code %s, restarting it in %.2fs",
+            worker.index,
+            process.exitcode,
+            backoff,
+        )
+
+    def _stop(self) -> None:
+        self._stopping = True
+
+        for worker in self._workers:
+            worker.restart_at = None
+            if worker.process:
+                worker.process.terminate()
+
+        deadline = time.monotonic() + _SHUTDOWN_TIMEOUT
+
+        try:
+            # Keep receiving while waiting, as the workers block if their channel fills up
+            while (remaining := deadline - time.monotonic()) > 0 and self._poll(remaining):
+                pass
+
+        finally:
+            for worker in self._workers:
+                if worker.process:
+                    _LOGGER.warning("worker %s did not shut down in time, killing it", worker.index)
+                    worker.process.kill()
+                    worker.process.join()
+                    worker.process = None
+
+                if worker.connection:
+                    worker.connection.close()
+                    worker.connection = None
@@ -0,0 +1,162 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Generation of specialised deserializers for attrs models from a declarative field spec.
+
+The generated functions build the model in a single constructor call, with
+every payload lookup, converter call and default inlined, avoiding the
+overhead of intermediate objects and repeated attribute lookups.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("REQUIRED", "Field", "generate_deserializer")
+
+import logging
+import typing
+
+import attrs
+
+from hikari.internal import attrs_extensions
+
+ModelT = typing.TypeVar("ModelT", bound=attrs.AttrsInstance)
+
+REQUIRED: typing.Final[object] = object()
+"""Default of fields which must be present in the payload."""
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.models")
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class Field:
+    """Specification of how a model field is read from a payload."""
+
+    name: str = attrs.field()
+    """The name of the keyword argument of the model to pass the value as."""
+
+    key: str | None = attrs.field(default=None)
+    """The key of the value in the payload, if it differs from `name`."""
+
+    converter: typing.Callable[[typing.Any], object] | str | None = attrs.field(default=None)
+    """The converter to pass the raw value through, if any.
+
+    If this is a string, it refers to one of the arguments of the generated
+    deserializer, which is expected to be a callable.
+    """
+
+    default: object = attrs.field(default=REQUIRED)
+    """The value to use when the key is missing or [`None`][] in the payload.
+
+    If this is left as [`hikari.internal.deserializers.REQUIRED`][], the key must
+    be present in the payload. Missing keys are only defaulted, without being
+    converted, while [`None`][] values are only defaulted if there is a converter.
+    """
+
+    nullable: bool = attrs.field(default=False)
+    """Whether a required value may be [`None`][], in which case it is not converted."""
+
+    default_if_falsy: bool = attrs.field(default=False)
+    """Whether any falsy value, such as an empty string, is defaulted instead of converted, rather than only [`None`][].
+
+    This has no effect if the field has no converter or default.
+    """
+
+
+def _generate_value(field: Field, namespace: dict[str, typing.Any], arguments: typing.Sequence[str]) -> str:
+    key = field.key or field.name
+    default_name = f"default_{field.name}"
+    namespace[default_name] = field.default
+
+    converter_name: str | None = None
+    if isinstance(field.converter, str):
+        if field.converter not in arguments:
+            msg = f"converter {field.converter!r} of field {field.name!r} is not an argument of the deserializer"
+            raise ValueError(msg)
+
+        converter_name = field.converter
+
+    elif field.converter is not None:
+        converter_name = f"convert_{field.name}"
+        namespace[converter_name] = field.converter
+
+    if field.default is REQUIRED:
+        if converter_name is None:
+            return f"payload[{key!r}]"
+
+        if field.nullable:
+            return f"{converter_name}(v) if (v := payload[{key!r}]) is not None else None"
+
+        return f"{converter_name}(payload[{key!r}])"
+
+    if converter_name is None:
+        return f"payload.get({key!r}, {default_name})"
+
+    if field.default_if_falsy:
+        return f"{converter_name}(v) if (v := payload.get({key!r})) else {default_name}"
+
+    return f"{converter_name}(v) if (v := payload.get({key!r})) is not None else {default_name}"
+
+
+def generate_deserializer(
+    cls: type[ModelT], fields: typing.Sequence[Field], *, arguments: typing.Sequence[str] = ()
+) -> typing.Callable[..., ModelT]:
+    """Generate a function deserializing a payload into an attrs model.
+
+    Parameters
+    ----------
+    cls
+        The attrs class to generate a deserializer for.
+    fields
+        The specification of the fields to read from the payload.
+    arguments
+        The names of the extra arguments the generated function takes, after
+        the payload. These are passed on to the model as keyword arguments,
+        unless they are used as the converter of a field.
+
+    Returns
+    -------
+    typing.Callable[..., ModelT]
+        The generated deserializer.
+
+    Raises
+    ------
+    ValueError
+        If a field or argument is not a keyword argument of the model, or if
+        a converter refers to an unknown argument.
+    """
+    # This import is delayed to avoid a circular import error on startup
+    from hikari.internal import ux
+
+    keywords = {keyword for _, keyword in attrs_extensions.get_fields_definition(cls)[0]}
+    converter_arguments = {field.converter for field in fields if isinstance(field.converter, str)}
+    passed_arguments = [argument for argument in arguments if argument not in converter_arguments]
+
+    for name in (*passed_arguments, *(field.name for field in fields)):
+        if name not in keywords:
+            msg = f"{name!r} is not a keyword argument of {cls.__name__}"
+            raise ValueError(msg)
+
+    namespace: dict[str, typing.Any] = {"cls": cls}
+    kwargs = [f"{argument}={argument}" for argument in passed_arguments]
+    kwargs.extend(f"{field.name}=({_generate_value(field, namespace, arguments)})" for field in fields)
+    code = f"def deserialize({','.join(('payload', *arguments))}):return cls({','.join(kwargs)})"
+    _LOGGER.log(ux.TRACE, "generating deserializer for %r: %r", cls, code)
+    exec(code, namespace)  # noqa: S102 - Use of exec detected.
+    return typing.cast("typing.Callable[..., ModelT]", namespace["deserialize"])
@@ -0,0 +1,328 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Pure-Python implementation of the Erlang external term format (ETF).
+
+Only the subset of the format used by the Discord gateway is supported. Terms
+are decoded to the same shapes that a JSON decoder would produce, with the
+exception of snowflakes, which Discord sends as integers instead of strings.
+
+References
+----------
+* [Erlang external term format](https://www.erlang.org/doc/apps/erts/erl_ext_dist.html)
+* [Discord API documentation - ETF/JSON](https://discord.com/developers/docs/topics/gateway#encoding-and-compression)
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("dumps", "loads")
+
+import struct
+import sys
+import typing
+import zlib
+
+if typing.TYPE_CHECKING:
+    from hikari.internal import data_binding
+
+_FORMAT_VERSION: typing.Final[int] = 131
+
+_NEW_FLOAT_EXT: typing.Final[int] = 70
+_BIT_BINARY_EXT: typing.Final[int] = 77
+_COMPRESSED: typing.Final[int] = 80
+_SMALL_INTEGER_EXT: typing.Final[int] = 97
+_INTEGER_EXT: typing.Final[int] = 98
+_FLOAT_EXT: typing.Final[int] = 99
+_ATOM_EXT: typing.Final[int] = 100
+_SMALL_TUPLE_EXT: typing.Final[int] = 104
+_LARGE_TUPLE_EXT: typing.Final[int] = 105
+_NIL_EXT: typing.Final[int] = 106
+_STRING_EXT: typing.Final[int] = 107
+_LIST_EXT: typing.Final[int] = 108
+_BINARY_EXT: typing.Final[int] = 109
+_SMALL_BIG_EXT: typing.Final[int] = 110
+_LARGE_BIG_EXT: typing.Final[int] = 111
+_SMALL_ATOM_EXT: typing.Final[int] = 115
+_MAP_EXT: typing.Final[int] = 116
+_ATOM_UTF8_EXT: typing.Final[int] = 118
+_SMALL_ATOM_UTF8_EXT: typing.Final[int] = 119
+
+_UINT16: typing.Final[struct.Struct] = struct.Struct(">H")
+_UINT32: typing.Final[struct.Struct] = struct.Struct(">I")
+_INT32: typing.Final[struct.Struct] = struct.Struct(">i")
+_DOUBLE: typing.Final[struct.Struct] = struct.Struct(">d")
+
+_INT32_MIN: typing.Final[int] = -(2**31)
+_INT32_MAX: typing.Final[int] = 2**31 - 1
+
+# Atoms which do not map to a string.
+_SPECIAL_ATOMS: typing.Final[typing.Mapping[str, bool | None]] = {"nil": None, "true": True, "false": False}
+# The atoms above, encoded as SMALL_ATOM_UTF8_EXT.
+_NIL: typing.Final[bytes] = bytes((_SMALL_ATOM_UTF8_EXT, 3)) + b"nil"
+_TRUE: typing.Final[bytes] = bytes((_SMALL_ATOM_UTF8_EXT, 4)) + b"true"
+_FALSE: typing.Final[bytes] = bytes((_SMALL_ATOM_UTF8_EXT, 5)) + b"false"
+
+
+def _decode_atom(name: str) -> str | bool | None:
+    # Atoms are used as keys in a lot of places, so interning them saves
+    # a lot of memory when they are then used as keys in cached payloads.
+    try:
+        return _SPECIAL_ATOMS[name]
+    except KeyError:
+        return sys.intern(name)
+
+
+# We rather keep everything we can here inline, as this is a hot path.
+def _decode(data: bytes, offset: int) -> tuple[typing.Any, int]:  # noqa: PLR0911, PLR0912, PLR0915
+    tag = data[offset]
+    offset += 1
+
+    if tag == _MAP_EXT:
+        (arity,) = _UINT32.unpack_from(data, offset)
+        offset += 4
+        mapping: dict[typing.Any, typing.Any] = {}
+        for _ in range(arity):
+            key, offset = _decode(data, offset)
+            mapping[key], offset = _decode(data, offset)
+        return mapping, offset
+
+    if tag == _BINARY_EXT:
+        (length,) = _UINT32.unpack_from(data, offset)
+        offset += 4
+        return data[offset : offset + length].decode("utf-8"), offset + length
+
+    if tag in (_SMALL_ATOM_UTF8_EXT, _SMALL_ATOM_EXT):
+        length = data[offset]
+        offset += 1
+        return _decode_atom(data[offset : offset + length].decode("utf-8")), offset + length
+
+    if tag == _SMALL_INTEGER_EXT:
+        return data[offset], offset + 1
+
+    if tag == _INTEGER_EXT:
+        return _INT32.unpack_from(data, offset)[0], offset + 4
+
+    if tag in (_SMALL_BIG_EXT, _LARGE_BIG_EXT):
+        if tag == _SMALL_BIG_EXT:
+            length = data[offset]
+            offset += 1
+        else:
+            (length,) = _UINT32.unpack_from(data, offset)
+            offset += 4
+
+        sign = data[offset]
+        offset += 1
+        value = int.from_bytes(data[offset : offset + length], "little")
+        return -value if sign else value, offset + length
+
+    if tag == _NIL_EXT:
+        return [], offset
+
+    if tag == _LIST_EXT:
+        (length,) = _UINT32.unpack_from(data, offset)
+        offset += 4
+        items: list[typing.Any] = [None] * length
+        for i in range(length):
+            items[i], offset = _decode(data, offset)
+
+        # Proper lists are terminated by an empty list. Improper lists are not
+        # something that Discord will send us, so the tail is just discarded.
+        _, offset = _decode(data, offset)
+        return items, offset
+
+    if tag == _STRING_EXT:
+        # Erlang strings are really just lists of bytes
+        (length,) = _UINT16.unpack_from(data, offset)
+        offset += 2
+        return list(data[offset : offset + length]), offset + length
+
+    if tag == _NEW_FLOAT_EXT:
+        return _DOUBLE.unpack_from(data, offset)[0], offset + 8
+
+    if tag in (_ATOM_UTF8_EXT, _ATOM_EXT):
+        (length,) = _UINT16.unpack_from(data, offset)
+        offset += 2
+        return _decode_atom(data[offset : offset + length].decode("utf-8")), offset + length
+
+    if tag in (_SMALL_TUPLE_EXT, _LARGE_TUPLE_EXT):
+        if tag == _SMALL_TUPLE_EXT:
+            length = data[offset]
+            offset += 1
+        else:
+            (length,) = _UINT32.unpack_from(data, offset)
+            offset += 4
+
+        elements: list[typing.Any] = [None] * length
+        for i in range(length):
+            elements[i], offset = _decode(data, offset)
+        return elements, offset
+
+    if tag == _FLOAT_EXT:
+        return float(data[offset : offset + 31].rstrip(b"\x00")), offset + 31
+
+    if tag == _BIT_BINARY_EXT:
+        (length,) = _UINT32.unpack_from(data, offset)
+        offset += 5  # Skip the number of bits used in the last byte
+        return data[offset : offset + length].decode("utf-8"), offset + length
+
+    msg = f"Unsupported ETF tag {tag} at position {offset - 1}"
+    raise ValueError(msg)
+
+
+def loads(data: str | bytes) -> data_binding.JSONArray | data_binding.JSONObject:
+    """Decode an ETF payload.
+
+    This matches the [`hikari.internal.data_binding.JSONDecoder`][] signature,
+    so it can be used as a drop-in replacement for it.
+
+    Parameters
+    ----------
+    data
+        The ETF payload to decode.
+
+    Returns
+    -------
+    typing.Union[hikari.internal.data_binding.JSONArray, hikari.internal.data_binding.JSONObject]
+        The decoded payload.
+
+    Raises
+    ------
+    ValueError
+        If the payload is not valid ETF.
+    """
+    if isinstance(data, str):
+        data = data.encode("latin-1")
+
+    try:
+        if data[0] != _FORMAT_VERSION:
+            msg = f"Unsupported ETF version {data[0]}"
+            raise ValueError(msg)
+
+        if data[1] == _COMPRESSED:
+            (size,) = _UINT32.unpack_from(data, 2)
+            data = bytes((_FORMAT_VERSION,)) + zlib.decompress(data[6:], bufsize=size)
+
+        value, offset = _decode(data, 1)
+
+    except (IndexError, struct.error, UnicodeDecodeError, zlib.error) as ex:
+        msg = f"Invalid ETF payload: {ex}"
+        raise ValueError(msg) from ex
+
+    if offset != len(data):
+        msg = f"Trailing data found in ETF payload at position {offset}"
+        raise ValueError(msg)
+
+    return value  # type: ignore[no-any-return]
+
+
+def _encode_binary(value: str, buffer: bytearray) -> None:
+    encoded = value.encode("utf-8")
+    buffer.append(_BINARY_EXT)
+    buffer += _UINT32.pack(len(encoded))
+    buffer += encoded
+
+
+# We rather keep everything we can here inline, as this is a hot path.
+def _encode(value: object, buffer: bytearray) -> None:  # noqa: PLR0912
+    if value is None:
+        buffer += _NIL
+
+    elif value is True:
+        buffer += _TRUE
+
+    elif value is False:
+        buffer += _FALSE
+
+    elif isinstance(value, str):
+        _encode_binary(value, buffer)
+
+    elif isinstance(value, int):
+        if 0 <= value <= 255:
+            buffer.append(_SMALL_INTEGER_EXT)
+            buffer.append(value)
+        elif _INT32_MIN <= value <= _INT32_MAX:
+            buffer.append(_INTEGER_EXT)
+            buffer += _INT32.pack(value)
+        else:
+            magnitude = abs(value)
+            length = (magnitude.bit_length() + 7) // 8
+            if length <= 255:
+                buffer.append(_SMALL_BIG_EXT)
+                buffer.append(length)
+            else:
+                buffer.append(_LARGE_BIG_EXT)
+                buffer += _UINT32.pack(length)
+            buffer.append(value < 0)
+            buffer += magnitude.to_bytes(length, "little")
+
+    elif isinstance(value, float):
+        buffer.append(_NEW_FLOAT_EXT)
+        buffer += _DOUBLE.pack(value)
+
+    elif isinstance(value, typing.Mapping):
+        buffer.append(_MAP_EXT)
+        buffer += _UINT32.pack(len(value))
+        for key, item in value.items():  # pyright: ignore[reportUnknownVariableType]
+            # Discord requires string keys and will close with a decode error if atoms are used.
+            _encode_binary(str(key), buffer)  # pyright: ignore[reportUnknownArgumentType]
+            _encode(item, buffer)
+
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            buffer.append(_NIL_EXT)
+            return
+
+        buffer.append(_LIST_EXT)
+        buffer += _UINT32.pack(len(value))  # pyright: ignore[reportUnknownArgumentType]
+        for item in value:  # pyright: ignore[reportUnknownVariableType]
+            _encode(item, buffer)
+        buffer.append(_NIL_EXT)
+
+    else:
+        msg = f"Cannot encode object of type {type(value).__name__} to ETF"
+        raise TypeError(msg)
+
+
+def dumps(obj: data_binding.JSONArray | data_binding.JSONObject) -> bytes:
+    """Encode an object to an ETF payload.
+
+    This matches the [`hikari.internal.data_binding.JSONEncoder`][] signature,
+    so it can be used as a drop-in replacement for it.
+
+    String keys and values are encoded as binaries, as required by Discord.
+
+    Parameters
+    ----------
+    obj
+        The object to encode.
+
+    Returns
+    -------
+    bytes
+        The encoded payload.
+
+    Raises
+    ------
+    TypeError
+        If the object contains a value that cannot be encoded.
+    """
+    buffer = bytearray((_FORMAT_VERSION,))
+    _encode(obj, buffer)
+    return bytes(buffer)
@@ -22,7 +22,7 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("handle_interrupts",)
+__all__: typing.Sequence[str] = ("handle_blocking_interrupts", "handle_interrupts")
 
 import contextlib
 import logging
@@ -75,6 +75,46 @@ def handler(signum: int, frame: types.FrameType | None) -> None:
     return handler
 
 
+def _blocking_interrupt_handler(signum: int, frame: types.FrameType | None) -> None:
+    if _LOGGER.isEnabledFor(ux.TRACE):
+        _LOGGER.log(
+            ux.TRACE,
+            "interrupt %s occurred on thread %s\nStacktrace for developer sanity:\n%s",
+            signum,
+            threading.get_native_id(),
+            "".join(traceback.format_stack(frame)),
+        )
+
+    _raise_interrupt(signum)
+
+
+@contextlib.contextmanager
+def _install_handler(
+    interrupt_handler: _SignalHandlerT, *, propagate_interrupts: bool
+) -> typing.Generator[None, None, None]:
+    original_handlers: dict[int, int | _SignalHandlerT | None] = {}
+
+    for sig in _INTERRUPT_SIGNALS:
+        try:
+            signum = getattr(signal, sig)
+        except AttributeError:  # noqa: PERF203 - no try except within a loop
+            _LOGGER.log(ux.TRACE, "signal %s is not implemented on your platform; skipping", sig)
+        else:
+            original_handlers[signum] = signal.getsignal(signum)
+            signal.signal(signum, interrupt_handler)
+
+    try:
+        yield
+
+    except errors.HikariInterrupt:
+        if propagate_interrupts:
+            raise
+
+    finally:
+        for signum, handler in original_handlers.items():
+            signal.signal(signum, handler)
+
+
 @contextlib.contextmanager
 def handle_interrupts(
     loop: asyncio.AbstractEventLoop, *, propagate_interrupts: bool, enabled: bool | None
@@ -101,25 +141,36 @@ def handle_interrupts(
         yield
         return
 
-    interrupt_handler = _interrupt_handler(loop)
-    original_handlers: dict[int, int | _SignalHandlerT | None] = {}
+    with _install_handler(_interrupt_handler(loop), propagate_interrupts=propagate_interrupts):
+        yield
 
-    for sig in _INTERRUPT_SIGNALS:
-        try:
-            signum = getattr(signal, sig)
-        except AttributeError:  # noqa: PERF203 - no try except within a loop
-            _LOGGER.log(ux.TRACE, "signal %s is not implemented on your platform; skipping", sig)
-        else:
-            original_handlers[signum] = signal.getsignal(signum)
-            signal.signal(signum, interrupt_handler)
 
-    try:
-        yield
+@contextlib.contextmanager
+def handle_blocking_interrupts(
+    *, propagate_interrupts: bool, enabled: bool | None
+) -> typing.Generator[None, None, None]:
+    """Context manager which cleanly exits on signal interrupts without an event loop.
 
-    except errors.HikariInterrupt:
-        if propagate_interrupts:
-            raise
+    The interrupt is raised straight away in the main thread, interrupting
+    whatever blocking call it is currently in.
 
-    finally:
-        for signum, handler in original_handlers.items():
-            signal.signal(signum, handler)
+    Parameters
+    ----------
+    propagate_interrupts
+        Whether to propagate interrupts.
+    enabled
+        Whether to enable the signal interrupts.
+
+        If set to [`None`][], then it will be enabled or not based on whether the running
+        thread is the main one or not.
+    """
+    if enabled is None:
+        enabled = threading.current_thread() is threading.main_thread()
+
+    if not enabled:
+        # NOOP context manager
+        yield
+        return
+
+    with _install_handler(_blocking_interrupt_handler, propagate_interrupts=propagate_interrupts):
+        yield
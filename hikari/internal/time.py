@@ -37,6 +37,7 @@
 )
 
 import datetime
+import functools
 import time
 import typing
 import uuid as uuid_
@@ -83,6 +84,34 @@ def slow_iso8601_datetime_string_to_datetime(datetime_str: str) -> datetime.date
     return datetime.datetime.fromisoformat(datetime_str)
 
 
+_fromisoformat: typing.Final[typing.Callable[[str], datetime.datetime]] = datetime.datetime.fromisoformat
+
+
+def python_iso8601_datetime_string_to_datetime(datetime_str: str) -> datetime.datetime:
+    """Parse an RFC-3339 datestring into a datetime, without using any C extensions.
+
+    This passes the string straight to [`datetime.datetime.fromisoformat`][],
+    which accepts the `+00:00` suffixed timestamps Discord sends on all supported
+    versions, and only falls back to
+    [`hikari.internal.time.slow_iso8601_datetime_string_to_datetime`][] for the
+    other shapes it rejects.
+
+    Parameters
+    ----------
+    datetime_str
+        The date string to parse.
+
+    Returns
+    -------
+    datetime.datetime
+        The corresponding date time.
+    """
+    try:
+        return _fromisoformat(datetime_str)
+    except ValueError:
+        return slow_iso8601_datetime_string_to_datetime(datetime_str)
+
+
 fast_iso8601_datetime_string_to_datetime: typing.Callable[[str], datetime.datetime] | None
 try:
     # CISO8601 is around 600x faster than modules like dateutil, which is
@@ -99,9 +128,18 @@ def slow_iso8601_datetime_string_to_datetime(datetime_str: str) -> datetime.date
     fast_iso8601_datetime_string_to_datetime = None
 
 iso8601_datetime_string_to_datetime: typing.Callable[[str], datetime.datetime] = (
-    fast_iso8601_datetime_string_to_datetime or slow_iso8601_datetime_string_to_datetime
+    fast_iso8601_datetime_string_to_datetime or python_iso8601_datetime_string_to_datetime
 )
 
+_TIMESTAMP_CACHE_SIZE: typing.Final[int] = 4096
+
+# Some timestamps are sent over and over again, such as the "joined_at" of the members
+# attached to every message they send, so these are worth keeping around for a while.
+# As datetimes are immutable, the parsed values can be safely shared.
+cached_iso8601_datetime_string_to_datetime: typing.Callable[[str], datetime.datetime] = functools.lru_cache(
+    maxsize=_TIMESTAMP_CACHE_SIZE
+)(iso8601_datetime_string_to_datetime)
+
 
 def discord_epoch_to_datetime(epoch: int, /) -> datetime.datetime:
     """Parse a Discord epoch into a [`datetime.datetime`][] object.
@@ -0,0 +1,158 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the generated user and member deserializers to their hand-written equivalents.
+
+Usage: `python scripts/benchmarks/deserializer_benchmark.py`
+
+The hand-written deserializers below are the implementations the entity factory
+used before switching to the generated ones. Both are first checked to produce
+the same models for a set of payloads, and then timed against each other.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+import attrs
+
+from hikari import guilds
+from hikari import snowflakes
+from hikari import undefined
+from hikari import users
+from hikari.impl import entity_factory
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari.internal import data_binding
+
+_APP: typing.Any = object()
+_GUILD_ID = snowflakes.Snowflake(574921006817476608)
+_ROLE_IDS = (snowflakes.Snowflake(574921006817476609), _GUILD_ID)
+
+
+def _hand_written_user(payload: data_binding.JSONObject) -> users.UserImpl:
+    user_fields = entity_factory.EntityFactoryImpl._set_user_attributes(payload)  # noqa: SLF001 - Benchmarking
+    flags = users.UserFlag(payload["public_flags"]) if "public_flags" in payload else users.UserFlag.NONE
+    return users.UserImpl(
+        app=_APP,
+        id=user_fields.id,
+        discriminator=user_fields.discriminator,
+        username=user_fields.username,
+        global_name=payload.get("global_name"),
+        avatar_hash=user_fields.avatar_hash,
+        banner_hash=user_fields.banner_hash,
+        accent_color=user_fields.accent_color,
+        is_bot=user_fields.is_bot,
+        is_system=user_fields.is_system,
+        flags=flags,
+    )
+
+
+def _hand_written_member(payload: data_binding.JSONObject, user: users.User) -> guilds.Member:
+    parse = time.iso8601_datetime_string_to_datetime
+    raw_joined_at = payload["joined_at"]
+    raw_premium_since = payload.get("premium_since")
+    communication_disabled_until = None
+    if raw_communication_disabled_until := payload.get("communication_disabled_until"):
+        communication_disabled_until = parse(raw_communication_disabled_until)
+
+    return guilds.Member(
+        user=user,
+        guild_id=_GUILD_ID,
+        role_ids=_ROLE_IDS,
+        joined_at=parse(raw_joined_at) if raw_joined_at is not None else None,
+        nickname=payload.get("nick"),
+        guild_avatar_hash=payload.get("avatar"),
+        guild_banner_hash=payload.get("banner"),
+        premium_since=parse(raw_premium_since) if raw_premium_since is not None else None,
+        is_deaf=payload.get("deaf", undefined.UNDEFINED),
+        is_mute=payload.get("mute", undefined.UNDEFINED),
+        is_pending=payload.get("pending", undefined.UNDEFINED),
+        raw_communication_disabled_until=communication_disabled_until,
+        guild_flags=guilds.GuildMemberFlags(payload.get("flags") or guilds.GuildMemberFlags.NONE),
+    )
+
+
+def _generated_user(payload: data_binding.JSONObject) -> users.UserImpl:
+    return entity_factory._deserialize_user(payload, _APP)  # noqa: SLF001 - Benchmarking private functions
+
+
+def _generated_member(payload: data_binding.JSONObject, user: users.User) -> guilds.Member:
+    return entity_factory._deserialize_member(  # noqa: SLF001 - Benchmarking private functions
+        payload, user, _GUILD_ID, _ROLE_IDS, time.iso8601_datetime_string_to_datetime
+    )
+
+
+def _as_tuple(model: attrs.AttrsInstance) -> tuple[object, ...]:
+    return tuple(getattr(model, field.name) for field in attrs.fields(type(model)))
+
+
+USER_PAYLOADS: list[data_binding.JSONObject] = [
+    {"id": "115590097100865541", "username": "nyaa", "discriminator": "0", "avatar": None},
+    {
+        "id": "115590097100865541",
+        "username": "nyaa",
+        "global_name": "Nyaa",
+        "discriminator": "6127",
+        "avatar": "b3b24c6d7cbcdec129d5d537067061a8",
+        "banner": "a_221313e1e2edsncsncsmcndsc",
+        "accent_color": 231321,
+        "bot": True,
+        "system": True,
+        "public_flags": int(users.UserFlag.EARLY_VERIFIED_DEVELOPER),
+    },
+]
+MEMBER_PAYLOADS: list[data_binding.JSONObject] = [
+    {"roles": [], "joined_at": None},
+    {
+        "nick": "foobarbaz",
+        "avatar": "estrogen",
+        "roles": ["574921006817476609"],
+        "joined_at": "2015-04-26T06:26:56.936000+00:00",
+        "premium_since": "2019-05-17T06:26:56.936000+00:00",
+        "communication_disabled_until": "2021-10-18T06:26:56.936000+00:00",
+        "deaf": False,
+        "mute": True,
+        "pending": False,
+        "flags": int(guilds.GuildMemberFlags.DID_REJOIN),
+    },
+]
+
+user = _hand_written_user(USER_PAYLOADS[0])
+for payload in USER_PAYLOADS:
+    assert _as_tuple(_hand_written_user(payload)) == _as_tuple(_generated_user(payload)), payload
+for payload in MEMBER_PAYLOADS:
+    assert _as_tuple(_hand_written_member(payload, user)) == _as_tuple(_generated_member(payload, user)), payload
+
+print("parity checked for", len(USER_PAYLOADS), "user and", len(MEMBER_PAYLOADS), "member payloads")
+
+for name, hand_written, generated, payloads in (
+    ("user", lambda pl: _hand_written_user(pl), lambda pl: _generated_user(pl), USER_PAYLOADS),
+    ("member", lambda pl: _hand_written_member(pl, user), lambda pl: _generated_member(pl, user), MEMBER_PAYLOADS),
+):
+    for index, payload in enumerate(payloads):
+        hand_written_time = min(timeit.repeat(lambda: hand_written(payload), number=100_000, repeat=5))  # noqa: B023
+        generated_time = min(timeit.repeat(lambda: generated(payload), number=100_000, repeat=5))  # noqa: B023
+        print(
+            f"{name} payload {index}: hand-written {hand_written_time * 10_000:.0f}ns,"
+            f" generated {generated_time * 10_000:.0f}ns ({hand_written_time / generated_time:.2f}x)"
+        )
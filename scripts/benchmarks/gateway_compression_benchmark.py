@@ -0,0 +1,102 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare zlib-stream and zstd-stream transport compression on gateway traffic.
+
+Usage: `python scripts/benchmarks/gateway_compression_benchmark.py [recording]`
+
+The recording is a file with one raw, uncompressed gateway payload (JSON) per
+line. If no recording is passed, synthetic dispatch traffic is used instead.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import timeit
+import zlib
+
+import zstandard
+
+
+def _synthetic_traffic() -> list[bytes]:
+    rng = random.Random(1234)  # noqa: S311 - Not used for cryptographic purposes
+    payloads: list[bytes] = []
+
+    for seq in range(5_000):
+        guild_id = str(rng.randrange(10**17, 10**18))
+        user_id = str(rng.randrange(10**17, 10**18))
+        name = rng.choice(("MESSAGE_CREATE", "PRESENCE_UPDATE", "TYPING_START", "GUILD_MEMBER_UPDATE"))
+        data = {
+            "guild_id": guild_id,
+            "channel_id": str(rng.randrange(10**17, 10**18)),
+            "user": {"id": user_id, "username": f"user{seq}", "discriminator": "0", "avatar": None},
+            "status": rng.choice(("online", "idle", "dnd")),
+            "content": " ".join(rng.choice(("hello", "world", "hikari", "gateway", "zstd")) for _ in range(12)),
+            "timestamp": "2021-05-04T12:34:56.789000+00:00",
+            "roles": [str(rng.randrange(10**17, 10**18)) for _ in range(rng.randrange(0, 8))],
+        }
+        payloads.append(json.dumps({"op": 0, "t": name, "s": seq, "d": data}).encode())
+
+    return payloads
+
+
+def _compress_zlib(payloads: list[bytes]) -> list[bytes]:
+    compressor = zlib.compressobj()
+    return [compressor.compress(pl) + compressor.flush(zlib.Z_SYNC_FLUSH) for pl in payloads]
+
+
+def _compress_zstd(payloads: list[bytes]) -> list[bytes]:
+    compressor = zstandard.ZstdCompressor().compressobj()
+    return [compressor.compress(pl) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) for pl in payloads]
+
+
+def _inflate_zlib(frames: list[bytes]) -> None:
+    decompressor = zlib.decompressobj()
+    for frame in frames:
+        decompressor.decompress(frame)
+
+
+def _inflate_zstd(frames: list[bytes]) -> None:
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    for frame in frames:
+        decompressor.decompress(frame)
+
+
+if len(sys.argv) > 1:
+    with open(sys.argv[1], "rb") as fp:  # noqa: PTH123 - Use pathlib
+        traffic = [line.strip() for line in fp if line.strip()]
+else:
+    traffic = _synthetic_traffic()
+
+zlib_frames = _compress_zlib(traffic)
+zstd_frames = _compress_zstd(traffic)
+
+raw_size = sum(map(len, traffic))
+zlib_size = sum(map(len, zlib_frames))
+zstd_size = sum(map(len, zstd_frames))
+
+zlib_time = timeit.timeit(lambda: _inflate_zlib(zlib_frames), number=20) / 20
+zstd_time = timeit.timeit(lambda: _inflate_zstd(zstd_frames), number=20) / 20
+
+print(f"{len(traffic)} payloads, {raw_size} bytes uncompressed")
+print(f"zlib-stream: {zlib_size} bytes ({zlib_size / raw_size:.2%}), {zlib_time * 1_000:.2f}ms to inflate")
+print(f"zstd-stream: {zstd_size} bytes ({zstd_size / raw_size:.2%}), {zstd_time * 1_000:.2f}ms to inflate")
@@ -0,0 +1,76 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the timestamp parsers in `hikari.internal.time`.
+
+Usage: `python scripts/benchmarks/timestamp_benchmark.py`
+
+Each parser is run over a mix of the timestamp shapes Discord sends, once with
+all of them unique and once with them repeated, as happens with the "joined_at"
+of the members attached to messages.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+import timeit
+import typing
+
+from hikari.internal import time
+
+
+def _timestamps(count: int, unique: int) -> list[str]:
+    rng = random.Random(1234)  # noqa: S311 - Not used for cryptographic purposes
+    start = datetime.datetime(2015, 5, 13, tzinfo=datetime.timezone.utc)
+    pool: list[str] = []
+
+    for _ in range(unique):
+        timestamp = start + datetime.timedelta(seconds=rng.randrange(10**9), microseconds=rng.randrange(10**6))
+        # Discord mostly sends microseconds, but some fields are truncated to seconds
+        pool.append(timestamp.isoformat(timespec=rng.choice(("microseconds", "microseconds", "seconds"))))
+
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _run(parser: typing.Callable[[str], datetime.datetime], timestamps: list[str]) -> None:
+    for timestamp in timestamps:
+        parser(timestamp)
+
+
+parsers: dict[str, typing.Callable[[str], datetime.datetime]] = {
+    "slow": time.slow_iso8601_datetime_string_to_datetime,
+    "python": time.python_iso8601_datetime_string_to_datetime,
+}
+if time.fast_iso8601_datetime_string_to_datetime is not None:
+    parsers["ciso8601"] = time.fast_iso8601_datetime_string_to_datetime
+else:
+    print("ciso8601 is not installed, skipping it")
+
+cached_parser = time.cached_iso8601_datetime_string_to_datetime
+parsers["cached"] = cached_parser
+
+for label, timestamps in (("unique", _timestamps(100_000, 100_000)), ("repeated", _timestamps(100_000, 1_000))):
+    print(f"{len(timestamps)} {label} timestamps")
+
+    for name, parser in parsers.items():
+        cached_parser.cache_clear()  # type: ignore[attr-defined]
+        elapsed = min(timeit.repeat(lambda: _run(parser, timestamps), number=1, repeat=5))  # noqa: B023
+        print(f"  {name}: {elapsed * 1_000:.2f}ms ({elapsed / len(timestamps) * 1_000_000_000:.0f}ns per timestamp)")
@@ -23,6 +23,7 @@
 import datetime
 import typing
 
+import attrs
 import mock
 import pytest
 
@@ -62,6 +63,30 @@
 from tests.hikari import hikari_test_helpers
 
 
+def assert_round_trip(original: object, result: object, *, exclude: typing.Collection[str] = ()) -> None:
+    # Entities compare by ID, so this compares the fields instead, recursing into any nested entities
+    if attrs.has(type(original)):
+        assert type(result) is type(original)
+        for field in attrs.fields(type(original)):
+            if field.name != "app" and field.name not in exclude:
+                assert_round_trip(getattr(original, field.name), getattr(result, field.name))
+
+    elif isinstance(original, typing.Mapping):
+        assert isinstance(result, typing.Mapping)
+        assert list(result.keys()) == list(original.keys())
+        for key, value in original.items():
+            assert_round_trip(value, result[key])
+
+    elif isinstance(original, typing.Sequence) and not isinstance(original, str):
+        assert isinstance(result, typing.Sequence)
+        assert len(result) == len(original)
+        for original_item, result_item in zip(original, result):
+            assert_round_trip(original_item, result_item)
+
+    else:
+        assert result == original
+
+
 @pytest.fixture
 def permission_overwrite_payload():
     return {"id": "4242", "type": 1, "allow": 65, "deny": 49152, "allow_new": "65", "deny_new": "49152"}
@@ -677,7 +702,7 @@ def test_members(self, entity_factory_impl, member_payload):
 
     def test_members_returns_cached_values(self, entity_factory_impl):
         mock_member = object()
-        entity_factory_impl.deserialize_member = mock.Mock()
+        entity_factory_impl.deserialize_members = mock.Mock()
         guild_definition = entity_factory_impl.deserialize_gateway_guild(
             {"id": "92929292"}, user_id=snowflakes.Snowflake(43123)
         )
@@ -685,7 +710,7 @@ def test_members_returns_cached_values(self, entity_factory_impl):
 
         assert guild_definition.members() == {"93939393": mock_member}
 
-        entity_factory_impl.deserialize_member.assert_not_called()
+        entity_factory_impl.deserialize_members.assert_not_called()
 
     def test_presences(self, entity_factory_impl, member_presence_payload):
         guild_definition = entity_factory_impl.deserialize_gateway_guild(
@@ -2664,6 +2689,39 @@ def test_deserialize_channel_when_unknown_type(self, entity_factory_impl):
         with pytest.raises(errors.UnrecognisedEntityError):
             entity_factory_impl.deserialize_channel({"type": -111})
 
+    def test_serialize_guild_channel_round_trip(
+        self,
+        entity_factory_impl: entity_factory.EntityFactoryImpl,
+        guild_category_payload: dict[str, typing.Any],
+        guild_text_channel_payload: dict[str, typing.Any],
+        guild_news_channel_payload: dict[str, typing.Any],
+        guild_voice_channel_payload: dict[str, typing.Any],
+        guild_stage_channel_payload: dict[str, typing.Any],
+        guild_forum_channel_payload: dict[str, typing.Any],
+    ):
+        for payload in [
+            guild_category_payload,
+            guild_text_channel_payload,
+            guild_news_channel_payload,
+            guild_voice_channel_payload,
+            guild_stage_channel_payload,
+            guild_forum_channel_payload,
+        ]:
+            channel = entity_factory_impl.deserialize_channel(payload)
+            assert isinstance(channel, channel_models.PermissibleGuildChannel)
+
+            result = entity_factory_impl.deserialize_channel(entity_factory_impl.serialize_guild_channel(channel))
+
+            assert_round_trip(channel, result)
+
+    def test_serialize_guild_channel_with_unsupported_type(
+        self, entity_factory_impl: entity_factory.EntityFactoryImpl, guild_public_thread_payload: dict[str, typing.Any]
+    ):
+        thread = entity_factory_impl.deserialize_guild_public_thread(guild_public_thread_payload)
+
+        with pytest.raises(TypeError, match=r"Cannot serialize guild channel of type GUILD_PUBLIC_THREAD"):
+            entity_factory_impl.serialize_guild_channel(thread)  # type: ignore[arg-type]
+
     ################
     # EMBED MODELS #
     ################
@@ -3246,6 +3304,19 @@ def test_deserialize_member_with_null_fields(self, entity_factory_impl, user_pay
         assert member.joined_at is None
         assert isinstance(member, guild_models.Member)
 
+    def test_deserialize_member_with_empty_communication_disabled_until(self, entity_factory_impl, user_payload):
+        member = entity_factory_impl.deserialize_member(
+            {
+                "roles": ["11111", "22222", "33333", "44444"],
+                "joined_at": "2015-04-26T06:26:56.936000+00:00",
+                "user": user_payload,
+                "guild_id": "123123123",
+                "communication_disabled_until": "",
+            }
+        )
+
+        assert member.raw_communication_disabled_until is None
+
     def test_deserialize_member_with_undefined_fields(self, entity_factory_impl, user_payload):
         member = entity_factory_impl.deserialize_member(
             {
@@ -3279,6 +3350,82 @@ def test_deserialize_member_with_passed_through_user_object_and_guild_id(self, e
         assert member.user is mock_user
         assert member.guild_id == 64234
 
+    def test_deserialize_members(self, entity_factory_impl, mock_app, member_payload, user_payload):
+        other_member_payload = {
+            **member_payload,
+            "user": {**user_payload, "id": "115590097100865542"},
+            "roles": ["11111", "22222", "33333", "44444"],
+        }
+
+        members = entity_factory_impl.deserialize_members(
+            [member_payload, other_member_payload], guild_id=snowflakes.Snowflake(76543325)
+        )
+
+        assert list(members.keys()) == [115590097100865541, 115590097100865542]
+        member = members[115590097100865541]
+        expected_member = entity_factory_impl.deserialize_member(
+            member_payload, guild_id=snowflakes.Snowflake(76543325)
+        )
+        for field in attrs.fields(guild_models.Member):
+            if field.name == "role_ids":
+                assert member.role_ids == (11111, 22222, 33333, 44444, 76543325)
+            else:
+                assert getattr(member, field.name) == getattr(expected_member, field.name)
+
+        other_member = members[115590097100865542]
+        assert other_member.user.id == 115590097100865542
+        assert other_member.role_ids is member.role_ids
+        assert other_member.joined_at is member.joined_at
+        assert other_member.premium_since is member.premium_since
+
+    def test_deserialize_members_shares_role_ids(self, entity_factory_impl, member_payload, user_payload):
+        other_member_payload = {
+            **member_payload,
+            "user": {**user_payload, "id": "115590097100865542"},
+            "roles": ["33333", "55555"],
+            "joined_at": None,
+        }
+
+        members = entity_factory_impl.deserialize_members(
+            [member_payload, other_member_payload], guild_id=snowflakes.Snowflake(76543325)
+        )
+
+        member, other_member = members.values()
+        assert member.role_ids == (11111, 22222, 33333, 44444, 76543325)
+        assert other_member.role_ids == (33333, 55555, 76543325)
+        assert other_member.role_ids[0] is member.role_ids[2]
+        assert other_member.role_ids[2] is member.role_ids[4]
+        assert other_member.joined_at is None
+
+    def test_deserialize_members_when_guild_id_already_in_role_array(self, entity_factory_impl, member_payload):
+        member_payload["roles"] = [11111, 76543325, 22222]
+
+        members = entity_factory_impl.deserialize_members([member_payload], guild_id=snowflakes.Snowflake(76543325))
+
+        assert members[115590097100865541].role_ids == (11111, 76543325, 22222)
+
+    def test_serialize_member_round_trip(self, entity_factory_impl, member_payload):
+        member = entity_factory_impl.deserialize_member(member_payload, guild_id=snowflakes.Snowflake(76543325))
+
+        payload = entity_factory_impl.serialize_member(member)
+        result = entity_factory_impl.deserialize_member(payload)
+
+        assert_round_trip(member, result)
+        assert "76543325" not in payload["roles"]
+
+    def test_serialize_member_round_trip_with_undefined_fields(self, entity_factory_impl, member_payload):
+        del member_payload["deaf"]
+        del member_payload["mute"]
+        del member_payload["pending"]
+        member = entity_factory_impl.deserialize_member(member_payload, guild_id=snowflakes.Snowflake(76543325))
+
+        payload = entity_factory_impl.serialize_member(member)
+
+        assert "deaf" not in payload
+        assert "mute" not in payload
+        assert "pending" not in payload
+        assert_round_trip(member, entity_factory_impl.deserialize_member(payload))
+
     def test_deserialize_role(self, entity_factory_impl, mock_app, guild_role_payload):
         guild_role = entity_factory_impl.deserialize_role(guild_role_payload, guild_id=snowflakes.Snowflake(76534453))
         assert guild_role.app is mock_app
@@ -3321,6 +3468,24 @@ def test_deserialize_role_with_no_tags(self, entity_factory_impl, guild_role_pay
         assert guild_role.integration_id is None
         assert guild_role.is_premium_subscriber_role is False
 
+    def test_serialize_role_round_trip(self, entity_factory_impl, guild_role_payload):
+        role = entity_factory_impl.deserialize_role(guild_role_payload, guild_id=snowflakes.Snowflake(76534453))
+
+        result = entity_factory_impl.deserialize_role(
+            entity_factory_impl.serialize_role(role), guild_id=snowflakes.Snowflake(76534453)
+        )
+
+        assert_round_trip(role, result)
+
+    def test_serialize_role_round_trip_without_tags(self, entity_factory_impl, guild_role_payload):
+        del guild_role_payload["tags"]
+        role = entity_factory_impl.deserialize_role(guild_role_payload, guild_id=snowflakes.Snowflake(76534453))
+
+        payload = entity_factory_impl.serialize_role(role)
+
+        assert "tags" not in payload
+        assert_round_trip(role, entity_factory_impl.deserialize_role(payload, guild_id=snowflakes.Snowflake(76534453)))
+
     def test_deserialize_partial_integration(self, entity_factory_impl, partial_integration_payload):
         partial_integration = entity_factory_impl.deserialize_partial_integration(partial_integration_payload)
         assert partial_integration.id == 4949494949
@@ -3994,6 +4159,33 @@ def test_deserialize_gateway_guild_with_null_fields(self, entity_factory_impl):
         assert guild.premium_subscription_count is None
         assert guild.public_updates_channel_id is None
 
+    def test_serialize_gateway_guild_round_trip(self, entity_factory_impl, gateway_guild_payload):
+        guild = entity_factory_impl.deserialize_gateway_guild(
+            gateway_guild_payload, user_id=snowflakes.Snowflake(43123)
+        ).guild()
+
+        result = entity_factory_impl.deserialize_gateway_guild(
+            entity_factory_impl.serialize_gateway_guild(guild), user_id=snowflakes.Snowflake(43123)
+        ).guild()
+
+        assert_round_trip(guild, result)
+
+    def test_serialize_gateway_guild_round_trip_with_unset_fields(self, entity_factory_impl, gateway_guild_payload):
+        for key in ("widget_enabled", "max_video_channel_users", "premium_subscription_count", "large", "joined_at"):
+            del gateway_guild_payload[key]
+        del gateway_guild_payload["member_count"]
+        guild = entity_factory_impl.deserialize_gateway_guild(
+            gateway_guild_payload, user_id=snowflakes.Snowflake(43123)
+        ).guild()
+
+        payload = entity_factory_impl.serialize_gateway_guild(guild)
+
+        assert "large" not in payload
+        assert "member_count" not in payload
+        assert_round_trip(
+            guild, entity_factory_impl.deserialize_gateway_guild(payload, user_id=snowflakes.Snowflake(43123)).guild()
+        )
+
     ######################
     # INTERACTION MODELS #
     ######################
@@ -6355,6 +6547,134 @@ def test_deserialize_message_deserializes_old_stickers_field(self, entity_factor
         assert sticker.format_type is sticker_models.StickerFormatType.LOTTIE
         assert isinstance(sticker, sticker_models.PartialSticker)
 
+    @pytest.fixture
+    def lazy_entity_factory_impl(self, mock_app) -> entity_factory.EntityFactoryImpl:
+        return entity_factory.EntityFactoryImpl(mock_app, lazy_messages=True)
+
+    def test_deserialize_message_when_lazy(self, lazy_entity_factory_impl, message_payload):
+        eager_message = entity_factory.EntityFactoryImpl(lazy_entity_factory_impl.app).deserialize_message(
+            message_payload
+        )
+
+        message = lazy_entity_factory_impl.deserialize_message(message_payload)
+
+        assert isinstance(message, message_models.Message)
+        assert attrs.asdict(message) == attrs.asdict(eager_message)
+
+    def test_deserialize_message_when_lazy_defers_fields(self, lazy_entity_factory_impl, message_payload):
+        message = lazy_entity_factory_impl.deserialize_message(message_payload)
+
+        with mock.patch.object(
+            entity_factory.EntityFactoryImpl, "deserialize_embed", wraps=lazy_entity_factory_impl.deserialize_embed
+        ) as deserialize_embed:
+            assert message.id == 123
+            deserialize_embed.assert_not_called()
+
+            embeds = message.embeds
+
+            assert message.embeds is embeds
+            deserialize_embed.assert_called_once_with(message_payload["embeds"][0])
+
+    def test_deserialize_message_when_lazy_and_unknown_attribute(self, lazy_entity_factory_impl, message_payload):
+        message = lazy_entity_factory_impl.deserialize_message(message_payload)
+
+        with pytest.raises(AttributeError, match=r"'_LazyMessage' object has no attribute 'foo'"):
+            message.foo  # noqa: B018 - Useless expression
+
+    def test_deserialize_partial_message_when_lazy(self, lazy_entity_factory_impl, message_payload):
+        eager_message = entity_factory.EntityFactoryImpl(lazy_entity_factory_impl.app).deserialize_partial_message(
+            message_payload
+        )
+
+        message = lazy_entity_factory_impl.deserialize_partial_message(message_payload)
+
+        assert isinstance(message, message_models.PartialMessage)
+        assert attrs.asdict(message) == attrs.asdict(eager_message)
+
+    def test_deserialize_partial_message_when_lazy_with_unset_fields(self, lazy_entity_factory_impl):
+        message = lazy_entity_factory_impl.deserialize_partial_message(
+            {"id": 123, "channel_id": 456, "referenced_message": None}
+        )
+
+        assert message.attachments is undefined.UNDEFINED
+        assert message.stickers is undefined.UNDEFINED
+        assert message.components is undefined.UNDEFINED
+        assert message.user_mentions is undefined.UNDEFINED
+        assert message.referenced_message is None
+        assert message.interaction_metadata is None
+
+    def test_serialize_message_round_trip(self, entity_factory_impl, message_payload):
+        message = entity_factory_impl.deserialize_message(message_payload)
+
+        result = entity_factory_impl.deserialize_message(entity_factory_impl.serialize_message(message))
+
+        assert_round_trip(message, result)
+        assert result.components
+        assert result.poll is not None
+        assert result.interaction_metadata is not None
+        assert result.thread is not None
+
+    def test_serialize_message_round_trip_with_other_sub_objects(
+        self, entity_factory_impl, message_payload, partial_interaction_metadata_payload, guild_private_thread_payload
+    ):
+        triggering_interaction_metadata_payload = dict(partial_interaction_metadata_payload)
+        triggering_interaction_metadata_payload["type"] = 3
+        triggering_interaction_metadata_payload["interacted_message_id"] = "684831"
+        message_payload["interaction_metadata"] = {
+            "id": "654321",
+            "type": 5,
+            "user": partial_interaction_metadata_payload["user"],
+            "authorizing_integration_owners": {"1": "456"},
+            "triggering_interaction_metadata": triggering_interaction_metadata_payload,
+        }
+        message_payload["components"] = [
+            {
+                "type": 1,
+                "components": [
+                    {
+                        "type": 3,
+                        "custom_id": "text",
+                        "options": [
+                            {"label": "Label", "value": "value", "description": "Description", "default": True},
+                            {"label": "Other", "value": "other", "emoji": {"id": None, "name": "🐸"}},
+                        ],
+                        "placeholder": "Pick one",
+                        "min_values": 0,
+                        "max_values": 2,
+                    }
+                ],
+            },
+            {"type": 1, "components": [{"type": 8, "custom_id": "channel", "channel_types": [0, 5], "disabled": True}]},
+            {"type": 1, "components": [{"type": 5, "custom_id": "user"}, {"type": 2, "style": 5, "url": "okokok"}]},
+        ]
+        message_payload["poll"]["results"] = None
+        message_payload["thread"] = guild_private_thread_payload
+        message = entity_factory_impl.deserialize_message(message_payload)
+
+        result = entity_factory_impl.deserialize_message(entity_factory_impl.serialize_message(message))
+
+        assert_round_trip(message, result)
+        assert isinstance(result.interaction_metadata, modal_interactions.ModalInteractionMetadata)
+        assert isinstance(result.thread, channel_models.GuildPrivateThread)
+
+    def test_serialize_message_for_partial_message_with_components(self, entity_factory_impl, action_row_payload):
+        message = entity_factory_impl.deserialize_partial_message(
+            {"id": "123", "channel_id": "456", "components": [action_row_payload]}
+        )
+
+        payload = entity_factory_impl.serialize_message(message)
+
+        assert payload["components"] == [action_row_payload]
+        assert_round_trip(message, entity_factory_impl.deserialize_partial_message(payload))
+
+    def test_serialize_message_round_trip_for_partial_message(self, entity_factory_impl):
+        message = entity_factory_impl.deserialize_partial_message({"id": "123", "channel_id": "456"})
+
+        payload = entity_factory_impl.serialize_message(message)
+
+        assert payload == {"id": "123", "channel_id": "456"}
+        assert_round_trip(message, entity_factory_impl.deserialize_partial_message(payload))
+
     ###################
     # PRESENCE MODELS #
     ###################
@@ -6554,6 +6874,15 @@ def test_deserialize_member_presence_with_unset_activity_sub_fields(self, entity
         assert activity.secrets.spectate is None
         assert activity.secrets.match is None
 
+    def test_serialize_member_presence_round_trip(self, entity_factory_impl, member_presence_payload):
+        presence = entity_factory_impl.deserialize_member_presence(member_presence_payload)
+
+        result = entity_factory_impl.deserialize_member_presence(
+            entity_factory_impl.serialize_member_presence(presence)
+        )
+
+        assert_round_trip(presence, result)
+
     ##########################
     # SCHEDULED EVENT MODELS #
     ##########################
@@ -7046,6 +7375,13 @@ def my_user_payload(self):
             "premium_type": 1,
         }
 
+    def test_serialize_user_round_trip(self, entity_factory_impl, user_payload):
+        user = entity_factory_impl.deserialize_user(user_payload)
+
+        result = entity_factory_impl.deserialize_user(entity_factory_impl.serialize_user(user))
+
+        assert_round_trip(user, result)
+
     def test_deserialize_my_user(self, entity_factory_impl, mock_app, my_user_payload):
         my_user = entity_factory_impl.deserialize_my_user(my_user_payload)
         assert my_user.app is mock_app
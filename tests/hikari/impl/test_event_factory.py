@@ -1414,7 +1414,7 @@ def test_deserialize_guild_member_chunk_event_with_optional_fields(self, event_f
 
         event = event_factory.deserialize_guild_member_chunk_event(mock_shard, mock_payload)
 
-        mock_app.entity_factory.deserialize_member.assert_called_once_with(mock_member_payload, guild_id=123432123)
+        mock_app.entity_factory.deserialize_members.assert_called_once_with([mock_member_payload], guild_id=123432123)
         mock_app.entity_factory.deserialize_member_presence.assert_called_once_with(
             mock_presence_payload, guild_id=123432123
         )
@@ -1422,7 +1422,7 @@ def test_deserialize_guild_member_chunk_event_with_optional_fields(self, event_f
         assert event.app is mock_app
         assert event.shard is mock_shard
         assert event.guild_id == 123432123
-        assert event.members == {4222222: mock_app.entity_factory.deserialize_member.return_value}
+        assert event.members is mock_app.entity_factory.deserialize_members.return_value
         assert event.chunk_count == 54
         assert event.chunk_index == 3
         assert event.not_found == [34212312312, 323123123]
@@ -21,72 +21,30 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import contextlib
-import random
+import concurrent.futures
+import threading
 
 import mock
 import pytest
 
 from hikari import channels
-from hikari import errors
 from hikari import intents
 from hikari import presences
+from hikari import snowflakes
 from hikari.api import event_factory as event_factory_
 from hikari.events import guild_events
+from hikari.events import shard_events
 from hikari.impl import config
 from hikari.impl import event_manager
-from hikari.internal import time
+from hikari.impl import member_chunker
 from tests.hikari import hikari_test_helpers
 
 
-def test_fixed_size_nonce():
-    stack = contextlib.ExitStack()
-    monotonic = stack.enter_context(mock.patch.object(time, "monotonic_ns"))
-    monotonic.return_value.to_bytes = mock.Mock(return_value="foo")
-
-    randbits = stack.enter_context(mock.patch.object(random, "getrandbits"))
-    randbits.return_value.to_bytes = mock.Mock(return_value="bar")
-
-    encode = stack.enter_context(mock.patch.object(base64, "b64encode"))
-    encode.return_value.decode = mock.Mock(return_value="nonce")
-
-    with stack:
-        assert event_manager._fixed_size_nonce() == "nonce"
-
-    monotonic.assert_called_once_with()
-    monotonic.return_value.to_bytes.assert_called_once_with(8, "big")
-
-    randbits.assert_called_once_with(92)
-    randbits.return_value.to_bytes.assert_called_once_with(12, "big")
-
-    encode.assert_called_once_with("foobar")
-    encode.return_value.decode.assert_called_once_with("ascii")
-
-
 @pytest.fixture
 def shard():
     return mock.Mock(id=987)
 
 
-@pytest.mark.asyncio
-async def test__request_guild_members(shard):
-    shard.request_guild_members = mock.AsyncMock()
-
-    await event_manager._request_guild_members(shard, 123, include_presences=True, nonce="okokok")
-
-    shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce="okokok")
-
-
-@pytest.mark.asyncio
-async def test__request_guild_members_handles_state_conflict_error(shard):
-    shard.request_guild_members = mock.AsyncMock(side_effect=errors.ComponentStateConflictError(reason="OK"))
-
-    await event_manager._request_guild_members(shard, 123, include_presences=True, nonce="okokok")
-
-    shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce="okokok")
-
-
 class TestEventManagerImpl:
     @pytest.fixture
     def entity_factory(self):
@@ -429,6 +387,20 @@ async def test_on_thread_members_update_stateless(
         )
         event_factory.deserialize_thread_members_update_event.assert_called_once_with(shard, mock_payload)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("offload_member_count", "member_count", "offloaded"), [(None, 10, False), (10, 10, False), (10, 11, True)]
+    )
+    async def test__deserialize_guild_create(self, event_manager_impl, offload_member_count, member_count, offloaded):
+        event_manager_impl._offload_member_count = offload_member_count
+        payload = {"members": [{}] * member_count}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            event_manager_impl._executor = executor
+            thread = await event_manager_impl._deserialize_guild_create(payload, threading.get_ident)
+
+        assert (thread != threading.get_ident()) is offloaded
+
     @pytest.mark.asyncio
     async def test_on_guild_create_when_unavailable_guild(
         self, event_manager_impl, shard, event_factory, entity_factory
@@ -437,7 +409,7 @@ async def test_on_guild_create_when_unavailable_guild(
         event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
         event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
             await event_manager_impl.on_guild_create(shard, payload)
 
         event_manager_impl._enabled_for_event.assert_not_called()
@@ -459,7 +431,7 @@ async def test_on_guild_create_when_unavailable_guild(
         event_manager_impl._cache.set_presence.assert_not_called()
         event_manager_impl._cache.clear_voice_states_for_guild.assert_not_called()
         event_manager_impl._cache.set_voice_state.assert_not_called()
-        request_guild_members.assert_not_called()
+        guild_chunker.assert_not_called()
 
         event_manager_impl.dispatch.assert_not_called()
 
@@ -473,7 +445,7 @@ async def test_on_guild_create_when_dispatching_and_not_caching(
         event_manager_impl._cache_enabled_for = mock.Mock(return_value=False)
         event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
             await event_manager_impl.on_guild_create(shard, payload)
 
         if include_unavailable:
@@ -502,7 +474,7 @@ async def test_on_guild_create_when_dispatching_and_not_caching(
         event_manager_impl._cache.set_presence.assert_not_called()
         event_manager_impl._cache.clear_voice_states_for_guild.assert_not_called()
         event_manager_impl._cache.set_voice_state.assert_not_called()
-        request_guild_members.assert_not_called()
+        guild_chunker.assert_not_called()
 
         event_manager_impl.dispatch.assert_awaited_once_with(event)
 
@@ -516,7 +488,7 @@ async def test_on_guild_create_when_not_dispatching_and_not_caching(
         event_manager_impl._cache_enabled_for = mock.Mock(return_value=False)
         event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
             await event_manager_impl.on_guild_create(shard, payload)
 
         if include_unavailable:
@@ -547,7 +519,7 @@ async def test_on_guild_create_when_not_dispatching_and_not_caching(
         event_manager_impl._cache.clear_voice_states_for_guild.assert_not_called()
         event_manager_impl._cache.set_voice_state.assert_not_called()
         shard.get_user_id.assert_called_once_with()
-        request_guild_members.assert_not_called()
+        guild_chunker.assert_not_called()
 
         event_manager_impl.dispatch.assert_not_called()
 
@@ -574,7 +546,7 @@ async def test_on_guild_create_when_not_dispatching_and_caching(
         gateway_guild.stickers.return_value = {1: "sticker1", 2: "sticker2"}
         gateway_guild.threads.return_value = {1: "thread1", 2: "thread2"}
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
             await event_manager_impl.on_guild_create(shard, payload)
 
         if include_unavailable:
@@ -609,7 +581,7 @@ async def test_on_guild_create_when_not_dispatching_and_caching(
         event_manager_impl._cache.set_presence.assert_has_calls([mock.call("presence1"), mock.call("presence2")])
         event_manager_impl._cache.clear_voice_states_for_guild.assert_called_once_with(gateway_guild.id)
         event_manager_impl._cache.set_voice_state.assert_has_calls([mock.call("voice1"), mock.call("voice2")])
-        request_guild_members.assert_not_called()
+        guild_chunker.assert_not_called()
 
         event_manager_impl.dispatch.assert_not_called()
 
@@ -626,7 +598,7 @@ async def test_on_guild_create_when_stateless(
         stateless_event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
         stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
             await stateless_event_manager_impl.on_guild_create(shard, payload)
 
         if include_unavailable:
@@ -636,7 +608,7 @@ async def test_on_guild_create_when_stateless(
 
         event_factory.deserialize_guild_join_event.assert_not_called()
         event_factory.deserialize_guild_available_event.assert_not_called()
-        request_guild_members.assert_not_called()
+        guild_chunker.assert_not_called()
 
         stateless_event_manager_impl.dispatch.assert_not_called()
 
@@ -655,17 +627,47 @@ def cache_enabled_for_members_only(component):
         gateway_guild = entity_factory.deserialize_gateway_guild.return_value
         gateway_guild.id = 456
         gateway_guild.members.return_value = {1: "member1", 2: "member2"}
-        mock_request_guild_members = mock.Mock()
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
+            await event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
-                with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
-                    await event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
+        guild_chunker.assert_called_once_with(shard, max_outstanding=5)
+        guild_chunker.return_value.request.assert_called_once_with(456, include_presences=False, member_count=0)
 
-        mock_request_guild_members.assert_called_once_with(shard, 456, include_presences=False, nonce="123.abc")
-        create_task.assert_called_once_with(
-            mock_request_guild_members.return_value, name="123:456 guild create members request"
-        )
+    @pytest.mark.asyncio
+    async def test_on_guild_create_when_chunking_reuses_shard_chunker(self, stateless_event_manager_impl, shard):
+        shard.id = 123
+        chunker = mock.Mock(shard=shard)
+        stateless_event_manager_impl._guild_chunkers = {123: chunker}
+        stateless_event_manager_impl._intents = intents.Intents.GUILD_MEMBERS
+        stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
+        stateless_event_manager_impl._event_factory.deserialize_guild_join_event.return_value.guild.id = 456
+
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
+            await stateless_event_manager_impl.on_guild_create(shard, {"large": True, "member_count": 5000})
+
+        guild_chunker.assert_not_called()
+        chunker.request.assert_called_once_with(456, include_presences=False, member_count=5000)
+        assert stateless_event_manager_impl.guild_chunkers == {123: chunker}
+
+    @pytest.mark.asyncio
+    async def test_on_guild_create_when_chunking_after_restart_replaces_shard_chunker(
+        self, stateless_event_manager_impl, shard
+    ):
+        shard.id = 123
+        old_chunker = mock.Mock(shard=mock.Mock(id=123))
+        stateless_event_manager_impl._guild_chunkers = {123: old_chunker}
+        stateless_event_manager_impl._intents = intents.Intents.GUILD_MEMBERS
+        stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
+        stateless_event_manager_impl._event_factory.deserialize_guild_join_event.return_value.guild.id = 456
+
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
+            await stateless_event_manager_impl.on_guild_create(shard, {"large": True, "member_count": 5000})
+
+        old_chunker.close.assert_called_once_with()
+        old_chunker.request.assert_not_called()
+        guild_chunker.assert_called_once_with(shard, max_outstanding=5)
+        guild_chunker.return_value.request.assert_called_once_with(456, include_presences=False, member_count=5000)
+        assert stateless_event_manager_impl.guild_chunkers == {123: guild_chunker.return_value}
 
     @pytest.mark.asyncio
     async def test_on_guild_create_when_members_declared_and_member_cache_but_only_my_member_enabled(
@@ -683,15 +685,10 @@ def cache_enabled_for_members_only(component):
         gateway_guild = entity_factory.deserialize_gateway_guild.return_value
         gateway_guild.members.return_value = {1: "member1", 2: "member2"}
 
-        mock_request_guild_members = mock.Mock()
-
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
-                with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
-                    await event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
+            await event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
 
-        mock_request_guild_members.assert_not_called()
-        create_task.assert_not_called()
+        guild_chunker.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_on_guild_create_when_members_declared_and_enabled_for_member_chunk_event(
@@ -705,18 +702,12 @@ async def test_on_guild_create_when_members_declared_and_enabled_for_member_chun
         mock_event.guild.id = 456
         event_factory.deserialize_guild_join_event.return_value = mock_event
 
-        mock_request_guild_members = mock.Mock()
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
+            await stateless_event_manager_impl.on_guild_create(shard, {"large": True})
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
-                with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
-                    await stateless_event_manager_impl.on_guild_create(shard, {"large": True})
-
-        mock_request_guild_members.assert_called_once_with(shard, 456, include_presences=False, nonce="123.abc")
-        create_task.assert_called_once_with(
-            mock_request_guild_members.return_value, name="123:456 guild create members request"
-        )
-        assert mock_event.chunk_nonce == "123.abc"
+        guild_chunker.assert_called_once_with(shard, max_outstanding=5)
+        guild_chunker.return_value.request.assert_called_once_with(456, include_presences=False, member_count=0)
+        assert mock_event.chunk_nonce is guild_chunker.return_value.request.return_value
         stateless_event_manager_impl.dispatch.assert_awaited_once_with(mock_event)
 
     @pytest.mark.parametrize("cache_enabled", [True, False])
@@ -732,10 +723,10 @@ async def test_on_guild_create_when_chunk_members_disabled(
         stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=enabled_for_event)
         stateless_event_manager_impl._auto_chunk_members = False
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
+        with mock.patch.object(member_chunker, "GuildChunker") as guild_chunker:
             await stateless_event_manager_impl.on_guild_create(shard, {"id": 456, "large": large})
 
-        request_guild_members.assert_not_called()
+        guild_chunker.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_on_guild_update_when_stateless(
@@ -1133,9 +1124,12 @@ async def test_on_guild_members_chunk_stateful(self, event_manager_impl, shard,
         payload = {}
         event = mock.Mock(members={"TestMember": 123}, presences={"TestPresences": 456})
         event_factory.deserialize_guild_member_chunk_event.return_value = event
+        chunker = mock.Mock()
+        event_manager_impl._guild_chunkers = {shard.id: chunker}
 
         await event_manager_impl.on_guild_members_chunk(shard, payload)
 
+        chunker.record_chunk.assert_called_once_with(event)
         event_manager_impl._cache.set_member.assert_called_once_with(123)
         event_manager_impl._cache.set_presence.assert_called_once_with(456)
         event_factory.deserialize_guild_member_chunk_event.assert_called_once_with(shard, payload)
@@ -1152,6 +1146,56 @@ async def test_on_guild_members_chunk_stateless(self, stateless_event_manager_im
             event_factory.deserialize_guild_member_chunk_event.return_value
         )
 
+    @pytest.mark.asyncio
+    async def test_on_guild_members_chunk_when_filtered_out_still_records_requested_chunk(
+        self, entity_factory, event_factory, shard
+    ):
+        manager = event_manager.EventManagerImpl(entity_factory, event_factory, intents.Intents.ALL, cache=None)
+        listener = mock.AsyncMock()
+        manager.subscribe(shard_events.MemberChunkEvent, listener, guild_ids=[123])
+        shard.is_alive = True
+        shard.request_guild_members = mock.AsyncMock()
+        chunker = manager._guild_chunkers[shard.id] = member_chunker.GuildChunker(shard)
+        nonce = chunker.request(456)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_in_flight=1)
+        event_factory.deserialize_guild_member_chunk_event.return_value = shard_events.MemberChunkEvent(
+            app=mock.Mock(),
+            shard=shard,
+            guild_id=snowflakes.Snowflake(456),
+            members={},
+            chunk_index=0,
+            chunk_count=1,
+            not_found=[],
+            presences={},
+            nonce=nonce,
+        )
+        payload = {"guild_id": "456", "chunk_index": 0, "chunk_count": 1, "nonce": nonce}
+
+        try:
+            await manager._handle_dispatch(manager._consumers["guild_members_chunk"], shard, payload)
+        finally:
+            chunker.close()
+
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_chunked=1)
+        listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_guild_members_chunk_when_filtered_out_and_not_requested(
+        self, entity_factory, event_factory, shard
+    ):
+        manager = event_manager.EventManagerImpl(entity_factory, event_factory, intents.Intents.ALL, cache=None)
+        manager.subscribe(shard_events.MemberChunkEvent, mock.AsyncMock(), guild_ids=[123])
+        manager._guild_chunkers[shard.id] = mock.Mock(is_in_flight=mock.Mock(return_value=False))
+        payload = {"guild_id": "456", "chunk_index": 0, "chunk_count": 1, "nonce": "some nonce"}
+
+        await manager._handle_dispatch(manager._consumers["guild_members_chunk"], shard, payload)
+
+        manager._guild_chunkers[shard.id].is_in_flight.assert_called_once_with("some nonce")
+        event_factory.deserialize_guild_member_chunk_event.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_on_guild_role_create_stateful(self, event_manager_impl, shard, event_factory):
         payload = {}
@@ -34,14 +34,27 @@
 from hikari import errors
 from hikari import intents
 from hikari import iterators
+from hikari import snowflakes
 from hikari.api import config
 from hikari.events import base_events
+from hikari.events import guild_events
 from hikari.events import member_events
 from hikari.events import shard_events
 from hikari.impl import event_manager_base
+from hikari.internal import aio
 from hikari.internal import reflect
 from tests.hikari import hikari_test_helpers
 
+_NO_LISTENER_OPTIONS = {
+    "guild_ids": None,
+    "channel_ids": None,
+    "author_is_bot": None,
+    "payload_predicate": None,
+    "sample_every": None,
+    "coalesce_by": None,
+    "window": None,
+}
+
 
 class TestGenerateWeakListener:
     @pytest.mark.asyncio
@@ -129,6 +142,169 @@ async def test__listener_when_filter_passes_and_queue_not_full(self, mock_app):
             assert await stream.next() is not mock_event
             assert await stream.next() is mock_event
 
+    @pytest.mark.asyncio
+    async def test__listener_when_queue_full_and_dropping_oldest(self, mock_app):
+        stream = event_manager_base.EventStream(
+            mock_app, base_events.Event, timeout=None, limit=2, overflow="drop_oldest"
+        )
+        events = [object(), object(), object()]
+
+        with stream:
+            for event in events:
+                await stream._listener(event)
+
+            assert list(stream._queue) == events[1:]
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test__listener_when_queue_full_and_blocking(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None, limit=1, overflow="block")
+        events = [object(), object(), object()]
+
+        with stream:
+            await stream._listener(events[0])
+            producers = [asyncio.create_task(stream._listener(event)) for event in events[1:]]
+            await asyncio.sleep(0)
+
+            assert not any(producer.done() for producer in producers)
+            assert list(stream._queue) == events[:1]
+
+            assert await stream.next() is events[0]
+            await asyncio.sleep(0)
+            assert producers[0].done()
+            assert not producers[1].done()
+
+            assert await stream.next() is events[1]
+            assert await stream.next() is events[2]
+            await asyncio.gather(*producers)
+
+        assert stream._reserved == 0
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test__listener_when_blocking_and_stream_closed(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None, limit=1, overflow="block")
+
+        with stream:
+            await stream._listener(object())
+            producer = asyncio.create_task(stream._listener(object()))
+            await asyncio.sleep(0)
+
+        await producer
+        assert len(stream._queue) == 1
+        assert not stream._producers
+        assert stream._reserved == 0
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test__listener_when_blocking_and_cancelled(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None, limit=1, overflow="block")
+        event = object()
+
+        with stream:
+            await stream._listener(object())
+            cancelled = asyncio.create_task(stream._listener(object()))
+            producer = asyncio.create_task(stream._listener(event))
+            await asyncio.sleep(0)
+            stream._queue.clear()
+            # Releases the first producer, which is then cancelled before it could use the space
+            stream._release_producers()
+            cancelled.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+
+            await producer
+            assert list(stream._queue) == [event]
+            assert stream._reserved == 0
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test__listener_when_blocking_and_cancelled_while_waiting(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None, limit=1, overflow="block")
+
+        with stream:
+            await stream._listener(object())
+            producer = asyncio.create_task(stream._listener(object()))
+            await asyncio.sleep(0)
+            producer.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await producer
+
+            assert not stream._producers
+            assert stream._reserved == 0
+
+    def test___init___when_blocking_with_key_by(self):
+        with pytest.raises(ValueError, match=r"keyed event streams cannot block the dispatch of events"):
+            event_manager_base.EventStream(
+                mock.Mock(event_manager_base.EventManagerBase),
+                base_events.Event,
+                timeout=None,
+                overflow="block",
+                key_by="guild_id",
+                key=123,
+            )
+
+    @pytest.mark.asyncio
+    async def test_batches_when_invalid_max_size(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None)
+
+        with stream, pytest.raises(ValueError, match=r"'max_size' must be greater than 0"):
+            await stream.batches(0).__anext__()
+
+    @pytest.mark.asyncio
+    async def test_batches_when_stream_closed(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None)
+
+        with pytest.raises(TypeError, match=r"stream must be started with before entering it"):
+            await stream.batches(10).__anext__()
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_batches(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=0.01)
+        events = [object() for _ in range(5)]
+
+        with stream:
+            for event in events:
+                await stream._listener(event)
+
+            assert [batch async for batch in stream.batches(2)] == [events[:2], events[2:4], events[4:]]
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_batches_with_max_latency(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=None)
+        events = [object() for _ in range(4)]
+
+        with stream:
+            await stream._listener(events[0])
+            batches = stream.batches(3, max_latency=0.05)
+            batch = asyncio.create_task(batches.__anext__())
+            await asyncio.sleep(0)
+            await stream._listener(events[1])
+            await asyncio.sleep(0)
+            assert not batch.done()
+
+            await stream._listener(events[2])
+            await stream._listener(events[3])
+            assert await batch == events[:3]
+
+            assert await batches.__anext__() == events[3:]
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_batches_releases_blocked_producers(self, mock_app):
+        stream = event_manager_base.EventStream(mock_app, base_events.Event, timeout=0.01, limit=2, overflow="block")
+        events = [object() for _ in range(4)]
+
+        with stream:
+            producers = asyncio.gather(*(stream._listener(event) for event in events))
+
+            assert [batch async for batch in stream.batches(10)] == [events[:2], events[2:]]
+            await producers
+
     @pytest.mark.asyncio
     @hikari_test_helpers.timeout()
     async def test___anext___when_stream_closed(self):
@@ -331,6 +507,38 @@ def test_open_for_inactive_stream(self):
         # Ensure we don't get a warning or error on del
         stream._active = False
 
+    def test___init___when_key_by_and_not_event_manager_base(self):
+        with pytest.raises(TypeError, match=r"keyed event streams are only supported by EventManagerBase"):
+            event_manager_base.EventStream(mock.Mock(), base_events.Event, timeout=None, key_by="guild_id", key=123)
+
+    def test_open_and_close_with_key(self):
+        mock_manager = mock.Mock(event_manager_base.EventManagerBase)
+        stream = event_manager_base.EventStream(
+            mock_manager, base_events.Event, timeout=None, key_by="guild_id", key=123
+        )
+
+        stream.open()
+
+        mock_manager.subscribe.assert_not_called()
+        mock_manager._add_keyed_sink.assert_called_once_with(base_events.Event, "guild_id", 123, mock.ANY)
+        sink = mock_manager._add_keyed_sink.call_args.args[3]
+        assert stream._registered_sink is sink
+
+        event = object()
+        assert sink(event) is False
+        assert list(stream._queue) == [event]
+
+        stream.close()
+
+        mock_manager._remove_keyed_sink.assert_called_once_with(base_events.Event, "guild_id", 123, sink)
+        assert stream._registered_sink is None
+        assert stream._active is False
+
+    def test__generate_weak_sink_when_stream_collected(self):
+        reference = mock.Mock(return_value=None)
+
+        assert event_manager_base._generate_weak_sink(reference)(object()) is True
+
     def test_open_for_active_stream(self):
         mock_manager = mock.Mock()
         stream = hikari_test_helpers.mock_class_namespace(event_manager_base.EventStream)(
@@ -368,6 +576,262 @@ def test_is_enabled(self, is_caching, listener_group_count, waiter_group_count,
         assert consumer.is_enabled is expected_result
 
 
+class TestPayloadFilter:
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            ({"guild_id": "123", "channel_id": "456", "author": {"bot": True}}, True),
+            ({"guild_id": 123, "channel_id": 456, "author": {"bot": True}}, True),
+            ({"guild_id": "123", "channel_id": "456", "user": {"bot": True}}, True),
+            ({"guild_id": "321", "channel_id": "456", "author": {"bot": True}}, False),
+            ({"channel_id": "456", "author": {"bot": True}}, False),
+            ({"guild_id": "123", "channel_id": "654", "author": {"bot": True}}, False),
+            ({"guild_id": "123", "channel_id": "456", "author": {}}, False),
+            ({"guild_id": "123", "channel_id": "456"}, False),
+        ],
+    )
+    def test___call__(self, payload, expected):
+        payload_filter = event_manager_base._make_payload_filter([snowflakes.Snowflake(123)], [456], True, None, None)
+
+        assert payload_filter(payload, event_manager_base._DEFAULT_ID_FIELDS) is expected
+
+    @pytest.mark.parametrize(
+        ("event_name", "payload", "expected"),
+        [
+            ("GUILD_CREATE", {"id": "123", "channel_id": "456"}, True),
+            ("GUILD_UPDATE", {"id": 123, "channel_id": 456}, True),
+            ("GUILD_DELETE", {"id": "321", "channel_id": "456"}, False),
+            ("GUILD_CREATE", {"guild_id": "123", "channel_id": "456"}, False),
+            ("CHANNEL_CREATE", {"guild_id": "123", "id": "456"}, True),
+            ("CHANNEL_UPDATE", {"guild_id": 123, "id": 456}, True),
+            ("CHANNEL_DELETE", {"guild_id": "123", "id": "654"}, False),
+            ("CHANNEL_CREATE", {"guild_id": "123", "channel_id": "456"}, False),
+            ("MESSAGE_CREATE", {"id": "123", "guild_id": "123", "channel_id": "456"}, True),
+            ("MESSAGE_CREATE", {"id": "456", "guild_id": "321", "channel_id": "456"}, False),
+        ],
+    )
+    def test___call___with_id_fields(self, event_name, payload, expected):
+        payload_filter = event_manager_base._make_payload_filter([123], [456], None, None, None)
+
+        assert payload_filter(payload, event_manager_base._id_fields(event_name)) is expected
+
+    def test___call___when_author_is_not_bot(self):
+        payload_filter = event_manager_base._make_payload_filter(None, None, False, None, None)
+
+        assert payload_filter({"author": {}}, event_manager_base._DEFAULT_ID_FIELDS) is True
+        assert payload_filter({"author": {"bot": False}}, event_manager_base._DEFAULT_ID_FIELDS) is True
+        assert payload_filter({"author": {"bot": True}}, event_manager_base._DEFAULT_ID_FIELDS) is False
+
+    def test___call___with_predicate(self):
+        predicate = mock.Mock(return_value=False)
+        payload_filter = event_manager_base._make_payload_filter(None, None, None, predicate, None)
+
+        assert payload_filter({"foo": "bar"}, event_manager_base._DEFAULT_ID_FIELDS) is False
+        predicate.assert_called_once_with({"foo": "bar"})
+
+    def test_consume_with_sample_every(self):
+        payload_filter = event_manager_base._make_payload_filter([123], None, None, None, 3)
+        id_fields = event_manager_base._DEFAULT_ID_FIELDS
+        results = []
+
+        for _ in range(7):
+            results.append(
+                (payload_filter({"guild_id": "123"}, id_fields), payload_filter.consume({"guild_id": "123"}, id_fields))
+            )
+            assert payload_filter.consume({"guild_id": "456"}, id_fields) is False
+
+        assert results == [(True, True), (False, False), (False, False)] * 2 + [(True, True)]
+
+    def test_consume_without_sample_every(self):
+        payload_filter = event_manager_base._make_payload_filter([123], None, None, None, None)
+
+        assert payload_filter.consume({"guild_id": "123"}, event_manager_base._DEFAULT_ID_FIELDS) is True
+        assert payload_filter.consume({"guild_id": "123"}, event_manager_base._DEFAULT_ID_FIELDS) is True
+        assert payload_filter.consume({"guild_id": "456"}, event_manager_base._DEFAULT_ID_FIELDS) is False
+
+    def test__make_payload_filter_when_no_filters(self):
+        assert event_manager_base._make_payload_filter(None, None, None, None, None) is None
+
+    def test__make_payload_filter_when_invalid_sample_every(self):
+        with pytest.raises(ValueError, match=r"'sample_every' must be greater than 0"):
+            event_manager_base._make_payload_filter(None, None, None, None, 0)
+
+
+class TestCoalescer:
+    def test__make_coalescer_without_window(self):
+        assert event_manager_base._make_coalescer(mock.Mock(), mock.Mock(), None, None) is None
+
+    def test__make_coalescer_when_coalesce_by_without_window(self):
+        with pytest.raises(ValueError, match=r"'coalesce_by' can only be provided with 'window'"):
+            event_manager_base._make_coalescer(mock.Mock(), mock.Mock(), "user_id", None)
+
+    @pytest.mark.parametrize("window", [0, -1.5])
+    def test__make_coalescer_when_invalid_window(self, window):
+        with pytest.raises(ValueError, match=r"'window' must be greater than 0"):
+            event_manager_base._make_coalescer(mock.Mock(), mock.Mock(), None, window)
+
+    def test__make_coalescer_with_attribute(self):
+        coalescer = event_manager_base._make_coalescer(mock.Mock(), mock.Mock(), "member.user_id", 5)
+
+        assert coalescer.window == 5
+        assert coalescer.extract(mock.Mock(member=mock.Mock(user_id=123))) == 123
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push(self):
+        invoke = mock.AsyncMock()
+        callback = object()
+        coalescer = event_manager_base._make_coalescer(callback, invoke, "user_id", 0.01)
+        events = [mock.Mock(user_id=user_id) for user_id in (1, 2, 1, 3)]
+
+        for event in events:
+            coalescer.push(event)
+
+        assert list(coalescer.pending.values()) == [events[1], events[2], events[3]]
+        invoke.assert_not_called()
+
+        await coalescer.task
+
+        assert invoke.await_args_list == [
+            mock.call(callback, events[1]),
+            mock.call(callback, events[2]),
+            mock.call(callback, events[3]),
+        ]
+        assert coalescer.pending == {}
+        assert coalescer.task is None
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push_without_coalesce_by(self):
+        invoke = mock.AsyncMock()
+        callback = object()
+        coalescer = event_manager_base._make_coalescer(callback, invoke, None, 0.01)
+        events = [object(), object()]
+
+        for event in events:
+            coalescer.push(event)
+
+        await coalescer.task
+
+        invoke.assert_awaited_once_with(callback, events[1])
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push_when_pushed_while_flushing(self):
+        callback = object()
+        events = [object(), object()]
+
+        async def invoke(_, event):
+            if event is events[0]:
+                coalescer.push(events[1])
+
+        invoke_mock = mock.AsyncMock(side_effect=invoke)
+        coalescer = event_manager_base._make_coalescer(callback, invoke_mock, None, 0.01)
+        coalescer.push(events[0])
+
+        await coalescer.task
+
+        assert invoke_mock.await_args_list == [mock.call(callback, events[0]), mock.call(callback, events[1])]
+        assert coalescer.task is None
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push_names_task(self):
+        async def on_member_update(event):
+            pass
+
+        coalescer = event_manager_base._make_coalescer(on_member_update, mock.AsyncMock(), None, 0.01)
+        coalescer.push(object())
+
+        assert coalescer.task.get_name() == f"coalesced dispatch {on_member_update.__qualname__}"
+        await coalescer.task
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push_after_flush_failed(self):
+        invoke = mock.AsyncMock(side_effect=[RuntimeError, None])
+        callback = object()
+        coalescer = event_manager_base._make_coalescer(callback, invoke, None, 0.01)
+        events = [object(), object()]
+        coalescer.push(events[0])
+
+        with pytest.raises(RuntimeError):
+            await coalescer.task
+
+        assert coalescer.task is None
+
+        coalescer.push(events[1])
+        await coalescer.task
+
+        assert invoke.await_args_list == [mock.call(callback, events[0]), mock.call(callback, events[1])]
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push_after_flush_cancelled(self):
+        invoke = mock.AsyncMock()
+        callback = object()
+        coalescer = event_manager_base._make_coalescer(callback, invoke, None, 0.01)
+        events = [object(), object()]
+        coalescer.push(events[0])
+        await asyncio.sleep(0)
+        coalescer.task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await coalescer.task
+
+        assert coalescer.task is None
+
+        coalescer.push(events[1])
+        await coalescer.task
+
+        invoke.assert_awaited_once_with(callback, events[1])
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_push_after_flush_cancelled_before_running(self):
+        invoke = mock.AsyncMock()
+        callback = object()
+        coalescer = event_manager_base._make_coalescer(callback, invoke, None, 0.01)
+        events = [object(), object()]
+        coalescer.push(events[0])
+        cancelled_task = coalescer.task
+        cancelled_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled_task
+
+        coalescer.push(events[1])
+        assert coalescer.task is not cancelled_task
+        await coalescer.task
+
+        invoke.assert_awaited_once_with(callback, events[1])
+
+    @pytest.mark.asyncio
+    async def test_push_when_extract_raises(self):
+        coalescer = event_manager_base._make_coalescer(mock.Mock(), mock.Mock(), mock.Mock(side_effect=KeyError), 5)
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+            coalescer.push(object())
+
+        logger.exception.assert_called_once_with(
+            "an exception occurred extracting the coalescing key of an event (%s)", "object"
+        )
+        assert coalescer.pending == {}
+        assert coalescer.task is None
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_close(self):
+        invoke = mock.AsyncMock()
+        coalescer = event_manager_base._make_coalescer(mock.Mock(), invoke, None, 0.01)
+        coalescer.push(object())
+
+        coalescer.close()
+        await coalescer.task
+
+        invoke.assert_not_called()
+
+
 class TestEventManagerBase:
     @pytest.fixture
     def event_manager(self):
@@ -459,7 +923,10 @@ def test__increment_waiter_group_count(self, event_manager):
         assert on_bat_consumer.waiter_group_count == 0
 
     def test__enabled_for_event_when_listener_registered(self, event_manager):
-        event_manager._listeners = {shard_events.ShardStateEvent: [], shard_events.MemberChunkEvent: []}
+        event_manager._listeners = {
+            shard_events.ShardStateEvent: [mock.Mock()],
+            shard_events.MemberChunkEvent: [mock.Mock()],
+        }
         event_manager._waiters = {}
 
         assert event_manager._enabled_for_event(shard_events.ShardStateEvent) is True
@@ -476,6 +943,317 @@ def test__enabled_for_event_when_not_registered(self, event_manager):
 
         assert event_manager._enabled_for_event(shard_events.ShardStateEvent) is False
 
+    def test__get_dispatch_entry(self, event_manager):
+        event_manager._listeners = {
+            base_events.Event: ["coroutine0"],
+            member_events.MemberEvent: ["coroutine1"],
+            member_events.MemberUpdateEvent: ["hidden"],
+        }
+        event_manager._waiters = {base_events.Event: {(None, mock.Mock())}}
+
+        entry = event_manager._get_dispatch_entry(member_events.MemberCreateEvent)
+
+        assert entry == (("coroutine1", "coroutine0"), None, None, True)
+        assert event_manager._dispatch_table == {member_events.MemberCreateEvent: entry}
+
+    def test__get_dispatch_entry_when_cached(self, event_manager):
+        entry = ((), None, None, False)
+        event_manager._dispatch_table = {member_events.MemberCreateEvent: entry}
+        event_manager._listeners = {member_events.MemberCreateEvent: ["coroutine0"]}
+
+        assert event_manager._get_dispatch_entry(member_events.MemberCreateEvent) is entry
+
+    @pytest.mark.asyncio
+    async def test_dispatch_when_listeners_change(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock())
+        listener = mock.AsyncMock()
+
+        await event_manager.dispatch(event)
+        event_manager.subscribe(member_events.MemberEvent, listener)
+        await event_manager.dispatch(event)
+        event_manager.unsubscribe(member_events.MemberEvent, listener)
+        await event_manager.dispatch(event)
+
+        listener.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks are only available on 3.12+")
+    async def test_dispatch_when_eager_dispatch(self, event_manager):
+        event_manager._eager_dispatch = True
+        event_manager._intents = intents.Intents.ALL
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock())
+        future = asyncio.get_running_loop().create_future()
+        calls = []
+
+        async def inline_listener(event):
+            calls.append("inline")
+
+        async def suspending_listener(event):
+            calls.append("suspending")
+            await future
+            calls.append("resumed")
+
+        event_manager.subscribe(member_events.MemberCreateEvent, inline_listener)
+        event_manager.subscribe(member_events.MemberEvent, suspending_listener)
+
+        dispatched = event_manager.dispatch(event)
+
+        assert calls == ["inline", "suspending"]
+        assert not dispatched.done()
+        future.set_result(None)
+        await dispatched
+        assert calls == ["inline", "suspending", "resumed"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks are only available on 3.12+")
+    async def test_dispatch_when_eager_dispatch_and_nothing_suspends(self, event_manager):
+        event_manager._eager_dispatch = True
+        event_manager._intents = intents.Intents.ALL
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock())
+        listener = mock.AsyncMock()
+        event_manager.subscribe(member_events.MemberCreateEvent, listener)
+
+        with mock.patch.object(asyncio, "gather") as gather:
+            dispatched = event_manager.dispatch(event)
+
+        listener.assert_awaited_once_with(event)
+        gather.assert_not_called()
+        assert dispatched.done()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_with_payload_filters(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        received = []
+
+        async def unfiltered(event):
+            received.append(("unfiltered", event_manager_base._RAW_PAYLOAD.get()))
+
+        async def filtered(event):
+            received.append(("filtered", event_manager_base._RAW_PAYLOAD.get()))
+
+        event_manager.subscribe(member_events.MemberEvent, unfiltered)
+        event_manager.subscribe(member_events.MemberCreateEvent, filtered, guild_ids=[123])
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock())
+
+        async def dispatch(payload):
+            event_manager_base._RAW_PAYLOAD.set((payload, event_manager_base._DEFAULT_ID_FIELDS))
+            await event_manager.dispatch(event)
+
+        await asyncio.create_task(dispatch({"guild_id": "456"}))
+        assert received == [("unfiltered", None)]
+
+        received.clear()
+        await asyncio.create_task(dispatch({"guild_id": "123"}))
+        assert sorted(received) == [("filtered", None), ("unfiltered", None)]
+
+        received.clear()
+        await event_manager.dispatch(event)
+        assert sorted(received) == [("filtered", None), ("unfiltered", None)]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_with_sample_every(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        callback = mock.AsyncMock()
+        event_manager.subscribe(member_events.MemberCreateEvent, callback, sample_every=2)
+        events = [member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock()) for _ in range(4)]
+
+        async def dispatch(event):
+            event_manager_base._RAW_PAYLOAD.set(({}, event_manager_base._DEFAULT_ID_FIELDS))
+            await event_manager.dispatch(event)
+
+        for event in events:
+            await asyncio.create_task(dispatch(event))
+
+        assert callback.await_args_list == [mock.call(events[0]), mock.call(events[2])]
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_dispatch_with_coalesced_listener(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        coalesced = mock.AsyncMock()
+        unfiltered = mock.AsyncMock()
+        event_manager.subscribe(member_events.MemberCreateEvent, coalesced, coalesce_by="user_id", window=0.01)
+        event_manager.subscribe(member_events.MemberCreateEvent, unfiltered)
+        events = [
+            member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock(user=mock.Mock(id=user_id)))
+            for user_id in (1, 2, 1)
+        ]
+
+        for event in events:
+            await event_manager.dispatch(event)
+
+        assert unfiltered.await_args_list == [mock.call(event) for event in events]
+        coalesced.assert_not_called()
+
+        coalescer = event_manager._listener_coalescers[member_events.MemberCreateEvent][0]
+        await coalescer.task
+
+        assert coalesced.await_args_list == [mock.call(events[1]), mock.call(events[2])]
+
+    def test_unsubscribe_with_coalesced_listener(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+
+        async def test(event): ...
+
+        async def test2(event): ...
+
+        event_manager.subscribe(member_events.MemberCreateEvent, test)
+        event_manager.subscribe(member_events.MemberCreateEvent, test2, window=5)
+        assert event_manager._listener_coalescers == {member_events.MemberCreateEvent: [None, mock.ANY]}
+        coalescer = event_manager._listener_coalescers[member_events.MemberCreateEvent][1]
+        coalescer.pending[None] = object()
+
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test2)
+
+        assert event_manager._listener_coalescers == {}
+        assert coalescer.pending == {}
+        assert event_manager._listeners == {member_events.MemberCreateEvent: [test]}
+
+    @pytest.mark.asyncio
+    async def test_dispatch_when_waiters_change(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock())
+
+        await event_manager.dispatch(event)
+        waiter = asyncio.ensure_future(event_manager.wait_for(member_events.MemberEvent, timeout=None))
+        await asyncio.sleep(0)
+        await event_manager.dispatch(event)
+
+        assert await waiter is event
+        assert event_manager._waiters == {}
+        assert event_manager._get_dispatch_entry(member_events.MemberCreateEvent) == ((), None, None, False)
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_wait_for_with_key(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        events = [
+            member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock(guild_id=guild_id))
+            for guild_id in (123, 456, 123)
+        ]
+        predicate = mock.Mock(side_effect=[False, True])
+
+        waiter = asyncio.create_task(
+            event_manager.wait_for(
+                member_events.MemberEvent, timeout=None, predicate=predicate, key_by="guild_id", key=123
+            )
+        )
+        await asyncio.sleep(0)
+        assert event_manager._get_dispatch_entry(member_events.MemberCreateEvent)[3] is True
+
+        for event in events:
+            await event_manager.dispatch(event)
+
+        assert await waiter is events[2]
+        predicate.assert_has_calls([mock.call(events[0]), mock.call(events[2])])
+        assert event_manager._keyed_waiters == {}
+        assert event_manager._get_dispatch_entry(member_events.MemberCreateEvent)[3] is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_with_key_when_timeout(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        event_manager._increment_waiter_group_count = mock.Mock()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(member_events.MemberEvent, timeout=0.01, key_by=str, key="abc")
+
+        assert event_manager._keyed_waiters == {}
+        event_manager._increment_waiter_group_count.assert_has_calls(
+            [mock.call(member_events.MemberEvent, 1), mock.call(member_events.MemberEvent, -1)]
+        )
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_wait_for_with_key_when_attribute_missing(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock(guild_id=123))
+
+        waiter = asyncio.create_task(
+            event_manager.wait_for(member_events.MemberEvent, timeout=None, key_by="member.nope.id", key=123)
+        )
+        await asyncio.sleep(0)
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+            event.member.nope = object()
+            await event_manager.dispatch(event)
+
+        logger.exception.assert_not_called()
+        assert not waiter.done()
+        waiter.cancel()
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_wait_for_with_key_when_extractor_raises(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock())
+
+        waiter = asyncio.create_task(
+            event_manager.wait_for(
+                member_events.MemberEvent, timeout=None, key_by=mock.Mock(side_effect=AttributeError), key=123
+            )
+        )
+        await asyncio.sleep(0)
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+            await event_manager.dispatch(event)
+
+        logger.exception.assert_called_once_with(
+            "an exception occurred extracting the key of an event (%s)", "MemberCreateEvent"
+        )
+        assert not waiter.done()
+        waiter.cancel()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_with_key_and_without_key(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        event_manager._increment_waiter_group_count = mock.Mock()
+        event = member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock(guild_id=123))
+
+        keyed = asyncio.create_task(
+            event_manager.wait_for(member_events.MemberCreateEvent, timeout=None, key_by="guild_id", key=123)
+        )
+        unkeyed = asyncio.create_task(event_manager.wait_for(member_events.MemberCreateEvent, timeout=None))
+        await asyncio.sleep(0)
+        await event_manager.dispatch(event)
+
+        assert await keyed is event
+        assert await unkeyed is event
+        assert event_manager._waiters == {}
+        assert event_manager._keyed_waiters == {}
+        event_manager._increment_waiter_group_count.assert_has_calls(
+            [mock.call(member_events.MemberCreateEvent, 1), mock.call(member_events.MemberCreateEvent, -1)]
+        )
+        assert event_manager._increment_waiter_group_count.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_when_key_without_key_by(self, event_manager):
+        with pytest.raises(ValueError, match=r"'key' can only be provided with 'key_by'"):
+            await event_manager.wait_for(member_events.MemberEvent, timeout=None, key=123)
+
+    def test_stream_when_key_without_key_by(self, event_manager):
+        with pytest.raises(ValueError, match=r"'key' can only be provided with 'key_by'"):
+            event_manager.stream(member_events.MemberEvent, timeout=None, key=123)
+
+    @pytest.mark.asyncio
+    async def test_stream_with_key(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+        events = [
+            member_events.MemberCreateEvent(shard=mock.Mock(), member=mock.Mock(guild_id=guild_id))
+            for guild_id in (123, 456, 123)
+        ]
+
+        with event_manager.stream(member_events.MemberEvent, timeout=0.01, key_by="guild_id", key=123) as stream:
+            assert event_manager.get_listeners(member_events.MemberEvent) == []
+            assert event_manager._keyed_waiters[member_events.MemberEvent]["guild_id"].sinks.keys() == {123}
+
+            for event in events:
+                await event_manager.dispatch(event)
+
+            assert [event async for event in stream] == [events[0], events[2]]
+
+        assert event_manager._keyed_waiters == {}
+
     @pytest.mark.asyncio
     async def test_consume_raw_event_when_KeyError(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=True)
@@ -496,6 +1274,27 @@ async def test_consume_raw_event_when_KeyError(self, event_manager):
         )
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
+    def test_should_consume_raw_event_when_shard_payload_event_enabled(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=True)
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=False)}
+
+        assert event_manager.should_consume_raw_event("EXISTING_EVENT") is True
+
+        event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
+
+    @pytest.mark.parametrize("is_enabled", [True, False])
+    def test_should_consume_raw_event(self, event_manager, is_enabled):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=is_enabled)}
+
+        assert event_manager.should_consume_raw_event("EXISTING_EVENT") is is_enabled
+
+    def test_should_consume_raw_event_when_unknown_event(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {}
+
+        assert event_manager.should_consume_raw_event("UNEXISTING_EVENT") is True
+
     @pytest.mark.asyncio
     async def test_consume_raw_event_when_found(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=True)
@@ -521,6 +1320,329 @@ async def test_consume_raw_event_when_found(self, event_manager):
         )
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("suspends", [True, False])
+    async def test_consume_raw_event_when_eager_dispatch(self, event_manager, suspends):
+        event_manager._eager_dispatch = True
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {"existing_event": object()}
+        task = mock.Mock() if suspends else None
+
+        with mock.patch.object(aio, "eager_task", return_value=task) as eager_task:
+            with mock.patch.object(asyncio, "create_task") as create_task:
+                event_manager.consume_raw_event("EXISTING_EVENT", object(), {})
+
+        eager_task.assert_called_once_with(mock.ANY, name="dispatch EXISTING_EVENT")
+        eager_task.call_args.args[0].close()
+        create_task.assert_not_called()
+        assert event_manager._handling_dispatch_tasks == ({task} if suspends else set())
+
+    @pytest.mark.parametrize(
+        ("event_name", "payload", "expected"),
+        [
+            ("GUILD_CREATE", {"id": "1", "channel_id": "2"}, "1"),
+            ("GUILD_MEMBER_ADD", {"guild_id": "1", "user": {"id": "3"}}, "1"),
+            ("MESSAGE_CREATE", {"id": "4", "channel_id": "2"}, "2"),
+            ("PRESENCE_UPDATE", {"user_id": 3}, 3),
+            ("SOME_EVENT", {"user": {"id": "3"}}, "3"),
+            ("READY", {"user": None, "session_id": "abc"}, None),
+            ("RESUMED", {}, None),
+        ],
+    )
+    def test__partition_key(self, event_name, payload, expected):
+        assert event_manager_base._partition_key(event_name, payload) == expected
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_consume_raw_event_when_ordered_dispatch(self, event_manager):
+        event_manager._ordered_dispatch = True
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        order = []
+        release = asyncio.Event()
+
+        async def handle_dispatch(consumer, shard, payload):
+            order.append(("start", payload["n"]))
+            if payload["n"] == 1:
+                await release.wait()
+            order.append(("end", payload["n"]))
+
+        event_manager._handle_dispatch = handle_dispatch
+        event_manager._consumers = {"guild_member_add": object(), "guild_member_update": object()}
+        shard = mock.Mock(id=0)
+
+        event_manager.consume_raw_event("GUILD_MEMBER_ADD", shard, {"guild_id": "1", "n": 1})
+        event_manager.consume_raw_event("GUILD_MEMBER_UPDATE", shard, {"guild_id": "1", "n": 2})
+        event_manager.consume_raw_event("GUILD_MEMBER_ADD", shard, {"guild_id": "2", "n": 3})
+        assert len(event_manager._handling_dispatch_tasks) == 2
+        assert len(event_manager._partitions["1"]) == 2
+
+        await asyncio.sleep(0)
+        assert order == [("start", 1), ("start", 3), ("end", 3)]
+        assert "2" not in event_manager._partitions
+
+        release.set()
+        await asyncio.gather(*event_manager._handling_dispatch_tasks)
+
+        assert order == [("start", 1), ("start", 3), ("end", 3), ("end", 1), ("start", 2), ("end", 2)]
+        assert event_manager._partitions == {}
+        assert event_manager._handling_dispatch_tasks == set()
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_wait_for_in_ordered_partition_logs_warning(self, event_manager):
+        event_manager._ordered_dispatch = True
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._check_event = mock.Mock()
+        event_manager._consumers = {"guild_member_add": event_manager_base._Consumer(mock.AsyncMock(), -1, False)}
+
+        async def handle_dispatch(consumer, shard, payload):
+            with pytest.raises(asyncio.TimeoutError):
+                await event_manager.wait_for(member_events.MemberUpdateEvent, timeout=0)
+
+        event_manager._handle_dispatch = handle_dispatch
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+            event_manager.consume_raw_event("GUILD_MEMBER_ADD", mock.Mock(id=0), {"guild_id": "1"})
+            await asyncio.gather(*event_manager._handling_dispatch_tasks)
+
+        logger.warning.assert_called_once_with(mock.ANY, "wait_for", "MemberUpdateEvent", "1")
+
+    @pytest.mark.asyncio
+    async def test_wait_for_outside_of_ordered_partition_does_not_log_warning(self, event_manager):
+        event_manager._check_event = mock.Mock()
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger, pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(member_events.MemberUpdateEvent, timeout=0)
+
+        logger.warning.assert_not_called()
+
+    def test_stream_in_ordered_partition_logs_warning(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        token = event_manager_base._ORDERED_PARTITION.set(123)
+
+        try:
+            with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+                event_manager.stream(member_events.MemberUpdateEvent, timeout=None)
+        finally:
+            event_manager_base._ORDERED_PARTITION.reset(token)
+
+        logger.warning.assert_called_once_with(mock.ANY, "stream", "MemberUpdateEvent", 123)
+
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_when_ordered_dispatch_and_no_partition_key(self, event_manager):
+        event_manager._ordered_dispatch = True
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._handle_dispatch = mock.Mock()
+        consumer = object()
+        event_manager._consumers = {"resumed": consumer}
+        shard = object()
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            event_manager.consume_raw_event("RESUMED", shard, {})
+
+        event_manager._handle_dispatch.assert_called_once_with(consumer, shard, {})
+        create_task.assert_called_once_with(event_manager._handle_dispatch.return_value, name="dispatch RESUMED")
+        assert event_manager._partitions == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks are only available on 3.12+")
+    async def test_consume_raw_event_when_ordered_dispatch_and_eager_dispatch(self, event_manager):
+        event_manager._ordered_dispatch = True
+        event_manager._eager_dispatch = True
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._handle_dispatch = mock.AsyncMock()
+        event_manager._consumers = {"guild_member_add": object()}
+
+        event_manager.consume_raw_event("GUILD_MEMBER_ADD", mock.Mock(id=0), {"guild_id": "1"})
+
+        event_manager._handle_dispatch.assert_awaited_once()
+        assert event_manager._partitions == {}
+        assert event_manager._handling_dispatch_tasks == set()
+
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_when_ordered_dispatch_cancelled_before_running(self, event_manager):
+        event_manager._ordered_dispatch = True
+        event_manager._shard_dispatch_water_marks = (1, 5)
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._handle_dispatch = mock.AsyncMock()
+        event_manager._consumers = {"guild_member_add": object()}
+        shard = mock.Mock(id=0)
+
+        event_manager.consume_raw_event("GUILD_MEMBER_ADD", shard, {"guild_id": "1"})
+        event_manager.consume_raw_event("GUILD_MEMBER_ADD", shard, {"guild_id": "1"})
+        assert event_manager._total_pending_dispatches == 2
+
+        (task,) = event_manager._handling_dispatch_tasks
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        event_manager._handle_dispatch.assert_not_called()
+        assert event_manager._partitions == {}
+        assert event_manager._pending_dispatches == {}
+        assert event_manager._total_pending_dispatches == 0
+        assert event_manager._handling_dispatch_tasks == set()
+
+    @pytest.mark.parametrize("water_marks", [(5, 5), (6, 5), (-1, 2)])
+    def test___init___when_invalid_water_marks(self, water_marks):
+        with pytest.raises(ValueError, match=r"'dispatch_water_marks' must be a \(low, high\) tuple"):
+            event_manager_base.EventManagerBase(mock.Mock(), mock.Mock(), dispatch_water_marks=water_marks)
+
+        with pytest.raises(ValueError, match=r"'shard_dispatch_water_marks' must be a \(low, high\) tuple"):
+            event_manager_base.EventManagerBase(mock.Mock(), mock.Mock(), shard_dispatch_water_marks=water_marks)
+
+    def test_should_pause_reading_when_no_water_marks(self, event_manager):
+        event_manager._total_pending_dispatches = 1_000
+
+        assert event_manager.should_pause_reading(mock.Mock(id=0)) is False
+
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_counts_pending_dispatches(self, event_manager):
+        event_manager._shard_dispatch_water_marks = (0, 2)
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._handle_dispatch = mock.AsyncMock()
+        event_manager._consumers = {"existing_event": object()}
+        shard = mock.Mock(id=3)
+
+        event_manager.consume_raw_event("EXISTING_EVENT", shard, {})
+        assert event_manager.should_pause_reading(shard) is False
+
+        event_manager.consume_raw_event("EXISTING_EVENT", shard, {})
+        assert event_manager._pending_dispatches == {3: 2}
+        assert event_manager._total_pending_dispatches == 2
+        assert event_manager.should_pause_reading(shard) is True
+        assert event_manager.should_pause_reading(mock.Mock(id=4)) is False
+
+        await asyncio.gather(*event_manager._handling_dispatch_tasks)
+
+        assert event_manager._pending_dispatches == {}
+        assert event_manager._total_pending_dispatches == 0
+        assert event_manager._handling_dispatch_tasks == set()
+        assert event_manager.should_pause_reading(shard) is False
+
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_counts_pending_dispatches_when_eager_dispatch_completes(self, event_manager):
+        event_manager._eager_dispatch = True
+        event_manager._shard_dispatch_water_marks = (1, 3)
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {"existing_event": object()}
+        shard = mock.Mock(id=0)
+
+        def eager_task(coroutine, *, name):
+            coroutine.close()
+
+        with mock.patch.object(aio, "eager_task", side_effect=eager_task):
+            for _ in range(5):
+                event_manager.consume_raw_event("EXISTING_EVENT", shard, {})
+
+        assert event_manager._pending_dispatches == {}
+        assert event_manager._total_pending_dispatches == 0
+        assert event_manager._handling_dispatch_tasks == set()
+        assert event_manager.should_pause_reading(shard) is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks are only available on 3.12+")
+    async def test_consume_raw_event_counts_pending_dispatches_when_eager_dispatch(self, event_manager):
+        event_manager._eager_dispatch = True
+        event_manager._shard_dispatch_water_marks = (1, 3)
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {"existing_event": object()}
+        future = asyncio.get_running_loop().create_future()
+        shard = mock.Mock(id=0)
+
+        async def handle_dispatch(consumer, shard, payload):
+            if payload:
+                await future
+
+        event_manager._handle_dispatch = handle_dispatch
+
+        for _ in range(5):
+            event_manager.consume_raw_event("EXISTING_EVENT", shard, {})
+
+        event_manager.consume_raw_event("EXISTING_EVENT", shard, {"suspends": True})
+        assert event_manager._pending_dispatches == {0: 1}
+        assert event_manager.should_pause_reading(shard) is False
+
+        future.set_result(None)
+        await asyncio.gather(*event_manager._handling_dispatch_tasks)
+
+        assert event_manager._pending_dispatches == {}
+        assert event_manager._total_pending_dispatches == 0
+        assert event_manager._handling_dispatch_tasks == set()
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_wait_to_resume_reading_by_shard(self, event_manager):
+        event_manager._shard_dispatch_water_marks = (1, 3)
+        event_manager._pending_dispatches = {0: 3, 1: 1}
+        event_manager._total_pending_dispatches = 4
+        shard = mock.Mock(id=0)
+        tasks = [asyncio.get_running_loop().create_future() for _ in range(3)]
+
+        waiter = asyncio.create_task(event_manager.wait_to_resume_reading(shard))
+        await asyncio.sleep(0)
+        assert event_manager._paused_shards[0].by_shard is True
+        assert event_manager._paused_shards[0].by_bot is False
+
+        event_manager._on_dispatch_done(1, tasks[0])
+        event_manager._on_dispatch_done(0, tasks[1])
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        event_manager._on_dispatch_done(0, tasks[2])
+        await waiter
+
+        assert event_manager._paused_shards == {}
+        assert event_manager._pending_dispatches == {0: 1}
+        assert event_manager._total_pending_dispatches == 1
+
+    @pytest.mark.asyncio
+    @hikari_test_helpers.timeout()
+    async def test_wait_to_resume_reading_by_bot(self, event_manager):
+        event_manager._dispatch_water_marks = (1, 3)
+        event_manager._pending_dispatches = {0: 1, 1: 2}
+        event_manager._total_pending_dispatches = 3
+        task = asyncio.get_running_loop().create_future()
+
+        waiters = [
+            asyncio.create_task(event_manager.wait_to_resume_reading(mock.Mock(id=shard_id))) for shard_id in (0, 2)
+        ]
+        await asyncio.sleep(0)
+        assert event_manager._paused_shards.keys() == {0, 2}
+
+        event_manager._on_dispatch_done(1, task)
+        await asyncio.sleep(0)
+        assert not any(waiter.done() for waiter in waiters)
+
+        event_manager._on_dispatch_done(1, task)
+        await asyncio.gather(*waiters)
+
+        assert event_manager._paused_shards == {}
+        assert event_manager._pending_dispatches == {0: 1}
+
+    @pytest.mark.asyncio
+    async def test_wait_to_resume_reading_when_water_marks_not_reached(self, event_manager):
+        event_manager._dispatch_water_marks = (1, 3)
+        event_manager._total_pending_dispatches = 2
+
+        await event_manager.wait_to_resume_reading(mock.Mock(id=0))
+
+        assert event_manager._paused_shards == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_to_resume_reading_when_cancelled(self, event_manager):
+        event_manager._dispatch_water_marks = (1, 3)
+        event_manager._total_pending_dispatches = 3
+
+        waiter = asyncio.create_task(event_manager.wait_to_resume_reading(mock.Mock(id=0)))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert event_manager._paused_shards == {}
+
     @pytest.mark.asyncio
     async def test_consume_raw_event_skips_raw_dispatch_when_not_enabled(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=False)
@@ -557,6 +1679,71 @@ async def test_handle_dispatch_invokes_callback(self, event_manager):
         consumer.callback.assert_awaited_once_with(shard, pl)
         error_handler.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_handle_dispatch_when_payload_filters_reject_payload(self, event_manager):
+        consumer = event_manager_base._Consumer(mock.AsyncMock(__name__="on_foo"), -1, False)
+        consumer.listener_group_count = 1
+        consumer.payload_filters = (mock.Mock(return_value=False), mock.Mock(return_value=False))
+
+        await event_manager._handle_dispatch(consumer, object(), {"foo": "bar"})
+
+        consumer.callback.assert_not_called()
+        for payload_filter in consumer.payload_filters:
+            payload_filter.assert_called_once_with({"foo": "bar"}, event_manager_base._DEFAULT_ID_FIELDS)
+            payload_filter.consume.assert_called_once_with({"foo": "bar"}, event_manager_base._DEFAULT_ID_FIELDS)
+
+    @pytest.mark.asyncio
+    async def test_handle_dispatch_when_payload_filters_reject_required_payload(self, event_manager):
+        consumer = event_manager_base._Consumer(mock.AsyncMock(__name__="on_foo"), -1, False)
+        consumer.listener_group_count = 1
+        consumer.payload_filters = (mock.Mock(return_value=False),)
+        shard = object()
+        event_manager._is_payload_required = mock.Mock(return_value=True)
+
+        await event_manager._handle_dispatch(consumer, shard, {"foo": "bar"})
+
+        event_manager._is_payload_required.assert_called_once_with(consumer.callback, shard, {"foo": "bar"})
+        consumer.callback.assert_awaited_once_with(shard, {"foo": "bar"})
+        consumer.payload_filters[0].consume.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("is_caching", "waiters", "accepts"), [(True, 0, False), (False, 1, False), (False, 0, True)]
+    )
+    async def test_handle_dispatch_when_payload_needed(self, event_manager, is_caching, waiters, accepts):
+        payloads = []
+
+        async def callback(shard, payload):
+            payloads.append(event_manager_base._RAW_PAYLOAD.get())
+
+        consumer = event_manager_base._Consumer(callback, -1, is_caching)
+        consumer.listener_group_count = 1
+        consumer.waiter_group_count = waiters
+        consumer.payload_filters = (mock.Mock(return_value=accepts),)
+
+        await event_manager._handle_dispatch(consumer, object(), {"foo": "bar"})
+
+        assert payloads == [({"foo": "bar"}, event_manager_base._DEFAULT_ID_FIELDS)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("payload", "expected"), [({"id": "123"}, True), ({"id": "456"}, False)])
+    async def test_handle_dispatch_when_payload_filters_use_id_field(self, payload, expected):
+        class StubManager(event_manager_base.EventManagerBase):
+            on_guild_create = mock.AsyncMock(__name__="on_guild_create")
+
+        event_manager = StubManager(mock.Mock(), intents.Intents.ALL, cache_components=config.CacheComponents.NONE)
+        event_manager.subscribe(guild_events.GuildAvailableEvent, mock.AsyncMock(), guild_ids=[123])
+        consumer = event_manager._consumers["guild_create"]
+        shard = object()
+
+        await event_manager._handle_dispatch(consumer, shard, payload)
+
+        assert consumer.id_fields == ("id", "channel_id")
+        if expected:
+            consumer.callback.assert_awaited_once_with(shard, payload)
+        else:
+            consumer.callback.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_dispatch_ignores_cancelled_errors(self, event_manager):
         event_manager._enabled_for_consumer = mock.Mock(return_value=True)
@@ -636,12 +1823,60 @@ async def test(): ...
         event_manager._increment_listener_group_count = mock.Mock()
         event_manager._check_event = mock.Mock()
 
+        event_manager._dispatch_table = {member_events.MemberCreateEvent: ((), None, None, False)}
+
         event_manager.subscribe(member_events.MemberCreateEvent, test, _nested=1)
 
         assert event_manager._listeners == {member_events.MemberCreateEvent: [test]}
+        assert event_manager._dispatch_table == {}
         event_manager._check_event.assert_called_once_with(member_events.MemberCreateEvent, 1)
         event_manager._increment_listener_group_count.assert_called_once_with(member_events.MemberCreateEvent, 1)
 
+    def test_subscribe_with_payload_filters(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+
+        async def test(event): ...
+
+        async def test2(event): ...
+
+        event_manager._consumers = {
+            "member_update": event_manager_base._Consumer(test, member_events.MemberUpdateEvent.bitmask(), False)
+        }
+
+        event_manager.subscribe(member_events.MemberUpdateEvent, test)
+        assert event_manager._listener_filters == {}
+
+        event_manager.subscribe(member_events.MemberUpdateEvent, test2, guild_ids=[123])
+        assert event_manager._listener_filters == {member_events.MemberUpdateEvent: [None, mock.ANY]}
+        assert event_manager._consumers["member_update"].payload_filters is None
+
+        event_manager.unsubscribe(member_events.MemberUpdateEvent, test)
+        (payload_filter,) = event_manager._listener_filters[member_events.MemberUpdateEvent]
+        assert payload_filter.guild_ids == {123, "123"}
+        assert event_manager._consumers["member_update"].payload_filters == (payload_filter,)
+
+        event_manager.unsubscribe(member_events.MemberUpdateEvent, test2)
+        assert event_manager._listener_filters == {}
+        assert event_manager._consumers["member_update"].payload_filters is None
+
+    def test_subscribe_with_payload_filters_when_other_event_type_unfiltered(self, event_manager):
+        event_manager._intents = intents.Intents.ALL
+
+        async def test(event): ...
+
+        event_manager._consumers = {
+            "member_update": event_manager_base._Consumer(test, member_events.MemberUpdateEvent.bitmask(), False),
+            "member_chunk": event_manager_base._Consumer(test, shard_events.MemberChunkEvent.bitmask(), False),
+        }
+
+        event_manager.subscribe(member_events.MemberUpdateEvent, test, channel_ids=[123])
+        event_manager.subscribe(shard_events.MemberChunkEvent, test)
+
+        assert event_manager._consumers["member_update"].payload_filters == (
+            event_manager._listener_filters[member_events.MemberUpdateEvent][0],
+        )
+        assert event_manager._consumers["member_chunk"].payload_filters is None
+
     def test_subscribe_when_event_type_in_listeners(self, event_manager):
         async def test(): ...
 
@@ -774,12 +2009,15 @@ async def test2(): ...
             member_events.MemberDeleteEvent: [test],
         }
 
+        event_manager._dispatch_table = {member_events.MemberCreateEvent: ((test, test2), None, None, False)}
+
         event_manager.unsubscribe(member_events.MemberCreateEvent, test)
 
         assert event_manager._listeners == {
             member_events.MemberCreateEvent: [test2],
             member_events.MemberDeleteEvent: [test],
         }
+        assert event_manager._dispatch_table == {}
         event_manager._increment_listener_group_count.assert_not_called()
 
     def test_unsubscribe_when_event_type_when_list_empty_after_delete(self, event_manager):
@@ -829,7 +2067,7 @@ def test_listen_when_param_provided_in_decorator(self, event_manager):
             async def test(event): ...
 
         resolve_signature.assert_not_called()
-        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, _nested=1)
+        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, **_NO_LISTENER_OPTIONS, _nested=1)
 
     def test_listen_when_multiple_params_provided_in_decorator(self, event_manager):
         stack = contextlib.ExitStack()
@@ -846,8 +2084,8 @@ async def test(event): ...
         resolve_signature.assert_not_called()
         subscribe.assert_has_calls(
             [
-                mock.call(member_events.MemberCreateEvent, test, _nested=1),
-                mock.call(member_events.MemberDeleteEvent, test, _nested=1),
+                mock.call(member_events.MemberCreateEvent, test, **_NO_LISTENER_OPTIONS, _nested=1),
+                mock.call(member_events.MemberDeleteEvent, test, **_NO_LISTENER_OPTIONS, _nested=1),
             ]
         )
 
@@ -857,7 +2095,7 @@ def test_listen_when_param_provided_in_typehint(self, event_manager):
             @event_manager.listen()
             async def test(event: member_events.MemberCreateEvent): ...
 
-        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, _nested=1)
+        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, **_NO_LISTENER_OPTIONS, _nested=1)
 
     def test_listen_when_multiple_params_provided_as_typing_union_in_typehint(self, event_manager):
         with mock.patch.object(event_manager_base.EventManagerBase, "subscribe") as subscribe:
@@ -868,8 +2106,8 @@ async def test(event: typing.Union[member_events.MemberCreateEvent, member_event
         assert subscribe.call_count == 2
         subscribe.assert_has_calls(
             [
-                mock.call(member_events.MemberCreateEvent, test, _nested=1),
-                mock.call(member_events.MemberDeleteEvent, test, _nested=1),
+                mock.call(member_events.MemberCreateEvent, test, **_NO_LISTENER_OPTIONS, _nested=1),
+                mock.call(member_events.MemberDeleteEvent, test, **_NO_LISTENER_OPTIONS, _nested=1),
             ]
         )
 
@@ -883,8 +2121,8 @@ async def test(event: member_events.MemberCreateEvent | member_events.MemberDele
         assert subscribe.call_count == 2
         subscribe.assert_has_calls(
             [
-                mock.call(member_events.MemberCreateEvent, test, _nested=1),
-                mock.call(member_events.MemberDeleteEvent, test, _nested=1),
+                mock.call(member_events.MemberCreateEvent, test, **_NO_LISTENER_OPTIONS, _nested=1),
+                mock.call(member_events.MemberDeleteEvent, test, **_NO_LISTENER_OPTIONS, _nested=1),
             ]
         )
 
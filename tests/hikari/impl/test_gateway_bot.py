@@ -21,7 +21,9 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
+import math
 import sys
 import warnings
 
@@ -33,16 +35,19 @@
 from hikari import presences
 from hikari import snowflakes
 from hikari import undefined
+from hikari.events import lifetime_events
 from hikari.impl import cache as cache_impl
 from hikari.impl import config
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
 from hikari.impl import gateway_bot as bot_impl
+from hikari.impl import identify_coordinator as identify_coordinator_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
+from hikari.internal import cluster
 from hikari.internal import signals
 from hikari.internal import ux
 from tests.hikari import hikari_test_helpers
@@ -171,6 +176,8 @@ def test_init(self):
         http_settings = object()
         proxy_settings = object()
         intents = object()
+        session_store = object()
+        identify_coordinator = object()
 
         with stack:
             bot = bot_impl.GatewayBot(
@@ -181,18 +188,37 @@ def test_init(self):
                 executor=executor,
                 force_color=True,
                 cache_settings=cache_settings,
+                compression="transport_zstd_stream",
+                data_format="etf",
+                dispatch_water_marks=(10, 20),
+                shard_dispatch_water_marks=(1, 5),
+                eager_dispatch=True,
+                ordered_dispatch=True,
+                lazy_messages=True,
                 http_settings=http_settings,
+                identify_coordinator=identify_coordinator,
                 intents=intents,
                 auto_chunk_members=False,
+                max_outstanding_chunk_requests=10,
                 logs="DEBUG",
+                max_gateway_payload_size=1_000_000,
+                offload_gateway_payload_size=100_000,
+                offload_guild_member_count=10_000,
                 max_rate_limit=200,
                 max_retries=0,
                 proxy_settings=proxy_settings,
                 rest_url="somewhere.com",
+                session_store=session_store,
             )
 
         assert bot._http_settings is http_settings
         assert bot._proxy_settings is proxy_settings
+        assert bot._compression == "transport_zstd_stream"
+        assert bot._data_format == "etf"
+        assert bot._max_gateway_payload_size == 1_000_000
+        assert bot._offload_gateway_payload_size == 100_000
+        assert bot._session_store is session_store
+        assert bot._identify_coordinator is identify_coordinator
         assert bot._cache is cache.return_value
         cache.assert_called_once_with(bot, cache_settings)
         assert bot._event_manager is event_manager.return_value
@@ -201,10 +227,17 @@ def test_init(self):
             event_factory.return_value,
             intents,
             auto_chunk_members=False,
+            max_outstanding_chunk_requests=10,
             cache=cache.return_value,
+            eager_dispatch=True,
+            dispatch_water_marks=(10, 20),
+            shard_dispatch_water_marks=(1, 5),
+            ordered_dispatch=True,
+            executor=executor,
+            offload_member_count=10_000,
         )
         assert bot._entity_factory is entity_factory.return_value
-        entity_factory.assert_called_once_with(bot)
+        entity_factory.assert_called_once_with(bot, lazy_messages=True)
         assert bot._event_factory is event_factory.return_value
         event_factory.assert_called_once_with(bot)
         assert bot._voice is voice.return_value
@@ -253,6 +286,7 @@ def test_init_when_no_settings(self):
         proxy_settings.assert_called_once_with()
         cache.assert_called_once_with(bot, cache_settings.return_value)
         cache_settings.assert_called_once_with()
+        assert isinstance(bot._identify_coordinator, identify_coordinator_impl.InProcessIdentifyCoordinator)
 
     def test_init_strips_token(self):
         stack = contextlib.ExitStack()
@@ -282,6 +316,32 @@ def test_event_factory(self, bot, event_factory):
     def test_executor(self, bot, executor):
         assert bot.executor is executor
 
+    def test_shard_metrics(self, bot):
+        shard0 = mock.Mock(shard_impl.GatewayShardImpl, id=0)
+        shard1 = mock.Mock(shard_impl.GatewayShardImpl, id=1)
+        bot._shards = {0: shard0, 1: shard1, 2: mock.Mock(id=2)}
+
+        assert bot.shard_metrics == {0: shard0.metrics, 1: shard1.metrics}
+
+    def test_gateway_metrics(self, bot):
+        bot._shards = {
+            0: mock.Mock(
+                shard_impl.GatewayShardImpl,
+                id=0,
+                metrics=shard_impl.GatewayShardMetrics(frames_received=2, dispatches=collections.Counter(READY=1)),
+            ),
+            1: mock.Mock(
+                shard_impl.GatewayShardImpl,
+                id=1,
+                metrics=shard_impl.GatewayShardMetrics(frames_received=3, dispatches=collections.Counter(READY=1)),
+            ),
+        }
+
+        metrics = bot.gateway_metrics
+
+        assert metrics.frames_received == 5
+        assert metrics.dispatches == {"READY": 2}
+
     def test_heartbeat_latencies(self, bot):
         bot._shards = {
             0: mock.Mock(id=0, heartbeat_latency=96),
@@ -300,6 +360,19 @@ def test_heartbeat_latency(self, bot):
 
         assert bot.heartbeat_latency == 109.5
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Clustering is not supported on Windows")
+    def test_heartbeat_latencies_when_running_cluster(self, bot):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [(0, 1), (2,)])
+        for worker, latencies in zip(supervisor._workers, ({0: 0.1, 1: float("nan")}, {2: 0.3})):
+            worker.connection = mock.Mock(recv=mock.Mock(return_value=latencies))
+            supervisor._receive(worker)
+        bot._cluster = supervisor
+        bot._shards = {}
+
+        assert bot.heartbeat_latencies == {0: 0.1, 1: mock.ANY, 2: 0.3}
+        assert math.isnan(bot.heartbeat_latencies[1])
+        assert bot.heartbeat_latency == pytest.approx(0.2)
+
     def test_http_settings(self, bot, http_settings):
         assert bot.http_settings is http_settings
 
@@ -405,6 +478,9 @@ def assert_awaited_once(self):
         shard1 = mock.Mock(id=1, close=AwaitableMock(error))
         shard2 = mock.Mock(id=2, close=AwaitableMock())
         bot._shards = {0: shard0, 1: shard1, 2: shard2}
+        chunker0 = mock.Mock()
+        chunker1 = mock.Mock()
+        event_manager.guild_chunkers = {0: chunker0, 1: chunker1}
 
         with stack:
             await bot.close()
@@ -432,6 +508,8 @@ def assert_awaited_once(self):
         shard0.close.assert_awaited_once()
         shard1.close.assert_awaited_once()
         shard2.close.assert_awaited_once()
+        chunker0.close.assert_called_once_with()
+        chunker1.close.assert_called_once_with()
 
         # Error handling
         get_running_loop.assert_called_once_with()
@@ -481,10 +559,32 @@ async def test_join_when_not_running(self, bot, event_manager):
 
     def test_listen(self, bot, event_manager):
         event = object()
+        predicate = object()
 
-        assert bot.listen(event) is event_manager.listen.return_value
+        assert (
+            bot.listen(
+                event,
+                guild_ids=[123],
+                channel_ids=[456],
+                author_is_bot=False,
+                payload_predicate=predicate,
+                sample_every=10,
+                coalesce_by="user_id",
+                window=5.0,
+            )
+            is event_manager.listen.return_value
+        )
 
-        event_manager.listen.assert_called_once_with(event)
+        event_manager.listen.assert_called_once_with(
+            event,
+            guild_ids=[123],
+            channel_ids=[456],
+            author_is_bot=False,
+            payload_predicate=predicate,
+            sample_every=10,
+            coalesce_by="user_id",
+            window=5.0,
+        )
 
     def test_print_banner(self, bot):
         with mock.patch.object(ux, "print_banner") as print_banner:
@@ -623,6 +723,109 @@ def test_run(self, bot):
         handle_interrupts.assert_called_once_with(enabled=False, loop=loop, propagate_interrupts=False)
         handle_interrupts.return_value.assert_used_once()
 
+    def test_run_when_processes_less_than_one(self, bot):
+        with pytest.raises(ValueError, match=r"'processes' must be at least 1"):
+            bot.run(processes=0)
+
+    def test_run_with_multiple_processes(self, bot):
+        with mock.patch.object(bot_impl.GatewayBot, "_run_cluster") as run_cluster:
+            with mock.patch.object(aio, "get_or_make_loop") as get_or_make_loop:
+                bot.run(
+                    processes=4, enable_signal_handlers=False, propagate_interrupts=True, shard_ids=[1], shard_count=2
+                )
+
+        get_or_make_loop.assert_not_called()
+        run_cluster.assert_called_once_with(
+            mock.ANY, enable_signal_handlers=False, processes=4, propagate_interrupts=True, shard_ids=[1], shard_count=2
+        )
+        run = run_cluster.call_args.args[0]
+        assert run.func == bot.run
+        assert run.keywords["large_threshold"] == 250
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Clustering is not supported on Windows")
+    def test__run_cluster(self, bot):
+        run = mock.Mock()
+        stack = contextlib.ExitStack()
+        supervisor = stack.enter_context(mock.patch.object(cluster, "ClusterSupervisor"))
+        handle_blocking_interrupts = stack.enter_context(
+            mock.patch.object(
+                signals, "handle_blocking_interrupts", return_value=hikari_test_helpers.ContextManagerMock()
+            )
+        )
+        fetch_recommended_shard_count = stack.enter_context(
+            mock.patch.object(bot_impl.GatewayBot, "_fetch_recommended_shard_count", new=mock.AsyncMock(return_value=5))
+        )
+
+        supervisor.return_value.run.side_effect = lambda: clusters.append(bot._cluster)
+        clusters = []
+
+        with stack:
+            bot._run_cluster(
+                run,
+                enable_signal_handlers=True,
+                processes=2,
+                propagate_interrupts=False,
+                shard_ids=None,
+                shard_count=None,
+            )
+
+        assert clusters == [supervisor.return_value]
+        assert bot._cluster is None
+        fetch_recommended_shard_count.assert_awaited_once_with()
+        supervisor.assert_called_once_with(mock.ANY, [(0, 1, 2), (3, 4)])
+        worker = supervisor.call_args.args[0]
+        assert worker.func == bot._run_cluster_worker
+        assert worker.keywords["run"] is run
+        assert worker.keywords["shard_count"] == 5
+        supervisor.return_value.run.assert_called_once_with()
+        handle_blocking_interrupts.assert_called_once_with(enabled=True, propagate_interrupts=False)
+        handle_blocking_interrupts.return_value.assert_used_once()
+
+    def test__run_cluster_on_windows(self, bot):
+        with mock.patch.object(sys, "platform", "win32"):
+            with pytest.raises(NotImplementedError):
+                bot._run_cluster(
+                    mock.Mock(),
+                    enable_signal_handlers=True,
+                    processes=2,
+                    propagate_interrupts=False,
+                    shard_ids=None,
+                    shard_count=None,
+                )
+
+    @pytest.mark.asyncio
+    async def test__fetch_recommended_shard_count(self, bot, rest):
+        rest.fetch_gateway_bot_info = mock.AsyncMock(return_value=mock.Mock(shard_count=7))
+        rest.close = mock.AsyncMock()
+
+        assert await bot._fetch_recommended_shard_count() == 7
+
+        rest.start.assert_called_once_with()
+        rest.close.assert_awaited_once_with()
+
+    def test__run_cluster_worker(self, bot):
+        run = mock.Mock()
+        channel = mock.Mock(shard_ids=(2, 3))
+        bot._identify_coordinator = identify_coordinator_impl.InProcessIdentifyCoordinator()
+        bot._cluster = mock.Mock()
+
+        with mock.patch.object(bot_impl.GatewayBot, "subscribe") as subscribe:
+            bot._run_cluster_worker(channel, run=run, shard_count=4, coordinator_directory="some/directory")
+
+        assert bot._cluster is None
+        assert isinstance(bot._identify_coordinator, identify_coordinator_impl.FileLockIdentifyCoordinator)
+        subscribe.assert_called_once_with(lifetime_events.StartedEvent, mock.ANY)
+        run.assert_called_once_with(shard_ids=(2, 3), shard_count=4)
+
+    def test__run_cluster_worker_when_custom_identify_coordinator(self, bot):
+        identify_coordinator = mock.Mock()
+        bot._identify_coordinator = identify_coordinator
+
+        with mock.patch.object(bot_impl.GatewayBot, "subscribe"):
+            bot._run_cluster_worker(mock.Mock(), run=mock.Mock(), shard_count=4, coordinator_directory="some/directory")
+
+        assert bot._identify_coordinator is identify_coordinator
+
     @pytest.mark.asyncio
     async def test_start_when_shard_ids_specified_without_shard_count(self, bot):
         with pytest.raises(TypeError, match=r"'shard_ids' must be passed with 'shard_count'"):
@@ -640,32 +843,24 @@ async def test_start(self, bot, rest, voice, event_manager, event_factory, http_
         class MockSessionStartLimit:
             remaining = 10
             reset_at = "now"
-            max_concurrency = 1
+            max_concurrency = 2
 
         class MockInfo:
             url = "yourmom.eu"
             shard_count = 2
             session_start_limit = MockSessionStartLimit()
 
-        shard1 = mock.Mock()
-        shard2 = mock.Mock()
-        shards_iter = iter((shard1, shard2))
-
-        mock_start_one_shard = mock.Mock()
-
-        def _mock_start_one_shard(*args, **kwargs):
-            bot._shards[kwargs["shard_id"]] = next(shards_iter)
-            return mock_start_one_shard(*args, **kwargs)
-
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(bot_impl, "_validate_activity"))
-        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=_mock_start_one_shard))
+        start_shard_bucket = stack.enter_context(
+            mock.patch.object(bot_impl.GatewayBot, "_start_shard_bucket", new=mock.Mock())
+        )
         create_task = stack.enter_context(mock.patch.object(asyncio, "create_task"))
-        gather = stack.enter_context(mock.patch.object(asyncio, "gather"))
-        event = stack.enter_context(mock.patch.object(asyncio, "Event"))
-        first_completed = stack.enter_context(
-            mock.patch.object(aio, "first_completed", side_effect=[None, asyncio.TimeoutError, None])
+        all_of = stack.enter_context(mock.patch.object(aio, "all_of", new=mock.Mock()))
+        event = stack.enter_context(
+            mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=False)))
         )
+        first_completed = stack.enter_context(mock.patch.object(aio, "first_completed"))
         check_for_updates = stack.enter_context(mock.patch.object(ux, "check_for_updates", new=mock.Mock()))
 
         event_manager.dispatch = mock.AsyncMock()
@@ -674,7 +869,7 @@ def _mock_start_one_shard(*args, **kwargs):
         with stack:
             await bot.start(
                 check_for_updates=True,
-                shard_ids=(2, 10),
+                shard_ids=(2, 10, 3, 4, 10),
                 shard_count=20,
                 activity="some activity",
                 afk=True,
@@ -696,41 +891,25 @@ def _mock_start_one_shard(*args, **kwargs):
             ]
         )
 
-        assert gather.call_count == 2
-        gather.assert_has_calls(
-            [mock.call(mock_start_one_shard.return_value), mock.call(mock_start_one_shard.return_value)]
-        )
-
-        assert mock_start_one_shard.call_count == 2
-        mock_start_one_shard.assert_has_calls(
+        assert start_shard_bucket.call_count == 2
+        start_shard_bucket.assert_has_calls(
             [
                 mock.call(
-                    bot,
+                    shard_ids,
                     activity="some activity",
                     afk=True,
                     idle_since="some idle since",
                     status="some status",
                     large_threshold=500,
-                    shard_id=i,
+                    max_concurrency=2,
                     shard_count=20,
                     url="yourmom.eu",
                 )
-                for i in (2, 10)
-            ]
-        )
-
-        closing_event_closing_wait = event.return_value.wait.return_value
-        assert first_completed.await_count == 3
-
-        first_completed.assert_has_awaits(
-            [
-                # Shard 1
-                mock.call(closing_event_closing_wait, gather.return_value),
-                # Shard 2
-                mock.call(closing_event_closing_wait, shard1.join.return_value, timeout=5),
-                mock.call(closing_event_closing_wait, gather.return_value),
+                for shard_ids in ([2, 10, 4], [3])
             ]
         )
+        all_of.assert_called_once_with(start_shard_bucket.return_value, start_shard_bucket.return_value)
+        first_completed.assert_awaited_once_with(event.return_value.wait.return_value, all_of.return_value)
 
     @pytest.mark.asyncio
     async def test_start_when_request_close_mid_startup(self, bot, rest, voice, event_manager, event_factory):
@@ -744,14 +923,11 @@ class MockInfo:
             shard_count = 2
             session_start_limit = MockSessionStartLimit()
 
-        # Assume that we already started one shard
-        shard1 = mock.Mock()
-        bot._shards = {"1": shard1}
-
         stack = contextlib.ExitStack()
-        start_one_shard = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard"))
-        first_completed = stack.enter_context(mock.patch.object(aio, "first_completed"))
-        event = stack.enter_context(
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_shard_bucket", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(aio, "all_of", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(aio, "first_completed"))
+        stack.enter_context(
             mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=True)))
         )
 
@@ -761,64 +937,164 @@ class MockInfo:
         with stack:
             await bot.start(shard_ids=(2, 10), shard_count=20, check_for_updates=False)
 
-        start_one_shard.assert_not_called()
-
-        first_completed.assert_called_once_with(
-            event.return_value.wait.return_value, shard1.join.return_value, timeout=5
-        )
+        event_manager.dispatch.assert_awaited_once_with(event_factory.deserialize_starting_event.return_value)
 
     @pytest.mark.asyncio
-    async def test_start_when_shard_closed_mid_startup(self, bot, rest, voice, event_manager, event_factory):
+    async def test_start_when_bucket_fails_cancels_other_buckets(self, bot, rest, event_manager):
         class MockSessionStartLimit:
             remaining = 10
             reset_at = "now"
-            max_concurrency = 1
+            max_concurrency = 2
 
         class MockInfo:
             url = "yourmom.eu"
             shard_count = 2
             session_start_limit = MockSessionStartLimit()
 
-        # Assume that we already started one shard
-        shard1 = mock.Mock()
-        bot._shards = {"1": shard1}
+        other_bucket_cancelled = False
 
-        stack = contextlib.ExitStack()
-        start_one_shard = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard"))
-        first_completed = stack.enter_context(mock.patch.object(aio, "first_completed"))
-        event = stack.enter_context(
-            mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=False)))
-        )
-        stack.enter_context(pytest.raises(RuntimeError, match="One or more shards closed while starting"))
+        async def _start_shard_bucket(self, shard_ids, **kwargs):
+            nonlocal other_bucket_cancelled
+
+            if shard_ids == [0]:
+                await asyncio.sleep(0)
+                msg = "One or more shards closed while starting"
+                raise RuntimeError(msg)
+
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                other_bucket_cancelled = True
+                raise
 
         event_manager.dispatch = mock.AsyncMock()
         rest.fetch_gateway_bot_info = mock.AsyncMock(return_value=MockInfo())
 
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_shard_bucket", new=_start_shard_bucket))
+        stack.enter_context(pytest.raises(RuntimeError, match="One or more shards closed while starting"))
+
         with stack:
-            await bot.start(shard_ids=(2, 10), shard_count=20, check_for_updates=False)
+            await bot.start(shard_ids=(0, 1), shard_count=2, check_for_updates=False)
+
+        assert other_bucket_cancelled is True
+
+    @pytest.mark.asyncio
+    async def test__start_shard_bucket(self, bot):
+        shard2 = mock.Mock(is_alive=True)
+        shard10 = mock.Mock(is_alive=True)
+        shard18 = mock.Mock(is_alive=True)
+        shards = iter((shard2, shard10, shard18))
 
-        start_one_shard.assert_not_called()
+        async def _mock_start_one_shard(**kwargs):
+            bot._shards[kwargs["shard_id"]] = next(shards)
 
-        first_completed.assert_called_once_with(
-            event.return_value.wait.return_value, shard1.join.return_value, timeout=5
+        stack = contextlib.ExitStack()
+        start_one_shard = stack.enter_context(
+            mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", side_effect=_mock_start_one_shard)
         )
+        sleep = stack.enter_context(mock.patch.object(asyncio, "sleep"))
+
+        with stack:
+            await bot._start_shard_bucket(
+                [2, 10, 18],
+                activity="some activity",
+                afk=True,
+                idle_since="some idle since",
+                status="some status",
+                large_threshold=500,
+                max_concurrency=8,
+                shard_count=20,
+                url="yourmom.eu",
+            )
+
+        assert start_one_shard.await_count == 3
+        start_one_shard.assert_has_awaits(
+            [
+                mock.call(
+                    activity="some activity",
+                    afk=True,
+                    idle_since="some idle since",
+                    status="some status",
+                    large_threshold=500,
+                    max_concurrency=8,
+                    shard_id=shard_id,
+                    shard_count=20,
+                    url="yourmom.eu",
+                )
+                for shard_id in (2, 10, 18)
+            ]
+        )
+        # Pacing is left to the identify coordinator
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test__start_shard_bucket_when_shard_closed_mid_startup(self, bot):
+        shard2 = mock.Mock(is_alive=False)
+
+        async def _mock_start_one_shard(**kwargs):
+            bot._shards[kwargs["shard_id"]] = shard2
+
+        stack = contextlib.ExitStack()
+        start_one_shard = stack.enter_context(
+            mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", side_effect=_mock_start_one_shard)
+        )
+        stack.enter_context(pytest.raises(RuntimeError, match="One or more shards closed while starting"))
+
+        with stack:
+            await bot._start_shard_bucket(
+                [2, 10],
+                activity=None,
+                afk=False,
+                idle_since=None,
+                status="some status",
+                large_threshold=500,
+                max_concurrency=8,
+                shard_count=20,
+                url="yourmom.eu",
+            )
+
+        start_one_shard.assert_awaited_once()
 
     def test_stream(self, bot):
         event_type = object()
 
         with mock.patch.object(bot_impl.GatewayBot, "_check_if_alive") as check_if_alive:
-            bot.stream(event_type, timeout=100, limit=400)
+            bot.stream(event_type, timeout=100, limit=400, overflow="block", key_by="message_id", key=123)
 
         check_if_alive.assert_called_once_with()
-        bot._event_manager.stream.assert_called_once_with(event_type, timeout=100, limit=400)
+        bot._event_manager.stream.assert_called_once_with(
+            event_type, timeout=100, limit=400, overflow="block", key_by="message_id", key=123
+        )
 
     def test_subscribe(self, bot):
         event_type = object()
         callback = object()
+        predicate = object()
 
-        bot.subscribe(event_type, callback)
+        bot.subscribe(
+            event_type,
+            callback,
+            guild_ids=[123],
+            channel_ids=[456],
+            author_is_bot=True,
+            payload_predicate=predicate,
+            sample_every=10,
+            coalesce_by="user_id",
+            window=5.0,
+        )
 
-        bot._event_manager.subscribe.assert_called_once_with(event_type, callback)
+        bot._event_manager.subscribe.assert_called_once_with(
+            event_type,
+            callback,
+            guild_ids=[123],
+            channel_ids=[456],
+            author_is_bot=True,
+            payload_predicate=predicate,
+            sample_every=10,
+            coalesce_by="user_id",
+            window=5.0,
+        )
 
     def test_unsubscribe(self, bot):
         event_type = object()
@@ -835,10 +1111,12 @@ async def test_wait_for(self, bot):
         bot._event_manager.wait_for = mock.AsyncMock()
 
         with mock.patch.object(bot_impl.GatewayBot, "_check_if_alive") as check_if_alive:
-            await bot.wait_for(event_type, timeout=100, predicate=predicate)
+            await bot.wait_for(event_type, timeout=100, predicate=predicate, key_by="message_id", key=123)
 
         check_if_alive.assert_called_once_with()
-        bot._event_manager.wait_for.assert_awaited_once_with(event_type, timeout=100, predicate=predicate)
+        bot._event_manager.wait_for.assert_awaited_once_with(
+            event_type, timeout=100, predicate=predicate, key_by="message_id", key=123
+        )
 
     def test_get_shard_when_not_present(self, bot):
         shard = mock.Mock(shard_count=96)
@@ -935,12 +1213,15 @@ async def test_start_one_shard(self, bot):
                 idle_since=None,
                 status=status,
                 large_threshold=1000,
+                max_concurrency=16,
                 shard_id=1,
                 shard_count=3,
                 url="https://some.website",
             )
 
         shard.assert_called_once_with(
+            compression=bot._compression,
+            data_format=bot._data_format,
             http_settings=bot._http_settings,
             proxy_settings=bot._proxy_settings,
             event_manager=bot._event_manager,
@@ -950,7 +1231,13 @@ async def test_start_one_shard(self, bot):
             initial_is_afk=True,
             initial_idle_since=None,
             initial_status=status,
+            identify_coordinator=bot._identify_coordinator,
             large_threshold=1000,
+            max_concurrency=16,
+            max_payload_size=bot._max_gateway_payload_size,
+            executor=bot._executor,
+            offload_payload_size=bot._offload_gateway_payload_size,
+            session_store=bot._session_store,
             shard_id=1,
             shard_count=3,
             loads=bot._loads,
@@ -976,6 +1263,7 @@ async def test_start_one_shard_when_not_alive(self, bot):
                     idle_since=None,
                     status=status,
                     large_threshold=1000,
+                    max_concurrency=16,
                     shard_id=1,
                     shard_count=3,
                     url="https://some.website",
@@ -1002,6 +1290,7 @@ async def test_start_one_shard_when_exception(self, bot, is_alive):
                     idle_since=None,
                     status=status,
                     large_threshold=1000,
+                    max_concurrency=16,
                     shard_id=1,
                     shard_count=3,
                     url="https://some.website",
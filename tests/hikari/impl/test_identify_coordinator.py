@@ -0,0 +1,123 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+import datetime
+import sys
+
+import mock
+import pytest
+
+from hikari.impl import identify_coordinator
+from hikari.internal import time
+
+
+def _utc(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+
+
+@pytest.mark.asyncio
+class TestInProcessIdentifyCoordinator:
+    async def test_acquire_when_first_identify(self):
+        coordinator = identify_coordinator.InProcessIdentifyCoordinator()
+
+        with mock.patch.object(asyncio, "sleep") as sleep:
+            await coordinator.acquire(0, 16)
+
+        sleep.assert_not_called()
+
+    async def test_acquire_waits_for_slot_in_same_bucket(self):
+        coordinator = identify_coordinator.InProcessIdentifyCoordinator()
+
+        stack = mock.patch.object(time, "monotonic", side_effect=[10, 10, 12, 15])
+        with stack, mock.patch.object(asyncio, "sleep") as sleep:
+            await coordinator.acquire(1, 16)
+            await coordinator.acquire(17, 16)
+
+        sleep.assert_awaited_once_with(3)
+        assert coordinator._buckets[1].last_identify == 15
+
+    async def test_acquire_does_not_wait_for_other_buckets(self):
+        coordinator = identify_coordinator.InProcessIdentifyCoordinator()
+
+        with mock.patch.object(asyncio, "sleep") as sleep:
+            await coordinator.acquire(0, 16)
+            await coordinator.acquire(1, 16)
+
+        sleep.assert_not_called()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="File locks are only supported on POSIX systems")
+@pytest.mark.asyncio
+class TestFileLockIdentifyCoordinator:
+    async def test_acquire_when_first_identify(self, tmp_path):
+        coordinator = identify_coordinator.FileLockIdentifyCoordinator(tmp_path)
+
+        with (
+            mock.patch.object(time, "utc_datetime", return_value=_utc(100.5)),
+            mock.patch.object(asyncio, "sleep") as sleep,
+        ):
+            await coordinator.acquire(17, 16)
+
+        sleep.assert_not_called()
+        assert (tmp_path / "identify-1.lock").read_text() == "100.5"
+
+    async def test_acquire_waits_for_slot_in_same_bucket(self, tmp_path):
+        (tmp_path / "identify-1.lock").write_text("100.5")
+        coordinator = identify_coordinator.FileLockIdentifyCoordinator(tmp_path)
+
+        stack = mock.patch.object(time, "utc_datetime", side_effect=[_utc(102.5), _utc(105.5)])
+        with stack, mock.patch.object(asyncio, "sleep") as sleep:
+            await coordinator.acquire(17, 16)
+
+        sleep.assert_awaited_once_with(3)
+        assert (tmp_path / "identify-1.lock").read_text() == "105.5"
+
+    async def test_acquire_when_file_corrupted(self, tmp_path):
+        (tmp_path / "identify-0.lock").write_text("not a timestamp")
+        coordinator = identify_coordinator.FileLockIdentifyCoordinator(tmp_path)
+
+        with (
+            mock.patch.object(time, "utc_datetime", return_value=_utc(100.0)),
+            mock.patch.object(asyncio, "sleep") as sleep,
+        ):
+            await coordinator.acquire(0, 1)
+
+        sleep.assert_not_called()
+        assert (tmp_path / "identify-0.lock").read_text() == "100.0"
+
+    async def test_acquire_when_locked_by_another_process(self, tmp_path):
+        import fcntl
+
+        coordinator = identify_coordinator.FileLockIdentifyCoordinator(tmp_path)
+        path = tmp_path / "identify-0.lock"
+
+        with path.open("w") as file:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            task = asyncio.create_task(coordinator.acquire(0, 1))
+            await asyncio.sleep(0.15)
+            assert not task.done()
+
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+        await asyncio.wait_for(task, timeout=1)
+        assert path.read_text()
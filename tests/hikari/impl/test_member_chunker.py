@@ -0,0 +1,251 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import random
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import member_chunker
+from hikari.internal import time
+
+
+def test_fixed_size_nonce():
+    stack = contextlib.ExitStack()
+    monotonic = stack.enter_context(mock.patch.object(time, "monotonic_ns"))
+    monotonic.return_value.to_bytes = mock.Mock(return_value="foo")
+
+    randbits = stack.enter_context(mock.patch.object(random, "getrandbits"))
+    randbits.return_value.to_bytes = mock.Mock(return_value="bar")
+
+    encode = stack.enter_context(mock.patch.object(base64, "b64encode"))
+    encode.return_value.decode = mock.Mock(return_value="nonce")
+
+    with stack:
+        assert member_chunker._fixed_size_nonce() == "nonce"
+
+    monotonic.assert_called_once_with()
+    monotonic.return_value.to_bytes.assert_called_once_with(8, "big")
+
+    randbits.assert_called_once_with(92)
+    randbits.return_value.to_bytes.assert_called_once_with(12, "big")
+
+    encode.assert_called_once_with("foobar")
+    encode.return_value.decode.assert_called_once_with("ascii")
+
+
+class TestChunkingProgress:
+    @pytest.mark.parametrize(("pending", "in_flight", "expected"), [(0, 0, True), (1, 0, False), (0, 1, False)])
+    def test_is_chunked(self, pending, in_flight, expected):
+        progress = member_chunker.ChunkingProgress(guilds_pending=pending, guilds_in_flight=in_flight)
+
+        assert progress.is_chunked is expected
+
+
+async def _run_pending_tasks():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _chunk(nonce, *, chunk_count=1, members=1):
+    return mock.Mock(nonce=nonce, chunk_count=chunk_count, members=dict.fromkeys(range(members)))
+
+
+@pytest.mark.asyncio
+class TestGuildChunker:
+    @pytest.fixture
+    def shard(self):
+        return mock.Mock(id=3, is_alive=True, request_guild_members=mock.AsyncMock())
+
+    async def test_init_when_max_outstanding_under_1(self, shard):
+        with pytest.raises(ValueError, match=r"'max_outstanding' must be greater than 0"):
+            member_chunker.GuildChunker(shard, max_outstanding=0)
+
+    async def test_shard(self, shard):
+        assert member_chunker.GuildChunker(shard).shard is shard
+
+    async def test_request(self, shard):
+        chunker = member_chunker.GuildChunker(shard)
+
+        with mock.patch.object(member_chunker, "_fixed_size_nonce", return_value="abc"):
+            nonce = chunker.request(123, include_presences=True)
+
+        assert nonce == "3.abc"
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_pending=1)
+
+        await _run_pending_tasks()
+
+        shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce="3.abc")
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_in_flight=1)
+
+        chunker.record_chunk(_chunk(nonce, chunk_count=2, members=1000))
+        chunker.record_chunk(_chunk("some other nonce"))
+        chunker.record_chunk(_chunk(None))
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_in_flight=1, members_received=1000)
+
+        chunker.record_chunk(_chunk(nonce, chunk_count=2, members=10))
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
+
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_chunked=1, members_received=1010)
+        # The scheduler only exits once it gets to run again after being woken up
+        await asyncio.wait_for(chunker._task, timeout=1)
+
+    async def test_is_in_flight(self, shard):
+        chunker = member_chunker.GuildChunker(shard)
+        nonce = chunker.request(123)
+
+        assert chunker.is_in_flight(nonce) is False
+
+        await _run_pending_tasks()
+
+        assert chunker.is_in_flight(nonce) is True
+        assert chunker.is_in_flight("some other nonce") is False
+        assert chunker.is_in_flight(None) is False
+
+        chunker.record_chunk(_chunk(nonce))
+
+        assert chunker.is_in_flight(nonce) is False
+
+    async def test_request_deduplicates_pending_guilds(self, shard):
+        chunker = member_chunker.GuildChunker(shard)
+
+        nonce = chunker.request(123)
+
+        assert chunker.request(123, include_presences=True) == nonce
+        assert chunker.progress.guilds_pending == 1
+
+        await _run_pending_tasks()
+
+        shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce=nonce)
+        chunker.close()
+
+    async def test_request_when_guild_in_flight_requests_again(self, shard):
+        chunker = member_chunker.GuildChunker(shard)
+
+        nonce = chunker.request(123)
+        await _run_pending_tasks()
+
+        assert chunker.request(123) != nonce
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_pending=1, guilds_in_flight=1)
+
+        chunker.close()
+
+    async def test_requests_are_ordered_by_priority_and_size(self, shard):
+        chunker = member_chunker.GuildChunker(shard, max_outstanding=1)
+        chunker.request(1, member_count=5000)
+        chunker.request(2, member_count=300)
+        chunker.request(3, member_count=100_000)
+        chunker.request(4, member_count=300)
+        chunker.request(3, priority=True)
+        sent = []
+
+        async def request_guild_members(guild, *, include_presences, nonce):
+            sent.append(guild)
+            chunker.record_chunk(_chunk(nonce))
+
+        shard.request_guild_members.side_effect = request_guild_members
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
+
+        assert sent == [3, 2, 4, 1]
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_chunked=4, members_received=4)
+
+    async def test_requests_are_capped_by_max_outstanding(self, shard):
+        chunker = member_chunker.GuildChunker(shard, max_outstanding=2)
+        nonces = [chunker.request(guild_id) for guild_id in range(4)]
+
+        await _run_pending_tasks()
+
+        assert shard.request_guild_members.await_count == 2
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_pending=2, guilds_in_flight=2)
+
+        chunker.record_chunk(_chunk(nonces[0]))
+        await _run_pending_tasks()
+
+        assert shard.request_guild_members.await_count == 3
+        chunker.close()
+
+    async def test_in_flight_requests_expire(self, shard):
+        chunker = member_chunker.GuildChunker(shard, timeout=0.01)
+        chunker.request(123)
+
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
+
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_dropped=1)
+
+    async def test_request_when_shard_reconnecting(self, shard):
+        chunker = member_chunker.GuildChunker(shard)
+        shard.request_guild_members.side_effect = [
+            asyncio.CancelledError,
+            errors.ComponentStateConflictError("no"),
+            None,
+        ]
+        nonce = chunker.request(123)
+
+        with mock.patch.object(member_chunker, "_RETRY_INTERVAL", new=0):
+            await _run_pending_tasks()
+
+        assert shard.request_guild_members.await_count == 3
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_in_flight=1)
+        chunker.record_chunk(_chunk(nonce))
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_chunked=1, members_received=1)
+
+    async def test_request_when_shard_closed(self, shard):
+        chunker = member_chunker.GuildChunker(shard, max_outstanding=1)
+        shard.is_alive = False
+        shard.request_guild_members.side_effect = errors.ComponentStateConflictError("no")
+        chunker.request(123)
+        chunker.request(456)
+
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
+
+        shard.request_guild_members.assert_awaited_once()
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_dropped=2)
+        assert chunker._task.done()
+
+    async def test_request_when_unexpected_error(self, shard):
+        chunker = member_chunker.GuildChunker(shard)
+        shard.request_guild_members.side_effect = RuntimeError("bad")
+        chunker.request(123)
+
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
+
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_dropped=1)
+
+    async def test_close(self, shard):
+        chunker = member_chunker.GuildChunker(shard, max_outstanding=1)
+        chunker.request(123)
+        chunker.request(456)
+        await _run_pending_tasks()
+        task = chunker._task
+
+        chunker.close()
+        await _run_pending_tasks()
+
+        assert task.cancelled()
+        assert chunker._task is None
+        assert chunker.progress == member_chunker.ChunkingProgress(guilds_dropped=2)
+        await asyncio.wait_for(chunker.wait_until_chunked(), timeout=1)
@@ -0,0 +1,144 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import json
+
+import mock
+import pytest
+
+from hikari.api import session_store as session_store_api
+from hikari.impl import session_store
+
+
+@pytest.fixture
+def session():
+    return session_store_api.GatewaySession(
+        session_id="some_session", seq=123, resume_gateway_url="wss://resume.discord.gg", shard_count=2
+    )
+
+
+@pytest.mark.asyncio
+class TestInMemorySessionStore:
+    async def test_load_when_no_session(self):
+        store = session_store.InMemorySessionStore()
+
+        assert await store.load(0) is None
+
+    async def test_save_and_load(self, session):
+        store = session_store.InMemorySessionStore()
+
+        await store.save(1, session)
+
+        assert await store.load(1) is session
+        assert await store.load(0) is None
+
+    async def test_delete(self, session):
+        store = session_store.InMemorySessionStore()
+        await store.save(1, session)
+
+        await store.delete(1)
+        await store.delete(1)
+
+        assert await store.load(1) is None
+
+
+@pytest.mark.asyncio
+class TestFileSessionStore:
+    async def test_load_when_file_does_not_exist(self, tmp_path):
+        store = session_store.FileSessionStore(tmp_path / "sessions")
+
+        assert await store.load(0) is None
+
+    async def test_save(self, tmp_path, session):
+        directory = tmp_path / "sessions"
+        store = session_store.FileSessionStore(directory)
+
+        await store.save(1, session)
+
+        assert json.loads((directory / "shard-1.json").read_bytes()) == {
+            "session_id": "some_session",
+            "seq": 123,
+            "resume_gateway_url": "wss://resume.discord.gg",
+            "shard_count": 2,
+        }
+        assert sorted(path.name for path in directory.iterdir()) == ["shard-1.json"]
+
+    async def test_save_only_writes_own_file(self, tmp_path, session):
+        directory = tmp_path / "sessions"
+        store = session_store.FileSessionStore(directory)
+        await store.save(0, session)
+        other_session = session_store_api.GatewaySession(
+            session_id="other_session", seq=456, resume_gateway_url="wss://resume.discord.gg", shard_count=2
+        )
+
+        with mock.patch.object(session_store, "_save_session", wraps=session_store._save_session) as save_session:
+            await store.save(1, other_session)
+
+        save_session.assert_called_once_with(directory / "shard-1.json", other_session)
+        assert await store.load(0) == session
+        assert await store.load(1) == other_session
+
+    async def test_load_from_existing_file(self, tmp_path, session):
+        directory = tmp_path / "sessions"
+        await session_store.FileSessionStore(directory).save(1, session)
+
+        store = session_store.FileSessionStore(str(directory))
+
+        assert await store.load(1) == session
+        assert await store.load(0) is None
+
+    async def test_delete(self, tmp_path, session):
+        directory = tmp_path / "sessions"
+        store = session_store.FileSessionStore(directory)
+        await store.save(0, session)
+        await store.save(1, session)
+
+        await store.delete(1)
+
+        assert await session_store.FileSessionStore(directory).load(1) is None
+        assert await session_store.FileSessionStore(directory).load(0) == session
+        assert not (directory / "shard-1.json").exists()
+
+    async def test_delete_when_no_session(self, tmp_path):
+        directory = tmp_path / "sessions"
+        store = session_store.FileSessionStore(directory)
+
+        await store.delete(1)
+
+        assert not directory.exists()
+
+    async def test_when_directory_shared_with_other_store(self, tmp_path, session):
+        directory = tmp_path / "sessions"
+        store = session_store.FileSessionStore(directory)
+        other_store = session_store.FileSessionStore(directory)
+
+        await other_store.save(1, session)
+        await store.save(0, session)
+        await store.delete(2)
+
+        assert await other_store.load(0) == session
+        assert await store.load(1) == session
+
+        await store.delete(0)
+
+        assert await other_store.load(0) is None
+        assert await other_store.load(1) == session
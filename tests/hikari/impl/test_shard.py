@@ -21,10 +21,15 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import concurrent.futures
 import contextlib
 import datetime
 import platform
+import random
 import re
+import threading
+import zlib
 
 import aiohttp
 import mock
@@ -35,14 +40,24 @@
 from hikari import intents
 from hikari import presences
 from hikari import urls
+from hikari.api import session_store
+from hikari.api import shard as shard_api
 from hikari.impl import config
 from hikari.impl import shard
 from hikari.internal import aio
+from hikari.internal import etf
 from hikari.internal import net
 from hikari.internal import time
 from hikari.internal import ux
 from tests.hikari import hikari_test_helpers
 
+try:
+    import zstandard
+
+    zstandard_present = True
+except ModuleNotFoundError:
+    zstandard_present = False
+
 
 def test_log_filterer():
     filterer = shard._log_filterer(b"TOKEN")
@@ -120,7 +135,8 @@ def transport_impl(self):
             log_filterer=mock.Mock(),
             loads=mock.Mock(return_value={}),
             dumps=mock.Mock(),
-            transport_compression=True,
+            compression="transport_zlib_stream",
+            data_format="json",
         )
 
     def test_init_when_transport_compression(self):
@@ -131,11 +147,42 @@ def test_init_when_transport_compression(self):
             log_filterer=mock.Mock(),
             loads=mock.Mock(),
             dumps=mock.Mock(),
-            transport_compression=True,
+            compression="transport_zlib_stream",
+            data_format="json",
         )
 
         assert transport._receive_and_check == transport._receive_and_check_zlib
 
+    @pytest.mark.skipif(not zstandard_present, reason="zstandard not present")
+    def test_init_when_zstd_transport_compression(self):
+        transport = shard._GatewayTransport(
+            ws=mock.Mock(),
+            exit_stack=mock.AsyncMock(),
+            logger=mock.Mock(),
+            log_filterer=mock.Mock(),
+            loads=mock.Mock(),
+            dumps=mock.Mock(),
+            compression="transport_zstd_stream",
+            data_format="json",
+        )
+
+        assert transport._receive_and_check == transport._receive_and_check_zstd
+        assert transport._zstd is not None
+
+    def test_init_when_etf_and_no_transport_compression(self):
+        transport = shard._GatewayTransport(
+            ws=mock.Mock(),
+            exit_stack=mock.AsyncMock(),
+            logger=mock.Mock(),
+            log_filterer=mock.Mock(),
+            loads=mock.Mock(),
+            dumps=mock.Mock(),
+            compression=None,
+            data_format="etf",
+        )
+
+        assert transport._receive_and_check == transport._receive_and_check_binary
+
     def test_init_when_no_transport_compression(self):
         transport = shard._GatewayTransport(
             ws=mock.Mock(),
@@ -144,7 +191,8 @@ def test_init_when_no_transport_compression(self):
             log_filterer=mock.Mock(),
             loads=mock.Mock(),
             dumps=mock.Mock(),
-            transport_compression=False,
+            compression=None,
+            data_format="json",
         )
 
         assert transport._receive_and_check == transport._receive_and_check_text
@@ -194,6 +242,73 @@ async def test_receive_json(self, transport_impl, trace):
         transport_impl._receive_and_check.assert_awaited_once_with()
         transport_impl._loads.assert_called_once_with(transport_impl._receive_and_check.return_value)
 
+    @pytest.mark.asyncio
+    async def test_receive_json_updates_metrics(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b"some payload")
+
+        with mock.patch.object(time, "monotonic", side_effect=[1, 3.5]):
+            await transport_impl.receive_json()
+
+        assert transport_impl._metrics.payloads_received == 1
+        assert transport_impl._metrics.bytes_received == 12
+        assert transport_impl._metrics.decode_time == 2.5
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zlib_updates_metrics(self, transport_impl):
+        compressor = zlib.compressobj()
+        data = compressor.compress(b"some payload") + compressor.flush(zlib.Z_SYNC_FLUSH)
+        transport_impl._ws.receive = mock.AsyncMock(
+            side_effect=[
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data[:5]),
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data[5:]),
+            ]
+        )
+
+        assert await transport_impl._receive_and_check_zlib() == b"some payload"
+
+        assert transport_impl._metrics.frames_received == 2
+        assert transport_impl._metrics.raw_bytes_received == len(data)
+        assert transport_impl._metrics.inflate_time > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("offload_payload_size", "offloaded"), [(None, False), (20, False), (5, True)])
+    async def test_receive_json_when_offloading(self, transport_impl, offload_payload_size, offloaded):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b"some payload")
+        transport_impl._loads = mock.Mock(side_effect=lambda _: {"thread": threading.get_ident()})
+        transport_impl._offload_payload_size = offload_payload_size
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            transport_impl._executor = executor
+            result = await transport_impl.receive_json()
+
+        assert (result["thread"] != threading.get_ident()) is offloaded
+        transport_impl._loads.assert_called_once_with(b"some payload")
+
+    @pytest.mark.asyncio
+    async def test_receive_json_when_dispatch_skipped(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(
+            side_effect=[b'{"t":"TYPING_START","s":12,"op":0,"d":{}}', b'{"t":"MESSAGE_CREATE","s":13,"op":0,"d":{}}']
+        )
+        skip_dispatch = mock.Mock(side_effect=[True, False])
+
+        assert await transport_impl.receive_json(skip_dispatch) == transport_impl._loads.return_value
+
+        assert skip_dispatch.call_args_list == [mock.call("TYPING_START", 12), mock.call("MESSAGE_CREATE", 13)]
+        transport_impl._loads.assert_called_once_with(b'{"t":"MESSAGE_CREATE","s":13,"op":0,"d":{}}')
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "payload", [b'{"op":11,"d":null}', b'{"op":0,"t":"TYPING_START","s":12,"d":{}}', b"\x83t\x00\x00\x00\x04"]
+    )
+    async def test_receive_json_when_dispatch_header_not_found(self, transport_impl, payload):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=payload)
+        skip_dispatch = mock.Mock()
+
+        assert await transport_impl.receive_json(skip_dispatch) == transport_impl._loads.return_value
+
+        skip_dispatch.assert_not_called()
+        transport_impl._loads.assert_called_once_with(payload)
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("trace", [True, False])
     async def test_send_json(self, transport_impl, trace):
@@ -297,6 +412,26 @@ async def test__receive_and_check_text_when_message_type_is_unknown(self, transp
 
         transport_impl._ws.receive.assert_awaited_once_with()
 
+    @pytest.mark.asyncio
+    async def test__receive_and_check_binary(self, transport_impl):
+        transport_impl._ws.receive = mock.AsyncMock(
+            return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"some binary")
+        )
+
+        assert await transport_impl._receive_and_check_binary() == b"some binary"
+
+        transport_impl._ws.receive.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_binary_when_message_type_is_unknown(self, transport_impl):
+        transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.TEXT))
+
+        with pytest.raises(
+            errors.GatewayTransportError,
+            match="Gateway transport error: Unexpected message type received TEXT, expected BINARY",
+        ):
+            await transport_impl._receive_and_check_binary()
+
     @pytest.mark.asyncio
     async def test__receive_and_check_zlib_when_payload_split_across_frames(self, transport_impl):
         response1 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"x\xda\xf2H\xcd\xc9")
@@ -308,6 +443,141 @@ async def test__receive_and_check_zlib_when_payload_split_across_frames(self, tr
 
         assert transport_impl._ws.receive.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zlib_reuses_buffer(self, transport_impl):
+        compressor = zlib.compressobj()
+        frames = []
+        for payload in (b"a" * 100, b"b" * 10):
+            data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            frames.extend(
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data[i : i + 3]) for i in range(0, len(data), 3)
+            )
+        transport_impl._ws.receive = mock.AsyncMock(side_effect=frames)
+
+        assert await transport_impl._receive_and_check_zlib() == b"a" * 100
+        buffer = transport_impl._buffer
+        assert await transport_impl._receive_and_check_zlib() == b"b" * 10
+
+        assert transport_impl._buffer is buffer
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zlib_releases_buffer_after_large_message(self, transport_impl):
+        large_payload = random.Random(0).randbytes(1_000)
+        compressor = zlib.compressobj()
+        frames = []
+        for payload in (large_payload, b"b" * 100):
+            data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            frames.extend(
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data[i : i + 3]) for i in range(0, len(data), 3)
+            )
+        transport_impl._ws.receive = mock.AsyncMock(side_effect=frames)
+        buffer = transport_impl._buffer
+
+        with mock.patch.object(shard, "_MAX_RETAINED_BUFFER_SIZE", new=200):
+            assert await transport_impl._receive_and_check_zlib() == large_payload
+            assert transport_impl._buffer is not buffer
+            assert transport_impl._buffer == bytearray()
+
+            buffer = transport_impl._buffer
+            assert await transport_impl._receive_and_check_zlib() == b"b" * 100
+            assert transport_impl._buffer is buffer
+            assert 0 < len(buffer) <= 200
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zlib_when_payload_larger_than_chunk_size(self, transport_impl):
+        payload = bytes(range(256)) * 1024
+        compressor = zlib.compressobj()
+        data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=data))
+
+        assert await transport_impl._receive_and_check_zlib() == payload
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zlib_when_payload_too_large(self, transport_impl):
+        transport_impl._max_payload_size = 50
+        compressor = zlib.compressobj()
+        responses = [
+            StubResponse(
+                type=aiohttp.WSMsgType.BINARY, data=compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            )
+            for payload in (b"a" * 100_000, b"b" * 10)
+        ]
+        transport_impl._ws.receive = mock.AsyncMock(side_effect=responses)
+
+        assert await transport_impl._receive_and_check_zlib() == b"b" * 10
+
+        transport_impl._logger.warning.assert_called_once_with(
+            "dropping payload of %s bytes, as it exceeds the maximum payload size of %s bytes", 100_000, 50
+        )
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_when_payload_too_large(self, transport_impl):
+        transport_impl._max_payload_size = 5
+        transport_impl._zstd = mock.Mock(decompress=mock.Mock(side_effect=[b"some data", b"data"]))
+        transport_impl._ws.receive = mock.AsyncMock(
+            return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"compressed")
+        )
+
+        assert await transport_impl._receive_and_check_zstd() == b"data"
+
+        transport_impl._logger.warning.assert_called_once_with(
+            "dropping payload of %s bytes, as it exceeds the maximum payload size of %s bytes", 9, 5
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("frame_size", [3, 1_000])
+    async def test__receive_and_check_zlib_when_offloading(self, transport_impl, frame_size):
+        compressor = zlib.compressobj()
+        frames = []
+        for payload in (b"a" * 100, b"b" * 10):
+            data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            frames.extend(
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data[i : i + frame_size])
+                for i in range(0, len(data), frame_size)
+            )
+        transport_impl._ws.receive = mock.AsyncMock(side_effect=frames)
+        transport_impl._offload_payload_size = 5
+        threads = []
+        inflate_zlib = shard._GatewayTransport._inflate_zlib
+
+        def _inflate_zlib(self, data):
+            threads.append(threading.get_ident())
+            return inflate_zlib(self, data)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            transport_impl._executor = executor
+
+            with mock.patch.object(shard._GatewayTransport, "_inflate_zlib", new=_inflate_zlib):
+                assert await transport_impl._receive_and_check_zlib() == b"a" * 100
+                assert await transport_impl._receive_and_check_zlib() == b"b" * 10
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_when_offloading(self, transport_impl):
+        transport_impl._zstd = mock.Mock(decompress=mock.Mock(return_value=b"some data"))
+        transport_impl._ws.receive = mock.AsyncMock(
+            return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"compressed")
+        )
+        transport_impl._offload_payload_size = 5
+        threads = []
+        inflate_zstd = shard._GatewayTransport._inflate_zstd
+
+        def _inflate_zstd(self, data):
+            threads.append(threading.get_ident())
+            return inflate_zstd(self, data)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            transport_impl._executor = executor
+
+            with mock.patch.object(shard._GatewayTransport, "_inflate_zstd", new=_inflate_zstd):
+                assert await transport_impl._receive_and_check_zstd() == b"some data"
+
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
+        transport_impl._zstd.decompress.assert_called_once_with(b"compressed")
+
     @pytest.mark.asyncio
     async def test__receive_and_check_zlib_when_full_payload_in_one_frame(self, transport_impl):
         response = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"x\xdaJLD\x07\x00\x00\x00\x00\xff\xff")
@@ -340,9 +610,101 @@ async def test__receive_and_check_zlib_when_issue_during_reception_of_multiple_f
         ):
             await transport_impl._receive_and_check_zlib()
 
-    @pytest.mark.parametrize("transport_compression", [True, False])
     @pytest.mark.asyncio
-    async def test_connect(self, http_settings, proxy_settings, transport_compression):
+    async def test__receive_and_check_zstd(self, transport_impl):
+        transport_impl._zstd = mock.Mock(decompress=mock.Mock(return_value=b"some data"))
+        transport_impl._ws.receive = mock.AsyncMock(
+            return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"compressed")
+        )
+
+        assert await transport_impl._receive_and_check_zstd() == b"some data"
+
+        transport_impl._ws.receive.assert_awaited_once_with()
+        transport_impl._zstd.decompress.assert_called_once_with(b"compressed")
+
+    @pytest.mark.skipif(not zstandard_present, reason="zstandard not present")
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_across_messages(self, transport_impl):
+        compressor = zstandard.ZstdCompressor().compressobj()
+        transport_impl._zstd = zstandard.ZstdDecompressor().decompressobj()
+        response1 = StubResponse(
+            type=aiohttp.WSMsgType.BINARY,
+            data=compressor.compress(b"Hello ") + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        )
+        response2 = StubResponse(
+            type=aiohttp.WSMsgType.BINARY,
+            data=compressor.compress(b"world!") + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        )
+        transport_impl._ws.receive = mock.AsyncMock(side_effect=[response1, response2])
+
+        assert await transport_impl._receive_and_check_zstd() == b"Hello "
+        assert await transport_impl._receive_and_check_zstd() == b"world!"
+
+    @pytest.mark.skipif(not zstandard_present, reason="zstandard not present")
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_when_payload_larger_than_chunk_size(self, transport_impl):
+        payload = random.Random(0).randbytes(100_000)
+        compressor = zstandard.ZstdCompressor().compressobj()
+        transport_impl._zstd = zstandard.ZstdDecompressor().decompressobj()
+        data = compressor.compress(payload) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=data))
+
+        assert await transport_impl._receive_and_check_zstd() == payload
+
+    @pytest.mark.skipif(not zstandard_present, reason="zstandard not present")
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_stops_buffering_when_payload_too_large(self, transport_impl):
+        transport_impl._max_payload_size = 50_000
+        compressor = zstandard.ZstdCompressor().compressobj()
+        transport_impl._zstd = zstandard.ZstdDecompressor().decompressobj()
+        responses = [
+            StubResponse(
+                type=aiohttp.WSMsgType.BINARY,
+                data=compressor.compress(payload) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            )
+            for payload in (random.Random(0).randbytes(100_000), b"b" * 10)
+        ]
+        transport_impl._ws.receive = mock.AsyncMock(side_effect=responses)
+        decompress = transport_impl._zstd.decompress
+        sizes = []
+
+        def _decompress(data):
+            result = decompress(data)
+            sizes.append(len(result))
+            return result
+
+        with mock.patch.object(transport_impl, "_zstd", new=mock.Mock(decompress=_decompress)):
+            assert await transport_impl._receive_and_check_zstd() == b"b" * 10
+
+        assert max(sizes) <= shard._ZSTD_INFLATE_CHUNK_SIZE
+        transport_impl._logger.warning.assert_called_once_with(
+            "dropping payload of %s bytes, as it exceeds the maximum payload size of %s bytes", 100_000, 50_000
+        )
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_when_message_type_is_unknown(self, transport_impl):
+        transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.TEXT))
+
+        with pytest.raises(
+            errors.GatewayTransportError,
+            match="Gateway transport error: Unexpected message type received TEXT, expected BINARY",
+        ):
+            await transport_impl._receive_and_check_zstd()
+
+    @pytest.mark.parametrize(
+        ("compression", "receive_and_check"),
+        [
+            ("transport_zlib_stream", "_receive_and_check_zlib"),
+            pytest.param(
+                "transport_zstd_stream",
+                "_receive_and_check_zstd",
+                marks=pytest.mark.skipif(not zstandard_present, reason="zstandard not present"),
+            ),
+            (None, "_receive_and_check_text"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_connect(self, http_settings, proxy_settings, compression, receive_and_check):
         logger = mock.Mock()
         log_filterer = mock.Mock()
         client_session = mock.Mock()
@@ -366,7 +728,9 @@ async def test_connect(self, http_settings, proxy_settings, transport_compressio
                 log_filterer=log_filterer,
                 loads=loads,
                 dumps=dumps,
-                transport_compression=transport_compression,
+                compression=compression,
+                data_format="json",
+                max_payload_size=1_000,
             )
 
         assert isinstance(ws, shard._GatewayTransport)
@@ -376,11 +740,9 @@ async def test_connect(self, http_settings, proxy_settings, transport_compressio
         assert ws._log_filterer is log_filterer
         assert ws._loads is loads
         assert ws._dumps is dumps
+        assert ws._max_payload_size == 1_000
 
-        if transport_compression:
-            assert ws._receive_and_check == ws._receive_and_check_zlib
-        else:
-            assert ws._receive_and_check == ws._receive_and_check_text
+        assert ws._receive_and_check == getattr(ws, receive_and_check)
 
         assert exit_stack.enter_async_context.call_count == 2
         exit_stack.enter_async_context.assert_has_calls(
@@ -428,7 +790,8 @@ async def test_connect_when_error_while_connecting(self, http_settings, proxy_se
                 log_filterer=log_filterer,
                 loads=object(),
                 dumps=object(),
-                transport_compression=True,
+                compression="transport_zlib_stream",
+                data_format="json",
             )
 
         exit_stack.aclose.assert_awaited_once_with()
@@ -469,7 +832,8 @@ async def test_connect_when_expected_error_while_connecting(self, http_settings,
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
-                transport_compression=True,
+                compression="transport_zlib_stream",
+                data_format="json",
                 loads=object(),
                 dumps=object(),
             )
@@ -478,10 +842,84 @@ async def test_connect_when_expected_error_while_connecting(self, http_settings,
         sleep.assert_awaited_once_with(0.25)
 
 
+class TestGatewayShardMetrics:
+    def test_heartbeat_latencies_is_bounded(self):
+        metrics = shard.GatewayShardMetrics()
+
+        metrics.heartbeat_latencies.extend(range(1_500))
+
+        assert len(metrics.heartbeat_latencies) == 1_000
+        assert metrics.heartbeat_latencies[0] == 500
+
+    def test_aggregate(self):
+        metrics = shard.GatewayShardMetrics.aggregate(
+            [
+                shard.GatewayShardMetrics(
+                    frames_received=3,
+                    payloads_received=2,
+                    raw_bytes_received=100,
+                    bytes_received=400,
+                    dispatches=collections.Counter(READY=1, MESSAGE_CREATE=1),
+                    skipped_dispatches=1,
+                    inflate_time=0.5,
+                    decode_time=1.5,
+                    total_rate_limit_wait_time=2.0,
+                    non_priority_rate_limit_wait_time=1.0,
+                    coalesced_commands=1,
+                    read_pauses=1,
+                    read_pause_time=0.5,
+                    identifies=1,
+                    resumes=0,
+                    reconnects=0,
+                    heartbeat_latencies=collections.deque([0.1, 0.2]),
+                ),
+                shard.GatewayShardMetrics(
+                    frames_received=1,
+                    payloads_received=1,
+                    raw_bytes_received=50,
+                    bytes_received=200,
+                    dispatches=collections.Counter(MESSAGE_CREATE=2),
+                    skipped_dispatches=2,
+                    inflate_time=0.25,
+                    decode_time=0.5,
+                    total_rate_limit_wait_time=1.0,
+                    non_priority_rate_limit_wait_time=0.5,
+                    coalesced_commands=3,
+                    read_pauses=2,
+                    read_pause_time=1.0,
+                    identifies=1,
+                    resumes=2,
+                    reconnects=2,
+                    heartbeat_latencies=collections.deque([0.3]),
+                ),
+            ]
+        )
+
+        assert metrics == shard.GatewayShardMetrics(
+            frames_received=4,
+            payloads_received=3,
+            raw_bytes_received=150,
+            bytes_received=600,
+            dispatches=collections.Counter(READY=1, MESSAGE_CREATE=3),
+            skipped_dispatches=3,
+            inflate_time=0.75,
+            decode_time=2.0,
+            total_rate_limit_wait_time=3.0,
+            non_priority_rate_limit_wait_time=1.5,
+            coalesced_commands=4,
+            read_pauses=3,
+            read_pause_time=1.5,
+            identifies=2,
+            resumes=2,
+            reconnects=2,
+            heartbeat_latencies=collections.deque([0.1, 0.2, 0.3]),
+        )
+
+
 @pytest.fixture
 def client(http_settings, proxy_settings):
     return shard.GatewayShardImpl(
-        event_manager=mock.Mock(),
+        event_manager=mock.Mock(should_pause_reading=mock.Mock(return_value=False)),
         event_factory=mock.Mock(),
         url="wss://gateway.discord.gg",
         intents=intents.Intents.ALL,
@@ -506,20 +944,52 @@ def test__init__when_unsupported_compression_format(self):
                 token="12345",
             )
 
-    def test_using_etf_is_unsupported(self, http_settings, proxy_settings):
-        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: etf"):
+    def test__init__when_unsupported_data_format(self, http_settings, proxy_settings):
+        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: msgpack"):
             shard.GatewayShardImpl(
                 event_manager=mock.Mock(),
                 event_factory=mock.Mock(),
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 token=mock.Mock(),
-                url="wss://erlpack-is-broken-lol.discord.meh",
+                url="wss://gateway.discord.gg",
                 intents=intents.Intents.ALL,
-                data_format="etf",
-                compression="testing",
+                data_format="msgpack",
             )
 
+    def test__init__when_etf(self, http_settings, proxy_settings):
+        client = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            token=mock.Mock(),
+            url="wss://gateway.discord.gg",
+            intents=intents.Intents.ALL,
+            data_format="etf",
+            dumps=mock.Mock(),
+            loads=mock.Mock(),
+        )
+
+        assert client._data_format is shard_api.GatewayDataFormat.ETF
+        assert client._dumps is etf.dumps
+        assert client._loads is etf.loads
+
+    def test__init__when_zstd_compression_but_zstandard_not_installed(self, http_settings, proxy_settings):
+        with mock.patch.dict("sys.modules", {"zstandard": None}):
+            with pytest.raises(RuntimeError, match=r"You must install the optional `hikari\[zstd\]` dependencies"):
+                shard.GatewayShardImpl(
+                    event_manager=mock.Mock(),
+                    event_factory=mock.Mock(),
+                    http_settings=http_settings,
+                    proxy_settings=proxy_settings,
+                    intents=intents.Intents.ALL,
+                    url="wss://gateway.discord.gg",
+                    compression="transport_zstd_stream",
+                    data_format="json",
+                    token="12345",
+                )
+
     def test_heartbeat_latency_property(self, client):
         client._heartbeat_latency = 420
         assert client.heartbeat_latency == 420
@@ -562,6 +1032,9 @@ def test_shard_count_property(self, client):
         client._shard_count = 69
         assert client.shard_count == 69
 
+    def test_metrics_property(self, client):
+        assert client.metrics is client._metrics
+
     def test_shard__check_if_connected_when_not_alive(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "is_connected", new=False):
             with pytest.raises(errors.ComponentStateConflictError):
@@ -635,6 +1108,36 @@ def test_get_user_id(self, client):
 
         check_if_alive.assert_called_once_with()
 
+    def test__skip_dispatch(self, client):
+        client._seq = 10
+        client._event_manager.should_consume_raw_event = mock.Mock(return_value=False)
+
+        assert client._skip_dispatch("TYPING_START", 11) is True
+
+        assert client._seq == 11
+        assert client._metrics.dispatches == {"TYPING_START": 1}
+        assert client._metrics.skipped_dispatches == 1
+        client._event_manager.should_consume_raw_event.assert_called_once_with("TYPING_START")
+
+    def test__skip_dispatch_when_consumed(self, client):
+        client._seq = 10
+        client._event_manager.should_consume_raw_event = mock.Mock(return_value=True)
+
+        assert client._skip_dispatch("TYPING_START", 11) is False
+
+        assert client._seq == 10
+        client._event_manager.should_consume_raw_event.assert_called_once_with("TYPING_START")
+
+    @pytest.mark.parametrize("name", ["READY", "RESUMED"])
+    def test__skip_dispatch_when_handshake_dispatch(self, client, name):
+        client._seq = 10
+        client._event_manager.should_consume_raw_event = mock.Mock(return_value=False)
+
+        assert client._skip_dispatch(name, 11) is False
+
+        assert client._seq == 10
+        client._event_manager.should_consume_raw_event.assert_not_called()
+
 
 @pytest.mark.asyncio
 class TestGatewayShardImplAsync:
@@ -711,8 +1214,11 @@ async def test__send_json(self, client):
         client._ws = mock.AsyncMock()
         data = object()
 
-        await client._send_json(data)
+        with mock.patch.object(time, "monotonic", side_effect=[1, 3, 7]):
+            await client._send_json(data)
 
+        assert client._metrics.non_priority_rate_limit_wait_time == 2
+        assert client._metrics.total_rate_limit_wait_time == 4
         client._non_priority_rate_limit.acquire.assert_awaited_once_with()
         client._total_rate_limit.acquire.assert_awaited_once_with()
         client._ws.send_json.assert_awaited_once_with(data)
@@ -723,12 +1229,62 @@ async def test__send_json_when_priority(self, client):
         client._ws = mock.AsyncMock()
         data = object()
 
-        await client._send_json(data, priority=True)
+        with mock.patch.object(time, "monotonic", side_effect=[1, 3]):
+            await client._send_json(data, priority=True)
 
+        assert client._metrics.non_priority_rate_limit_wait_time == 0
+        assert client._metrics.total_rate_limit_wait_time == 2
         client._non_priority_rate_limit.acquire.assert_not_called()
         client._total_rate_limit.acquire.assert_awaited_once_with()
         client._ws.send_json.assert_awaited_once_with(data)
 
+    async def test__send_command_coalesces_and_orders_by_priority(self, client):
+        client._non_priority_rate_limit = mock.AsyncMock()
+        sent = []
+
+        async def send_json(data, *, priority=False):
+            assert priority is True
+            sent.append(data)
+
+        with mock.patch.object(shard.GatewayShardImpl, "_send_json", side_effect=send_json):
+            await asyncio.gather(
+                client._send_command("presence", 2, {"op": 3, "d": 1}),
+                client._send_command(object(), 1, {"op": 8, "d": 1}),
+                client._send_command("presence", 2, {"op": 3, "d": 2}),
+                client._send_command((4, 123), 0, {"op": 4, "d": 1}),
+                client._send_command((4, 456), 0, {"op": 4, "d": 2}),
+                client._send_command((4, 123), 0, {"op": 4, "d": 3}),
+            )
+
+        assert sent == [{"op": 4, "d": 3}, {"op": 4, "d": 2}, {"op": 8, "d": 1}, {"op": 3, "d": 2}]
+        assert client._non_priority_rate_limit.acquire.await_count == 4
+        assert client._metrics.coalesced_commands == 2
+        assert client._pending_commands == {}
+        assert client._command_task is None
+
+    async def test__send_command_when_send_fails(self, client):
+        client._non_priority_rate_limit = mock.AsyncMock()
+        error = errors.ComponentStateConflictError("some error")
+
+        with mock.patch.object(shard.GatewayShardImpl, "_send_json", side_effect=[error, None]):
+            results = await asyncio.gather(
+                client._send_command("a", 0, {"op": 3}), client._send_command("b", 0, {"op": 4}), return_exceptions=True
+            )
+
+        assert results == [error, None]
+
+    async def test__send_command_when_rate_limit_closed(self, client):
+        client._non_priority_rate_limit = mock.AsyncMock()
+        client._non_priority_rate_limit.acquire.side_effect = asyncio.CancelledError
+
+        results = await asyncio.gather(
+            client._send_command("a", 0, {"op": 3}), client._send_command("b", 0, {"op": 4}), return_exceptions=True
+        )
+
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+        assert client._pending_commands == {}
+        assert client._command_task is None
+
     async def test_request_guild_members_when_no_query_and_no_limit_and_GUILD_MEMBERS_not_enabled(self, client):
         client._intents = intents.Intents.GUILD_INTEGRATIONS
 
@@ -750,12 +1306,12 @@ async def test_request_guild_members_when_presences_and_GUILD_PRESENCES_not_enab
     async def test_request_guild_members_when_presences_false_and_GUILD_PRESENCES_not_enabled(self, client):
         client._intents = intents.Intents.GUILD_INTEGRATIONS
 
-        with mock.patch.object(shard.GatewayShardImpl, "_send_json") as send_json:
+        with mock.patch.object(shard.GatewayShardImpl, "_send_command") as send_command:
             with mock.patch.object(shard.GatewayShardImpl, "_check_if_connected") as check_if_alive:
                 await client.request_guild_members(123, query="test", limit=1, include_presences=False)
 
-        send_json.assert_awaited_once_with(
-            {"op": 8, "d": {"guild_id": "123", "query": "test", "presences": False, "limit": 1}}
+        send_command.assert_awaited_once_with(
+            mock.ANY, 1, {"op": 8, "d": {"guild_id": "123", "query": "test", "presences": False, "limit": 1}}
         )
 
         check_if_alive.assert_called_once_with()
@@ -802,14 +1358,16 @@ async def test_request_guild_members_when_nonce_over_32_chars(self, client):
     async def test_request_guild_members(self, client, include_presences):
         client._intents = intents.Intents.ALL
 
-        with mock.patch.object(shard.GatewayShardImpl, "_send_json") as send_json:
+        with mock.patch.object(shard.GatewayShardImpl, "_send_command") as send_command:
             with mock.patch.object(shard.GatewayShardImpl, "_check_if_connected") as check_if_alive:
                 await client.request_guild_members(123, include_presences=include_presences)
+                await client.request_guild_members(123, include_presences=include_presences)
 
-        send_json.assert_awaited_once_with(
-            {"op": 8, "d": {"guild_id": "123", "query": "", "presences": include_presences, "limit": 0}}
-        )
-        check_if_alive.assert_called_once_with()
+        payload = {"op": 8, "d": {"guild_id": "123", "query": "", "presences": include_presences, "limit": 0}}
+        send_command.assert_has_awaits([mock.call(mock.ANY, 1, payload), mock.call(mock.ANY, 1, payload)])
+        # Member requests are never coalesced
+        assert send_command.await_args_list[0].args[0] != send_command.await_args_list[1].args[0]
+        assert check_if_alive.call_count == 2
 
     @pytest.mark.parametrize("attr", ["_keep_alive_task", "_handshake_event"])
     async def test_start_when_already_running(self, client, attr):
@@ -858,33 +1416,236 @@ async def test_start(self, client):
         shield.assert_called_once_with(create_task.return_value)
         first_completed.assert_awaited_once_with(handshake_event.wait.return_value, shield.return_value)
 
+    async def test_start_when_session_store(self, client):
+        client._session_store = mock.Mock()
+        handshake_event = mock.Mock(is_set=mock.Mock(return_value=True))
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(aio, "first_completed"))
+        stack.enter_context(mock.patch.object(asyncio, "shield"))
+        stack.enter_context(mock.patch.object(asyncio, "create_task"))
+        stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_keep_alive", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(asyncio, "Event", return_value=handshake_event))
+        restore_session = stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_restore_session"))
+
+        with stack:
+            await client.start()
+
+        restore_session.assert_awaited_once_with()
+
+    async def test__restore_session(self, client):
+        session = session_store.GatewaySession(
+            session_id="some_session", seq=123, resume_gateway_url="wss://resume.discord.gg", shard_count=1
+        )
+        client._session_store = mock.Mock(load=mock.AsyncMock(return_value=session))
+
+        await client._restore_session()
+
+        assert client._session_id == "some_session"
+        assert client._seq == 123
+        assert client._resume_gateway_url == "wss://resume.discord.gg"
+        client._session_store.load.assert_awaited_once_with(0)
+
+    async def test__restore_session_when_no_session(self, client):
+        client._session_store = mock.Mock(load=mock.AsyncMock(return_value=None))
+
+        await client._restore_session()
+
+        assert client._session_id is None
+        assert client._seq is None
+        assert client._resume_gateway_url is None
+
+    async def test__restore_session_when_different_shard_count(self, client):
+        session = session_store.GatewaySession(
+            session_id="some_session", seq=123, resume_gateway_url="wss://resume.discord.gg", shard_count=2
+        )
+        client._session_store = mock.Mock(load=mock.AsyncMock(return_value=session))
+
+        await client._restore_session()
+
+        assert client._session_id is None
+        assert client._seq is None
+        assert client._resume_gateway_url is None
+
+    async def test__restore_session_when_load_fails(self, client):
+        client._session_store = mock.Mock(load=mock.AsyncMock(side_effect=RuntimeError))
+        client._logger = mock.Mock()
+
+        await client._restore_session()
+
+        assert client._session_id is None
+        client._logger.exception.assert_called_once_with(
+            "failed to load stored session, will identify with a new session"
+        )
+
+    async def test__checkpoint_session(self, client):
+        client._session_store = mock.Mock(save=mock.AsyncMock())
+        client._session_id = "some_session"
+        client._seq = 123
+        client._resume_gateway_url = "wss://resume.discord.gg"
+
+        await client._checkpoint_session()
+
+        client._session_store.save.assert_awaited_once_with(
+            0,
+            session_store.GatewaySession(
+                session_id="some_session", seq=123, resume_gateway_url="wss://resume.discord.gg", shard_count=1
+            ),
+        )
+
+    async def test__checkpoint_session_when_no_session(self, client):
+        client._session_store = mock.Mock(save=mock.AsyncMock(), delete=mock.AsyncMock())
+
+        await client._checkpoint_session()
+
+        client._session_store.delete.assert_awaited_once_with(0)
+        client._session_store.save.assert_not_called()
+
+    async def test__checkpoint_session_when_save_fails(self, client):
+        client._session_store = mock.Mock(delete=mock.AsyncMock(side_effect=RuntimeError))
+        client._logger = mock.Mock()
+
+        await client._checkpoint_session()
+
+        client._logger.exception.assert_called_once_with("failed to checkpoint session")
+
+    async def test__checkpoint_session_when_no_session_store(self, client):
+        client._session_id = "some_session"
+        client._seq = 123
+        client._resume_gateway_url = "wss://resume.discord.gg"
+
+        await client._checkpoint_session()
+
+    async def test__start_checkpoint(self, client):
+        client._session_store = mock.Mock(delete=mock.AsyncMock())
+
+        client._start_checkpoint()
+        task = client._checkpoint_task
+        await task
+
+        assert task.get_name() == "checkpoint session (shard 0)"
+        client._session_store.delete.assert_awaited_once_with(0)
+
+    async def test__start_checkpoint_when_previous_still_running(self, client):
+        release = asyncio.Event()
+
+        async def delete(shard_id):
+            await release.wait()
+
+        client._session_store = mock.Mock(delete=mock.AsyncMock(side_effect=delete))
+
+        client._start_checkpoint()
+        task = client._checkpoint_task
+        await asyncio.sleep(0)
+        client._start_checkpoint()
+
+        assert client._checkpoint_task is task
+        release.set()
+        await task
+        client._session_store.delete.assert_awaited_once_with(0)
+
+        client._start_checkpoint()
+        await client._checkpoint_task
+
+        assert client._checkpoint_task is not task
+        assert client._session_store.delete.await_count == 2
+
+    async def test__start_checkpoint_when_no_session_store(self, client):
+        client._start_checkpoint()
+
+        assert client._checkpoint_task is None
+
+    async def test__final_checkpoint_waits_for_running_checkpoint(self, client):
+        release = asyncio.Event()
+        deletes = []
+
+        async def delete(shard_id):
+            deletes.append("started")
+            await release.wait()
+            deletes.append("finished")
+
+        client._session_store = mock.Mock(delete=mock.AsyncMock(side_effect=delete))
+        client._start_checkpoint()
+        await asyncio.sleep(0)
+
+        final_checkpoint = asyncio.create_task(client._final_checkpoint())
+        await asyncio.sleep(0)
+        assert deletes == ["started"]
+
+        release.set()
+        await final_checkpoint
+
+        assert deletes == ["started", "finished", "started", "finished"]
+        assert client._checkpoint_task is None
+
+    @hikari_test_helpers.timeout()
+    async def test__heartbeat_when_session_store_is_slow(self, client):
+        client._last_heartbeat_sent = 5
+        client._logger = mock.Mock()
+        real_sleep = asyncio.sleep
+        sleeps = []
+
+        async def delete(shard_id):
+            await asyncio.Event().wait()
+
+        async def sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 3:
+                raise ExitException
+
+            await real_sleep(0)
+
+        class ExitException(Exception): ...
+
+        client._session_store = mock.Mock(delete=mock.AsyncMock(side_effect=delete))
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(asyncio, "sleep", new=sleep))
+        stack.enter_context(mock.patch.object(time, "monotonic", return_value=10))
+        send_heartbeat = stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_send_heartbeat"))
+        stack.enter_context(pytest.raises(ExitException))
+
+        with stack:
+            await client._heartbeat(20)
+
+        assert send_heartbeat.await_count == 3
+        assert sleeps == [20, 20, 20]
+        client._session_store.delete.assert_awaited_once_with(0)
+
+        client._checkpoint_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await client._checkpoint_task
+
     async def test_update_presence(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "_serialize_and_store_presence_payload") as presence:
             with mock.patch.object(shard.GatewayShardImpl, "_check_if_connected") as check_if_alive:
-                with mock.patch.object(shard.GatewayShardImpl, "_send_json") as send_json:
+                with mock.patch.object(shard.GatewayShardImpl, "_send_command") as send_command:
                     await client.update_presence(
                         idle_since=datetime.datetime.now(), afk=True, status=presences.Status.IDLE, activity=None
                     )
 
-        send_json.assert_awaited_once_with({"op": 3, "d": presence.return_value})
+        send_command.assert_awaited_once_with("presence", 2, {"op": 3, "d": presence.return_value})
         check_if_alive.assert_called_once_with()
 
     async def test_update_voice_state(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "_check_if_connected") as check_if_alive:
-            with mock.patch.object(shard.GatewayShardImpl, "_send_json") as send_json:
+            with mock.patch.object(shard.GatewayShardImpl, "_send_command") as send_command:
                 await client.update_voice_state(123456, 6969420, self_mute=False, self_deaf=True)
 
-        send_json.assert_awaited_once_with(
-            {"op": 4, "d": {"guild_id": "123456", "channel_id": "6969420", "self_mute": False, "self_deaf": True}}
+        send_command.assert_awaited_once_with(
+            (4, 123456),
+            0,
+            {"op": 4, "d": {"guild_id": "123456", "channel_id": "6969420", "self_mute": False, "self_deaf": True}},
         )
         check_if_alive.assert_called_once_with()
 
     async def test_update_voice_state_without_optionals(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "_check_if_connected") as check_if_alive:
-            with mock.patch.object(shard.GatewayShardImpl, "_send_json") as send_json:
+            with mock.patch.object(shard.GatewayShardImpl, "_send_command") as send_command:
                 await client.update_voice_state(123456, 6969420)
 
-        send_json.assert_awaited_once_with({"op": 4, "d": {"guild_id": "123456", "channel_id": "6969420"}})
+        send_command.assert_awaited_once_with(
+            (4, 123456), 0, {"op": 4, "d": {"guild_id": "123456", "channel_id": "6969420"}}
+        )
         check_if_alive.assert_called_once_with()
 
     @hikari_test_helpers.timeout()
@@ -898,6 +1659,7 @@ class ExitException(Exception): ...
         sleep = stack.enter_context(mock.patch.object(asyncio, "sleep", side_effect=[None, ExitException]))
         stack.enter_context(mock.patch.object(time, "monotonic", return_value=10))
         send_heartbeat = stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_send_heartbeat"))
+        start_checkpoint = stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_start_checkpoint"))
         stack.enter_context(pytest.raises(ExitException))
 
         with stack:
@@ -905,6 +1667,7 @@ class ExitException(Exception): ...
 
         assert send_heartbeat.await_count == 2
         send_heartbeat.assert_has_awaits([mock.call(), mock.call()])
+        assert start_checkpoint.call_count == 2
         assert sleep.await_count == 2
         sleep.assert_has_awaits([mock.call(20), mock.call(20)])
 
@@ -919,6 +1682,26 @@ async def test__heartbeat_when_zombie(self, client):
 
         sleep.assert_not_called()
 
+    async def test__heartbeat_when_reading_paused(self, client):
+        client._last_heartbeat_sent = 10
+        client._last_heartbeat_ack_received = 5
+        client._reading_paused = True
+        client._logger = mock.Mock()
+
+        class ExitException(Exception): ...
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(asyncio, "sleep", side_effect=ExitException))
+        stack.enter_context(mock.patch.object(time, "monotonic", return_value=10))
+        send_heartbeat = stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_send_heartbeat"))
+        stack.enter_context(mock.patch.object(shard.GatewayShardImpl, "_start_checkpoint"))
+        stack.enter_context(pytest.raises(ExitException))
+
+        with stack:
+            await client._heartbeat(20)
+
+        send_heartbeat.assert_awaited_once_with()
+
     async def test__connect_when_ws(self, client):
         client._ws = object()
 
@@ -928,7 +1711,7 @@ async def test__connect_when_ws(self, client):
     async def test__connect_when_not_reconnecting(self, client, http_settings, proxy_settings):
         ws = mock.AsyncMock()
         ws.receive_json.return_value = {"op": 10, "d": {"heartbeat_interval": 10}}
-        client._transport_compression = False
+        client._compression = None
         client._shard_id = 20
         client._shard_count = 100
         client._gateway_url = "wss://somewhere.com?somewhere=true"
@@ -939,6 +1722,8 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
         client._seq = None
         client._large_threshold = "your mom"
         client._intents = 9
+        client._identify_coordinator = mock.Mock(acquire=mock.AsyncMock())
+        client._max_concurrency = 16
 
         heartbeat_task = object()
         poll_events_task = object()
@@ -978,9 +1763,14 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
             log_filterer=log_filterer.return_value,
             logger=client._logger,
             proxy_settings=proxy_settings,
-            transport_compression=False,
+            compression=None,
+            data_format=shard_api.GatewayDataFormat.JSON,
             loads=client._loads,
             dumps=client._dumps,
+            max_payload_size=client._max_payload_size,
+            executor=client._executor,
+            offload_payload_size=client._offload_payload_size,
+            metrics=client._metrics,
             url="wss://somewhere.com?somewhere=true&v=400&encoding=json",
         )
 
@@ -991,6 +1781,9 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
                 mock.call(poll_events.return_value, name="poll events (shard 20)"),
             ]
         )
+        assert client._metrics.identifies == 1
+        assert client._metrics.resumes == 0
+        client._identify_coordinator.acquire.assert_awaited_once_with(20, 16)
         heartbeat.assert_called_once_with(0.01)
 
         ws.receive_json.assert_awaited_once_with()
@@ -1022,7 +1815,7 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
     async def test__connect_when_reconnecting(self, client, http_settings, proxy_settings):
         ws = mock.AsyncMock()
         ws.receive_json.return_value = {"op": 10, "d": {"heartbeat_interval": 10}}
-        client._transport_compression = True
+        client._compression = shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM
         client._shard_id = 20
         client._gateway_url = "wss://somewhere.com?somewhere=false"
         client._resume_gateway_url = "wss://notsomewhere.com?somewhere=true"
@@ -1031,6 +1824,7 @@ async def test__connect_when_reconnecting(self, client, http_settings, proxy_set
         client._handshake_event = mock.Mock()
         client._seq = 1234
         client._session_id = "some session id"
+        client._identify_coordinator = mock.Mock(acquire=mock.AsyncMock())
 
         heartbeat_task = object()
         poll_events_task = object()
@@ -1065,7 +1859,12 @@ async def test__connect_when_reconnecting(self, client, http_settings, proxy_set
             proxy_settings=proxy_settings,
             loads=client._loads,
             dumps=client._dumps,
-            transport_compression=True,
+            compression=shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+            data_format=shard_api.GatewayDataFormat.JSON,
+            max_payload_size=client._max_payload_size,
+            executor=client._executor,
+            offload_payload_size=client._offload_payload_size,
+            metrics=client._metrics,
             url="wss://notsomewhere.com?somewhere=true&v=400&encoding=json&compress=zlib-stream",
         )
 
@@ -1076,6 +1875,9 @@ async def test__connect_when_reconnecting(self, client, http_settings, proxy_set
                 mock.call(poll_events.return_value, name="poll events (shard 20)"),
             ]
         )
+        assert client._metrics.identifies == 0
+        assert client._metrics.resumes == 1
+        client._identify_coordinator.acquire.assert_not_called()
         heartbeat.assert_called_once_with(0.01)
 
         ws.receive_json.assert_awaited_once_with()
@@ -1089,6 +1891,47 @@ async def test__connect_when_reconnecting(self, client, http_settings, proxy_set
             client._handshake_event.wait.return_value, shielded_heartbeat_task, shielded_poll_events_task
         )
 
+    async def test__connect_when_zstd_compression(self, client):
+        client._compression = shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM
+        client._gateway_url = "wss://somewhere.com"
+        client._resume_gateway_url = None
+        client._handshake_event = mock.Mock()
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(pytest.raises(RuntimeError))
+        gateway_transport_connect = stack.enter_context(
+            mock.patch.object(shard._GatewayTransport, "connect", side_effect=RuntimeError)
+        )
+        stack.enter_context(mock.patch.object(urls, "VERSION", new=400))
+
+        with stack:
+            await client._connect()
+
+        assert gateway_transport_connect.call_args.kwargs["compression"] is client._compression
+        assert gateway_transport_connect.call_args.kwargs["url"] == (
+            "wss://somewhere.com?v=400&encoding=json&compress=zstd-stream"
+        )
+
+    async def test__connect_when_etf(self, client):
+        client._data_format = shard_api.GatewayDataFormat.ETF
+        client._compression = None
+        client._gateway_url = "wss://somewhere.com"
+        client._resume_gateway_url = None
+        client._handshake_event = mock.Mock()
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(pytest.raises(RuntimeError))
+        gateway_transport_connect = stack.enter_context(
+            mock.patch.object(shard._GatewayTransport, "connect", side_effect=RuntimeError)
+        )
+        stack.enter_context(mock.patch.object(urls, "VERSION", new=400))
+
+        with stack:
+            await client._connect()
+
+        assert gateway_transport_connect.call_args.kwargs["data_format"] is shard_api.GatewayDataFormat.ETF
+        assert gateway_transport_connect.call_args.kwargs["url"] == "wss://somewhere.com?v=400&encoding=etf"
+
     async def test__connect_when_op_received_is_not_HELLO(self, client):
         ws = mock.AsyncMock()
         ws.receive_json.return_value = {"op": 0, "d": {"not": "hello"}}
@@ -1135,7 +1978,9 @@ async def test__poll_events_on_dispatch(self, client):
             await client._poll_events()
 
         assert client._ws.receive_json.await_count == 2
+        client._ws.receive_json.assert_awaited_with(client._skip_dispatch)
         assert client._seq == 101
+        assert client._metrics.dispatches == {"SOMETHING": 1}
         client._event_manager.consume_raw_event.assert_called_once_with("SOMETHING", client, {"some": "test"})
         client._handshake_event.set.assert_not_called()
 
@@ -1185,6 +2030,50 @@ async def test__poll_events_on_dispatch_when_RESUMED(self, client):
         client._event_manager.consume_raw_event.assert_called_once_with("RESUMED", client, {"some": "test"})
         client._handshake_event.set.assert_called_once_with()
 
+    async def test__poll_events_when_should_pause_reading(self, client):
+        client._ws = mock.Mock(receive_json=mock.AsyncMock(side_effect=RuntimeError))
+        client._handshake_event = mock.Mock()
+        client._event_manager.should_pause_reading.return_value = True
+
+        with mock.patch.object(shard.GatewayShardImpl, "_pause_reading") as pause_reading:
+            with pytest.raises(RuntimeError):
+                await client._poll_events()
+
+        client._event_manager.should_pause_reading.assert_called_once_with(client)
+        pause_reading.assert_awaited_once_with()
+        client._ws.receive_json.assert_awaited_once()
+
+    async def test__pause_reading(self, client):
+        client._last_heartbeat_ack_received = 1
+        client._logger = mock.Mock()
+
+        async def wait_to_resume_reading(shard):
+            assert shard is client
+            assert client._reading_paused is True
+
+        client._event_manager.wait_to_resume_reading = mock.AsyncMock(side_effect=wait_to_resume_reading)
+
+        with mock.patch.object(time, "monotonic", side_effect=[10, 12.5]):
+            await client._pause_reading()
+
+        client._event_manager.wait_to_resume_reading.assert_awaited_once_with(client)
+        assert client._reading_paused is False
+        assert client._last_heartbeat_ack_received == 12.5
+        assert client._metrics.read_pauses == 1
+        assert client._metrics.read_pause_time == 2.5
+
+    async def test__pause_reading_when_cancelled(self, client):
+        client._logger = mock.Mock()
+        client._event_manager.wait_to_resume_reading = mock.AsyncMock(side_effect=asyncio.CancelledError)
+
+        with mock.patch.object(time, "monotonic", side_effect=[10, 11]):
+            with pytest.raises(asyncio.CancelledError):
+                await client._pause_reading()
+
+        assert client._reading_paused is False
+        assert client._metrics.read_pauses == 1
+        assert client._metrics.read_pause_time == 1
+
     async def test__poll_events_on_heartbeat_ack(self, client):
         payload = {"op": 11}
 
@@ -1201,6 +2090,7 @@ async def test__poll_events_on_heartbeat_ack(self, client):
         assert client._ws.receive_json.await_count == 2
         assert client._last_heartbeat_ack_received == 3
         assert client._heartbeat_latency == 1.5
+        assert list(client._metrics.heartbeat_latencies) == [1.5]
         client._handshake_event.set.assert_not_called()
 
     async def test__poll_events_on_heartbeat(self, client):
@@ -21,6 +21,8 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import sys
 
 import mock.mock
 import pytest
@@ -84,6 +86,168 @@ async def test_non_default_result(self):
         assert aio.completed_future(...).result() is ...
 
 
+@pytest.mark.asyncio
+class TestEagerTask:
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks are only available on 3.12+")
+    async def test_when_coroutine_completes_without_suspending(self):
+        ran = []
+
+        async def coroutine():
+            ran.append(True)
+
+        assert aio.eager_task(coroutine()) is None
+        assert ran == [True]
+
+    @pytest.mark.skipif(sys.version_info >= (3, 12), reason="Eager tasks are available on 3.12+")
+    async def test_when_coroutine_completes_without_suspending_before_3_12(self):
+        ran = []
+
+        async def coroutine():
+            ran.append(True)
+            return "done"
+
+        task = aio.eager_task(coroutine(), name="some task")
+
+        assert ran == []
+        assert task.get_name() == "some task"
+        assert await task == "done"
+        assert ran == [True]
+
+    async def test_when_coroutine_suspends(self):
+        future = asyncio.get_running_loop().create_future()
+        steps = []
+
+        async def coroutine():
+            steps.append("start")
+            result = await future
+            steps.append(result)
+            await asyncio.sleep(0)
+            return "done"
+
+        task = aio.eager_task(coroutine(), name="some task")
+        await asyncio.sleep(0)
+
+        assert steps == ["start"]
+        assert task.get_name() == "some task"
+
+        future.set_result("resumed")
+
+        assert await task == "done"
+        assert steps == ["start", "resumed"]
+
+    async def test_runs_in_own_task(self):
+        caller = asyncio.current_task()
+        tasks = []
+
+        async def coroutine():
+            tasks.append(asyncio.current_task())
+
+        aio.eager_task(coroutine())
+        await asyncio.sleep(0)
+
+        assert len(tasks) == 1
+        assert tasks[0] is not None
+        assert tasks[0] is not caller
+
+    @hikari_test_helpers.timeout()
+    async def test_timeout_in_coroutine_does_not_cancel_caller(self):
+        never = asyncio.get_running_loop().create_future()
+        results = []
+
+        async def coroutine():
+            try:
+                await asyncio.wait_for(never, timeout=0.01)
+            except asyncio.TimeoutError:
+                results.append("timed out")
+
+        task = aio.eager_task(coroutine())
+        await asyncio.sleep(0.05)
+
+        assert results == ["timed out"]
+        assert task.done()
+
+    async def test_runs_in_copy_of_context(self):
+        variable = contextvars.ContextVar("variable", default="caller")
+        future = asyncio.get_running_loop().create_future()
+        seen = []
+
+        async def coroutine():
+            seen.append(variable.get())
+            variable.set("coroutine")
+            await future
+            seen.append(variable.get())
+
+        variable.set("before")
+        task = aio.eager_task(coroutine())
+        await asyncio.sleep(0)
+        assert variable.get() == "before"
+
+        future.set_result(None)
+        await task
+
+        assert seen == ["before", "coroutine"]
+        assert variable.get() == "before"
+
+    async def test_when_coroutine_raises_after_suspending(self):
+        future = asyncio.get_running_loop().create_future()
+
+        async def coroutine():
+            try:
+                await future
+            except ValueError:
+                raise RuntimeError("handled") from None
+
+        task = aio.eager_task(coroutine())
+        await asyncio.sleep(0)
+        future.set_exception(ValueError())
+
+        with pytest.raises(RuntimeError, match="handled"):
+            await task
+
+    async def test_when_task_cancelled_after_suspending(self):
+        cancelled = []
+
+        async def coroutine():
+            try:
+                await asyncio.get_running_loop().create_future()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        task = aio.eager_task(coroutine())
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert cancelled == [True]
+
+    async def test_when_coroutine_raises_without_suspending(self):
+        error = RuntimeError()
+
+        async def coroutine():
+            raise error
+
+        task = aio.eager_task(coroutine())
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await task
+
+        assert exc_info.value is error
+
+    async def test_when_coroutine_cancelled_without_suspending(self):
+        async def coroutine():
+            raise asyncio.CancelledError
+
+        task = aio.eager_task(coroutine())
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert task.cancelled()
+
+
 @pytest.mark.asyncio
 class TestFirstCompleted:
     @hikari_test_helpers.timeout()
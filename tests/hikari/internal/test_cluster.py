@@ -0,0 +1,214 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import logging
+import math
+import sys
+import time
+
+import mock
+import pytest
+
+from hikari.internal import cluster
+
+
+@pytest.mark.parametrize(
+    ("shard_ids", "processes", "expected"),
+    [
+        (range(6), 2, [(0, 1, 2), (3, 4, 5)]),
+        (range(7), 3, [(0, 1, 2), (3, 4), (5, 6)]),
+        (range(2), 4, [(0,), (1,)]),
+        ((), 2, []),
+    ],
+)
+def test_split_shard_ids(shard_ids, processes, expected):
+    assert cluster.split_shard_ids(shard_ids, processes) == expected
+
+
+class TestWorkerChannel:
+    def test_put_nowait(self):
+        connection = mock.Mock()
+        channel = cluster.WorkerChannel(1, (2, 3), connection)
+
+        channel.put_nowait("item")
+
+        connection.send.assert_called_once_with("item")
+
+    def test_forward_logs(self):
+        connection = mock.Mock()
+        channel = cluster.WorkerChannel(1, (2, 3), connection)
+        root = logging.getLogger()
+        original_handlers = root.handlers[:]
+
+        try:
+            channel.forward_logs()
+
+            assert len(root.handlers) == 1
+            assert root.handlers[0].queue is channel
+
+        finally:
+            root.handlers[:] = original_handlers
+
+    def test_report_heartbeat_latencies(self):
+        connection = mock.Mock()
+        channel = cluster.WorkerChannel(1, (2, 3), connection)
+
+        channel.report_heartbeat_latencies({2: 0.1, 3: 0.2})
+
+        connection.send.assert_called_once_with({2: 0.1, 3: 0.2})
+
+
+class TestClusterSupervisor:
+    def test_heartbeat_latency(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        supervisor._heartbeat_latencies.update({0: 0.1, 1: 0.3, 2: float("nan")})
+
+        assert supervisor.heartbeat_latency == pytest.approx(0.2)
+
+    def test_heartbeat_latency_when_no_latencies(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+
+        assert math.isnan(supervisor.heartbeat_latency)
+
+    def test__receive_log_record(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        record = logging.LogRecord("hikari.test", logging.INFO, "path", 1, "message", None, None)
+        worker = cluster._Worker(index=0, shard_ids=(0,), connection=mock.Mock(recv=mock.Mock(return_value=record)))
+
+        with mock.patch.object(logging, "getLogger") as get_logger:
+            supervisor._receive(worker)
+
+        get_logger.assert_called_once_with("hikari.test")
+        get_logger.return_value.handle.assert_called_once_with(record)
+
+    def test__receive_heartbeat_latencies(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        worker = cluster._Worker(index=0, shard_ids=(0,), connection=mock.Mock(recv=mock.Mock(return_value={0: 0.5})))
+
+        supervisor._receive(worker)
+
+        assert supervisor.heartbeat_latencies == {0: 0.5}
+
+    def test__receive_when_closed(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        connection = mock.Mock(recv=mock.Mock(side_effect=EOFError))
+        worker = cluster._Worker(index=0, shard_ids=(0,), connection=connection)
+
+        supervisor._receive(worker)
+
+        connection.close.assert_called_once_with()
+        assert worker.connection is None
+
+    def test__reap_when_exited_cleanly(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        supervisor._heartbeat_latencies.update({0: 0.1, 1: 0.2})
+        process = mock.Mock(exitcode=0)
+        worker = cluster._Worker(index=0, shard_ids=(0,), process=process)
+
+        supervisor._reap(worker)
+
+        process.join.assert_called_once_with()
+        assert worker.process is None
+        assert worker.restart_at is None
+        assert supervisor.heartbeat_latencies == {1: 0.2}
+
+    @pytest.mark.parametrize(
+        ("failures", "uptime", "expected_backoff", "expected_failures"),
+        [(0, 1, 1.0, 1), (3, 1, 8.0, 4), (10, 1, 60.0, 11), (3, 200, 1.0, 1)],
+    )
+    def test__reap_when_exited_unexpectedly(self, failures, uptime, expected_backoff, expected_failures):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        worker = cluster._Worker(
+            index=0, shard_ids=(0,), process=mock.Mock(exitcode=1), failures=failures, started_at=100
+        )
+
+        with mock.patch.object(cluster.time, "monotonic", return_value=100 + uptime):
+            supervisor._reap(worker)
+
+        assert worker.restart_at == 100 + uptime + expected_backoff
+        assert worker.failures == expected_failures
+
+    def test__reap_when_stopping(self):
+        supervisor = cluster.ClusterSupervisor(mock.Mock(), [])
+        supervisor._stopping = True
+        worker = cluster._Worker(index=0, shard_ids=(0,), process=mock.Mock(exitcode=-15))
+
+        supervisor._reap(worker)
+
+        assert worker.restart_at is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Workers are forked")
+    def test_run(self, tmp_path):
+        marker = tmp_path / "crashed"
+        messages = []
+        handler = logging.Handler()
+        handler.emit = lambda record: messages.append(record.getMessage())
+        logger = logging.getLogger("hikari")
+
+        def target(channel):
+            logging.getLogger("hikari.test").warning("worker %s running %s", channel.index, channel.shard_ids)
+
+            if channel.index == 1 and not marker.exists():
+                marker.touch()
+                msg = "testing"
+                raise RuntimeError(msg)
+
+        supervisor = cluster.ClusterSupervisor(target, [(0, 1), (2,)])
+        logger.addHandler(handler)
+
+        try:
+            with mock.patch.object(cluster, "_RESTART_BACKOFF_INITIAL", 0.01):
+                supervisor.run()
+
+        finally:
+            logger.removeHandler(handler)
+
+        assert "worker 0 running (0, 1)" in messages
+        assert messages.count("worker 1 running (2,)") == 2
+        assert any(message.startswith("worker 1 crashed\nTraceback") for message in messages)
+        assert "worker 1 exited unexpectedly with code 1, restarting it in 0.01s" in messages
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Workers are forked")
+    def test_run_when_interrupted(self):
+        original_poll = cluster.ClusterSupervisor._poll
+
+        def poll(self, timeout):
+            if timeout is None:
+                raise KeyboardInterrupt
+
+            return original_poll(self, timeout)
+
+        def target(_):
+            time.sleep(30)
+
+        supervisor = cluster.ClusterSupervisor(target, [(0,), (1,)])
+
+        with mock.patch.object(cluster.ClusterSupervisor, "_poll", autospec=True, side_effect=poll):
+            with mock.patch.object(cluster, "_LOGGER") as logger:
+                with pytest.raises(KeyboardInterrupt):
+                    supervisor.run()
+
+        assert all(worker.process is None for worker in supervisor._workers)
+        logger.info.assert_has_calls(
+            [mock.call("worker %s exited with code %s", 0, -15), mock.call("worker %s exited with code %s", 1, -15)],
+            any_order=True,
+        )
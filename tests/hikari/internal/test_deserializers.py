@@ -0,0 +1,121 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import attrs
+import pytest
+
+from hikari.internal import deserializers
+
+
+@attrs.define(kw_only=True)
+class Model:
+    app: object = attrs.field()
+    id: int = attrs.field()
+    name: str | None = attrs.field()
+    nickname: str | None = attrs.field()
+    count: int | None = attrs.field()
+    created_at: str | None = attrs.field()
+    _flags: int = attrs.field(alias="flags")
+
+
+def _generate_model_deserializer():
+    return deserializers.generate_deserializer(
+        Model,
+        [
+            deserializers.Field(name="id", converter=int),
+            deserializers.Field(name="name", nullable=True, converter=str.upper),
+            deserializers.Field(name="nickname", key="nick", default=None),
+            deserializers.Field(name="count", converter=int, default=-1),
+            deserializers.Field(name="created_at", converter="parse", default=None),
+            deserializers.Field(name="flags", default=0),
+        ],
+        arguments=("app", "parse"),
+    )
+
+
+class TestGenerateDeserializer:
+    def test_with_all_fields(self):
+        app = object()
+
+        model = _generate_model_deserializer()(
+            {"id": "123", "name": "foo", "nick": "bar", "count": "5", "created_at": "now", "flags": 3},
+            app,
+            lambda value: f"parsed {value}",
+        )
+
+        assert model == Model(app=app, id=123, name="FOO", nickname="bar", count=5, created_at="parsed now", flags=3)
+
+    def test_with_missing_fields(self):
+        app = object()
+
+        model = _generate_model_deserializer()({"id": "123", "name": None}, app, pytest.fail)
+
+        assert model == Model(app=app, id=123, name=None, nickname=None, count=-1, created_at=None, flags=0)
+
+    def test_with_null_fields(self):
+        app = object()
+
+        model = _generate_model_deserializer()(
+            {"id": "123", "name": None, "nick": None, "count": None, "created_at": None, "flags": None},
+            app,
+            pytest.fail,
+        )
+
+        assert model == Model(app=app, id=123, name=None, nickname=None, count=-1, created_at=None, flags=None)
+
+    @pytest.mark.parametrize("value", ["", 0])
+    def test_with_falsy_field_when_default_if_falsy(self, value):
+        deserialize = deserializers.generate_deserializer(
+            Model,
+            [
+                deserializers.Field(name="id", converter=int),
+                deserializers.Field(name="name", default=None),
+                deserializers.Field(name="nickname", default=None),
+                deserializers.Field(name="count", default=None),
+                deserializers.Field(name="created_at", converter="parse", default=None, default_if_falsy=True),
+                deserializers.Field(name="flags", default=0),
+            ],
+            arguments=("app", "parse"),
+        )
+        app = object()
+
+        model = deserialize({"id": "123", "created_at": value}, app, pytest.fail)
+
+        assert model == Model(app=app, id=123, name=None, nickname=None, count=None, created_at=None, flags=0)
+
+    def test_when_required_field_missing(self):
+        with pytest.raises(KeyError, match="'name'"):
+            _generate_model_deserializer()({"id": "123"}, object(), pytest.fail)
+
+    def test_when_field_not_keyword_argument(self):
+        with pytest.raises(ValueError, match=r"'_flags' is not a keyword argument of Model"):
+            deserializers.generate_deserializer(Model, [deserializers.Field(name="_flags")])
+
+    def test_when_argument_not_keyword_argument(self):
+        with pytest.raises(ValueError, match=r"'parse' is not a keyword argument of Model"):
+            deserializers.generate_deserializer(Model, [], arguments=("parse",))
+
+    def test_when_converter_not_argument(self):
+        with pytest.raises(
+            ValueError, match=r"converter 'parse' of field 'created_at' is not an argument of the deserializer"
+        ):
+            deserializers.generate_deserializer(Model, [deserializers.Field(name="created_at", converter="parse")])
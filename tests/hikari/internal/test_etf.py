@@ -0,0 +1,136 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import zlib
+
+import pytest
+
+from hikari.internal import etf
+
+
+class TestLoads:
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (b"\x83a\x05", 5),
+            (b"\x83b\xff\xff\xff\xfe", -2),
+            (b"\x83n\x08\x00\x00\x20\x80\xc0\x08\x23\x21\x01", 81384788765712384),
+            (b"\x83n\x01\x01\x05", -5),
+            (b"\x83o\x00\x00\x00\x01\x00\x07", 7),
+            (b"\x83F\x3f\xf8\x00\x00\x00\x00\x00\x00", 1.5),
+            (b"\x83m\x00\x00\x00\x05hello", "hello"),
+            (b"\x83m\x00\x00\x00\x02\xc3\xa9", "é"),
+            (b"\x83w\x03nil", None),
+            (b"\x83w\x04true", True),
+            (b"\x83s\x05false", False),
+            (b"\x83d\x00\x05guild", "guild"),
+            (b"\x83v\x00\x05guild", "guild"),
+            (b"\x83j", []),
+            (b"\x83k\x00\x02\x01\x02", [1, 2]),
+            (b"\x83l\x00\x00\x00\x02a\x01a\x02j", [1, 2]),
+            (b"\x83h\x02a\x01a\x02", [1, 2]),
+            (b"\x83i\x00\x00\x00\x01a\x01", [1]),
+            (b"\x83c" + b"1.50000000000000000000e+00".ljust(31, b"\x00"), 1.5),
+        ],
+    )
+    def test_loads(self, payload, expected):
+        assert etf.loads(payload) == expected
+
+    def test_loads_map_with_atom_keys(self):
+        payload = b"\x83t\x00\x00\x00\x02d\x00\x02opa\x00d\x00\x01dt\x00\x00\x00\x01w\x02idn\x01\x00\x7b"
+
+        assert etf.loads(payload) == {"op": 0, "d": {"id": 123}}
+
+    def test_loads_map_with_binary_keys(self):
+        payload = b"\x83t\x00\x00\x00\x01m\x00\x00\x00\x01aa\x01"
+
+        assert etf.loads(payload) == {"a": 1}
+
+    def test_loads_compressed(self):
+        term = b"m\x00\x00\x00\x05hello"
+        payload = b"\x83P" + len(term).to_bytes(4, "big") + zlib.compress(term)
+
+        assert etf.loads(payload) == "hello"
+
+    def test_loads_str(self):
+        assert etf.loads("\x83a\x05") == 5
+
+    def test_loads_when_invalid_version(self):
+        with pytest.raises(ValueError, match=r"Unsupported ETF version 130"):
+            etf.loads(b"\x82a\x05")
+
+    def test_loads_when_unsupported_tag(self):
+        with pytest.raises(ValueError, match=r"Unsupported ETF tag 255 at position 1"):
+            etf.loads(b"\x83\xff")
+
+    def test_loads_when_truncated(self):
+        with pytest.raises(ValueError, match=r"Invalid ETF payload"):
+            etf.loads(b"\x83b\x00\x00")
+
+    def test_loads_when_trailing_data(self):
+        with pytest.raises(ValueError, match=r"Trailing data found in ETF payload at position 3"):
+            etf.loads(b"\x83a\x05a\x06")
+
+
+class TestDumps:
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            (None, b"\x83w\x03nil"),
+            (True, b"\x83w\x04true"),
+            (False, b"\x83w\x05false"),
+            (5, b"\x83a\x05"),
+            (-2, b"\x83b\xff\xff\xff\xfe"),
+            (81384788765712384, b"\x83n\x08\x00\x00\x20\x80\xc0\x08\x23\x21\x01"),
+            (-(2**40), b"\x83n\x06\x01\x00\x00\x00\x00\x00\x01"),
+            (1.5, b"\x83F\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+            ("hello", b"\x83m\x00\x00\x00\x05hello"),
+            ([], b"\x83j"),
+            ((1, 2), b"\x83l\x00\x00\x00\x02a\x01a\x02j"),
+            ({"a": 1}, b"\x83t\x00\x00\x00\x01m\x00\x00\x00\x01aa\x01"),
+        ],
+    )
+    def test_dumps(self, obj, expected):
+        assert etf.dumps(obj) == expected
+
+    def test_dumps_large_big(self):
+        value = 2**2048
+
+        assert etf.dumps(value)[:7] == b"\x83o\x00\x00\x01\x01\x00"
+
+    def test_dumps_when_unsupported_type(self):
+        with pytest.raises(TypeError, match=r"Cannot encode object of type object to ETF"):
+            etf.dumps([object()])
+
+    def test_round_trip(self):
+        obj = {
+            "op": 2,
+            "d": {
+                "token": "some token",
+                "large_threshold": 250,
+                "shard": [0, 1],
+                "intents": 2**40 + 1,
+                "presence": {"since": None, "afk": False, "game": None, "status": "online"},
+            },
+        }
+
+        assert etf.loads(etf.dumps(obj)) == obj
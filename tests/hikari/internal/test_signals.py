@@ -48,6 +48,15 @@ def test__interrupt_handler(trace):
     loop.call_soon_threadsafe.assert_called_once_with(signals._raise_interrupt, 1)
 
 
+@pytest.mark.parametrize("trace", [True, False])
+def test__blocking_interrupt_handler(trace):
+    with mock.patch.object(signals, "_LOGGER", new=mock.Mock(isEnabledFor=mock.Mock(return_value=trace))):
+        with mock.patch.object(signals, "_raise_interrupt") as raise_interrupt:
+            signals._blocking_interrupt_handler(1, None)
+
+    raise_interrupt.assert_called_once_with(1)
+
+
 class TestHandleInterrupt:
     def test_behaviour(self):
         loop = object()
@@ -92,3 +101,45 @@ def test_when_not_propagate_interrupt(self):
         with mock.patch.object(signal, "signal"):
             with signals.handle_interrupts(mock.Mock(), enabled=True, propagate_interrupts=False):
                 raise errors.HikariInterrupt(1, "t")
+
+
+class TestHandleBlockingInterrupts:
+    def test_behaviour(self):
+        stack = contextlib.ExitStack()
+        register_signal_handler = stack.enter_context(mock.patch.object(signal, "signal"))
+        stack.enter_context(mock.patch.object(signal, "SIGINT", new=2, create=True))
+        stack.enter_context(mock.patch.object(signal, "SIGTERM", new=15, create=True))
+        stack.enter_context(mock.patch.object(signals, "_INTERRUPT_SIGNALS", ("SIGINT", "SIGTERM")))
+
+        with stack:
+            with signals.handle_blocking_interrupts(propagate_interrupts=True, enabled=True):
+                register_signal_handler.assert_has_calls(
+                    [
+                        mock.call(2, signals._blocking_interrupt_handler),
+                        mock.call(15, signals._blocking_interrupt_handler),
+                    ]
+                )
+
+                register_signal_handler.reset_mock()
+
+        register_signal_handler.assert_has_calls(
+            [mock.call(2, signal.default_int_handler), mock.call(15, signal.SIG_DFL)]
+        )
+
+    def test_when_disabled(self):
+        with mock.patch.object(signal, "signal") as register_signal_handler:
+            with signals.handle_blocking_interrupts(enabled=False, propagate_interrupts=True):
+                register_signal_handler.assert_not_called()
+
+        register_signal_handler.assert_not_called()
+
+    def test_when_propagate_interrupt(self):
+        with mock.patch.object(signal, "signal"):
+            with pytest.raises(errors.HikariInterrupt):
+                with signals.handle_blocking_interrupts(enabled=True, propagate_interrupts=True):
+                    raise errors.HikariInterrupt(1, "t")
+
+    def test_when_not_propagate_interrupt(self):
+        with mock.patch.object(signal, "signal"):
+            with signals.handle_blocking_interrupts(enabled=True, propagate_interrupts=False):
+                raise errors.HikariInterrupt(1, "t")
@@ -94,6 +94,37 @@ def test_parse_iso_8601_date_with_no_fraction():
     assert date.microsecond == 0
 
 
+@pytest.mark.parametrize(
+    "string",
+    [
+        "2019-10-10T05:22:33.023456+00:00",
+        "2019-10-10T05:22:33.023+00:00",
+        "2019-10-10T05:22:33+00:00",
+        "2019-10-10T05:22:33.023456-02:30",
+        "2019-10-10T05:22:33.023456Z",
+        "2019-10-10T05:22:33z",
+    ],
+)
+def test_python_parse_iso_8601_date_matches_slow_parse(string):
+    assert time.python_iso8601_datetime_string_to_datetime(string) == time.slow_iso8601_datetime_string_to_datetime(
+        string
+    )
+
+
+def test_python_parse_iso_8601_date_when_invalid():
+    with pytest.raises(ValueError, match=r"Invalid isoformat string"):
+        time.python_iso8601_datetime_string_to_datetime("10/10/2019")
+
+
+def test_cached_parse_iso_8601_date_shares_result():
+    string = "2015-04-26T06:26:56.936000+00:00"
+
+    date = time.cached_iso8601_datetime_string_to_datetime(string)
+
+    assert date == datetime.datetime(2015, 4, 26, 6, 26, 56, 936000, tzinfo=datetime.timezone.utc)
+    assert time.cached_iso8601_datetime_string_to_datetime(string) is date
+
+
 def test_speedup_replaces_python_version_when_available():
     try:
         import ciso8601
@@ -104,7 +135,7 @@ def test_speedup_replaces_python_version_when_available():
         # No speedups, test pure version has been setup correctly
 
         assert time.fast_iso8601_datetime_string_to_datetime is None
-        assert time.iso8601_datetime_string_to_datetime is time.slow_iso8601_datetime_string_to_datetime
+        assert time.iso8601_datetime_string_to_datetime is time.python_iso8601_datetime_string_to_datetime
 
 
 def test_parse_discord_epoch_to_datetime():